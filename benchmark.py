@@ -25,21 +25,282 @@
 
 """
 Script to benchmark pystemmer and purestemmer.
+
+Besides the tables that compare implementation variants, there is a
+benchmark suite (``benchmark.py suite``) which measures throughput,
+latency, memory usage and import time of every algorithm. Its results
+can be saved as JSON and compared to a stored baseline to detect
+performance regressions. The suite does not require pystemmer.
+
+Run ``benchmark.py --help`` for usage information.
 """
 
+import argparse
+import bisect
 import codecs
+import collections
 import glob
+import imp
+import itertools
+import json
 import os.path
+import platform
+import random
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+
+import purestemmer
+import purestemmer.cache
+import purestemmer.parallel
+import purestemmer.server
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_test_dir = os.path.join(_module_dir, 'test')
+
+# Executed in a fresh interpreter to measure the import of purestemmer.
+# Prints the elapsed time in seconds and the peak memory usage in kB.
+_IMPORT_CODE = """
+import resource
 import timeit
+start = timeit.default_timer()
+import purestemmer
+%s
+stop = timeit.default_timer()
+print stop - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
 
-import Stemmer
 
+# Executed in a fresh interpreter for each algorithm by ``run_suite``.
+# Measures the time for importing purestemmer and loading the algorithm
+# before anything else is imported, then runs ``measure_algorithm``.
+# Prints the results as JSON.
+_SUITE_CODE = """
+import json
+import resource
+import timeit
+start = timeit.default_timer()
 import purestemmer
+purestemmer.preload([%(algorithm)r])
+import_time = timeit.default_timer() - start
+import benchmark
+results = benchmark.measure_algorithm(%(algorithm)r, %(repeat)d, %(warmup)d,
+                                      %(limit)r)
+results['import_ms'] = 1000 * import_time
+results['peak_memory_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print json.dumps(results)
+"""
+
+# Executed in a fresh interpreter for each cache and size by
+# ``benchmark_cache_memory``. Prints the memory usage in kB before and
+# after filling the cache and the time for looking up all entries.
+_MEMORY_CODE = """
+import itertools
+import timeit
+import benchmark
+keys, prefixes, suffixes = benchmark.make_cache_entries(%(algorithm)r,
+                                                        %(size)d)
+cache = benchmark.make_memory_cache(%(name)r, %(size)d)
+before = benchmark.current_memory()
+for key, n, suffix in itertools.izip(keys, prefixes, suffixes):
+    # Fresh stem objects, like the ones returned by the algorithm
+    cache[key] = key[:n] + suffix
+after = benchmark.current_memory()
+start = timeit.default_timer()
+for key in keys:
+    cache[key]
+print before, after, timeit.default_timer() - start
+"""
+
+# Metrics of the benchmark suite. Maps each metric to true if higher
+# values are better and to false if lower values are better.
+SUITE_METRICS = collections.OrderedDict([
+    ('cold_wps', True),
+    ('warm_wps', True),
+    ('latency_p50_us', False),
+    ('latency_p90_us', False),
+    ('latency_p99_us', False),
+    ('import_ms', False),
+    ('peak_memory_kb', False),
+])
+
 
 def mean(numbers):
     return sum(numbers) / float(len(numbers))
 
 
+def percentile(sorted_numbers, p):
+    """
+    Get a percentile of a sorted list of numbers.
+
+    ``p`` is a number between 0 and 100.
+    """
+    return sorted_numbers[int(p / 100.0 * (len(sorted_numbers) - 1))]
+
+
+def benchmark_import(preload=False, repeat=5):
+    """
+    Measure how long it takes to import purestemmer.
+
+    Each measurement is done in a fresh interpreter. If ``preload`` is
+    true then all algorithm modules are imported, too, which is what
+    purestemmer did on import before the modules were loaded lazily.
+
+    Returns the time in seconds and the peak memory usage of the
+    interpreter in kB.
+    """
+    code = _IMPORT_CODE % ('purestemmer.preload()' if preload else '')
+    timings = []
+    memory = []
+    for x in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=_module_dir)
+        elapsed, rss = output.split()
+        timings.append(float(elapsed))
+        memory.append(int(rss))
+    return mean(timings), max(memory)
+
+
+class _PurgingCache(object):
+    """
+    The cache used by ``purestemmer.Stemmer`` up to version 0.1.1.
+
+    Kept here as a baseline for ``benchmark_cache``. Whenever the cache
+    grows beyond its limit, the whole cache is rebuilt and only the
+    ``keep_ratio * max_size`` most recently used entries are kept.
+    """
+
+    def __init__(self, max_size=10000, keep_ratio=0.75):
+        self._cache = {}
+        self._counter = 0
+        self.max_size = max_size
+        self.keep_ratio = keep_ratio
+
+    def __getitem__(self, key):
+        entry = self._cache[key]
+        entry[1] = self._counter
+        self._counter += 1
+        return entry[0]
+
+    def __setitem__(self, key, value):
+        self._cache[key] = [value, self._counter]
+        self._counter += 1
+        if len(self._cache) <= self.max_size:
+            return
+        new_cache = {}
+        limit = self._counter - self.keep_ratio * self.max_size
+        for key, value in self._cache.iteritems():
+            if value[1] > limit:
+                new_cache[key] = value
+        self._cache = new_cache
+
+
+def load_words(algorithm):
+    """
+    Load the test vocabulary of an algorithm.
+    """
+    filename = os.path.join(_test_dir, algorithm + '.txt')
+    with codecs.open(filename, 'r', 'utf8') as f:
+        return f.read().splitlines()
+
+
+def make_workload(words, length, scan=False, seed=0):
+    """
+    Create a stream of words for benchmarking caches.
+
+    Words are drawn from the vocabulary ``words`` according to Zipf's
+    law, which is a good model for the word frequencies of natural
+    language text. If ``scan`` is true then the stream is interrupted
+    by a single pass over the rarest half of the vocabulary, which
+    simulates a burst of words that are only seen once.
+
+    Returns a list of ``length`` words (plus the scanned words).
+    """
+    rng = random.Random(seed)
+    vocabulary = list(words)
+    rng.shuffle(vocabulary)
+    cumulative = []
+    total = 0.0
+    for rank in xrange(1, len(vocabulary) + 1):
+        total += 1.0 / rank
+        cumulative.append(total)
+    workload = [vocabulary[bisect.bisect(cumulative, rng.random() * total)]
+                for x in xrange(length)]
+    if scan:
+        middle = length // 2
+        workload[middle:middle] = vocabulary[len(vocabulary) // 2:]
+    return workload
+
+
+def benchmark_cache(cache, workload):
+    """
+    Measure hit rate and latency of a cache.
+
+    ``cache`` is used like ``purestemmer.Stemmer`` uses its cache for
+    each word in ``workload``. The stemming itself is left out so that
+    only the cost of the cache is measured.
+
+    Returns the hit rate and the mean, 99th percentile and maximum
+    latency per word in seconds.
+    """
+    timer = timeit.default_timer
+    latencies = []
+    hits = 0
+    for word in workload:
+        start = timer()
+        try:
+            cache[word]
+            hits += 1
+        except KeyError:
+            cache[word] = word
+        latencies.append(timer() - start)
+    latencies.sort()
+    return (hits / float(len(workload)), mean(latencies),
+            percentile(latencies, 99), latencies[-1])
+
+
+def benchmark_threads(stemmer, workloads):
+    """
+    Measure throughput and latency of a stemmer shared by threads.
+
+    Each of the lists of words in ``workloads`` is stemmed word by word
+    in a separate thread, all threads start at the same time.
+
+    Returns the total throughput in words per second and the median
+    and 99th percentile latency per word in seconds.
+    """
+    timer = timeit.default_timer
+    start_event = threading.Event()
+    latencies = [[] for workload in workloads]
+
+    def worker(words, results):
+        stem = stemmer.stemWord
+        start_event.wait()
+        for word in words:
+            start = timer()
+            stem(word)
+            results.append(timer() - start)
+
+    threads = [threading.Thread(target=worker, args=args)
+               for args in zip(workloads, latencies)]
+    for thread in threads:
+        thread.start()
+    start = timer()
+    start_event.set()
+    for thread in threads:
+        thread.join()
+    elapsed = timer() - start
+    merged = sorted(itertools.chain.from_iterable(latencies))
+    return (len(merged) / elapsed, percentile(merged, 50),
+            percentile(merged, 99))
+
+
 def benchmark(stemmer, words, repeat=1):
     """
     Measure how long a stemmer takes to stem a list of words.
@@ -55,6 +316,135 @@ def benchmark(stemmer, words, repeat=1):
     return mean(timings)
 
 
+def measure_throughput(stemmer, words, repeat=3, warmup=1):
+    """
+    Measure how many words per second a stemmer can stem.
+
+    ``words`` are stemmed ``warmup`` times before the measurement, each
+    word is passed to ``stemmer.stemWord`` separately. Returns the best
+    throughput of ``repeat`` runs.
+    """
+    stem = stemmer.stemWord
+    timer = timeit.default_timer
+    best = None
+    for x in range(warmup + repeat):
+        start = timer()
+        for word in words:
+            stem(word)
+        elapsed = timer() - start
+        if x >= warmup and (best is None or elapsed < best):
+            best = elapsed
+    return len(words) / best
+
+
+def measure_latencies(stemmer, words):
+    """
+    Measure the time a stemmer takes for each word.
+
+    Returns a sorted list of latencies in seconds.
+    """
+    stem = stemmer.stemWord
+    timer = timeit.default_timer
+    latencies = []
+    for word in words:
+        start = timer()
+        stem(word)
+        latencies.append(timer() - start)
+    latencies.sort()
+    return latencies
+
+
+def measure_algorithm(algorithm, repeat=3, warmup=1, limit=None):
+    """
+    Measure throughput and latency of an algorithm for its test data.
+
+    ``limit`` is the maximum number of words from the test data to use
+    (default: all).
+
+    The cold throughput is measured with the cache disabled, the warm
+    throughput with a cache that holds all words and is filled during
+    the warm-up. Latency percentiles are measured afterwards with the
+    cache disabled.
+
+    Returns a dict with the number of words and the suite metrics
+    except for import time and memory usage, which are measured by
+    ``run_suite``.
+    """
+    words = load_words(algorithm)[:limit]
+    cold = purestemmer.Stemmer(algorithm, maxCacheSize=0)
+    warm = purestemmer.Stemmer(algorithm, maxCacheSize=len(set(words)))
+    cold_wps = measure_throughput(cold, words, repeat, warmup)
+    warm_wps = measure_throughput(warm, words, repeat, max(1, warmup))
+    latencies = measure_latencies(cold, words)
+    return {
+        'words': len(words),
+        'cold_wps': cold_wps,
+        'warm_wps': warm_wps,
+        'latency_p50_us': 1e6 * percentile(latencies, 50),
+        'latency_p90_us': 1e6 * percentile(latencies, 90),
+        'latency_p99_us': 1e6 * percentile(latencies, 99),
+    }
+
+
+def run_suite(algorithms=None, repeat=3, warmup=1, limit=None):
+    """
+    Run the benchmark suite.
+
+    Each algorithm (default: all) is measured in a fresh interpreter so
+    that its import time and peak memory usage are not influenced by
+    the other algorithms. See ``measure_algorithm`` for the other
+    arguments.
+
+    Returns a dict that can be serialized as JSON.
+    """
+    results = collections.OrderedDict()
+    for algorithm in algorithms or purestemmer.algorithms():
+        code = _SUITE_CODE % {'algorithm': algorithm, 'repeat': repeat,
+                              'warmup': warmup, 'limit': limit}
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=_module_dir)
+        results[algorithm] = json.loads(output)
+    return collections.OrderedDict([
+        ('purestemmer', purestemmer.__version__),
+        ('python', platform.python_version()),
+        ('platform', platform.platform()),
+        ('repeat', repeat),
+        ('warmup', warmup),
+        ('limit', limit),
+        ('algorithms', results),
+    ])
+
+
+def find_regressions(baseline, results, tolerance=0.1):
+    """
+    Compare the results of two suite runs.
+
+    ``baseline`` and ``results`` are dicts returned by ``run_suite``. A
+    metric has regressed if it is worse than in the baseline by more
+    than the fraction ``tolerance``. Algorithms that are missing from
+    one of the runs are ignored.
+
+    Returns a list of tuples ``(algorithm, metric, baseline value,
+    current value)``.
+    """
+    regressions = []
+    for algorithm, current in results['algorithms'].iteritems():
+        old = baseline['algorithms'].get(algorithm)
+        if old is None:
+            continue
+        for metric, higher_is_better in SUITE_METRICS.iteritems():
+            if metric not in old or metric not in current:
+                continue
+            if higher_is_better:
+                regressed = current[metric] < old[metric] * (1 - tolerance)
+            else:
+                regressed = current[metric] > old[metric] * (1 + tolerance)
+            if regressed:
+                regressions.append((algorithm, metric, old[metric],
+                                    current[metric]))
+    return regressions
+
+
 def compare(algorithm, words, repeat=1):
     """
     Compare the pystemmer and purestemmer variants of an algorithm.
@@ -64,6 +454,7 @@ def compare(algorithm, words, repeat=1):
 
     Returns the elapsed times of the variants.
     """
+    import Stemmer
     py_algo = Stemmer.Stemmer(algorithm)
     py_time = benchmark(py_algo, words, repeat)
     pure_algo = purestemmer.Stemmer(algorithm)
@@ -71,10 +462,518 @@ def compare(algorithm, words, repeat=1):
     return (py_time, pure_time)
 
 
-if __name__ == '__main__':
-    module_dir = os.path.abspath(os.path.dirname(__file__))
-    test_dir = os.path.join(module_dir, 'test')
-    filenames = sorted(glob.glob(os.path.join(test_dir, '*.txt')))
+def print_import_table():
+    """
+    Print import time and memory usage of purestemmer.
+    """
+    delim = '+-----------------+-------------+-------------+'
+    line_format = '| %-15s | %11.1f | %11d |'
+    print delim
+    print '| Import          | Time [ms]   | Memory [kB] |'
+    print '+=================+=============+=============+'
+    for label, preload in [('lazy', False), ('preload', True)]:
+        elapsed, rss = benchmark_import(preload)
+        print line_format % (label, 1000 * elapsed, rss)
+        print delim
+
+
+def print_cache_table(max_size=10000, length=200000):
+    """
+    Print hit rates and latencies of the different cache policies.
+    """
+    caches = [('purge', _PurgingCache)]
+    for policy in purestemmer.cache.policies():
+        caches.append((policy, lambda n, p=policy:
+                       purestemmer.cache.make_cache(p, n)))
+    delim = ('+-----------------+----------+--------+----------+' +
+             '-----------+----------+----------+')
+    line_format = '| %-15s | %-8s | %-6s | %8.4f | %9.3f | %8.3f | %8.1f |'
+    print delim
+    print ('| Algorithm       | Workload | Cache  | Hit rate | ' +
+           'Mean [us] | P99 [us] | Max [us] |')
+    print delim.replace('-', '=')
+    for algorithm in purestemmer.algorithms():
+        words = load_words(algorithm)
+        for label, scan in [('zipf', False), ('scan', True)]:
+            workload = make_workload(words, length, scan)
+            for name, factory in caches:
+                hit_rate, avg, p99, worst = benchmark_cache(
+                        factory(max_size), workload)
+                print line_format % (algorithm, label, name, hit_rate,
+                                     1e6 * avg, 1e6 * p99, 1e6 * worst)
+        print delim
+
+
+def make_unique_workload(words, length, seed=0):
+    """
+    Create a stream of words that are all different.
+
+    The words are made from the vocabulary ``words`` by appending random
+    letters, which simulates a bulk import of a large vocabulary.
+    """
+    rng = random.Random(seed)
+    letters = u'abcdefghijklmnopqrstuvwxyz'
+    workload = set()
+    while len(workload) < length:
+        word = rng.choice(words)
+        workload.add(word + u''.join(rng.choice(letters) for i in xrange(4)))
+    workload = list(workload)
+    rng.shuffle(workload)
+    return workload
+
+
+def benchmark_single_words(stemmer, workload):
+    """
+    Measure the throughput of ``stemWord``.
+
+    Returns the number of words per second.
+    """
+    stem_word = stemmer.stemWord
+    start = timeit.default_timer()
+    for word in workload:
+        stem_word(word)
+    return len(workload) / (timeit.default_timer() - start)
+
+
+def print_adaptive_table(sizes=(0, 1000, 10000, 100000), min_size=1000,
+                         length=200000, batch_size=1000):
+    """
+    Print the throughput of fixed-size and adaptive caches.
+
+    The workloads are Zipf-distributed words, unique words and a mix of
+    both (a third of Zipf-distributed words, a third of unique words and
+    another third of Zipf-distributed words). Each stemmer starts with
+    an empty cache.
+    """
+    algorithm = 'english'
+    words = load_words(algorithm)
+    zipf = make_workload(words, length)
+    unique = make_unique_workload(words, length)
+    third = length // 3
+    workloads = [
+        ('zipf', zipf),
+        ('unique', unique),
+        ('mixed', zipf[:third] + unique[:third] + zipf[third:2 * third]),
+    ]
+    caches = [(str(size), {'maxCacheSize': size}) for size in sizes]
+    caches.append(('adaptive', {'maxCacheSize': max(sizes),
+                                'minCacheSize': min_size}))
+    delim = '+----------+----------+-------------+-------------+'
+    line_format = '| %-8s | %-8s | %11.1f | %11.1f |'
+    print delim
+    print '| Workload | Cache    | Batch [w/s] | Words [w/s] |'
+    print delim.replace('-', '=')
+    for label, workload in workloads:
+        for name, kwargs in caches:
+            batch = benchmark_batches(purestemmer.Stemmer(algorithm,
+                                                          **kwargs),
+                                      workload, batch_size)
+            single = benchmark_single_words(purestemmer.Stemmer(algorithm,
+                                                                **kwargs),
+                                            workload)
+            print line_format % (label, name, batch, single)
+        print delim
+
+
+def print_parallel_table(processes=None):
+    """
+    Print the speedup of parallel stemming for the test data.
+    """
+    delim = '+-----------------+-------------+-------------+--------+'
+    line_format = '| %-15s | %11.2f | %11.2f | %6.2f |'
+    print delim
+    print '| Algorithm       | Serial      | Parallel    | Factor |'
+    print '+=================+=============+=============+========+'
+    for algorithm in purestemmer.algorithms():
+        words = load_words(algorithm)
+        serial = purestemmer.Stemmer(algorithm, maxCacheSize=0)
+        serial_time = benchmark(serial, words)
+        with purestemmer.parallel.ParallelStemmer(
+                algorithm, maxCacheSize=0, processes=processes) as parallel:
+            parallel_time = benchmark(parallel, words)
+        factor = serial_time / parallel_time
+        print line_format % (algorithm, serial_time, parallel_time, factor)
+        print delim
+
+
+def print_threads_table(thread_counts=(1, 2, 4, 8), shards=16,
+                        length=40000, max_size=10000):
+    """
+    Print throughput and latency of a stemmer that is shared by threads.
+
+    The total number of words (drawn from the test data according to
+    Zipf's law) is the same for each number of threads. The default
+    cache is compared to a sharded cache of the same size.
+    """
+    caches = [('lru', 1), ('lru/%d' % shards, shards)]
+    delim = ('+-----------------+---------+-----------+------------+' +
+             '----------+----------+')
+    line_format = '| %-15s | %7d | %-9s | %10d | %8.1f | %8.1f |'
+    print delim
+    print ('| Algorithm       | Threads | Cache     | Words/s    | ' +
+           'P50 [us] | P99 [us] |')
+    print delim.replace('-', '=')
+    for algorithm in purestemmer.algorithms():
+        words = load_words(algorithm)
+        for n in thread_counts:
+            workloads = [make_workload(words, length // n, seed=i)
+                         for i in range(n)]
+            for label, cache_shards in caches:
+                stemmer = purestemmer.Stemmer(algorithm, max_size,
+                                              cacheShards=cache_shards)
+                wps, p50, p99 = benchmark_threads(stemmer, workloads)
+                print line_format % (algorithm, n, label, wps, 1e6 * p50,
+                                     1e6 * p99)
+        print delim
+
+
+def start_server(path, algorithm, timeout=30):
+    """
+    Start a stemming server in a separate process.
+
+    Returns the ``subprocess.Popen`` instance once the server accepts
+    connections on the socket ``path``.
+    """
+    process = subprocess.Popen([sys.executable, '-m', 'purestemmer.server',
+                                '--socket', path, '--preload', algorithm],
+                               cwd=_module_dir)
+    deadline = timeit.default_timer() + timeout
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+            return process
+        except socket.error:
+            if (process.poll() is not None or
+                    timeit.default_timer() > deadline):
+                process.kill()
+                raise RuntimeError('Could not start the server.')
+            time.sleep(0.1)
+        finally:
+            sock.close()
+
+
+def benchmark_batches(stemmer, workload, batch_size):
+    """
+    Measure the throughput of ``stemWords`` for batches of words.
+
+    ``workload`` is split into batches of ``batch_size`` words, each of
+    which is stemmed via ``stemmer.stemWords``.
+
+    Returns the number of words per second.
+    """
+    batches = [workload[i:i + batch_size]
+               for i in xrange(0, len(workload), batch_size)]
+    start = timeit.default_timer()
+    for batch in batches:
+        stemmer.stemWords(batch)
+    return len(workload) / (timeit.default_timer() - start)
+
+
+def print_server_table(batch_sizes=(1, 100, 1000, 10000), length=100000):
+    """
+    Print the throughput of a stemming server and of in-process stemming.
+
+    The server runs in a separate process on the same machine. Each
+    stemmer first stems the whole workload once, so that the caches are
+    warm, except for the in-process stemmer without cache.
+    """
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'stemmer.sock')
+    algorithm = 'english'
+    server = start_server(path, algorithm)
+    try:
+        workload = make_workload(load_words(algorithm), length)
+        stemmers = [
+            ('no cache', purestemmer.Stemmer(algorithm, 0)),
+            ('cache', purestemmer.Stemmer(algorithm, 1000000)),
+            ('server', purestemmer.server.StemmerClient(algorithm, path)),
+        ]
+        delim = '+------------+------------+-------------+'
+        line_format = '| %-10s | %10d | %11.1f |'
+        print delim
+        print '| Stemmer    | Batch size | Words/s     |'
+        print delim.replace('-', '=')
+        for label, stemmer in stemmers:
+            if label != 'no cache':
+                stemmer.stemWords(workload)
+            for batch_size in batch_sizes:
+                words_per_second = benchmark_batches(stemmer, workload,
+                                                     batch_size)
+                print line_format % (label, batch_size, words_per_second)
+            print delim
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(temp_dir)
+
+
+def make_documents(words, count=1000, length=200, seed=0):
+    """
+    Create documents for benchmarking the text pipeline.
+
+    Each document consists of ``length`` words drawn from ``words``
+    according to Zipf's law (see ``make_workload``). Sentences start
+    with a capital letter and end with a period.
+
+    Returns a list of ``count`` ``unicode`` documents.
+    """
+    rng = random.Random(seed)
+    workload = make_workload(words, count * length, seed=seed)
+    documents = []
+    for start in xrange(0, len(workload), length):
+        tokens = workload[start:start + length]
+        for i in xrange(0, len(tokens), 12):
+            tokens[i] = tokens[i].capitalize()
+            end = min(i + rng.randint(6, 12), len(tokens)) - 1
+            tokens[end] += u'.'
+        documents.append(u' '.join(tokens))
+    return documents
+
+
+def benchmark_documents(function, documents, repeat=3):
+    """
+    Measure the throughput of a function that stems documents.
+
+    ``function`` is called with the list ``documents``.
+
+    Returns the number of documents per second.
+    """
+    elapsed = min(timeit.repeat(lambda: function(documents), number=1,
+                                repeat=repeat))
+    return len(documents) / elapsed
+
+
+def print_text_table(count=1000, length=200):
+    """
+    Print the throughput of the text pipeline.
+
+    A loop that splits each document, lower-cases each token and stems
+    it via ``stemWord`` is compared to ``stemText`` and
+    ``stemDocuments``, with and without term-frequency counts.
+    """
+    def loop(stemmer, documents):
+        results = []
+        for document in documents:
+            stems = []
+            for token in document.split():
+                stems.append(stemmer.stemWord(token.strip(u'.').lower()))
+            results.append(stems)
+        return results
+
+    variants = [
+        ('stemWord loop', loop),
+        ('stemText', lambda s, d: [s.stemText(x) for x in d]),
+        ('stemText counts',
+            lambda s, d: [s.stemText(x, counts=True) for x in d]),
+        ('stemDocuments', lambda s, d: list(s.stemDocuments(d))),
+        ('stemDocuments counts',
+            lambda s, d: list(s.stemDocuments(d, counts=True))),
+    ]
+    delim = '+-----------------+----------------------+------------+'
+    line_format = '| %-15s | %-20s | %10.1f |'
+    print delim
+    print '| Algorithm       | Method               | Docs/s     |'
+    print delim.replace('-', '=')
+    for algorithm in purestemmer.algorithms():
+        documents = make_documents(load_words(algorithm), count, length)
+        for label, function in variants:
+            stemmer = purestemmer.Stemmer(algorithm)
+            docs_per_second = benchmark_documents(
+                    lambda d: function(stemmer, d), documents)
+            print line_format % (algorithm, label, docs_per_second)
+        print delim
+
+
+def current_memory():
+    """
+    Get the current memory usage of the interpreter in kB.
+
+    Uses the resident set size on Linux and the peak memory usage on
+    other systems.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except IOError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pages * resource.getpagesize() // 1024
+
+
+def make_cache_entries(algorithm, size):
+    """
+    Create words and their stems for filling a cache.
+
+    The test vocabulary of the algorithm is stemmed. If more than its
+    size is required then it is repeated with a different number in
+    front of the words and stems in each round.
+
+    Returns a list of ``size`` words, and for each word the length of
+    the prefix that its stem shares with it and the rest of the stem.
+    The stems are not created so that the cache under test has to hold
+    its own stem objects.
+    """
+    module = purestemmer._load_algorithm(algorithm)
+    words = load_words(algorithm)
+    splits = []
+    for word in words:
+        stem = module.stem(word)
+        n = len(os.path.commonprefix([word, stem]))
+        splits.append((n, stem[n:]))
+    keys = []
+    prefixes = []
+    suffixes = []
+    for i in xrange(size):
+        round_, j = divmod(i, len(words))
+        label = u'%d' % round_ if round_ else u''
+        n, suffix = splits[j]
+        keys.append(label + words[j])
+        prefixes.append(len(label) + n)
+        suffixes.append(suffix)
+    return keys, prefixes, suffixes
+
+
+def make_memory_cache(name, size):
+    """
+    Create a cache for ``benchmark_cache_memory``.
+
+    ``name`` is ``'purge'`` for the cache of purestemmer 0.1.1 or the
+    name of a cache policy.
+    """
+    if name == 'purge':
+        return _PurgingCache(size)
+    return purestemmer.cache.make_cache(name, size)
+
+
+def benchmark_cache_memory(name, size, algorithm='english'):
+    """
+    Measure the memory usage of a full cache.
+
+    The cache (see ``make_memory_cache``) is filled with ``size`` words
+    and freshly created stems (see ``make_cache_entries``) in a fresh
+    interpreter, and the growth of the resident set size is measured.
+    This includes the cache's own data structures and whatever it keeps
+    of the stems: ``'compact'`` drops the stem objects and only keeps
+    shared suffixes, the other caches keep a stem object per entry. The
+    memory for the words themselves is not included since it is needed
+    without a cache, too.
+
+    Returns the number of bytes per entry and the mean time in seconds
+    for looking up an entry.
+    """
+    code = _MEMORY_CODE % {'algorithm': algorithm, 'size': size,
+                           'name': name}
+    output = subprocess.check_output([sys.executable, '-c', code],
+                                     cwd=_module_dir)
+    before, after, elapsed = output.split()
+    return (1024.0 * (int(after) - int(before)) / size,
+            float(elapsed) / size)
+
+
+def print_memory_table(sizes=(10000, 100000, 1000000)):
+    """
+    Print the memory usage of the caches for different sizes.
+
+    See ``benchmark_cache_memory`` for what is measured. ``purge`` is
+    the cache of purestemmer 0.1.1.
+    """
+    names = ['purge'] + purestemmer.cache.policies()
+    delim = '+----------+---------+-------------+----------+'
+    line_format = '| %-8s | %7d | %11.1f | %8.3f |'
+    print delim
+    print '| Cache    | Size    | Bytes/entry | Hit [us] |'
+    print delim.replace('-', '=')
+    for size in sizes:
+        for name in names:
+            per_entry, lookup = benchmark_cache_memory(name, size)
+            print line_format % (name, size, per_entry, 1e6 * lookup)
+        print delim
+    print ('Bytes/entry: growth of the resident set size per entry, ' +
+           'including the')
+    print ('stems kept by the cache but not the words (keys). Hit: ' +
+           'mean lookup time.')
+
+
+_module_counter = itertools.count()
+
+
+def load_algorithm_modules(directory):
+    """
+    Load the algorithm modules in a directory.
+
+    This is useful to compare modules that were created by
+    ``convert_algorithms.py`` using different options.
+
+    Returns a dict that maps algorithm names to modules.
+    """
+    modules = {}
+    for filename in glob.glob(os.path.join(directory, '*.py')):
+        base = os.path.splitext(os.path.basename(filename))[0]
+        if base.startswith('__'):
+            continue
+        # Module names must be unique, otherwise modules are reused
+        name = '_benchmark_%d_%s' % (next(_module_counter), base)
+        modules[base.split('_')[0]] = imp.load_source(name, filename)
+    return modules
+
+
+def compare_modules(baseline, module, words, repeat=3):
+    """
+    Compare two algorithm modules.
+
+    Raises ``AssertionError`` if the modules return different stems for
+    ``words``. Otherwise returns the best of ``repeat`` times each
+    module takes to stem ``words``.
+    """
+    times = []
+    for m in (baseline, module):
+        timings = []
+        for x in range(repeat):
+            start = timeit.default_timer()
+            stems = [m.stem(word) for word in words]
+            timings.append(timeit.default_timer() - start)
+        times.append(min(timings))
+        if m is baseline:
+            expected = stems
+        elif stems != expected:
+            for word, a, b in zip(words, expected, stems):
+                assert a == b, ((u'Different stems for %r: %r (baseline) ' +
+                                 u'and %r') % (word, a, b))
+    return times
+
+
+def print_codegen_table(baseline_dir):
+    """
+    Compare the algorithm modules to those in a baseline directory.
+
+    The stems of both module versions must be identical for the test
+    data.
+    """
+    baseline = load_algorithm_modules(baseline_dir)
+    delim = '+-----------------+-------------+-------------+--------+'
+    line_format = '| %-15s | %11.2f | %11.2f | %6.2f |'
+    print delim
+    print '| Algorithm       | Baseline    | Current     | Factor |'
+    print '+=================+=============+=============+========+'
+    totals = [0, 0]
+    for algorithm in purestemmer.algorithms():
+        words = load_words(algorithm)
+        module = purestemmer._load_algorithm(algorithm)
+        times = compare_modules(baseline[algorithm], module, words)
+        totals = [a + b for a, b in zip(totals, times)]
+        print line_format % ((algorithm,) + tuple(times) +
+                             (times[0] / times[1],))
+        print delim
+    print line_format % (('TOTAL',) + tuple(totals) +
+                         (totals[0] / totals[1],))
+    print delim
+
+
+def print_pystemmer_table():
+    """
+    Print the time pystemmer and purestemmer need for the test data.
+    """
+    filenames = sorted(glob.glob(os.path.join(_test_dir, '*.txt')))
     py_times = []
     pure_times = []
     delim = '+-----------------+-------------+-------------+--------+'
@@ -98,3 +997,127 @@ if __name__ == '__main__':
     total_factor = pure_total / float(py_total)
     print line_format % ('TOTAL', py_total, pure_total, total_factor)
     print delim
+
+
+def print_suite_table(results):
+    """
+    Print the results of the benchmark suite.
+
+    ``results`` is a dict returned by ``run_suite``.
+    """
+    delim = ('+-----------------+------------+------------+----------+' +
+             '----------+-------------+-------------+')
+    line_format = ('| %-15s | %10d | %10d | %8.1f | %8.1f | %11.1f | ' +
+                   '%11d |')
+    print delim
+    print ('| Algorithm       | Cold [w/s] | Warm [w/s] | P50 [us] | ' +
+           'P99 [us] | Import [ms] | Memory [kB] |')
+    print delim.replace('-', '=')
+    for algorithm, r in results['algorithms'].iteritems():
+        print line_format % (algorithm, r['cold_wps'], r['warm_wps'],
+                             r['latency_p50_us'], r['latency_p99_us'],
+                             r['import_ms'], r['peak_memory_kb'])
+        print delim
+
+
+def print_regressions(regressions, tolerance):
+    """
+    Print the regressions found by ``find_regressions``.
+    """
+    if not regressions:
+        print 'No regressions (tolerance %d%%).' % (100 * tolerance)
+        return
+    print '%d regression(s) (tolerance %d%%):' % (len(regressions),
+                                                100 * tolerance)
+    for algorithm, metric, old, new in regressions:
+        print '  %-15s %-15s %12.1f -> %12.1f (%+.1f%%)' % (
+                algorithm, metric, old, new, 100.0 * (new - old) / old)
+
+
+def have_pystemmer():
+    """
+    Check if pystemmer is installed.
+    """
+    try:
+        import Stemmer
+    except ImportError:
+        return False
+    return True
+
+
+_TABLES = collections.OrderedDict([
+    ('import', print_import_table),
+    ('cache', print_cache_table),
+    ('adaptive', print_adaptive_table),
+    ('parallel', print_parallel_table),
+    ('threads', print_threads_table),
+    ('memory', print_memory_table),
+    ('server', print_server_table),
+    ('text', print_text_table),
+    ('pystemmer', print_pystemmer_table),
+    ('codegen', print_codegen_table),
+    ('suite', print_suite_table),
+])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('tables', nargs='*', choices=[[]] + _TABLES.keys(),
+                        metavar='TABLE', help='Benchmarks to run: ' +
+                        ', '.join(_TABLES.keys()) + ' (default: all)')
+    parser.add_argument('--baseline', metavar='DIR', help='Directory ' +
+                        'with algorithm modules to compare the current ' +
+                        'ones to (required for the codegen benchmark)')
+    group = parser.add_argument_group('suite')
+    group.add_argument('--algorithm', action='append', dest='algorithms',
+                       metavar='NAME', help='Algorithm to benchmark ' +
+                       '(can be repeated, default: all)')
+    group.add_argument('--repeat', type=int, default=3, help='Number ' +
+                       'of measurements (default: %(default)s)')
+    group.add_argument('--warmup', type=int, default=1, help='Number ' +
+                       'of runs before measuring (default: %(default)s)')
+    group.add_argument('--limit', type=int, help='Maximum number of ' +
+                       'words per algorithm (default: all)')
+    group.add_argument('--json', metavar='FILE', help='Write the ' +
+                       'results to FILE')
+    group.add_argument('--compare', metavar='FILE', help='Compare the ' +
+                       'results to those stored in FILE and exit with ' +
+                       'status 1 if there are regressions')
+    group.add_argument('--tolerance', type=float, default=0.1,
+                       help='Relative change that is considered a ' +
+                       'regression (default: %(default)s)')
+    args = parser.parse_args()
+    tables = args.tables or _TABLES.keys()
+    if not args.baseline:
+        if 'codegen' in args.tables:
+            parser.error('The codegen benchmark requires --baseline')
+        tables = [name for name in tables if name != 'codegen']
+    if 'pystemmer' in tables and not have_pystemmer():
+        if 'pystemmer' in args.tables:
+            parser.error('The pystemmer benchmark requires pystemmer')
+        tables = [name for name in tables if name != 'pystemmer']
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    regressions = []
+    for name in tables:
+        if name == 'codegen':
+            print_codegen_table(args.baseline)
+        elif name == 'suite':
+            results = run_suite(args.algorithms, args.repeat, args.warmup,
+                                args.limit)
+            print_suite_table(results)
+            if args.json:
+                with open(args.json, 'w') as f:
+                    json.dump(results, f, indent=2)
+            if baseline is not None:
+                regressions = find_regressions(baseline, results,
+                                               args.tolerance)
+                print
+                print_regressions(regressions, args.tolerance)
+        else:
+            _TABLES[name]()
+        print
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,557 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Script to check every stemming path against the expected stems.
+
+The test data of each algorithm (``test/<algorithm>.txt``, one word per
+line) is paired with the expected stems (``test/<algorithm>.stems``,
+one stem per line), which were created by pystemmer, the C version of
+the Snowball algorithms. This script stems the test data via each
+execution path of purestemmer (the algorithm modules, with and without
+prefilter, cold and warm caches of each policy, sharded caches, batch,
+streaming, parallel, asynchronous, server, multilingual and bytes
+input, ...) and reports the throughput of each path together with the
+first word for which it returns a different stem. Since correctness
+and speed are measured in the same run, an optimization can be judged
+by both at once.
+
+With ``--codegen``, algorithm modules are also generated in each of
+the alternative modes of ``convert_algorithms.py`` and checked, and
+``--modules`` checks the modules in a directory. Only ``--update``,
+which recreates the expected stems, requires pystemmer.
+
+The script exits with status 1 if any path diverges. Run
+``conformance.py --help`` for usage information.
+"""
+
+import argparse
+import codecs
+import collections
+import glob
+import os.path
+import Queue
+import shutil
+import sys
+import tempfile
+import threading
+import timeit
+
+import purestemmer
+import purestemmer.arrays
+import purestemmer.asynchronous
+import purestemmer.dictionary
+import purestemmer.multilingual
+import purestemmer.parallel
+import purestemmer.server
+import purestemmer.stream
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_test_dir = os.path.join(_module_dir, 'test')
+
+
+def words_filename(algorithm):
+    return os.path.join(_test_dir, algorithm + '.txt')
+
+
+def stems_filename(algorithm):
+    return os.path.join(_test_dir, algorithm + '.stems')
+
+
+def _read_lines(filename):
+    with codecs.open(filename, 'r', 'utf8') as f:
+        return f.read().splitlines()
+
+
+def load_words(algorithm):
+    """
+    Load the test data of an algorithm.
+    """
+    return _read_lines(words_filename(algorithm))
+
+
+def load_expected(algorithm):
+    """
+    Load the expected stems for the test data of an algorithm.
+    """
+    return _read_lines(stems_filename(algorithm))
+
+
+def test_algorithms():
+    """
+    Get the names of the algorithms that have test data.
+    """
+    filenames = glob.glob(os.path.join(_test_dir, '*.txt'))
+    return sorted(os.path.splitext(os.path.basename(filename))[0]
+                  for filename in filenames)
+
+
+def update_expected(algorithm):
+    """
+    Recreate the expected stems of an algorithm using pystemmer.
+    """
+    import Stemmer
+    stems = Stemmer.Stemmer(algorithm).stemWords(load_words(algorithm))
+    with codecs.open(stems_filename(algorithm), 'w', 'utf8') as f:
+        for stem in stems:
+            f.write(stem + u'\n')
+
+
+def find_divergence(words, expected, stems):
+    """
+    Find the first word for which a path returned a wrong stem.
+
+    Returns ``None`` if ``stems`` equals ``expected`` and all stems are
+    ``unicode`` instances. Otherwise the return value is a tuple
+    ``(index, word, expected_stem, stem)``. If there are too few stems
+    then the missing ones are ``None``.
+    """
+    for index, word in enumerate(words):
+        stem = stems[index] if index < len(stems) else None
+        if stem != expected[index] or type(stem) is not unicode:
+            return index, word, expected[index], stem
+    if len(stems) > len(words):
+        return len(words), None, None, stems[len(words)]
+    return None
+
+
+def _timed(function, *args):
+    """
+    Call a function and measure how long it takes.
+
+    Returns the result and the elapsed time in seconds.
+    """
+    start = timeit.default_timer()
+    result = function(*args)
+    return result, timeit.default_timer() - start
+
+
+def _stem_each(stemmer, words):
+    stem = stemmer.stemWord
+    return [stem(word) for word in words]
+
+
+# Paths that use an algorithm module directly. Each one is a function
+# that takes an algorithm module and a list of words and returns the
+# stems and the elapsed time, or ``None`` if the module does not support
+# the path.
+
+def _module_path(module, words):
+    stem = module.stem
+    return _timed(lambda: [stem(word) for word in words])
+
+
+def _prefilter_path(module, words):
+    unchanged = getattr(module, 'unchanged', None)
+    if unchanged is None:
+        return None
+    stem = module.stem
+    return _timed(lambda: [word if unchanged(word) else stem(word)
+                           for word in words])
+
+
+MODULE_PATHS = collections.OrderedDict([
+    ('module', _module_path),
+    ('prefilter', _prefilter_path),
+])
+
+
+# Paths that use the public API. Each one is a function that takes the
+# name of an algorithm and a list of words and returns the stems and
+# the elapsed time, or ``None`` if the path is not available. Setting up
+# stemmers is not included in the time.
+
+def _cold_path(algorithm, words):
+    return _timed(_stem_each, purestemmer.Stemmer(algorithm), words)
+
+
+def _warm_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm, len(words))
+    _stem_each(stemmer, words)
+    return _timed(_stem_each, stemmer, words)
+
+
+def _no_cache_path(algorithm, words):
+    return _timed(_stem_each, purestemmer.Stemmer(algorithm, 0), words)
+
+
+def _compact_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm, len(words), 'compact')
+    _stem_each(stemmer, words)
+    return _timed(_stem_each, stemmer, words)
+
+
+def _2q_path(algorithm, words):
+    # Half of the words, so that entries move between the queues and
+    # are evicted
+    stemmer = purestemmer.Stemmer(algorithm, len(words) // 2, '2q')
+    _stem_each(stemmer, words)
+    return _timed(_stem_each, stemmer, words)
+
+
+def _sharded_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm, max(16, len(words) // 2),
+                                  cacheShards=16)
+    _stem_each(stemmer, words)
+    return _timed(_stem_each, stemmer, words)
+
+
+def _adaptive_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm, minCacheSize=100)
+    return _timed(_stem_each, stemmer, words)
+
+
+def _batch_path(algorithm, words):
+    return _timed(purestemmer.Stemmer(algorithm).stemWords, words)
+
+
+def _factorized_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm)
+
+    def stem(words):
+        ids, stems = stemmer.stemWords(words, factorize=True)
+        return [stems[index] for index in ids]
+
+    return _timed(stem, words)
+
+
+def _stream_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm)
+    return _timed(lambda: list(stemmer.iterStems(iter(words), 1000)))
+
+
+def _file_path(algorithm, words):
+    stemmer = purestemmer.Stemmer(algorithm)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(temp_dir, 'words.txt')
+        with open(filename, 'wb') as f:
+            f.write(u'\n'.join(words).encode('utf8'))
+        # Small blocks, so that words are split between blocks
+        return _timed(lambda: list(purestemmer.stream.iter_file_stems(
+                      stemmer, filename, 16 * 1024)))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def _bytes_path(algorithm, words):
+    encoded = [word.encode('utf8') for word in words]
+    stems, elapsed = _timed(purestemmer.Stemmer(algorithm).stemWords,
+                            encoded)
+    return [stem.decode('utf8') for stem in stems], elapsed
+
+
+def _stem_bytes_path(algorithm, words):
+    # ``stemBytes`` splits its input at whitespace, so words that are
+    # empty or contain whitespace are stemmed via ``stemWord`` instead.
+    stemmer = purestemmer.Stemmer(algorithm)
+    data = u'\n'.join(words).encode('utf8')
+    stems, elapsed = _timed(stemmer.stemBytes, data)
+    stems = iter(stems)
+    return [next(stems).decode('utf8') if word.split() == [word]
+            else stemmer.stemWord(word) for word in words], elapsed
+
+
+def _parallel_path(algorithm, words):
+    with purestemmer.parallel.ParallelStemmer(algorithm,
+                                              chunkSize=1000) as stemmer:
+        return _timed(stemmer.stemWords, words)
+
+
+def _async_path(algorithm, words):
+    callbacks = Queue.Queue()
+    stemmer = purestemmer.Stemmer(algorithm)
+
+    def stem(words):
+        future = async_stemmer.stemWords(words)
+        while not future.done():
+            callbacks.get()()
+        return future.result()
+
+    with purestemmer.asynchronous.AsyncStemmer(
+            stemmer, callbacks.put) as async_stemmer:
+        return _timed(stem, words)
+
+
+def _server_path(algorithm, words):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'server.sock')
+        with purestemmer.server.StemmerServer(path, processes=1) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                with purestemmer.server.StemmerClient(algorithm,
+                                                      path) as client:
+                    return _timed(client.stemWords, words)
+            finally:
+                server.shutdown()
+                thread.join()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def _multilingual_path(algorithm, words, sharedCache=False):
+    # Words of another language are mixed in, so that batches are split.
+    # The time includes stemming them.
+    other = 'english' if algorithm != 'english' else 'german'
+    stemmer = purestemmer.multilingual.MultilingualStemmer(
+            sharedCache=sharedCache)
+    pairs = []
+    for word in words:
+        pairs.append((algorithm, word))
+        pairs.append((other, word))
+    stems, elapsed = _timed(stemmer.stemWords, pairs)
+    return stems[::2], elapsed
+
+
+def _shared_cache_path(algorithm, words):
+    return _multilingual_path(algorithm, words, sharedCache=True)
+
+
+def _dictionary_path(algorithm, words):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(temp_dir, 'stems.dict')
+        purestemmer.dictionary.build(filename, algorithm, words)
+        dictionary = purestemmer.dictionary.StemDictionary(filename)
+        try:
+            stemmer = purestemmer.Stemmer(algorithm, 0,
+                                          dictionary=dictionary)
+            return _timed(_stem_each, stemmer, words)
+        finally:
+            dictionary.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def _array_path(algorithm, words):
+    numpy = purestemmer.arrays.numpy
+    if numpy is None:
+        return None
+    values = numpy.array(words, dtype=unicode)
+    stems, elapsed = _timed(purestemmer.arrays.stem_array,
+                            purestemmer.Stemmer(algorithm), values)
+    return stems.tolist(), elapsed
+
+
+STEMMER_PATHS = collections.OrderedDict([
+    ('cold', _cold_path),
+    ('warm', _warm_path),
+    ('no-cache', _no_cache_path),
+    ('compact', _compact_path),
+    ('2q', _2q_path),
+    ('sharded', _sharded_path),
+    ('adaptive', _adaptive_path),
+    ('batch', _batch_path),
+    ('factorized', _factorized_path),
+    ('stream', _stream_path),
+    ('file', _file_path),
+    ('bytes', _bytes_path),
+    ('stem-bytes', _stem_bytes_path),
+    ('parallel', _parallel_path),
+    ('async', _async_path),
+    ('server', _server_path),
+    ('multilingual', _multilingual_path),
+    ('shared-cache', _shared_cache_path),
+    ('dictionary', _dictionary_path),
+    ('array', _array_path),
+])
+
+
+# Alternative modes of ``convert_algorithms.py``, given as keyword
+# arguments for ``convert_algorithms.translate``.
+CODEGEN_MODES = collections.OrderedDict([
+    ('no-among-tables', {'among_tables': False}),
+    ('no-grouping-scans', {'grouping_scans': False}),
+    ('no-buffer-runtime', {'buffer_runtime': False}),
+    ('no-prefilter', {'prefilter': False}),
+    ('baseline', {'among_tables': False, 'grouping_scans': False,
+                  'buffer_runtime': False, 'prefilter': False}),
+    ('profile', {'profile': True}),
+])
+
+
+def check_path(path, target, words, expected):
+    """
+    Run an execution path and compare its stems to the expected ones.
+
+    ``path`` is a function from ``MODULE_PATHS`` or ``STEMMER_PATHS``
+    and ``target`` is an algorithm module or name, respectively.
+
+    Returns ``None`` if the path is not available. Otherwise returns a
+    tuple ``(divergence, words_per_second)``, see ``find_divergence``.
+    """
+    result = path(target, words)
+    if result is None:
+        return None
+    stems, elapsed = result
+    return (find_divergence(words, expected, stems),
+            len(words) / max(elapsed, 1e-9))
+
+
+def generate_modules(directory, algorithms, **kwargs):
+    """
+    Generate algorithm modules via ``convert_algorithms.py``.
+
+    The modules for ``algorithms`` are written to ``directory``. The
+    keyword arguments are passed on to ``convert_algorithms.translate``.
+    """
+    import convert_algorithms
+    for algorithm in algorithms:
+        filename = convert_algorithms.find_snowball_source(algorithm)
+        convert_algorithms.make_algorithm(filename, directory, **kwargs)
+
+
+def load_modules(directory):
+    """
+    Load the algorithm modules in a directory.
+
+    Returns a dict that maps algorithm names to modules.
+    """
+    import benchmark
+    return benchmark.load_algorithm_modules(directory)
+
+
+def _format_divergence(divergence):
+    index, word, expected, stem = divergence
+    if word is None:
+        return u'unexpected stem %r after the last word' % stem
+    return u'line %d (%r): expected %r, got %r' % (index + 1, word,
+                                                    expected, stem)
+
+
+class _Report(object):
+    """
+    Collects and prints the results of the checks.
+    """
+
+    _DELIM = ('+-----------------+----------------------------------+' +
+              '-------------+--------+')
+    _LINE = '| %-15s | %-32s | %11s | %-6s |'
+
+    def __init__(self):
+        self.failures = []
+
+    def print_header(self):
+        print self._DELIM
+        print self._LINE % ('Algorithm', 'Path', 'Words/s', 'Result')
+        print self._DELIM.replace('-', '=')
+
+    def add(self, algorithm, label, result):
+        if result is None:
+            print self._LINE % (algorithm, label, '-', 'n/a')
+        else:
+            divergence, words_per_second = result
+            if divergence is not None:
+                self.failures.append((algorithm, label, divergence))
+            print self._LINE % (algorithm, label,
+                                '%.1f' % words_per_second,
+                                'FAIL' if divergence else 'ok')
+        sys.stdout.flush()
+
+    def end_algorithm(self):
+        print self._DELIM
+
+    def print_failures(self):
+        for algorithm, label, divergence in self.failures:
+            print (u'%s, %s: %s' % (algorithm, label,
+                   _format_divergence(divergence))).encode('utf8')
+
+
+def main():
+    """
+    Check the execution paths against the expected stems.
+    """
+    all_paths = MODULE_PATHS.keys() + STEMMER_PATHS.keys()
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('algorithms', nargs='*', metavar='ALGORITHM',
+                        help='Algorithms to check (default: all)')
+    parser.add_argument('--path', action='append', dest='paths',
+                        choices=all_paths, metavar='PATH',
+                        help='Execution path to check (can be repeated, ' +
+                        'default: all): ' + ', '.join(all_paths))
+    parser.add_argument('--limit', type=int, help='Maximum number of ' +
+                        'words per algorithm (default: all)')
+    parser.add_argument('--codegen', action='store_true', help='Also ' +
+                        'check modules generated in each alternative ' +
+                        'mode of convert_algorithms.py (slow)')
+    parser.add_argument('--modules', action='append', default=[],
+                        metavar='DIR', help='Also check the algorithm ' +
+                        'modules in DIR (can be repeated)')
+    parser.add_argument('--update', action='store_true', help='Recreate ' +
+                        'the expected stems using pystemmer and exit')
+    args = parser.parse_args()
+    algorithms = args.algorithms or test_algorithms()
+    for algorithm in algorithms:
+        if algorithm not in test_algorithms():
+            parser.error('No test data for %s' % algorithm)
+    if args.update:
+        for algorithm in algorithms:
+            print stems_filename(algorithm)
+            update_expected(algorithm)
+        return 0
+    paths = args.paths or all_paths
+    module_paths = [name for name in MODULE_PATHS if name in paths]
+    stemmer_paths = [name for name in STEMMER_PATHS if name in paths]
+    variants = [(os.path.basename(os.path.normpath(directory)),
+                 load_modules(directory)) for directory in args.modules]
+    temp_dir = tempfile.mkdtemp()
+    try:
+        if args.codegen:
+            for mode, kwargs in CODEGEN_MODES.iteritems():
+                directory = os.path.join(temp_dir, mode)
+                os.mkdir(directory)
+                print 'Generating %s modules' % mode
+                sys.stdout.flush()
+                generate_modules(directory, algorithms, **kwargs)
+                variants.append((mode, load_modules(directory)))
+        report = _Report()
+        report.print_header()
+        for algorithm in algorithms:
+            words = load_words(algorithm)[:args.limit]
+            expected = load_expected(algorithm)[:args.limit]
+            module = purestemmer._load_algorithm(algorithm)
+            for name in module_paths:
+                report.add(algorithm, name, check_path(
+                           MODULE_PATHS[name], module, words, expected))
+            for name in stemmer_paths:
+                report.add(algorithm, name, check_path(
+                           STEMMER_PATHS[name], algorithm, words, expected))
+            for label, modules in variants:
+                for name in module_paths:
+                    report.add(algorithm, '%s [%s]' % (name, label),
+                               check_path(MODULE_PATHS[name],
+                                          modules[algorithm], words,
+                                          expected))
+            report.end_algorithm()
+    finally:
+        shutil.rmtree(temp_dir)
+    report.print_failures()
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
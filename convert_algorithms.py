@@ -25,28 +25,1108 @@
 
 """
 Script to convert the Snowball stemmers to Python modules.
+
+The Snowball code is translated via sbl2py. Some constructs are
+compiled into faster code than sbl2py generates by default:
+
+- The strings of each ``among`` are put into a hash table, so that
+  finding the longest matching string takes one dictionary lookup per
+  distinct string length instead of one comparison per string.
+
+- Groupings are frozensets, and ``gopast``/``goto`` commands that scan
+  for a single grouping (or its negation) are compiled into a tight
+  loop over the character indices.
+
+- The runtime's ``starts_with`` and ``hop`` work on the cursor and
+  limit indices instead of copying the remaining text.
+
+In addition, each module gets a conservative ``unchanged`` function
+which is derived from the program and recognizes many of the words
+that the algorithm returns unchanged, so that they can skip stemming.
+
+Run ``convert_algorithms.py --help`` for usage information.
 """
 
+import argparse
 import codecs
+import collections
 import glob
 import os.path
+import re
 
 import sbl2py
+import sbl2py.ast
+import sbl2py.grammar
 
 _module_dir = os.path.abspath(os.path.dirname(__file__))
 _snowball_dir = os.path.join(_module_dir, 'snowball')
 _algorithms_dir = os.path.join(_module_dir, 'purestemmer', 'algorithms')
 
 
-def make_algorithm(filename):
+#
+# AMONG TABLES
+#
+
+# Runtime support for hashed ``among`` lookups. An among table is a
+# tuple ``(strings, lengths, max_length)``: ``strings`` maps each
+# string to its ``among`` entries (in their original order), and
+# ``lengths`` contains the distinct string lengths in decreasing order.
+# Since sbl2py tries the strings by decreasing length, looking up the
+# text before/after the cursor for each length yields the matching
+# entries in the same order in which sbl2py would find them.
+_AMONG_RUNTIME = """
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+"""
+
+
+def _has_routines(among):
+    """
+    Check if any string of an ``among`` has a routine condition.
+    """
+    return any(routine for string, routine, index in among.strings)
+
+
+def _generate_among_search(env, among):
+    """
+    Generate code that finds the matching string of an ``among``.
+
+    Replaces sbl2py's linear search. If none of the strings has a
+    routine condition then the first match wins. Otherwise the routines
+    of the matching strings are tried in order, as in sbl2py.
+    """
+    index = among.among_index
+    if not _has_routines(among):
+        code = """
+a_%d = _find_among(s, _t_%d)
+r = a_%d is not None
+""" % (index, index, index)
+    else:
+        code = """
+a_%d = None
+r = False
+<v0> = s.cursor
+for <v1>, <v2>, <v3> in _find_among_all(s, _t_%d):
+    s.cursor = <v0> + len(<v1>) * s.direction
+    <v4> = s.cursor
+    r = (not <v2>) or getattr(self, <v2>)(s)
+    if r:
+        s.cursor = <v4>
+        a_%d = <v3>
+        break
+    s.cursor = <v0>
+""" % (index, index, index)
+    if getattr(env, 'profile', False):
+        if not _has_routines(among):
+            code = '<v0> = s.cursor\n' + code
+        code += """
+if r:
+    _record_among(%d, s, <v0>)
+""" % index
+    return env.transform_pseudo_code(code, [])
+
+
+def _find_among_node(node):
+    """
+    Find the ``among`` that belongs to a ``substring``.
+    """
+    current = node.next()
+    while not isinstance(current, sbl2py.ast.AmongNode):
+        current = current.next()
+    return current
+
+
+class _HashedSubstringNode(sbl2py.ast.SubstringNode):
+    """
+    ``substring`` command that uses an among table.
+    """
+    def generate_code(self, env):
+        among = _find_among_node(self)
+        among.among_index = env.claim_among_index()
+        return self.annotate(_generate_among_search(env, among))
+
+
+class _HashedAmongNode(sbl2py.ast.AmongNode):
+    """
+    ``among`` command that uses an among table.
+    """
+    def generate_var(self):
+        var = super(_HashedAmongNode, self).generate_var()
+        return var + '\n_t_%d = _make_among_table(_a_%d)' % (
+                self.among_index, self.among_index)
+
+    def generate_code(self, env):
+        blocks = []
+        if self.among_index is None:
+            self.among_index = env.claim_among_index()
+            blocks.append(_generate_among_search(env, self))
+        env.module_code.append(self.generate_var())
+        if self.common_cmd:
+            blocks.append(self.common_cmd.generate_code(env))
+        blocks.append(self.generate_if_chain(env))
+        return self.annotate(sbl2py.ast._make_if_chain(blocks))
+
+
+def _use_among_tables(program, env):
+    """
+    Make a program use hashed lookups for its ``among`` commands.
+    """
+    for node in _iter_nodes(program):
+        if type(node) is sbl2py.ast.SubstringNode:
+            node.__class__ = _HashedSubstringNode
+        elif type(node) is sbl2py.ast.AmongNode:
+            node.__class__ = _HashedAmongNode
+    env.module_code.append(_AMONG_RUNTIME)
+
+
+#
+# GROUPING SCANS
+#
+
+# Pseudo code for ``gopast``/``goto`` commands that scan for a single
+# grouping. The loop runs over the character indices only, instead of
+# moving the cursor and checking the limit for each character. If no
+# character matches then, as in sbl2py's loops, the cursor is moved to
+# the limit.
+_SCAN_CODE = """
+for <v> in xrange(%(start)s, %(stop)s, %(step)s):
+    if s.chars[<v>] %(test)s _g_%(name)s:
+        s.cursor = <v>%(offset)s
+        r = True
+        break
+else:
+    s.cursor = s.limit
+    r = False
+"""
+
+
+def _scanned_grouping(node):
+    """
+    Get the grouping scanned by a ``gopast`` or ``goto`` command.
+
+    Returns a tuple ``(name, negate)`` if the command's only argument
+    is a (negated) grouping reference and ``None`` otherwise.
+    """
+    if len(node) != 1:
+        return None
+    check = node[0]
+    if type(check) not in (sbl2py.ast.GroupingNode, sbl2py.ast.NonNode):
+        return None
+    if (len(check) != 1 or
+            not isinstance(check[0], sbl2py.ast.GroupingReferenceNode)):
+        return None
+    return check[0].name, type(check) is sbl2py.ast.NonNode
+
+
+class _GroupingScanMixin(object):
+    """
+    ``gopast``/``goto`` command that scans for a grouping.
+
+    Subclasses set ``past`` to true if the cursor is to be left behind
+    the matching character.
+    """
+    past = False
+
+    def generate_code(self, env):
+        name, negate = self.grouping
+        values = {
+            'name': name,
+            'test': 'not in' if negate else 'in',
+        }
+        if env.direction == 1:
+            values.update(start='s.cursor', stop='s.limit', step=1,
+                          offset=' + 1' if self.past else '')
+        else:
+            values.update(start='s.cursor - 1', stop='s.limit - 1', step=-1,
+                          offset='' if self.past else ' + 1')
+        code = env.transform_pseudo_code(_SCAN_CODE % values, [])
+        return self.annotate(code)
+
+
+class _GroupingGoPastNode(_GroupingScanMixin, sbl2py.ast.GoPastNode):
+    past = True
+
+
+class _GroupingGoToNode(_GroupingScanMixin, sbl2py.ast.GoToNode):
+    past = False
+
+
+class _FrozenGroupingDefinitionNode(sbl2py.ast.GroupingDefinitionNode):
+    """
+    Grouping definition that creates a frozenset.
+    """
+    def generate_code(self, env):
+        value = self[0].generate_code(env)
+        if value.startswith('set('):
+            value = 'frozen' + value
+        else:
+            value = 'frozenset(%s)' % value
+        env.module_code.append('_g_%s = %s' % (self.name, value))
+        return ''
+
+
+def _use_grouping_scans(program):
+    """
+    Make a program use frozensets and loops over indices for groupings.
+    """
+    for node in _iter_nodes(program):
+        if type(node) is sbl2py.ast.GroupingDefinitionNode:
+            node.__class__ = _FrozenGroupingDefinitionNode
+        elif type(node) in (sbl2py.ast.GoPastNode, sbl2py.ast.GoToNode):
+            grouping = _scanned_grouping(node)
+            if grouping is None:
+                continue
+            if type(node) is sbl2py.ast.GoPastNode:
+                node.__class__ = _GroupingGoPastNode
+            else:
+                node.__class__ = _GroupingGoToNode
+            node.grouping = grouping
+
+
+#
+# BUFFER RUNTIME
+#
+
+# Replacement for sbl2py's ``_String`` class. The text is kept in a
+# list of characters that is edited in place (as in sbl2py), but
+# ``starts_with`` and ``hop`` work on the cursor and limit indices
+# instead of copying the remaining text on every call.
+_BUFFER_STRING_CODE = """class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+"""
+
+# sbl2py's ``_String`` class, up to the next top-level statement
+_STRING_CLASS_RE = re.compile(r'^class _String\(object\):\n.*?(?=^\S)',
+                              re.MULTILINE | re.DOTALL)
+
+
+def _use_buffer_runtime(module_code):
+    """
+    Make generated Python code use the buffer runtime.
+
+    Replaces sbl2py's ``_String`` class. In addition, the routines get
+    the length of the text directly from the character list instead of
+    via ``_String.__len__``, which is called for almost every command in
+    backward mode.
+    """
+    module_code, n = _STRING_CLASS_RE.subn(
+            lambda m: _BUFFER_STRING_CODE, module_code, count=1)
+    if n != 1:
+        raise ValueError('Could not find the _String class')
+    head, sep, routines = module_code.partition('\nclass _Program(object):')
+    return head + sep + routines.replace('len(s)', 'len(s.chars)')
+
+
+#
+# PROFILING
+#
+
+# Runtime support for profiling builds. ``_profile_program`` wraps each
+# routine of the ``_Program`` class so that its calls, successes and
+# total and self time are recorded. The self time of a routine excludes
+# the time spent in the routines it calls. ``_record_among`` records a
+# hit of an ``among`` string in the currently running routine. The
+# profile is global and hence not thread-safe.
+_PROFILE_RUNTIME = """
+import collections
+import timeit
+
+_routine_profile = {}
+_among_profile = collections.Counter()
+_profile_stack = []
+
+def _profile_routine(name, method):
+    counters = _routine_profile.setdefault(name, [0, 0, 0.0, 0.0])
+    timer = timeit.default_timer
+    def wrapper(self, s):
+        counters[0] += 1
+        frame = [name, 0.0]
+        _profile_stack.append(frame)
+        start = timer()
+        try:
+            r = method(self, s)
+        finally:
+            elapsed = timer() - start
+            _profile_stack.pop()
+            if _profile_stack:
+                _profile_stack[-1][1] += elapsed
+        if r:
+            counters[1] += 1
+        counters[2] += elapsed
+        counters[3] += elapsed - frame[1]
+        return r
+    return wrapper
+
+def _profile_program(cls):
+    for attr in dir(cls):
+        if attr.startswith('r_'):
+            setattr(cls, attr, _profile_routine(attr[2:], getattr(cls, attr)))
+
+def _record_among(index, s, start):
+    routine = _profile_stack[-1][0] if _profile_stack else None
+    text = u''.join(s.chars[min(start, s.cursor):max(start, s.cursor)])
+    _among_profile[(routine, index, text)] += 1
+
+def get_profile():
+    routines = {}
+    for name, counters in _routine_profile.iteritems():
+        routines[name] = dict(zip(('calls', 'successes', 'total_time',
+                                   'self_time'), counters))
+    return {'routines': routines, 'amongs': dict(_among_profile)}
+
+def reset_profile():
+    for counters in _routine_profile.itervalues():
+        counters[:] = [0, 0, 0.0, 0.0]
+    _among_profile.clear()
+"""
+
+
+#
+# PREFILTERS
+#
+
+# A prefilter is a cheap check that proves that the stemming algorithm
+# returns a word unchanged. It is derived from the Snowball program by
+# an abstract interpretation of the ``stem`` routine, which computes
+# for each command the conditions on the word under which the command
+# fails, succeeds or at least does not modify the word.
+#
+# A condition is a disjunction of ``_Conjunction`` instances, each of
+# which requires that the word is not one of ``words``, that its last
+# character is not in ``last``, that it contains none of ``chars`` and,
+# if ``length`` is not None, that it is shorter than ``length``. All
+# conditions are sufficient but not necessary, and whenever a construct
+# is not understood the analysis assumes that it modifies the word.
+# Hence dropping alternatives from a disjunction is always safe.
+
+_Conjunction = collections.namedtuple('_Conjunction',
+                                      'words last chars length')
+
+_TRUE = (_Conjunction(frozenset(), frozenset(), frozenset(), None),)
+_FALSE = ()
+
+# Maximum number of alternatives in a condition
+_MAX_ALTERNATIVES = 4
+
+
+def _condition(words=(), last=(), chars=(), length=None):
+    return (_Conjunction(frozenset(words), frozenset(last),
+                         frozenset(chars), length),)
+
+
+def _implies(a, b):
+    """
+    Check if conjunction ``a`` implies conjunction ``b``.
+    """
+    return (a.words >= b.words and a.last >= b.last and
+            a.chars >= b.chars and (b.length is None or
+            (a.length is not None and a.length <= b.length)))
+
+
+def _cost(conjunction):
+    """
+    Rough measure of how restrictive a conjunction is.
+    """
+    cost = 10 * len(conjunction.chars) + len(conjunction.last)
+    if conjunction.length is not None:
+        cost += 100
+    return cost
+
+
+def _simplify(conjunctions):
+    """
+    Remove redundant and excess alternatives from a disjunction.
+    """
+    result = []
+    for a in sorted(set(conjunctions), key=_cost):
+        if not any(_implies(a, b) for b in result):
+            result.append(a)
+    return tuple(result[:_MAX_ALTERNATIVES])
+
+
+def _either(*conditions):
+    return _simplify(c for condition in conditions for c in condition)
+
+
+def _both(x, y):
+    conjunctions = []
+    for a in x:
+        for b in y:
+            if a.length is None or b.length is None:
+                length = b.length if a.length is None else a.length
+            else:
+                length = min(a.length, b.length)
+            conjunctions.append(_Conjunction(
+                    a.words | b.words, a.last | b.last, a.chars | b.chars,
+                    length))
+    return _simplify(conjunctions)
+
+
+# ``fails``: the command fails without modifying the word.
+# ``succeeds``: the command succeeds without modifying the word.
+# ``unchanged``: the command does not modify the word.
+# ``stays``: the cursor is not moved if the command succeeds.
+# ``restores``: condition under which the cursor is not moved if the
+# command succeeds (only needed if ``stays`` is false).
+_Effect = collections.namedtuple('_Effect',
+                                 'fails succeeds unchanged stays restores')
+_Effect.__new__.__defaults__ = ((),)
+
+_UNKNOWN = _Effect(_FALSE, _FALSE, _FALSE, False)
+_PURE_TRUE = _Effect(_FALSE, _TRUE, _TRUE, True)
+_PURE_TEST = _Effect(_FALSE, _FALSE, _TRUE, True)
+_PURE_MOVE = _Effect(_FALSE, _FALSE, _TRUE, False)
+
+
+def _combine(condition, effect, fallback):
+    """
+    Combine the effect of a command for a special case with the effect
+    for the general case.
+
+    ``effect`` is valid if ``condition`` holds, ``fallback`` is always
+    valid.
+    """
+    def select(a, b):
+        return _either(b, _both(condition, a))
+    return _Effect(select(effect.fails, fallback.fails),
+                   select(effect.succeeds, fallback.succeeds),
+                   select(effect.unchanged, fallback.unchanged),
+                   effect.stays and fallback.stays,
+                   select(effect.restores, fallback.restores))
+
+
+class _Context(collections.namedtuple('_Context',
+                                      'backward at_boundary exact')):
+    """
+    Position of the cursor when a command is run.
+
+    ``at_boundary`` means that the cursor is at the start of the word
+    (forward mode) or at its end (backward mode). ``exact`` means that
+    in addition the limits are the boundaries of the word.
+    """
+
+    def moved(self):
+        return _Context(self.backward, False, False)
+
+
+_PURE_TRUE_NODES = (
+    sbl2py.ast.SetLeftNode, sbl2py.ast.SetRightNode,
+    sbl2py.ast.ExportSliceNode, sbl2py.ast.SetMarkNode, sbl2py.ast.SetNode,
+    sbl2py.ast.UnsetNode, sbl2py.ast.TrueCommandNode,
+    sbl2py.ast.EmptyCommandNode, sbl2py.ast.IntegerAssignNode,
+    sbl2py.ast.IntegerIncrementByNode, sbl2py.ast.IntegerDecrementByNode,
+    sbl2py.ast.IntegerMultiplyByNode, sbl2py.ast.IntegerDivideByNode,
+)
+
+_PURE_TEST_NODES = (
+    sbl2py.ast.BooleanCommandNode, sbl2py.ast.AtMarkNode,
+    sbl2py.ast.AtLimitNode, sbl2py.ast.IntegerEqualNode,
+    sbl2py.ast.IntegerUnequalNode, sbl2py.ast.IntegerGreaterNode,
+    sbl2py.ast.IntegerLessNode, sbl2py.ast.IntegerGreaterOrEqualNode,
+    sbl2py.ast.IntegerLessOrEqualNode,
+)
+
+
+class _PrefilterAnalysis(object):
+    """
+    Derives a prefilter from a Snowball program.
+    """
+
+    def __init__(self, program):
+        self.routines = {}
+        self.groupings = {}
+        for node in program:
+            if isinstance(node, sbl2py.ast.BackwardModeNode):
+                for child in node:
+                    self._add_definition(child, True)
+            else:
+                self._add_definition(node, False)
+        # ``among`` commands that follow a ``substring``
+        self.substring_amongs = {}
+        for node in _iter_nodes(program):
+            if isinstance(node, sbl2py.ast.SubstringNode):
+                among = _find_among_node(node)
+                self.substring_amongs[id(node)] = among
+        self.dispatched = set(id(a) for a in self.substring_amongs.values())
+        # Conditions for the strings of an ``among`` not to match, as
+        # recorded by the preceding ``substring``
+        self.no_match = {}
+        self.memo = {}
+
+    def _add_definition(self, node, backward):
+        if isinstance(node, sbl2py.ast.RoutineDefinitionNode):
+            self.routines[node.name] = (node[0], backward)
+        elif isinstance(node, sbl2py.ast.GroupingDefinitionNode):
+            self.groupings[node.name] = node
+
+    def grouping_chars(self, name):
+        """
+        Get the characters of a grouping as a frozenset.
+        """
+        value = self.groupings[name]
+        if not isinstance(value, frozenset):
+            value = self.groupings[name] = frozenset(
+                    self._eval_chars(value[0]))
+        return value
+
+    def _eval_chars(self, node):
+        if isinstance(node, sbl2py.ast.CharSetNode):
+            return set(node.chars)
+        if isinstance(node, sbl2py.ast.GroupingReferenceNode):
+            return set(self.grouping_chars(node.name))
+        left = self._eval_chars(node[0])
+        right = self._eval_chars(node[1])
+        if isinstance(node, sbl2py.ast.SetUnionNode):
+            return left | right
+        return left - right
+
+    def prefilter(self, routine='stem'):
+        """
+        Get the condition under which a routine does not modify a word.
+        """
+        return self.call(routine, _Context(False, True, True)).unchanged
+
+    def call(self, name, ctx):
+        body, backward = self.routines[name]
+        if backward != ctx.backward:
+            ctx = _Context(backward, False, False)
+        key = (name, ctx)
+        try:
+            effect = self.memo[key]
+        except KeyError:
+            # Recursive calls are treated as unknown
+            self.memo[key] = _UNKNOWN
+            effect = self.memo[key] = self.analyze(body, ctx)
+        return effect
+
+    def analyze(self, node, ctx):
+        """
+        Compute the effect of a command.
+        """
+        ast = sbl2py.ast
+        if isinstance(node, ast.ConcatenationNode):
+            return self._sequence(node, ctx, False)
+        if isinstance(node, ast.AndNode):
+            return self._sequence(node, ctx, True)
+        if isinstance(node, ast.OrNode):
+            return self._alternatives(node, ctx)
+        if isinstance(node, _PURE_TRUE_NODES):
+            return _PURE_TRUE
+        if isinstance(node, _PURE_TEST_NODES):
+            return _PURE_TEST
+        if isinstance(node, ast.FalseCommandNode):
+            return _Effect(_TRUE, _FALSE, _TRUE, True)
+        if isinstance(node, (ast.ToMarkNode, ast.NonNode)):
+            return _PURE_MOVE
+        if isinstance(node, ast.ToLimitNode):
+            return _Effect(_FALSE, _TRUE, _TRUE, False)
+        if isinstance(node, (ast.HopNode, ast.NextNode)):
+            return self._hop(node)
+        if isinstance(node, ast.StartsWithNode):
+            return self._starts_with(node, ctx)
+        if isinstance(node, ast.GroupingNode):
+            chars = self.grouping_chars(node[0].name)
+            return _Effect(self._no_char(chars, ctx), _FALSE, _TRUE, False)
+        if isinstance(node, ast.SubstringNode):
+            return self._match(self.substring_amongs[id(node)], ctx)
+        if isinstance(node, ast.AmongNode):
+            return self._among(node, ctx)
+        if isinstance(node, ast.RoutineCallNode):
+            return self.call(node[0].name, ctx)
+        if isinstance(node, ast.BackwardsNode):
+            exact = ctx.exact and not ctx.backward
+            effect = self.analyze(node[0], _Context(
+                    not ctx.backward, exact, exact and ctx.at_boundary))
+            return effect._replace(stays=True)
+        if isinstance(node, ast.SetLimitNode):
+            return self._setlimit(node, ctx)
+        if isinstance(node, (ast.NotNode, ast.TestNode, ast.TryNode,
+                             ast.DoNode, ast.FailNode)):
+            return self._wrapped(node, self.analyze(node[0], ctx))
+        if isinstance(node, (ast.GoToNode, ast.GoPastNode, ast.RepeatNode)):
+            return self._loop(node, node[0], ctx)
+        if isinstance(node, (ast.LoopNode, ast.AtLeastNode)):
+            return self._loop(node, node[1], ctx)
+        # Commands that modify the word and unknown commands
+        return _UNKNOWN
+
+    def _no_char(self, chars, ctx):
+        """
+        Condition under which the character at the cursor is not in
+        ``chars``.
+        """
+        if ctx.backward and ctx.at_boundary:
+            return _condition(last=chars)
+        return _condition(chars=chars)
+
+    def _hop(self, node):
+        if isinstance(node, sbl2py.ast.NextNode):
+            n = 1
+        elif isinstance(node[0], sbl2py.ast.IntegerLiteralNode):
+            n = node[0].integer
+        else:
+            return _PURE_MOVE
+        if n <= 0:
+            return _Effect(_FALSE, _FALSE, _TRUE, True)
+        return _Effect(_condition(length=n), _FALSE, _TRUE, False)
+
+    def _starts_with(self, node, ctx):
+        if not isinstance(node[0], sbl2py.ast.StringLiteralNode):
+            return _PURE_MOVE
+        string = node[0].string
+        if not string:
+            return _PURE_TRUE
+        char = string[-1] if ctx.backward else string[0]
+        return _Effect(self._no_char([char], ctx), _FALSE, _TRUE, False)
+
+    def _string_no_match(self, string, ctx):
+        """
+        Condition under which an ``among`` string does not match.
+        """
+        if not string:
+            return _FALSE
+        return self._no_char([string[-1] if ctx.backward else string[0]],
+                             ctx)
+
+    def _match(self, among, ctx):
+        """
+        Effect of finding the matching string of an ``among``.
+        """
+        fails = _TRUE
+        unchanged = _TRUE
+        no_match = {}
+        for string, routine, index in among.strings:
+            condition = self._string_no_match(string, ctx)
+            fails = _both(fails, condition)
+            no_match[index] = _both(no_match.get(index, _TRUE), condition)
+            if routine:
+                # Called after the string has matched
+                effect = self.call(routine, ctx.moved())
+                unchanged = _both(unchanged, _either(condition,
+                                                     effect.unchanged))
+        self.no_match[id(among)] = no_match
+        return _Effect(fails, _FALSE, _either(fails, unchanged), False)
+
+    def _among(self, node, ctx):
+        if id(node) in self.dispatched:
+            match = None
+        else:
+            match = self._match(node, ctx)
+        no_match = self.no_match.get(id(node))
+        if no_match is None:
+            self._match(node, ctx.moved())
+            no_match = self.no_match[id(node)]
+        moved = ctx.moved()
+        succeeds = unchanged = _TRUE
+        if node.common_cmd:
+            effect = self.analyze(node.common_cmd, moved)
+            succeeds, unchanged = effect.succeeds, effect.unchanged
+        for index, command in enumerate(node.commands):
+            if command:
+                effect = self.analyze(command, moved)
+            else:
+                effect = _PURE_TRUE
+            condition = no_match.get(index, _TRUE)
+            succeeds = _both(succeeds, _either(condition, effect.succeeds))
+            unchanged = _both(unchanged, _either(condition, effect.unchanged))
+        if match is None:
+            return _Effect(_FALSE, succeeds, unchanged, False)
+        return _Effect(match.fails, _FALSE,
+                       _either(match.fails, _both(match.unchanged, unchanged)),
+                       False)
+
+    def _sequence(self, commands, ctx, restore):
+        """
+        Effect of a concatenation (or of ``and`` if ``restore`` is true).
+        """
+        fails = _FALSE
+        succeeds = _TRUE
+        unchanged = _TRUE
+        stays = True
+        words = None
+        # Condition under which the cursor has not been moved
+        here = _TRUE
+        for command in commands:
+            sub_ctx = ctx if (restore or stays) else ctx.moved()
+            if words is not None and isinstance(command,
+                                                sbl2py.ast.AtLimitNode):
+                # A string matched at one boundary ends at the other one,
+                # so it is the whole word.
+                effect = _Effect(_condition(words=words), _FALSE, _TRUE,
+                                 True)
+            else:
+                effect = self.analyze(command, sub_ctx)
+                if sub_ctx != ctx and here:
+                    effect = _combine(here, self.analyze(command, ctx),
+                                      effect)
+            if (not restore and sub_ctx.exact and sub_ctx.at_boundary and
+                    isinstance(command, (sbl2py.ast.SubstringNode,
+                                         sbl2py.ast.AmongNode)) and
+                    id(command) not in self.dispatched):
+                among = (self.substring_amongs[id(command)]
+                         if isinstance(command, sbl2py.ast.SubstringNode)
+                         else command)
+                words = [string for string, routine, index in among.strings]
+            elif not isinstance(command, (sbl2py.ast.SetLeftNode,
+                                          sbl2py.ast.SetRightNode)):
+                words = None
+            fails = _either(fails, _both(unchanged, effect.fails))
+            succeeds = _both(succeeds, effect.succeeds)
+            unchanged = _both(unchanged, effect.unchanged)
+            if not (restore or effect.stays):
+                here = _both(here, effect.restores)
+            stays = effect.stays if restore else (stays and effect.stays)
+        return _Effect(fails, succeeds, _either(unchanged, fails), stays,
+                       here)
+
+    def _alternatives(self, commands, ctx):
+        """
+        Effect of an ``or``.
+        """
+        fails = _TRUE
+        succeeds = _FALSE
+        unchanged = _TRUE
+        stays = True
+        for command in commands:
+            effect = self.analyze(command, ctx)
+            succeeds = _either(succeeds, _both(unchanged, effect.succeeds))
+            fails = _both(fails, effect.fails)
+            unchanged = _both(unchanged, effect.unchanged)
+            stays = stays and effect.stays
+        return _Effect(fails, succeeds, _either(unchanged, succeeds, fails),
+                       stays)
+
+    def _setlimit(self, node, ctx):
+        """
+        Effect of ``setlimit``.
+        """
+        first = self.analyze(node[0], ctx)
+        second = self.analyze(node[1], _Context(ctx.backward,
+                                                ctx.at_boundary, False))
+        fails = _either(first.fails, _both(first.unchanged, second.fails))
+        succeeds = _both(first.unchanged, second.succeeds)
+        unchanged = _either(first.fails, _both(first.unchanged,
+                                               second.unchanged))
+        return _Effect(fails, succeeds, unchanged, second.stays)
+
+    def _wrapped(self, node, effect):
+        """
+        Effect of ``not``, ``test``, ``try``, ``do`` and ``fail``.
+        """
+        ast = sbl2py.ast
+        if isinstance(node, ast.NotNode):
+            return _Effect(effect.succeeds, effect.fails, effect.unchanged,
+                           True)
+        if isinstance(node, ast.TestNode):
+            return effect._replace(stays=True)
+        if isinstance(node, ast.TryNode):
+            return _Effect(_FALSE, effect.unchanged, effect.unchanged,
+                           effect.stays, _either(effect.fails,
+                                                 effect.restores))
+        if isinstance(node, ast.DoNode):
+            return _Effect(_FALSE, effect.unchanged, effect.unchanged, True)
+        return _Effect(effect.unchanged, _FALSE, effect.unchanged, True)
+
+    def _loop(self, node, command, ctx):
+        """
+        Effect of commands that run another command repeatedly.
+        """
+        first = self.analyze(command, ctx)
+        later = self.analyze(command, ctx.moved())
+        unchanged = _both(first.unchanged, later.unchanged)
+        if isinstance(node, (sbl2py.ast.GoToNode, sbl2py.ast.GoPastNode)):
+            return _Effect(_both(first.fails, later.fails), _FALSE,
+                           unchanged, False)
+        unchanged = _either(first.fails, unchanged)
+        if isinstance(node, sbl2py.ast.RepeatNode):
+            return _Effect(_FALSE, unchanged, unchanged, False)
+        return _Effect(_FALSE, _FALSE, unchanged, False)
+
+
+def _generate_prefilter(condition):
+    """
+    Generate the code of the ``unchanged`` function for a condition.
+    """
+    code = []
+    if not condition:
+        return ''
+    alternatives = []
+    for i, conjunction in enumerate(condition):
+        parts = []
+        if conjunction.length is not None:
+            parts.append('len(word) < %d' % conjunction.length)
+        if conjunction.last:
+            code.append('_u_last_%d = frozenset(%r)' % (
+                        i, sorted(conjunction.last)))
+            parts.append('word[-1:] not in _u_last_%d' % i)
+        if conjunction.chars:
+            code.append('_u_chars_%d = frozenset(%r)' % (
+                        i, sorted(conjunction.chars)))
+            parts.append('_u_chars_%d.isdisjoint(word)' % i)
+        if conjunction.words:
+            code.append('_u_words_%d = frozenset(%r)' % (
+                        i, sorted(conjunction.words)))
+            parts.append('word not in _u_words_%d' % i)
+        alternatives.append('(%s)' % ' and '.join(parts or ['True']))
+    code.append(_PREFILTER_CODE % ' or\n            '.join(alternatives))
+    return '\n'.join(code)
+
+
+_PREFILTER_CODE = '''
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return (%s)
+'''
+
+
+def _use_prefilter(program):
+    """
+    Generate the prefilter of a program.
+
+    Returns the code of the ``unchanged`` function, or an empty string
+    if no words can be proven to be left unchanged.
+    """
+    condition = _PrefilterAnalysis(program).prefilter()
+    # Alternatives that only accept the empty word are not worth a check
+    condition = tuple(c for c in condition
+                      if c.length is None or c.length > 1)
+    return _generate_prefilter(condition)
+
+
+#
+# CODE GENERATION
+#
+
+def _iter_nodes(node):
+    """
+    Iterate over all nodes of an sbl2py AST, in depth-first order.
+    """
+    yield node
+    children = list(node)
+    if isinstance(node, sbl2py.ast.AmongNode):
+        # The commands of an ``among`` are not among its children
+        children.extend(cmd for cmd in node.commands if cmd)
+        if node.common_cmd:
+            children.append(node.common_cmd)
+    for child in children:
+        for descendant in _iter_nodes(child):
+            yield descendant
+
+
+def translate(code, among_tables=True, grouping_scans=True,
+              buffer_runtime=True, profile=False, prefilter=True):
+    """
+    Translate Snowball code to Python.
+
+    ``code`` is a string containing Snowball code. If ``among_tables``
+    is true then ``among`` commands use hashed lookups. If
+    ``grouping_scans`` is true then groupings are frozensets and
+    ``gopast``/``goto`` commands for single groupings are compiled into
+    loops over the character indices. If ``buffer_runtime`` is true
+    then the generated code uses a runtime that avoids copying the
+    text. If ``prefilter`` is true then the module gets an ``unchanged``
+    function which checks cheaply whether a word is certainly returned
+    unchanged by ``stem``.
+
+    If ``profile`` is true then an instrumented module is generated
+    which records calls, successes and time for each routine and, if
+    ``among_tables`` is true, hits for each ``among`` string. The
+    profile can be retrieved via the module's ``get_profile`` function
+    and cleared via ``reset_profile``.
+
+    Returns the Python code as a string.
+    """
+    program = sbl2py.grammar.parse_string(code)
+    if prefilter:
+        # Analyze the program before it is modified by the optimizations
+        prefilter_code = _use_prefilter(program)
+    env = sbl2py.ast.Environment()
+    if profile:
+        env.profile = True
+        env.module_code.append(_PROFILE_RUNTIME)
+    if among_tables:
+        _use_among_tables(program, env)
+    if grouping_scans:
+        _use_grouping_scans(program)
+    module_code = program.generate_code(env)
+    if buffer_runtime:
+        module_code = _use_buffer_runtime(module_code)
+    if profile:
+        module_code += '\n_profile_program(_Program)\n'
+    if prefilter and prefilter_code:
+        module_code += '\n' + prefilter_code
+    return module_code
+
+
+def make_algorithm(filename, output_dir=_algorithms_dir, **kwargs):
     """
     Create Python algorithm module from Snowball source file.
+
+    The module is written to ``output_dir``. See ``translate`` for the
+    keyword arguments.
     """
     base = os.path.splitext(os.path.basename(filename))[0]
-    module_filename = os.path.join(_algorithms_dir, base + '.py')
+    module_filename = os.path.join(output_dir, base + '.py')
     with codecs.open(filename, 'r', 'utf8') as f:
-        with codecs.open(module_filename, 'w', 'utf8') as g:
-            g.write(sbl2py.translate_file(f))
+        code = translate(f.read(), **kwargs)
+    with codecs.open(module_filename, 'w', 'utf8') as g:
+        g.write(code)
 
 def find_snowball_sources():
     """
@@ -55,13 +1135,59 @@ def find_snowball_sources():
     return sorted(glob.glob(os.path.join(_snowball_dir, '*.sbl')))
 
 
+def find_snowball_source(algorithm):
+    """
+    Find the Snowball source file of an algorithm.
+
+    ``algorithm`` is the name or an alias of the algorithm.
+
+    Raises ``ValueError`` if there is no such algorithm.
+    """
+    for filename in find_snowball_sources():
+        names = os.path.splitext(os.path.basename(filename))[0].split('_')
+        if algorithm in names:
+            return filename
+    raise ValueError("Unknown algorithm '%s'" % algorithm)
+
+
 def main():
     """
-    Create Python algorith modules for all Snowball source files.
+    Create Python algorith modules for Snowball source files.
     """
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('algorithms', nargs='*', metavar='ALGORITHM',
+                        help='Algorithms to convert, by name or alias ' +
+                        '(default: all)')
+    parser.add_argument('--output', default=_algorithms_dir, metavar='DIR',
+                        help='Output directory (default: %(default)s)')
+    parser.add_argument('--no-among-tables', dest='among_tables',
+                        action='store_false',
+                        help='Use linear search for among commands')
+    parser.add_argument('--no-grouping-scans', dest='grouping_scans',
+                        action='store_false',
+                        help='Use character loops for gopast and goto')
+    parser.add_argument('--no-buffer-runtime', dest='buffer_runtime',
+                        action='store_false',
+                        help="Use sbl2py's runtime, which copies the text")
+    parser.add_argument('--no-prefilter', dest='prefilter',
+                        action='store_false',
+                        help='Do not generate prefilters for unchanged words')
+    parser.add_argument('--profile', action='store_true',
+                        help='Generate instrumented modules for profiling ' +
+                        '(see profile_algorithm.py)')
+    args = parser.parse_args()
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
     for filename in find_snowball_sources():
+        names = os.path.splitext(os.path.basename(filename))[0].split('_')
+        if args.algorithms and not set(names).intersection(args.algorithms):
+            continue
         print filename
-        make_algorithm(filename)
+        make_algorithm(filename, args.output, among_tables=args.among_tables,
+                       grouping_scans=args.grouping_scans,
+                       buffer_runtime=args.buffer_runtime,
+                       profile=args.profile, prefilter=args.prefilter)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Script to profile the routines of a stemming algorithm.
+
+An instrumented version of the algorithm is generated via
+``convert_algorithms.py`` and used to stem a list of words (by default
+the algorithm's test data). The routines are ranked by the time spent
+in them, excluding the routines they call, and the most frequently hit
+``among`` strings are listed.
+
+The algorithm modules in ``purestemmer/algorithms`` are not modified.
+
+Run ``profile_algorithm.py --help`` for usage information.
+"""
+
+import argparse
+import codecs
+import imp
+import itertools
+import os.path
+import shutil
+import tempfile
+
+import convert_algorithms
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_test_dir = os.path.join(_module_dir, 'test')
+
+
+def load_profiled_algorithm(algorithm, **kwargs):
+    """
+    Generate and load the instrumented module of an algorithm.
+
+    ``algorithm`` is the name or an alias of the algorithm. Keyword
+    arguments are passed on to ``convert_algorithms.translate``.
+    """
+    filename = convert_algorithms.find_snowball_source(algorithm)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        convert_algorithms.make_algorithm(filename, temp_dir, profile=True,
+                                          **kwargs)
+        base = os.path.splitext(os.path.basename(filename))[0]
+        return imp.load_source('_profiled_' + base,
+                               os.path.join(temp_dir, base + '.py'))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def profile(module, words):
+    """
+    Stem words using an instrumented algorithm module.
+
+    Returns the profile, see the ``get_profile`` function of the module.
+    """
+    module.reset_profile()
+    for word in words:
+        module.stem(word)
+    return module.get_profile()
+
+
+def print_routine_table(routines):
+    """
+    Print the routines of a profile, ranked by self time.
+    """
+    total = sum(r['self_time'] for r in routines.itervalues()) or 1.0
+    delim = ('+--------------------------------+-----------+---------+' +
+             '-----------+-----------+--------+')
+    line_format = '| %-30s | %9d | %6.1f%% | %9.3f | %9.3f | %5.1f%% |'
+    print delim
+    print ('| Routine                        | Calls     | Success | ' +
+           'Self [s]  | Total [s] | Share  |')
+    print delim.replace('-', '=')
+    ranked = sorted(routines.iteritems(), key=lambda x: -x[1]['self_time'])
+    for name, r in ranked:
+        if not r['calls']:
+            continue
+        success = 100.0 * r['successes'] / r['calls']
+        print line_format % (name, r['calls'], success, r['self_time'],
+                             r['total_time'], 100 * r['self_time'] / total)
+    print delim
+
+
+def print_among_table(amongs, limit=20):
+    """
+    Print the most frequently hit ``among`` strings of a profile.
+    """
+    delim = ('+--------------------------------+-------+' +
+             '----------------------+-----------+')
+    line_format = u'| %-30s | %5d | %-20s | %9d |'
+    print delim
+    print ('| Routine                        | Among | String               ' +
+           '| Hits      |')
+    print delim.replace('-', '=')
+    ranked = sorted(amongs.iteritems(), key=lambda x: -x[1])
+    for (routine, index, string), hits in itertools.islice(ranked, limit):
+        line = line_format % (routine, index, string, hits)
+        print line.encode('utf8')
+    print delim
+
+
+def main():
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('algorithm', help='Name or alias of the algorithm')
+    parser.add_argument('--words', metavar='FILE', help='UTF-8 encoded ' +
+                        'file with one word per line (default: the test ' +
+                        'data of the algorithm)')
+    parser.add_argument('--limit', type=int, help='Maximum number of ' +
+                        'words to stem (default: all)')
+    parser.add_argument('--top', type=int, default=20, help='Number of ' +
+                        'among strings to list (default: %(default)s)')
+    args = parser.parse_args()
+    filename = convert_algorithms.find_snowball_source(args.algorithm)
+    name = os.path.basename(filename).split('_')[0].split('.')[0]
+    words_file = args.words or os.path.join(_test_dir, name + '.txt')
+    with codecs.open(words_file, 'r', 'utf8') as f:
+        words = f.read().splitlines()[:args.limit]
+    module = load_profiled_algorithm(args.algorithm)
+    result = profile(module, words)
+    print 'Profile of %s for %d words from %s' % (name, len(words),
+                                                 words_file)
+    print
+    print_routine_table(result['routines'])
+    print
+    print_among_table(result['amongs'], args.top)
+
+
+if __name__ == '__main__':
+    main()
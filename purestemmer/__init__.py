@@ -37,23 +37,30 @@ you cannot use a C extension.
 # compatibility.
 
 
-import collections
+import array
 import glob
 import importlib
+import itertools
 import os.path
 
+from purestemmer.cache import make_cache
+from purestemmer.dictionary import StemDictionary
+from purestemmer.stats import StemmerStats, timer
+from purestemmer.text import get_tokenizer
 
-__all__ = ['algorithms', 'Stemmer']
+
+__all__ = ['algorithms', 'preload', 'Stemmer']
 __version__ = '0.1.1'
 __docformat__ = 'restructuredtext en'
 
 
-def _load_algorithms():
+def _find_algorithms():
     """
-    Load all algorithm modules.
+    Find all algorithm modules without importing them.
 
-    Returns a dictionary that maps algorithm names to stemmer modules
-    and a dictionary that maps aliases to algorithm names.
+    Returns a dictionary that maps algorithm names to the names of the
+    corresponding stemmer modules and a dictionary that maps aliases to
+    algorithm names.
     """
     module_dir = os.path.abspath(os.path.dirname(__file__))
     algorithms_dir = os.path.join(module_dir, 'algorithms')
@@ -65,90 +72,70 @@ def _load_algorithms():
         if name.startswith('__'):
             continue
         parts = name.split('_')
-        module_name = 'purestemmer.algorithms.' + name
-        algorithms[unicode(parts[0])] = importlib.import_module(module_name)
+        algorithms[unicode(parts[0])] = 'purestemmer.algorithms.' + name
         for part in parts[1:]:
             aliases[unicode(part)] = parts[0]
     return algorithms, aliases
 
-_algorithms, _aliases = _load_algorithms()
-
-
-class _Cache(collections.MutableMapping):
-    """
-    Cache with limited size.
-
-    This cache works like a normal dict, but keeps only a limited number of
-    entries. If the limit is reached then a fraction of the oldest entries
-    is discarded. This purging is done automatically if necessary whenever
-    an entry is stored.
-    """
-
-    def __init__(self, max_size=10000, keep_ratio=0.75):
-        """
-        Constructor.
+_algorithms, _aliases = _find_algorithms()
 
-        ``max_size`` is the maximum number of entries. Can also be set via the
-        property of the same name.
+# The algorithm package must be imported before the ``algorithms``
+# function is defined below. Otherwise importing the first algorithm
+# module would replace that function with the package.
+importlib.import_module('purestemmer.algorithms')
 
-        ``keep_ratio`` is the ratio of items that is kept when old items are
-        purged. For example, if ``max_size = 100`` and ``keep_ratio = 0.25``
-        then the 25 newest entries are kept when the cache is purged. Can also
-        be set via the property of the same name.
-        """
-        self._cache = {}
-        self._counter = 0
-        self._max_size = max_size
-        self.keep_ratio = keep_ratio
+# Algorithm modules that have already been imported, by algorithm name
+_modules = {}
 
-    def __getitem__(self, key):
-        entry = self._cache[key]
-        entry[1] = self._counter
-        self._counter += 1
-        return entry[0]
 
-    def __setitem__(self, key, value):
-        self._cache[key] = [value, self._counter]
-        self._counter += 1
-        self._purge()
+def _resolve_algorithm(algorithm):
+    """
+    Resolve an algorithm name or alias to the algorithm name.
 
-    def __delitem__(self, key):
-        del self._cache[key]
+    Raises ``KeyError`` if the algorithm is unknown.
+    """
+    if algorithm in _algorithms:
+        return algorithm
+    try:
+        return _aliases[algorithm]
+    except KeyError:
+        # Would prefer ``ValueError``, but pystemmer uses ``KeyError``.
+        raise KeyError("Stemming algorithm '%s' not found" % algorithm)
 
-    def __iter__(self):
-        return iter(self._cache)
 
-    def __len__(self):
-        return len(self._cache)
+def _load_algorithm(algorithm):
+    """
+    Get the module of an algorithm, importing it if necessary.
 
-    @property
-    def max_size(self):
-        return self._max_size
-
-    @max_size.setter
-    def max_size(self, value):
-        self._max_size = value
-        if self._max_size == 0:
-            self._cache = {}
-            self._counter = 0
-        else:
-            self._purge()
+    ``algorithm`` is an algorithm name or alias.
+    """
+    name = _resolve_algorithm(algorithm)
+    try:
+        return _modules[name]
+    except KeyError:
+        # ``import_module`` is protected by the import lock, so there is
+        # no harm if two threads get here at the same time.
+        module = importlib.import_module(_algorithms[name])
+        _modules[name] = module
+        return module
+
+
+def preload(names=None):
+    """
+    Import the modules of stemming algorithms in advance.
 
-    def _purge(self):
-        """
-        Make sure that the cache size is below its limit.
+    Algorithm modules are normally imported when the first ``Stemmer``
+    for them is created. Long-running processes can use this function
+    to pay that price up front, for example in a server before it forks
+    its worker processes.
 
-        If the cache is larger than the limit then old items are purged. Only
-        the ``keep_ratio * max_size`` latest entries are kept.
-        """
-        if len(self._cache) <= self._max_size:
-            return
-        new_cache = {}
-        limit = self._counter - self.keep_ratio * self._max_size
-        for key, value in self._cache.iteritems():
-            if value[1] > limit:
-                new_cache[key] = value
-        self._cache = new_cache
+    ``names`` is an iterable of algorithm names and/or aliases. If it is
+    not given then all available algorithms are loaded.
+    """
+    if names is None:
+        names = _algorithms.keys()
+    for name in names:
+        _load_algorithm(name)
 
 
 def version():
@@ -186,6 +173,53 @@ def algorithms(aliases=False):
     return sorted(_algorithms.keys())
 
 
+def _decode_all(words):
+    """
+    Decode a list of UTF-8 encoded ``str`` instances.
+
+    The words are joined and decoded with a single call, which is much
+    faster than decoding them one by one. The latter is only necessary
+    if a word contains a newline.
+    """
+    data = '\n'.join(words)
+    if data.count('\n') == len(words) - 1:
+        return data.decode('utf8').split(u'\n')
+    return [word.decode('utf8') for word in words]
+
+
+def _encode_all(texts):
+    """
+    UTF-8 encode a list of ``unicode`` instances.
+
+    See ``_decode_all``.
+    """
+    text = u'\n'.join(texts)
+    if text.count(u'\n') == len(texts) - 1:
+        return text.encode('utf8').split('\n')
+    return [text.encode('utf8') for text in texts]
+
+
+def _factorize(results, ids):
+    """
+    Create the factorized output of ``Stemmer.stemWords``.
+
+    ``results`` is a list of the stems of the distinct words and ``ids``
+    contains the index of each word in ``results``.
+    """
+    unicode_ids = {}
+    str_ids = {}
+    table = []
+    stem_ids = []
+    for stem in results:
+        known = unicode_ids if isinstance(stem, unicode) else str_ids
+        index = known.get(stem)
+        if index is None:
+            index = known[stem] = len(table)
+            table.append(stem)
+        stem_ids.append(index)
+    return array.array('i', [stem_ids[index] for index in ids]), table
+
+
 class Stemmer(object):
     """
     An instance of a stemming algorithm.
@@ -198,32 +232,81 @@ class Stemmer(object):
     language codes.
 
     A second optional argument to the constructor for ``Stemmer`` is the size
-    of cache to use. The cache implemented in this module is not terribly
-    efficient, but benchmarks show that it approximately doubles
+    of cache to use. Benchmarks show that the cache approximately doubles
     performance for typical text processing operations, without too much
     memory overhead. The cache may be disabled by passing a size of 0.
     The default size (10000 words) is probably appropriate in most
     situations. In pathological cases (for example, when no word is
     presented to the stemming algorithm more than once, so the cache is
-    useless), the cache can severely damage performance.
+    useless), the cache can severely damage performance. ``str`` and
+    ``unicode`` words are cached separately, each in a cache of that
+    size, so that cached ``str`` words need not be decoded.
+
+    The third optional argument is the eviction policy of the cache (see
+    ``purestemmer.cache.policies``). The default, ``'lru'``, discards the
+    least recently used word. ``'2q'`` is scan-resistant: words that are
+    only seen once cannot flush frequently used words from the cache.
+
+    The fourth optional argument is a stem dictionary (see
+    ``purestemmer.dictionary``), either as a filename or as a
+    ``StemDictionary`` instance. Words that are not in the cache are
+    looked up in the dictionary before the stemming algorithm is used.
+    Words found in the dictionary are not added to the cache. A
+    ``ValueError`` is raised if the dictionary was created for a
+    different algorithm or by a different version of purestemmer.
+
+    The fifth optional argument is the number of cache shards. If many
+    threads share a ``Stemmer`` then a cache that is split into several
+    independently locked shards (see ``purestemmer.cache.ShardedCache``)
+    reduces lock contention. By default the cache is not split. A cache
+    that is enabled must have at least one entry per shard.
+
+    The sixth optional argument, ``minCacheSize``, makes the cache adapt
+    to the input (see ``purestemmer.cache.AdaptiveCache``): its size then
+    varies between ``minCacheSize`` and ``maxCacheSize`` depending on the
+    observed hit rate, and it is bypassed while hardly any words repeat.
+    This is useful if the input switches between repetitive text and
+    mostly unique words.
+
+    Words that are not in the cache are first checked by the
+    algorithm's prefilter, which recognizes many words that the
+    algorithm would return unchanged. Such words are returned as they
+    are, without consulting the dictionary or the algorithm, and are
+    not added to the cache.
+
+    Statistics about the cache and the stemming algorithm can be
+    collected via ``enableStats``. They are disabled by default.
+
+    Besides lists of words, a ``Stemmer`` can stem whole texts, see
+    ``stemText`` and ``stemDocuments``.
     """
 
-    def __init__(self, algorithm, maxCacheSize=10000):
+    def __init__(self, algorithm, maxCacheSize=10000, cachePolicy='lru',
+                 dictionary=None, cacheShards=1, minCacheSize=None):
         """
         Initialise a stemmer.
 
         See the class documentation for details.
         """
-        try:
-            self._module = _algorithms[algorithm]
-        except KeyError:
-            # Maybe an alias?
-            try:
-                self._module = _algorithms[_aliases[algorithm]]
-            except KeyError:
-                # Would prefer ``ValueError``, but pystemmer uses ``KeyError``.
-                raise KeyError("Stemming algorithm '%s' not found" % algorithm)
-        self._cache = _Cache(maxCacheSize)
+        self._algorithm = _resolve_algorithm(algorithm)
+        self._module = _load_algorithm(algorithm)
+        # Cheap check for words that the algorithm returns unchanged, see
+        # ``convert_algorithms.py``. Not all algorithms have one.
+        self._unchanged = getattr(self._module, 'unchanged', None)
+        self._cache = make_cache(cachePolicy, maxCacheSize, cacheShards,
+                                 minCacheSize)
+        self._bytes_cache = make_cache(cachePolicy, maxCacheSize, cacheShards,
+                                       minCacheSize)
+        if isinstance(dictionary, basestring):
+            dictionary = StemDictionary(dictionary)
+        if dictionary is not None and not dictionary.is_current(algorithm):
+            raise ValueError(('Stem dictionary for %s (purestemmer %s) ' +
+                              'cannot be used for %s (purestemmer %s)') % (
+                              dictionary.algorithm, dictionary.version,
+                              self._algorithm, __version__))
+        self._dictionary = dictionary
+        self._stats = None
+        self._tokenize = get_tokenizer(self._algorithm)
 
     @property
     def maxCacheSize(self):
@@ -232,6 +315,7 @@ class Stemmer(object):
     @maxCacheSize.setter
     def maxCacheSize(self, value):
         self._cache.max_size = value
+        self._bytes_cache.max_size = value
 
     def stemWord(self, word):
         """
@@ -243,20 +327,200 @@ class Stemmer(object):
         they are encoded via UTF8.
         """
         if isinstance(word, unicode):
-            was_unicode = True
+            cache = self._cache
+            text = word
         else:
-            word = word.decode('utf8')
-            was_unicode = False
+            # ``str`` words have their own cache, so that a cache hit
+            # requires neither decoding the word nor encoding the stem.
+            cache = self._bytes_cache
+            text = None
         try:
-            stem = self._cache[word]
+            return cache[word]
         except KeyError:
-            stem = self._module.stem(word)
-            self._cache[word] = stem
-        if not was_unicode:
+            pass
+        if text is None:
+            text = word.decode('utf8')
+        if self._unchanged is not None and self._unchanged(text):
+            return word
+        stem = None
+        if self._dictionary is not None:
+            stem = self._dictionary.get(text)
+        if stem is None:
+            stem = self._module.stem(text)
+            if text is not word:
+                stem = stem.encode('utf8')
+            cache[word] = stem
+        elif text is not word:
             stem = stem.encode('utf8')
         return stem
 
-    def stemWords(self, words):
+    def _stemWordWithStats(self, word):
+        """
+        Version of ``stemWord`` that records statistics.
+
+        Replaces ``stemWord`` while statistics are enabled, so that the
+        normal version does not have to check whether they are.
+        """
+        if isinstance(word, unicode):
+            cache = self._cache
+            text = word
+        else:
+            cache = self._bytes_cache
+            text = None
+        hits = dictionary_hits = misses = prefiltered = 0
+        stem_time = 0.0
+        try:
+            stem = cache[word]
+            hits = 1
+        except KeyError:
+            if text is None:
+                text = word.decode('utf8')
+            if self._unchanged is not None and self._unchanged(text):
+                stem = word
+                prefiltered = 1
+            else:
+                stem = None
+                if self._dictionary is not None:
+                    stem = self._dictionary.get(text)
+                if stem is None:
+                    start = timer()
+                    stem = self._module.stem(text)
+                    stem_time = timer() - start
+                    misses = 1
+                    if text is not word:
+                        stem = stem.encode('utf8')
+                    cache[word] = stem
+                else:
+                    dictionary_hits = 1
+                    if text is not word:
+                        stem = stem.encode('utf8')
+        self._stats.record_lookups([word], hits, dictionary_hits, misses,
+                                   stem_time, prefiltered)
+        return stem
+
+    def enableStats(self, callback=None, interval=10000):
+        """
+        Start collecting statistics.
+
+        If ``callback`` is given then it is called with the current
+        statistics (see ``getStats``) each time another ``interval``
+        words have been looked up.
+
+        Statistics that have already been collected are discarded.
+        """
+        self._stats = StemmerStats(callback, interval)
+        self._cache.stats = self._stats
+        self._bytes_cache.stats = self._stats
+        self.stemWord = self._stemWordWithStats
+
+    def disableStats(self):
+        """
+        Stop collecting statistics.
+        """
+        self._stats = None
+        self._cache.stats = None
+        self._bytes_cache.stats = None
+        self.__dict__.pop('stemWord', None)
+
+    def getStats(self):
+        """
+        Get the statistics collected since they were enabled or reset.
+
+        Returns ``None`` if statistics are disabled. Otherwise the
+        return value is a dict, see
+        ``purestemmer.stats.StemmerStats.snapshot`` for its contents.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+    def resetStats(self):
+        """
+        Reset the collected statistics.
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def _stem_many(self, words, encoded=False):
+        """
+        Stem a list of distinct words.
+
+        ``words`` is a list of ``unicode`` instances or, if ``encoded``
+        is true, of UTF-8 encoded ``str`` instances. In the latter case
+        the cache for ``str`` words is used and only the words that are
+        not in it are decoded, all at once.
+
+        The cache is only accessed once for all words, and each word is
+        stemmed at most once. Words that pass the prefilter are mapped to
+        themselves.
+
+        Returns a dict that maps the words to their stems, which have the
+        same type as the words.
+        """
+        stats = self._stats
+        cache = self._bytes_cache if encoded else self._cache
+        stems = cache.get_many(words)
+        hits = len(stems)
+        num_found = num_missing = num_prefiltered = 0
+        stem_time = 0.0
+        if hits < len(words):
+            uncached = [word for word in words if word not in stems]
+            texts = _decode_all(uncached) if encoded else uncached
+            dictionary = self._dictionary
+            unchanged = self._unchanged
+            found = []
+            found_stems = []
+            missing = []
+            missing_texts = []
+            for word, text in itertools.izip(uncached, texts):
+                if unchanged is not None and unchanged(text):
+                    stems[word] = word
+                    num_prefiltered += 1
+                    continue
+                result = None
+                if dictionary is not None:
+                    result = dictionary.get(text)
+                if result is None:
+                    missing.append(word)
+                    missing_texts.append(text)
+                else:
+                    found.append(word)
+                    found_stems.append(result)
+            if found:
+                if encoded:
+                    found_stems = _encode_all(found_stems)
+                stems.update(itertools.izip(found, found_stems))
+            if missing:
+                if stats is not None:
+                    start = timer()
+                new_stems = self._stem_missing(missing_texts)
+                if stats is not None:
+                    stem_time = timer() - start
+                new_stems = [new_stems[text] for text in missing_texts]
+                if encoded:
+                    new_stems = _encode_all(new_stems)
+                new_stems = zip(missing, new_stems)
+                stems.update(new_stems)
+                cache.put_many(new_stems)
+            num_found = len(found)
+            num_missing = len(missing)
+        if stats is not None:
+            stats.record_lookups(words, hits, num_found, num_missing,
+                                 stem_time, num_prefiltered)
+        return stems
+
+    def _stem_missing(self, words):
+        """
+        Stem distinct words that are neither cached nor in the dictionary.
+
+        ``words`` is a list of ``unicode`` instances.
+
+        Returns a dict that maps the words to their stems.
+        """
+        stem = self._module.stem
+        return dict((word, stem(word)) for word in words)
+
+    def stemWords(self, words, factorize=False):
         """
         Stem a list of words.
 
@@ -265,5 +529,138 @@ class Stemmer(object):
         to Unicode. It is assumed that they are encoded via UTF8.
 
         The return value is a list of the word stems.
+
+        Each distinct word is only stemmed once, so repeated words are
+        cheap. If ``factorize`` is true then the return value is a tuple
+        ``(ids, stems)`` instead, where ``stems`` is a list of the
+        distinct stems and ``ids`` is an ``array.array`` that contains
+        the index of each word's stem in ``stems``. Stems of ``str`` and
+        ``unicode`` words have separate entries in ``stems``.
+        """
+        # Words are grouped by type, because in Python 2 a ``str`` and a
+        # ``unicode`` instance can be equal.
+        unicode_ids = {}
+        str_ids = {}
+        distinct = []
+        ids = []
+        for word in words:
+            known = unicode_ids if isinstance(word, unicode) else str_ids
+            index = known.get(word)
+            if index is None:
+                index = known[word] = len(distinct)
+                distinct.append(word)
+            ids.append(index)
+        unicode_stems = str_stems = {}
+        if unicode_ids:
+            unicode_stems = self._stem_many(
+                [w for w in distinct if isinstance(w, unicode)])
+        if str_ids:
+            str_stems = self._stem_many(
+                [w for w in distinct if not isinstance(w, unicode)], True)
+        results = [(unicode_stems if isinstance(word, unicode)
+                    else str_stems)[word] for word in distinct]
+        if not factorize:
+            return [results[index] for index in ids]
+        return _factorize(results, ids)
+
+    def iterStems(self, words, chunkSize=10000):
+        """
+        Stem an iterable of words lazily.
+
+        ``words`` can be any iterable of ``str`` and/or ``unicode``
+        instances, for example a generator. It is consumed in chunks of
+        ``chunkSize`` words, each of which is stemmed using ``stemWords``.
+        Hence memory usage does not depend on the number of words.
+
+        Returns an iterator over the stems.
+        """
+        words = iter(words)
+        while True:
+            chunk = list(itertools.islice(words, chunkSize))
+            if not chunk:
+                return
+            for stem in self.stemWords(chunk):
+                yield stem
+
+    def stemBytes(self, data):
+        """
+        Stem the words in a UTF-8 encoded ``str``.
+
+        ``data`` contains words separated by whitespace, for example the
+        contents of a file with one word per line. It is decoded with a
+        single call, and the stems are encoded with a single call, which
+        is much faster than converting each word on its own.
+
+        Returns a list of the stems as UTF-8 encoded ``str`` instances.
+        """
+        ids, stems = self.stemWords(data.decode('utf8').split(),
+                                    factorize=True)
+        stems = _encode_all(stems)
+        return [stems[index] for index in ids]
+
+    def stemText(self, text, counts=False):
+        """
+        Tokenize and stem a text.
+
+        ``text`` is a ``str`` or ``unicode`` instance. It is split into
+        lower-case tokens via ``purestemmer.text.tokenize``, using the
+        rules for this stemmer's algorithm.
+
+        Returns a list of the stems of the tokens. If ``counts`` is true
+        then the return value is a dict that maps each stem to the number
+        of tokens that have that stem instead. The stems have the same
+        type as ``text``.
+        """
+        return next(self.stemDocuments([text], counts))
+
+    def stemDocuments(self, documents, counts=False, chunkSize=100):
+        """
+        Tokenize and stem several texts.
+
+        ``documents`` is an iterable of ``str`` and/or ``unicode``
+        instances, each of which is processed like by ``stemText``. The
+        documents are consumed in chunks of ``chunkSize`` documents. The
+        distinct tokens of all documents in a chunk are stemmed at once.
+
+        Returns an iterator over the results of ``stemText`` for the
+        documents.
         """
-        return [self.stemWord(w) for w in words]
+        tokenize = self._tokenize
+        documents = iter(documents)
+        while True:
+            chunk = list(itertools.islice(documents, chunkSize))
+            if not chunk:
+                return
+            chunk_tokens = []
+            distinct = set()
+            any_encoded = False
+            for document in chunk:
+                if not isinstance(document, unicode):
+                    document = document.decode('utf8')
+                    any_encoded = True
+                tokens = tokenize(document)
+                if counts:
+                    frequencies = {}
+                    get = frequencies.get
+                    for token in tokens:
+                        frequencies[token] = get(token, 0) + 1
+                    tokens = frequencies
+                chunk_tokens.append(tokens)
+                distinct.update(tokens)
+            distinct = list(distinct)
+            unicode_stems = self._stem_many(distinct)
+            if any_encoded:
+                stems = [unicode_stems[token] for token in distinct]
+                str_stems = dict(itertools.izip(distinct, _encode_all(stems)))
+            for document, tokens in itertools.izip(chunk, chunk_tokens):
+                stems = (unicode_stems if isinstance(document, unicode)
+                         else str_stems)
+                if not counts:
+                    yield [stems[token] for token in tokens]
+                    continue
+                stem_counts = {}
+                get = stem_counts.get
+                for token, n in tokens.iteritems():
+                    stem = stems[token]
+                    stem_counts[stem] = get(stem, 0) + n
+                yield stem_counts
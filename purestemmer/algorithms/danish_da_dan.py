@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:52:20 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy\xe6\xe5\xf8')
+_g_s_ending = frozenset(u'abcdfghjklmnoprtvyz\xe5')
+_a_1 = ((u'erendes', '', 0), (u'erende', '', 0), (u'hedens', '', 0), (u'ethed', '', 0), (u'erede', '', 0), (u'heden', '', 0), (u'heder', '', 0), (u'endes', '', 0), (u'ernes', '', 0), (u'erens', '', 0), (u'erets', '', 0), (u'ered', '', 0), (u'ende', '', 0), (u'erne', '', 0), (u'eren', '', 0), (u'erer', '', 0), (u'heds', '', 0), (u'enes', '', 0), (u'eres', '', 0), (u'eret', '', 0), (u'hed', '', 0), (u'ene', '', 0), (u'ere', '', 0), (u'ens', '', 0), (u'ers', '', 0), (u'ets', '', 0), (u'en', '', 0), (u'er', '', 0), (u'es', '', 0), (u'et', '', 0), (u'e', '', 0), (u's', '', 1),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'gd', '', 0), (u'dt', '', 0), (u'gt', '', 0), (u'kt', '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'elig', '', 0), (u'l\xf8st', '', 1), (u'lig', '', 0), (u'els', '', 0), (u'ig', '', 0),)
+_t_3 = _make_among_table(_a_3)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.s_ch = _String('')
+        self.i_p1 = 0
+        self.i_x = 0
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            var0 = s.cursor                      ##
+            r = s.hop(3)  # hop                  #
+            if r:                                #
+                self.i_x = s.cursor  ##          # test
+                r = True             ## setmark  #
+            s.cursor = var0                      ##
+            if r:
+                for var1 in xrange(s.cursor, s.limit, 1):  ##
+                    if s.chars[var1] in _g_v:              #
+                        s.cursor = var1                    #
+                        r = True                           #
+                        break                              # goto
+                else:                                      #
+                    s.cursor = s.limit                     #
+                    r = False                              ##
+                if r:
+                    for var2 in xrange(s.cursor, s.limit, 1):  ##
+                        if s.chars[var2] not in _g_v:          #
+                            s.cursor = var2 + 1                #
+                            r = True                           #
+                            break                              # gopast
+                    else:                                      #
+                        s.cursor = s.limit                     #
+                        r = False                              ##
+                    if r:
+                        self.i_p1 = s.cursor  ##
+                        r = True              ## setmark
+                        if r:
+                            var3 = s.cursor                ##
+                            r = self.i_p1 < self.i_x  # <  #
+                            if r:                          #
+                                self.i_p1 = self.i_x       #
+                                r = True                   # try
+                            if not r:                      #
+                                r = True                   #
+                                s.cursor = var3            ##
+        return r
+    
+    def r_main_suffix(self, s):
+        r = True
+        var4 = len(s.chars) - s.cursor                          ##
+        var5 = s.limit                                    #
+        r = s.to_mark(self.i_p1)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var4                      #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_1 = _find_among(s, _t_1)  ##            #
+                r = a_1 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var5                                ##
+        if r:
+            if a_1 == 0:                                                        ##
+                r = s.set_range(self.left, self.right, u'')  # delete           #
+            if a_1 == 1:                                                        #
+                if s.cursor == s.limit:                       ##                #
+                    r = False                                 #                 #
+                else:                                         #                 # among
+                    r = s.chars[s.cursor - 1] in _g_s_ending  # grouping check  #
+                if r:                                         #                 #
+                    s.cursor -= 1                             ##                #
+                if r:                                                           #
+                    r = s.set_range(self.left, self.right, u'')  # delete       ##
+        return r
+    
+    def r_consonant_pair(self, s):
+        r = True
+        var8 = len(s.chars) - s.cursor                                      ##
+        var6 = len(s.chars) - s.cursor                          ##          #
+        var7 = s.limit                                    #           #
+        r = s.to_mark(self.i_p1)  # tomark                #           #
+        if r:                                             #           #
+            s.limit = s.cursor                            #           #
+            s.cursor = len(s.chars) - var6                      #           #
+            self.left = s.cursor  ##                      #           #
+            r = True              ## [                    # setlimit  #
+            if r:                                         #           #
+                a_2 = _find_among(s, _t_2)  ##            #           # test
+                r = a_2 is not None         ## substring  #           #
+                if r:                                     #           #
+                    self.right = s.cursor  ##             #           #
+                    r = True               ## ]           #           #
+            s.limit = var7                                ##          #
+        if r:                                                         #
+            if a_2 == 0:  ##                                          #
+                r = True  ## among                                    #
+        s.cursor = len(s.chars) - var8                                      ##
+        if r:
+            r = s.hop(1)  # next
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_other_suffix(self, s):
+        r = True
+        var9 = len(s.chars) - s.cursor                                               ##
+        self.left = s.cursor  ##                                               #
+        r = True              ## [                                             #
+        if r:                                                                  #
+            r = s.starts_with(u'st')  # character check                        #
+            if r:                                                              #
+                self.right = s.cursor  ##                                      #
+                r = True               ## ]                                    # do
+                if r:                                                          #
+                    r = s.starts_with(u'ig')  # character check                #
+                    if r:                                                      #
+                        r = s.set_range(self.left, self.right, u'')  # delete  #
+        s.cursor = len(s.chars) - var9                                               #
+        r = True                                                               ##
+        if r:
+            var10 = len(s.chars) - s.cursor                         ##
+            var11 = s.limit                                   #
+            r = s.to_mark(self.i_p1)  # tomark                #
+            if r:                                             #
+                s.limit = s.cursor                            #
+                s.cursor = len(s.chars) - var10                     #
+                self.left = s.cursor  ##                      #
+                r = True              ## [                    # setlimit
+                if r:                                         #
+                    a_3 = _find_among(s, _t_3)  ##            #
+                    r = a_3 is not None         ## substring  #
+                    if r:                                     #
+                        self.right = s.cursor  ##             #
+                        r = True               ## ]           #
+                s.limit = var11                               ##
+            if r:
+                if a_3 == 0:                                                 ##
+                    r = s.set_range(self.left, self.right, u'')  # delete    #
+                    if r:                                                    #
+                        var12 = len(s.chars) - s.cursor                     ##     #
+                        r = self.r_consonant_pair(s)  # routine call  #      # among
+                        s.cursor = len(s.chars) - var12                     # do   #
+                        r = True                                      ##     #
+                if a_3 == 1:                                                 #
+                    r = s.set_range(self.left, self.right, u'l\xf8s')  # <-  ##
+        return r
+    
+    def r_undouble(self, s):
+        r = True
+        var13 = len(s.chars) - s.cursor                                                          ##
+        var14 = s.limit                                                                    #
+        r = s.to_mark(self.i_p1)  # tomark                                                 #
+        if r:                                                                              #
+            s.limit = s.cursor                                                             #
+            s.cursor = len(s.chars) - var13                                                      #
+            self.left = s.cursor  ##                                                       #
+            r = True              ## [                                                     #
+            if r:                                                                          #
+                if s.cursor == s.limit:                    ##                              #
+                    r = False                              #                               # setlimit
+                else:                                      #                               #
+                    r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check       #
+                if r:                                      #                               #
+                    s.cursor -= 1                          ##                              #
+                if r:                                                                      #
+                    self.right = s.cursor  ##                                              #
+                    r = True               ## ]                                            #
+                    if r:                                                                  #
+                        r = self.s_ch.set_chars(s.get_range(self.left, self.right))  # ->  #
+            s.limit = var14                                                                ##
+        if r:
+            r = s.starts_with(self.s_ch.chars)  # character check
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var15 = s.cursor                            ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var15                            # do
+        r = True                                    ##
+        if r:
+            var20 = s.cursor                                          ##
+            var21 = len(s.chars) - s.limit                                  #
+            s.direction *= -1                                         #
+            s.cursor, s.limit = s.limit, s.cursor                     #
+            var16 = len(s.chars) - s.cursor                  ##             #
+            r = self.r_main_suffix(s)  # routine call  #              #
+            s.cursor = len(s.chars) - var16                  # do           #
+            r = True                                   ##             #
+            if r:                                                     #
+                var17 = len(s.chars) - s.cursor                     ##      #
+                r = self.r_consonant_pair(s)  # routine call  #       #
+                s.cursor = len(s.chars) - var17                     # do    #
+                r = True                                      ##      #
+                if r:                                                 # backwards
+                    var18 = len(s.chars) - s.cursor                   ##    #
+                    r = self.r_other_suffix(s)  # routine call  #     #
+                    s.cursor = len(s.chars) - var18                   # do  #
+                    r = True                                    ##    #
+                    if r:                                             #
+                        var19 = len(s.chars) - s.cursor               ##    #
+                        r = self.r_undouble(s)  # routine call  #     #
+                        s.cursor = len(s.chars) - var19               # do  #
+                        r = True                                ##    #
+            s.direction *= -1                                         #
+            s.cursor = var20                                          #
+            s.limit = len(s.chars) - var21                                  ##
+        return r
@@ -0,0 +1,670 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:52:22 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy\xe8')
+_g_v_I = frozenset((_g_v | set(u'I')))
+_g_v_j = frozenset((_g_v | set(u'j')))
+_a_1 = ((u'\xe4', '', 0), (u'\xe1', '', 0), (u'\xeb', '', 1), (u'\xe9', '', 1), (u'\xef', '', 2), (u'\xed', '', 2), (u'\xf6', '', 3), (u'\xf3', '', 3), (u'\xfc', '', 4), (u'\xfa', '', 4), (u'', '', 5),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'Y', '', 0), (u'I', '', 1), (u'', '', 2),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'kk', '', 0), (u'dd', '', 0), (u'tt', '', 0),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'heden', '', 0), (u'ene', '', 1), (u'en', '', 1), (u'se', '', 2), (u's', '', 2),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'lijk', '', 2), (u'baar', '', 3), (u'end', '', 0), (u'ing', '', 0), (u'bar', '', 4), (u'ig', '', 1),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'aa', '', 0), (u'ee', '', 0), (u'oo', '', 0), (u'uu', '', 0),)
+_t_6 = _make_among_table(_a_6)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.b_e_found = True
+        self.i_p1 = 0
+        self.i_p2 = 0
+
+    def r_prelude(self, s):
+        r = True
+        var1 = s.cursor                                                                            ##
+        while True:                                                                      ##        #
+            var0 = s.cursor                                                              #         #
+            self.left = s.cursor  ##                                                     #         #
+            r = True              ## [                                                   #         #
+            if r:                                                                        #         #
+                a_1 = _find_among(s, _t_1)  ##                                           #         #
+                r = a_1 is not None         ## substring                                 #         #
+                if r:                                                                    #         #
+                    self.right = s.cursor  ##                                            #         #
+                    r = True               ## ]                                          #         #
+                    if r:                                                                #         #
+                        if a_1 == 0:                                            ##       #         #
+                            r = s.set_range(self.left, self.right, u'a')  # <-  #        #         #
+                        if a_1 == 1:                                            #        # repeat  # test
+                            r = s.set_range(self.left, self.right, u'e')  # <-  #        #         #
+                        if a_1 == 2:                                            #        #         #
+                            r = s.set_range(self.left, self.right, u'i')  # <-  #        #         #
+                        if a_1 == 3:                                            # among  #         #
+                            r = s.set_range(self.left, self.right, u'o')  # <-  #        #         #
+                        if a_1 == 4:                                            #        #         #
+                            r = s.set_range(self.left, self.right, u'u')  # <-  #        #         #
+                        if a_1 == 5:                                            #        #         #
+                            r = s.hop(1)  # next                                ##       #         #
+            if not r:                                                                    #         #
+                s.cursor = var0                                                          #         #
+                break                                                                    #         #
+        r = True                                                                         ##        #
+        s.cursor = var1                                                                            ##
+        if r:
+            var2 = s.cursor                                                 ##
+            self.left = s.cursor  ##                                        #
+            r = True              ## [                                      #
+            if r:                                                           #
+                r = s.starts_with(u'y')  # character check                  #
+                if r:                                                       #
+                    self.right = s.cursor  ##                               # try
+                    r = True               ## ]                             #
+                    if r:                                                   #
+                        r = s.set_range(self.left, self.right, u'Y')  # <-  #
+            if not r:                                                       #
+                r = True                                                    #
+                s.cursor = var2                                             ##
+            if r:
+                while True:                                                                                   ##
+                    var5 = s.cursor                                                                           #
+                    while True:                                                                       ##      #
+                        var4 = s.cursor                                                               #       #
+                        if s.cursor == s.limit:            ##                                         #       #
+                            r = False                      #                                          #       #
+                        else:                              #                                          #       #
+                            r = s.chars[s.cursor] in _g_v  # grouping check                           #       #
+                        if r:                              #                                          #       #
+                            s.cursor += 1                  ##                                         #       #
+                        if r:                                                                         #       #
+                            self.left = s.cursor  ##                                                  #       #
+                            r = True              ## [                                                #       #
+                            if r:                                                                     #       #
+                                var3 = s.cursor                                                 ##    #       #
+                                r = s.starts_with(u'i')  # character check                      #     #       #
+                                if r:                                                           #     #       #
+                                    self.right = s.cursor  ##                                   #     #       #
+                                    r = True               ## ]                                 #     #       #
+                                    if r:                                                       #     #       #
+                                        if s.cursor == s.limit:            ##                   #     #       #
+                                            r = False                      #                    #     # goto  #
+                                        else:                              #                    #     #       # repeat
+                                            r = s.chars[s.cursor] in _g_v  # grouping check     #     #       #
+                                        if r:                              #                    #     #       #
+                                            s.cursor += 1                  ##                   # or  #       #
+                                        if r:                                                   #     #       #
+                                            r = s.set_range(self.left, self.right, u'I')  # <-  #     #       #
+                                if not r:                                                       #     #       #
+                                    s.cursor = var3                                             #     #       #
+                                    r = s.starts_with(u'y')  # character check                  #     #       #
+                                    if r:                                                       #     #       #
+                                        self.right = s.cursor  ##                               #     #       #
+                                        r = True               ## ]                             #     #       #
+                                        if r:                                                   #     #       #
+                                            r = s.set_range(self.left, self.right, u'Y')  # <-  ##    #       #
+                        if r or s.cursor == s.limit:                                                  #       #
+                            s.cursor = var4                                                           #       #
+                            break                                                                     #       #
+                        s.cursor = var4 + 1                                                           ##      #
+                    if not r:                                                                                 #
+                        s.cursor = var5                                                                       #
+                        break                                                                                 #
+                r = True                                                                                      ##
+        return r
+    
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            self.i_p2 = s.limit
+            r = True
+            if r:
+                for var6 in xrange(s.cursor, s.limit, 1):  ##
+                    if s.chars[var6] in _g_v:              #
+                        s.cursor = var6 + 1                #
+                        r = True                           #
+                        break                              # gopast
+                else:                                      #
+                    s.cursor = s.limit                     #
+                    r = False                              ##
+                if r:
+                    for var7 in xrange(s.cursor, s.limit, 1):  ##
+                        if s.chars[var7] not in _g_v:          #
+                            s.cursor = var7 + 1                #
+                            r = True                           #
+                            break                              # gopast
+                    else:                                      #
+                        s.cursor = s.limit                     #
+                        r = False                              ##
+                    if r:
+                        self.i_p1 = s.cursor  ##
+                        r = True              ## setmark
+                        if r:
+                            var8 = s.cursor         ##
+                            r = self.i_p1 < 3  # <  #
+                            if r:                   #
+                                self.i_p1 = 3       #
+                                r = True            # try
+                            if not r:               #
+                                r = True            #
+                                s.cursor = var8     ##
+                            if r:
+                                for var9 in xrange(s.cursor, s.limit, 1):  ##
+                                    if s.chars[var9] in _g_v:              #
+                                        s.cursor = var9 + 1                #
+                                        r = True                           #
+                                        break                              # gopast
+                                else:                                      #
+                                    s.cursor = s.limit                     #
+                                    r = False                              ##
+                                if r:
+                                    for var10 in xrange(s.cursor, s.limit, 1):  ##
+                                        if s.chars[var10] not in _g_v:          #
+                                            s.cursor = var10 + 1                #
+                                            r = True                            #
+                                            break                               # gopast
+                                    else:                                       #
+                                        s.cursor = s.limit                      #
+                                        r = False                               ##
+                                    if r:
+                                        self.i_p2 = s.cursor  ##
+                                        r = True              ## setmark
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        while True:                                                                      ##
+            var11 = s.cursor                                                             #
+            self.left = s.cursor  ##                                                     #
+            r = True              ## [                                                   #
+            if r:                                                                        #
+                a_2 = _find_among(s, _t_2)  ##                                           #
+                r = a_2 is not None         ## substring                                 #
+                if r:                                                                    #
+                    self.right = s.cursor  ##                                            #
+                    r = True               ## ]                                          #
+                    if r:                                                                # repeat
+                        if a_2 == 0:                                            ##       #
+                            r = s.set_range(self.left, self.right, u'y')  # <-  #        #
+                        if a_2 == 1:                                            #        #
+                            r = s.set_range(self.left, self.right, u'i')  # <-  # among  #
+                        if a_2 == 2:                                            #        #
+                            r = s.hop(1)  # next                                ##       #
+            if not r:                                                                    #
+                s.cursor = var11                                                         #
+                break                                                                    #
+        r = True                                                                         ##
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_undouble(self, s):
+        r = True
+        var12 = len(s.chars) - s.cursor            ##
+        a_3 = _find_among(s, _t_3)  ##       #
+        r = a_3 is not None         #        #
+        if r:                       # among  # test
+            if a_3 == 0:            #        #
+                r = True            ##       #
+        s.cursor = len(s.chars) - var12            ##
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                r = s.hop(1)  # next
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_e_ending(self, s):
+        r = True
+        self.b_e_found = False  ##
+        r = True                ## unset
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                r = s.starts_with(u'e')  # character check
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = self.r_R1(s)  # routine call
+                        if r:
+                            var13 = len(s.chars) - s.cursor                                             ##
+                            if s.cursor == s.limit:                    ##                         #
+                                r = False                              #                          #
+                            else:                                      #                          #
+                                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  # test
+                            if r:                                      #                          #
+                                s.cursor -= 1                          ##                         #
+                            s.cursor = len(s.chars) - var13                                             ##
+                            if r:
+                                r = s.set_range(self.left, self.right, u'')  # delete
+                                if r:
+                                    self.b_e_found = True  ##
+                                    r = True               ## set
+                                    if r:
+                                        r = self.r_undouble(s)  # routine call
+        return r
+    
+    def r_en_ending(self, s):
+        r = True
+        r = self.r_R1(s)  # routine call
+        if r:
+            var15 = len(s.chars) - s.cursor                                             ##
+            if s.cursor == s.limit:                    ##                         #
+                r = False                              #                          #
+            else:                                      #                          #
+                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  #
+            if r:                                      #                          #
+                s.cursor -= 1                          ##                         #
+            if r:                                                                 # and
+                s.cursor = len(s.chars) - var15                                         #
+                var14 = len(s.chars) - s.cursor                     ##                  #
+                r = s.starts_with(u'gem')  # character check  #                   #
+                if not r:                                     # not               #
+                    s.cursor = len(s.chars) - var14                 #                   #
+                r = not r                                     ##                  ##
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+                if r:
+                    r = self.r_undouble(s)  # routine call
+        return r
+    
+    def r_standard_suffix(self, s):
+        r = True
+        var16 = len(s.chars) - s.cursor                                                                            ##
+        self.left = s.cursor  ##                                                                             #
+        r = True              ## [                                                                           #
+        if r:                                                                                                #
+            a_4 = _find_among(s, _t_4)  ##                                                                   #
+            r = a_4 is not None         ## substring                                                         #
+            if r:                                                                                            #
+                self.right = s.cursor  ##                                                                    #
+                r = True               ## ]                                                                  #
+                if r:                                                                                        #
+                    if a_4 == 0:                                                                    ##       #
+                        r = self.r_R1(s)  # routine call                                            #        #
+                        if r:                                                                       #        #
+                            r = s.set_range(self.left, self.right, u'heid')  # <-                   #        #
+                    if a_4 == 1:                                                                    #        # do
+                        r = self.r_en_ending(s)  # routine call                                     #        #
+                    if a_4 == 2:                                                                    #        #
+                        r = self.r_R1(s)  # routine call                                            #        #
+                        if r:                                                                       # among  #
+                            if s.cursor == s.limit:                      ##                         #        #
+                                r = False                                #                          #        #
+                            else:                                        #                          #        #
+                                r = s.chars[s.cursor - 1] not in _g_v_j  # negative grouping check  #        #
+                            if r:                                        #                          #        #
+                                s.cursor -= 1                            ##                         #        #
+                            if r:                                                                   #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete               ##       #
+        s.cursor = len(s.chars) - var16                                                                            #
+        r = True                                                                                             ##
+        if r:
+            var17 = len(s.chars) - s.cursor               ##
+            r = self.r_e_ending(s)  # routine call  #
+            s.cursor = len(s.chars) - var17               # do
+            r = True                                ##
+            if r:
+                var19 = len(s.chars) - s.cursor                                                    ##
+                self.left = s.cursor  ##                                                     #
+                r = True              ## [                                                   #
+                if r:                                                                        #
+                    r = s.starts_with(u'heid')  # character check                            #
+                    if r:                                                                    #
+                        self.right = s.cursor  ##                                            #
+                        r = True               ## ]                                          #
+                        if r:                                                                #
+                            r = self.r_R2(s)  # routine call                                 #
+                            if r:                                                            #
+                                var18 = len(s.chars) - s.cursor                   ##               #
+                                r = s.starts_with(u'c')  # character check  #                #
+                                if not r:                                   # not            #
+                                    s.cursor = len(s.chars) - var18               #                #
+                                r = not r                                   ##               # do
+                                if r:                                                        #
+                                    r = s.set_range(self.left, self.right, u'')  # delete    #
+                                    if r:                                                    #
+                                        self.left = s.cursor  ##                             #
+                                        r = True              ## [                           #
+                                        if r:                                                #
+                                            r = s.starts_with(u'en')  # character check      #
+                                            if r:                                            #
+                                                self.right = s.cursor  ##                    #
+                                                r = True               ## ]                  #
+                                                if r:                                        #
+                                                    r = self.r_en_ending(s)  # routine call  #
+                s.cursor = len(s.chars) - var19                                                    #
+                r = True                                                                     ##
+                if r:
+                    var23 = len(s.chars) - s.cursor                                                                                         ##
+                    self.left = s.cursor  ##                                                                                          #
+                    r = True              ## [                                                                                        #
+                    if r:                                                                                                             #
+                        a_5 = _find_among(s, _t_5)  ##                                                                                #
+                        r = a_5 is not None         ## substring                                                                      #
+                        if r:                                                                                                         #
+                            self.right = s.cursor  ##                                                                                 #
+                            r = True               ## ]                                                                               #
+                            if r:                                                                                                     #
+                                if a_5 == 0:                                                                                 ##       #
+                                    r = self.r_R2(s)  # routine call                                                         #        #
+                                    if r:                                                                                    #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                #        #
+                                        if r:                                                                                #        #
+                                            var21 = len(s.chars) - s.cursor                                                  ##    #        #
+                                            self.left = s.cursor  ##                                                   #     #        #
+                                            r = True              ## [                                                 #     #        #
+                                            if r:                                                                      #     #        #
+                                                r = s.starts_with(u'ig')  # character check                            #     #        #
+                                                if r:                                                                  #     #        #
+                                                    self.right = s.cursor  ##                                          #     #        #
+                                                    r = True               ## ]                                        #     #        #
+                                                    if r:                                                              #     #        #
+                                                        r = self.r_R2(s)  # routine call                               #     #        #
+                                                        if r:                                                          # or  #        #
+                                                            var20 = len(s.chars) - s.cursor                   ##             #     #        #
+                                                            r = s.starts_with(u'e')  # character check  #              #     #        #
+                                                            if not r:                                   # not          #     #        #
+                                                                s.cursor = len(s.chars) - var20               #              #     #        #
+                                                            r = not r                                   ##             #     #        #
+                                                            if r:                                                      #     #        #
+                                                                r = s.set_range(self.left, self.right, u'')  # delete  #     #        # do
+                                            if not r:                                                                  #     #        #
+                                                s.cursor = len(s.chars) - var21                                              #     #        #
+                                                r = self.r_undouble(s)  # routine call                                 ##    #        #
+                                if a_5 == 1:                                                                                 # among  #
+                                    r = self.r_R2(s)  # routine call                                                         #        #
+                                    if r:                                                                                    #        #
+                                        var22 = len(s.chars) - s.cursor                   ##                                       #        #
+                                        r = s.starts_with(u'e')  # character check  #                                        #        #
+                                        if not r:                                   # not                                    #        #
+                                            s.cursor = len(s.chars) - var22               #                                        #        #
+                                        r = not r                                   ##                                       #        #
+                                        if r:                                                                                #        #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                            #        #
+                                if a_5 == 2:                                                                                 #        #
+                                    r = self.r_R2(s)  # routine call                                                         #        #
+                                    if r:                                                                                    #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                #        #
+                                        if r:                                                                                #        #
+                                            r = self.r_e_ending(s)  # routine call                                           #        #
+                                if a_5 == 3:                                                                                 #        #
+                                    r = self.r_R2(s)  # routine call                                                         #        #
+                                    if r:                                                                                    #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                #        #
+                                if a_5 == 4:                                                                                 #        #
+                                    r = self.r_R2(s)  # routine call                                                         #        #
+                                    if r:                                                                                    #        #
+                                        r = self.b_e_found  # boolean variable check                                         #        #
+                                        if r:                                                                                #        #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                            ##       #
+                    s.cursor = len(s.chars) - var23                                                                                         #
+                    r = True                                                                                                          ##
+                    if r:
+                        var25 = len(s.chars) - s.cursor                                                             ##
+                        if s.cursor == s.limit:                      ##                                       #
+                            r = False                                #                                        #
+                        else:                                        #                                        #
+                            r = s.chars[s.cursor - 1] not in _g_v_I  # negative grouping check                #
+                        if r:                                        #                                        #
+                            s.cursor -= 1                            ##                                       #
+                        if r:                                                                                 #
+                            var24 = len(s.chars) - s.cursor                                                 ##      #
+                            a_6 = _find_among(s, _t_6)  ##                                            #       #
+                            r = a_6 is not None         #                                             #       #
+                            if r:                       # among                                       #       #
+                                if a_6 == 0:            #                                             #       #
+                                    r = True            ##                                            #       #
+                            if r:                                                                     #       #
+                                if s.cursor == s.limit:                    ##                         # test  #
+                                    r = False                              #                          #       #
+                                else:                                      #                          #       # do
+                                    r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  #       #
+                                if r:                                      #                          #       #
+                                    s.cursor -= 1                          ##                         #       #
+                            s.cursor = len(s.chars) - var24                                                 ##      #
+                            if r:                                                                             #
+                                self.left = s.cursor  ##                                                      #
+                                r = True              ## [                                                    #
+                                if r:                                                                         #
+                                    r = s.hop(1)  # next                                                      #
+                                    if r:                                                                     #
+                                        self.right = s.cursor  ##                                             #
+                                        r = True               ## ]                                           #
+                                        if r:                                                                 #
+                                            r = s.set_range(self.left, self.right, u'')  # delete             #
+                        s.cursor = len(s.chars) - var25                                                             #
+                        r = True                                                                              ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var26 = s.cursor                       ##
+        r = self.r_prelude(s)  # routine call  #
+        s.cursor = var26                       # do
+        r = True                               ##
+        if r:
+            var27 = s.cursor                            ##
+            r = self.r_mark_regions(s)  # routine call  #
+            s.cursor = var27                            # do
+            r = True                                    ##
+            if r:
+                var29 = s.cursor                                     ##
+                var30 = len(s.chars) - s.limit                             #
+                s.direction *= -1                                    #
+                s.cursor, s.limit = s.limit, s.cursor                #
+                var28 = len(s.chars) - s.cursor                      ##    #
+                r = self.r_standard_suffix(s)  # routine call  #     # backwards
+                s.cursor = len(s.chars) - var28                      # do  #
+                r = True                                       ##    #
+                s.direction *= -1                                    #
+                s.cursor = var29                                     #
+                s.limit = len(s.chars) - var30                             ##
+                if r:
+                    var31 = s.cursor                        ##
+                    r = self.r_postlude(s)  # routine call  #
+                    s.cursor = var31                        # do
+                    r = True                                ##
+        return r
+
+_u_last_0 = frozenset([u'd', u'e', u'g', u'k', u'n', u'r', u's'])
+_u_chars_0 = frozenset([u'I', u'Y', u'a', u'e', u'i', u'o', u'u', u'y', u'\xe1', u'\xe4', u'\xe9', u'\xeb', u'\xed', u'\xef', u'\xf3', u'\xf6', u'\xfa', u'\xfc'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)))
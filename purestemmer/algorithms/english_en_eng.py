@@ -0,0 +1,853 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:55:15 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy')
+_g_v_WXY = frozenset((_g_v | set(u'wxY')))
+_g_valid_LI = frozenset(u'cdeghkmnrt')
+_a_1 = ((u'commun', '', 0), (u'gener', '', 0), (u'arsen', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u"'s'", '', 0), (u"'s", '', 0), (u"'", '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'sses', '', 0), (u'ied', '', 1), (u'ies', '', 1), (u'us', '', 3), (u'ss', '', 3), (u's', '', 2),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'eedly', '', 0), (u'ingly', '', 1), (u'edly', '', 1), (u'eed', '', 0), (u'ing', '', 1), (u'ed', '', 1),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'at', '', 0), (u'bl', '', 0), (u'iz', '', 0), (u'bb', '', 1), (u'dd', '', 1), (u'ff', '', 1), (u'gg', '', 1), (u'mm', '', 1), (u'nn', '', 1), (u'pp', '', 1), (u'rr', '', 1), (u'tt', '', 1), (u'', '', 2),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'ization', '', 5), (u'ational', '', 6), (u'fulness', '', 8), (u'ousness', '', 9), (u'iveness', '', 10), (u'tional', '', 0), (u'biliti', '', 11), (u'lessli', '', 14), (u'entli', '', 4), (u'ation', '', 6), (u'alism', '', 7), (u'aliti', '', 7), (u'ousli', '', 9), (u'iviti', '', 10), (u'fulli', '', 13), (u'enci', '', 1), (u'anci', '', 2), (u'abli', '', 3), (u'izer', '', 5), (u'ator', '', 6), (u'alli', '', 7), (u'bli', '', 11), (u'ogi', '', 12), (u'li', '', 15),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'ational', '', 1), (u'tional', '', 0), (u'alize', '', 2), (u'icate', '', 3), (u'iciti', '', 3), (u'ative', '', 5), (u'ical', '', 3), (u'ness', '', 4), (u'ful', '', 4),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'ement', '', 0), (u'ance', '', 0), (u'ence', '', 0), (u'able', '', 0), (u'ible', '', 0), (u'ment', '', 0), (u'ant', '', 0), (u'ent', '', 0), (u'ism', '', 0), (u'ate', '', 0), (u'iti', '', 0), (u'ous', '', 0), (u'ive', '', 0), (u'ize', '', 0), (u'ion', '', 1), (u'al', '', 0), (u'er', '', 0), (u'ic', '', 0),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'e', '', 0), (u'l', '', 1),)
+_t_9 = _make_among_table(_a_9)
+_a_10 = ((u'canning', '', 0), (u'herring', '', 0), (u'earring', '', 0), (u'proceed', '', 0), (u'succeed', '', 0), (u'inning', '', 0), (u'outing', '', 0), (u'exceed', '', 0),)
+_t_10 = _make_among_table(_a_10)
+_a_11 = ((u'gently', '', 6), (u'singly', '', 10), (u'cosmos', '', 11), (u'skies', '', 1), (u'dying', '', 2), (u'lying', '', 3), (u'tying', '', 4), (u'early', '', 8), (u'atlas', '', 11), (u'andes', '', 11), (u'skis', '', 0), (u'idly', '', 5), (u'ugly', '', 7), (u'only', '', 9), (u'news', '', 11), (u'howe', '', 11), (u'bias', '', 11), (u'sky', '', 11),)
+_t_11 = _make_among_table(_a_11)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+        self.i_p2 = 0
+        self.b_Y_found = True
+
+    def r_prelude(self, s):
+        r = True
+        self.b_Y_found = False  ##
+        r = True                ## unset
+        if r:
+            var0 = s.cursor                                                    ##
+            self.left = s.cursor  ##                                           #
+            r = True              ## [                                         #
+            if r:                                                              #
+                r = s.starts_with(u"'")  # character check                     #
+                if r:                                                          #
+                    self.right = s.cursor  ##                                  # do
+                    r = True               ## ]                                #
+                    if r:                                                      #
+                        r = s.set_range(self.left, self.right, u'')  # delete  #
+            s.cursor = var0                                                    #
+            r = True                                                           ##
+            if r:
+                var1 = s.cursor                                                 ##
+                self.left = s.cursor  ##                                        #
+                r = True              ## [                                      #
+                if r:                                                           #
+                    r = s.starts_with(u'y')  # character check                  #
+                    if r:                                                       #
+                        self.right = s.cursor  ##                               #
+                        r = True               ## ]                             # do
+                        if r:                                                   #
+                            r = s.set_range(self.left, self.right, u'Y')  # <-  #
+                            if r:                                               #
+                                self.b_Y_found = True  ##                       #
+                                r = True               ## set                   #
+                s.cursor = var1                                                 #
+                r = True                                                        ##
+                if r:
+                    var4 = s.cursor                                                                ##
+                    while True:                                                          ##        #
+                        var3 = s.cursor                                                  #         #
+                        while True:                                              ##      #         #
+                            var2 = s.cursor                                      #       #         #
+                            if s.cursor == s.limit:            ##                #       #         #
+                                r = False                      #                 #       #         #
+                            else:                              #                 #       #         #
+                                r = s.chars[s.cursor] in _g_v  # grouping check  #       #         #
+                            if r:                              #                 #       #         #
+                                s.cursor += 1                  ##                #       #         #
+                            if r:                                                #       #         #
+                                self.left = s.cursor  ##                         #       #         #
+                                r = True              ## [                       # goto  #         #
+                                if r:                                            #       #         #
+                                    r = s.starts_with(u'y')  # character check   #       #         #
+                                    if r:                                        #       # repeat  #
+                                        self.right = s.cursor  ##                #       #         # do
+                                        r = True               ## ]              #       #         #
+                            if r or s.cursor == s.limit:                         #       #         #
+                                s.cursor = var2                                  #       #         #
+                                break                                            #       #         #
+                            s.cursor = var2 + 1                                  ##      #         #
+                        if r:                                                            #         #
+                            r = s.set_range(self.left, self.right, u'Y')  # <-           #         #
+                            if r:                                                        #         #
+                                self.b_Y_found = True  ##                                #         #
+                                r = True               ## set                            #         #
+                        if not r:                                                        #         #
+                            s.cursor = var3                                              #         #
+                            break                                                        #         #
+                    r = True                                                             ##        #
+                    s.cursor = var4                                                                #
+                    r = True                                                                       ##
+        return r
+    
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            self.i_p2 = s.limit
+            r = True
+            if r:
+                var10 = s.cursor                                                   ##
+                var7 = s.cursor                                              ##    #
+                a_1 = _find_among(s, _t_1)  ##                               #     #
+                r = a_1 is not None         #                                #     #
+                if r:                       # among                          #     #
+                    if a_1 == 0:            #                                #     #
+                        r = True            ##                               #     #
+                if not r:                                                    #     #
+                    s.cursor = var7                                          #     #
+                    for var5 in xrange(s.cursor, s.limit, 1):  ##            #     #
+                        if s.chars[var5] in _g_v:              #             #     #
+                            s.cursor = var5 + 1                #             #     #
+                            r = True                           #             #     #
+                            break                              # gopast      # or  #
+                    else:                                      #             #     #
+                        s.cursor = s.limit                     #             #     #
+                        r = False                              ##            #     #
+                    if r:                                                    #     #
+                        for var6 in xrange(s.cursor, s.limit, 1):  ##        #     #
+                            if s.chars[var6] not in _g_v:          #         #     #
+                                s.cursor = var6 + 1                #         #     #
+                                r = True                           #         #     #
+                                break                              # gopast  #     #
+                        else:                                      #         #     #
+                            s.cursor = s.limit                     #         #     #
+                            r = False                              ##        ##    #
+                if r:                                                              # do
+                    self.i_p1 = s.cursor  ##                                       #
+                    r = True              ## setmark                               #
+                    if r:                                                          #
+                        for var8 in xrange(s.cursor, s.limit, 1):  ##              #
+                            if s.chars[var8] in _g_v:              #               #
+                                s.cursor = var8 + 1                #               #
+                                r = True                           #               #
+                                break                              # gopast        #
+                        else:                                      #               #
+                            s.cursor = s.limit                     #               #
+                            r = False                              ##              #
+                        if r:                                                      #
+                            for var9 in xrange(s.cursor, s.limit, 1):  ##          #
+                                if s.chars[var9] not in _g_v:          #           #
+                                    s.cursor = var9 + 1                #           #
+                                    r = True                           #           #
+                                    break                              # gopast    #
+                            else:                                      #           #
+                                s.cursor = s.limit                     #           #
+                                r = False                              ##          #
+                            if r:                                                  #
+                                self.i_p2 = s.cursor  ##                           #
+                                r = True              ## setmark                   #
+                s.cursor = var10                                                   #
+                r = True                                                           ##
+        return r
+    
+    def r_shortv(self, s):
+        r = True
+        var11 = len(s.chars) - s.cursor                                                     ##
+        if s.cursor == s.limit:                        ##                             #
+            r = False                                  #                              #
+        else:                                          #                              #
+            r = s.chars[s.cursor - 1] not in _g_v_WXY  # negative grouping check      #
+        if r:                                          #                              #
+            s.cursor -= 1                              ##                             #
+        if r:                                                                         #
+            if s.cursor == s.limit:                ##                                 #
+                r = False                          #                                  #
+            else:                                  #                                  #
+                r = s.chars[s.cursor - 1] in _g_v  # grouping check                   #
+            if r:                                  #                                  #
+                s.cursor -= 1                      ##                                 #
+            if r:                                                                     #
+                if s.cursor == s.limit:                    ##                         #
+                    r = False                              #                          #
+                else:                                      #                          #
+                    r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  #
+                if r:                                      #                          # or
+                    s.cursor -= 1                          ##                         #
+        if not r:                                                                     #
+            s.cursor = len(s.chars) - var11                                                 #
+            if s.cursor == s.limit:                    ##                             #
+                r = False                              #                              #
+            else:                                      #                              #
+                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check      #
+            if r:                                      #                              #
+                s.cursor -= 1                          ##                             #
+            if r:                                                                     #
+                if s.cursor == s.limit:                ##                             #
+                    r = False                          #                              #
+                else:                                  #                              #
+                    r = s.chars[s.cursor - 1] in _g_v  # grouping check               #
+                if r:                                  #                              #
+                    s.cursor -= 1                      ##                             #
+                if r:                                                                 #
+                    r = (s.cursor == s.limit)  # atlimit                              ##
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_Step_1a(self, s):
+        r = True
+        var12 = len(s.chars) - s.cursor                                                        ##
+        self.left = s.cursor  ##                                                         #
+        r = True              ## [                                                       #
+        if r:                                                                            #
+            a_2 = _find_among(s, _t_2)  ##                                               #
+            r = a_2 is not None         ## substring                                     #
+            if r:                                                                        #
+                self.right = s.cursor  ##                                                # try
+                r = True               ## ]                                              #
+                if r:                                                                    #
+                    if a_2 == 0:                                               ##        #
+                        r = s.set_range(self.left, self.right, u'')  # delete  ## among  #
+        if not r:                                                                        #
+            r = True                                                                     #
+            s.cursor = len(s.chars) - var12                                                    ##
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                a_3 = _find_among(s, _t_3)  ##
+                r = a_3 is not None         ## substring
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        if a_3 == 0:                                                           ##
+                            r = s.set_range(self.left, self.right, u'ss')  # <-                #
+                        if a_3 == 1:                                                           #
+                            var13 = len(s.chars) - s.cursor                                ##        #
+                            r = s.hop(2)  # hop                                      #         #
+                            if r:                                                    #         #
+                                r = s.set_range(self.left, self.right, u'i')  # <-   # or      #
+                            if not r:                                                #         #
+                                s.cursor = len(s.chars) - var13                            #         #
+                                r = s.set_range(self.left, self.right, u'ie')  # <-  ##        #
+                        if a_3 == 2:                                                           #
+                            r = s.hop(1)  # next                                               #
+                            if r:                                                              # among
+                                for var14 in xrange(s.cursor - 1, s.limit - 1, -1):  ##        #
+                                    if s.chars[var14] in _g_v:                       #         #
+                                        s.cursor = var14                             #         #
+                                        r = True                                     #         #
+                                        break                                        # gopast  #
+                                else:                                                #         #
+                                    s.cursor = s.limit                               #         #
+                                    r = False                                        ##        #
+                                if r:                                                          #
+                                    r = s.set_range(self.left, self.right, u'')  # delete      #
+                        if a_3 == 3:                                                           #
+                            r = True                                                           ##
+        return r
+    
+    def r_Step_1b(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_4 == 0:                                                                                    ##
+                        r = self.r_R1(s)  # routine call                                                            #
+                        if r:                                                                                       #
+                            r = s.set_range(self.left, self.right, u'ee')  # <-                                     #
+                    if a_4 == 1:                                                                                    #
+                        var16 = len(s.chars) - s.cursor                                      ##                           #
+                        for var15 in xrange(s.cursor - 1, s.limit - 1, -1):  ##        #                            #
+                            if s.chars[var15] in _g_v:                       #         #                            #
+                                s.cursor = var15                             #         #                            #
+                                r = True                                     #         #                            #
+                                break                                        # gopast  # test                       #
+                        else:                                                #         #                            #
+                            s.cursor = s.limit                               #         #                            #
+                            r = False                                        ##        #                            #
+                        s.cursor = len(s.chars) - var16                                      ##                           #
+                        if r:                                                                                       #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                   #
+                            if r:                                                                                   #
+                                var17 = len(s.chars) - s.cursor                 ##                                        #
+                                a_5 = _find_among(s, _t_5)  ##            #                                         #
+                                r = a_5 is not None         ## substring  # test                                    #
+                                s.cursor = len(s.chars) - var17                 ##                                        # among
+                                if r:                                                                               #
+                                    if a_5 == 0:                                                           ##       #
+                                        r = s.insert(u'e')  # insert                                       #        #
+                                    if a_5 == 1:                                                           #        #
+                                        self.left = s.cursor  ##                                           #        #
+                                        r = True              ## [                                         #        #
+                                        if r:                                                              #        #
+                                            r = s.hop(1)  # next                                           #        #
+                                            if r:                                                          #        #
+                                                self.right = s.cursor  ##                                  #        #
+                                                r = True               ## ]                                #        #
+                                                if r:                                                      # among  #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  #        #
+                                    if a_5 == 2:                                                           #        #
+                                        r = (s.cursor == self.i_p1)  # atmark                              #        #
+                                        if r:                                                              #        #
+                                            var18 = len(s.chars) - s.cursor             ##                       #        #
+                                            r = self.r_shortv(s)  # routine call  # test                   #        #
+                                            s.cursor = len(s.chars) - var18             ##                       #        #
+                                            if r:                                                          #        #
+                                                r = s.insert(u'e')  # insert                               ##       ##
+        return r
+    
+    def r_Step_1c(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            var19 = len(s.chars) - s.cursor                       ##
+            r = s.starts_with(u'y')  # character check      #
+            if not r:                                       # or
+                s.cursor = len(s.chars) - var19                   #
+                r = s.starts_with(u'Y')  # character check  ##
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if s.cursor == s.limit:                    ##
+                        r = False                              #
+                    else:                                      #
+                        r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check
+                    if r:                                      #
+                        s.cursor -= 1                          ##
+                    if r:
+                        var20 = len(s.chars) - s.cursor             ##
+                        r = (s.cursor == s.limit)  # atlimit  #
+                        if not r:                             # not
+                            s.cursor = len(s.chars) - var20         #
+                        r = not r                             ##
+                        if r:
+                            r = s.set_range(self.left, self.right, u'i')  # <-
+        return r
+    
+    def r_Step_2(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_6 = _find_among(s, _t_6)  ##
+            r = a_6 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_6 == 0:                                                        ##
+                            r = s.set_range(self.left, self.right, u'tion')  # <-           #
+                        if a_6 == 1:                                                        #
+                            r = s.set_range(self.left, self.right, u'ence')  # <-           #
+                        if a_6 == 2:                                                        #
+                            r = s.set_range(self.left, self.right, u'ance')  # <-           #
+                        if a_6 == 3:                                                        #
+                            r = s.set_range(self.left, self.right, u'able')  # <-           #
+                        if a_6 == 4:                                                        #
+                            r = s.set_range(self.left, self.right, u'ent')  # <-            #
+                        if a_6 == 5:                                                        #
+                            r = s.set_range(self.left, self.right, u'ize')  # <-            #
+                        if a_6 == 6:                                                        #
+                            r = s.set_range(self.left, self.right, u'ate')  # <-            #
+                        if a_6 == 7:                                                        #
+                            r = s.set_range(self.left, self.right, u'al')  # <-             #
+                        if a_6 == 8:                                                        #
+                            r = s.set_range(self.left, self.right, u'ful')  # <-            #
+                        if a_6 == 9:                                                        #
+                            r = s.set_range(self.left, self.right, u'ous')  # <-            #
+                        if a_6 == 10:                                                       # among
+                            r = s.set_range(self.left, self.right, u'ive')  # <-            #
+                        if a_6 == 11:                                                       #
+                            r = s.set_range(self.left, self.right, u'ble')  # <-            #
+                        if a_6 == 12:                                                       #
+                            r = s.starts_with(u'l')  # character check                      #
+                            if r:                                                           #
+                                r = s.set_range(self.left, self.right, u'og')  # <-         #
+                        if a_6 == 13:                                                       #
+                            r = s.set_range(self.left, self.right, u'ful')  # <-            #
+                        if a_6 == 14:                                                       #
+                            r = s.set_range(self.left, self.right, u'less')  # <-           #
+                        if a_6 == 15:                                                       #
+                            if s.cursor == s.limit:                       ##                #
+                                r = False                                 #                 #
+                            else:                                         #                 #
+                                r = s.chars[s.cursor - 1] in _g_valid_LI  # grouping check  #
+                            if r:                                         #                 #
+                                s.cursor -= 1                             ##                #
+                            if r:                                                           #
+                                r = s.set_range(self.left, self.right, u'')  # delete       ##
+        return r
+    
+    def r_Step_3(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_7 = _find_among(s, _t_7)  ##
+            r = a_7 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_7 == 0:                                                   ##
+                            r = s.set_range(self.left, self.right, u'tion')  # <-      #
+                        if a_7 == 1:                                                   #
+                            r = s.set_range(self.left, self.right, u'ate')  # <-       #
+                        if a_7 == 2:                                                   #
+                            r = s.set_range(self.left, self.right, u'al')  # <-        #
+                        if a_7 == 3:                                                   #
+                            r = s.set_range(self.left, self.right, u'ic')  # <-        # among
+                        if a_7 == 4:                                                   #
+                            r = s.set_range(self.left, self.right, u'')  # delete      #
+                        if a_7 == 5:                                                   #
+                            r = self.r_R2(s)  # routine call                           #
+                            if r:                                                      #
+                                r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_Step_4(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_8 = _find_among(s, _t_8)  ##
+            r = a_8 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R2(s)  # routine call
+                    if r:
+                        if a_8 == 0:                                                   ##
+                            r = s.set_range(self.left, self.right, u'')  # delete      #
+                        if a_8 == 1:                                                   #
+                            var21 = len(s.chars) - s.cursor                       ##         #
+                            r = s.starts_with(u's')  # character check      #          #
+                            if not r:                                       # or       # among
+                                s.cursor = len(s.chars) - var21                   #          #
+                                r = s.starts_with(u't')  # character check  ##         #
+                            if r:                                                      #
+                                r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_Step_5(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_9 = _find_among(s, _t_9)  ##
+            r = a_9 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_9 == 0:                                                       ##
+                        var23 = len(s.chars) - s.cursor                            ##        #
+                        r = self.r_R2(s)  # routine call                     #         #
+                        if not r:                                            #         #
+                            s.cursor = len(s.chars) - var23                        #         #
+                            r = self.r_R1(s)  # routine call                 #         #
+                            if r:                                            # or      #
+                                var22 = len(s.chars) - s.cursor             ##     #         #
+                                r = self.r_shortv(s)  # routine call  #      #         #
+                                if not r:                             # not  #         #
+                                    s.cursor = len(s.chars) - var22         #      #         # among
+                                r = not r                             ##     ##        #
+                        if r:                                                          #
+                            r = s.set_range(self.left, self.right, u'')  # delete      #
+                    if a_9 == 1:                                                       #
+                        r = self.r_R2(s)  # routine call                               #
+                        if r:                                                          #
+                            r = s.starts_with(u'l')  # character check                 #
+                            if r:                                                      #
+                                r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_exception2(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_10 = _find_among(s, _t_10)  ##
+            r = a_10 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = (s.cursor == s.limit)  # atlimit
+                    if r:
+                        if a_10 == 0:  ##
+                            r = True   ## among
+        return r
+    
+    def r_exception1(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_11 = _find_among(s, _t_11)  ##
+            r = a_11 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = (s.cursor == s.limit)  # atlimit
+                    if r:
+                        if a_11 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'ski')  # <-    #
+                        if a_11 == 1:                                               #
+                            r = s.set_range(self.left, self.right, u'sky')  # <-    #
+                        if a_11 == 2:                                               #
+                            r = s.set_range(self.left, self.right, u'die')  # <-    #
+                        if a_11 == 3:                                               #
+                            r = s.set_range(self.left, self.right, u'lie')  # <-    #
+                        if a_11 == 4:                                               #
+                            r = s.set_range(self.left, self.right, u'tie')  # <-    #
+                        if a_11 == 5:                                               #
+                            r = s.set_range(self.left, self.right, u'idl')  # <-    #
+                        if a_11 == 6:                                               # among
+                            r = s.set_range(self.left, self.right, u'gentl')  # <-  #
+                        if a_11 == 7:                                               #
+                            r = s.set_range(self.left, self.right, u'ugli')  # <-   #
+                        if a_11 == 8:                                               #
+                            r = s.set_range(self.left, self.right, u'earli')  # <-  #
+                        if a_11 == 9:                                               #
+                            r = s.set_range(self.left, self.right, u'onli')  # <-   #
+                        if a_11 == 10:                                              #
+                            r = s.set_range(self.left, self.right, u'singl')  # <-  #
+                        if a_11 == 11:                                              #
+                            r = True                                                ##
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        r = self.b_Y_found  # boolean variable check
+        if r:
+            while True:                                                     ##
+                var25 = s.cursor                                            #
+                while True:                                         ##      #
+                    var24 = s.cursor                                #       #
+                    self.left = s.cursor  ##                        #       #
+                    r = True              ## [                      #       #
+                    if r:                                           #       #
+                        r = s.starts_with(u'Y')  # character check  #       #
+                        if r:                                       # goto  #
+                            self.right = s.cursor  ##               #       #
+                            r = True               ## ]             #       # repeat
+                    if r or s.cursor == s.limit:                    #       #
+                        s.cursor = var24                            #       #
+                        break                                       #       #
+                    s.cursor = var24 + 1                            ##      #
+                if r:                                                       #
+                    r = s.set_range(self.left, self.right, u'y')  # <-      #
+                if not r:                                                   #
+                    s.cursor = var25                                        #
+                    break                                                   #
+            r = True                                                        ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var41 = s.cursor                                                                                       ##
+        var27 = s.cursor                          ##                                                           #
+        r = self.r_exception1(s)  # routine call  #                                                            #
+        if not r:                                 #                                                            #
+            s.cursor = var27                      #                                                            #
+            var26 = s.cursor      ##              # or                                                         #
+            r = s.hop(3)  # hop   #               #                                                            #
+            if not r:             # not           #                                                            #
+                s.cursor = var26  #               #                                                            #
+            r = not r             ##              ##                                                           #
+        if not r:                                                                                              #
+            s.cursor = var41                                                                                   #
+            var28 = s.cursor                       ##                                                          #
+            r = self.r_prelude(s)  # routine call  #                                                           #
+            s.cursor = var28                       # do                                                        #
+            r = True                               ##                                                          #
+            if r:                                                                                              #
+                var29 = s.cursor                            ##                                                 #
+                r = self.r_mark_regions(s)  # routine call  #                                                  #
+                s.cursor = var29                            # do                                               #
+                r = True                                    ##                                                 #
+                if r:                                                                                          #
+                    var38 = s.cursor                                                              ##           #
+                    var39 = len(s.chars) - s.limit                                                      #            #
+                    s.direction *= -1                                                             #            #
+                    s.cursor, s.limit = s.limit, s.cursor                                         #            #
+                    var30 = len(s.chars) - s.cursor              ##                                     #            #
+                    r = self.r_Step_1a(s)  # routine call  #                                      #            #
+                    s.cursor = len(s.chars) - var30              # do                                   #            #
+                    r = True                               ##                                     #            #
+                    if r:                                                                         #            #
+                        var37 = len(s.chars) - s.cursor                                           ##    #            #
+                        r = self.r_exception2(s)  # routine call                            #     #            #
+                        if not r:                                                           #     #            #
+                            s.cursor = len(s.chars) - var37                                       #     #            #
+                            var31 = len(s.chars) - s.cursor              ##                       #     #            #
+                            r = self.r_Step_1b(s)  # routine call  #                        #     #            # or
+                            s.cursor = len(s.chars) - var31              # do                     #     #            #
+                            r = True                               ##                       #     #            #
+                            if r:                                                           #     #            #
+                                var32 = len(s.chars) - s.cursor              ##                   #     #            #
+                                r = self.r_Step_1c(s)  # routine call  #                    #     #            #
+                                s.cursor = len(s.chars) - var32              # do                 #     #            #
+                                r = True                               ##                   #     #            #
+                                if r:                                                       #     # backwards  #
+                                    var33 = len(s.chars) - s.cursor             ##                #     #            #
+                                    r = self.r_Step_2(s)  # routine call  #                 #     #            #
+                                    s.cursor = len(s.chars) - var33             # do              # or  #            #
+                                    r = True                              ##                #     #            #
+                                    if r:                                                   #     #            #
+                                        var34 = len(s.chars) - s.cursor             ##            #     #            #
+                                        r = self.r_Step_3(s)  # routine call  #             #     #            #
+                                        s.cursor = len(s.chars) - var34             # do          #     #            #
+                                        r = True                              ##            #     #            #
+                                        if r:                                               #     #            #
+                                            var35 = len(s.chars) - s.cursor             ##        #     #            #
+                                            r = self.r_Step_4(s)  # routine call  #         #     #            #
+                                            s.cursor = len(s.chars) - var35             # do      #     #            #
+                                            r = True                              ##        #     #            #
+                                            if r:                                           #     #            #
+                                                var36 = len(s.chars) - s.cursor             ##    #     #            #
+                                                r = self.r_Step_5(s)  # routine call  #     #     #            #
+                                                s.cursor = len(s.chars) - var36             # do  #     #            #
+                                                r = True                              ##    ##    #            #
+                    s.direction *= -1                                                             #            #
+                    s.cursor = var38                                                              #            #
+                    s.limit = len(s.chars) - var39                                                      ##           #
+                    if r:                                                                                      #
+                        var40 = s.cursor                        ##                                             #
+                        r = self.r_postlude(s)  # routine call  #                                              #
+                        s.cursor = var40                        # do                                           #
+                        r = True                                ##                                             ##
+        return r
+
+_u_last_0 = frozenset([u"'", u'Y', u'c', u'd', u'e', u'g', u'i', u'l', u'm', u'n', u'r', u's', u't', u'y'])
+_u_chars_0 = frozenset([u"'", u'Y', u'y'])
+_u_words_0 = frozenset([u'andes', u'atlas', u'bias', u'cosmos', u'dying', u'early', u'gently', u'howe', u'idly', u'lying', u'news', u'only', u'singly', u'skies', u'skis', u'sky', u'tying', u'ugly'])
+_u_last_1 = frozenset([u"'", u'Y', u'c', u'd', u'e', u'i', u'l', u'm', u'n', u'r', u's', u't', u'y'])
+_u_chars_1 = frozenset([u"'", u'Y', u'a', u'e', u'i', u'o', u'u', u'y'])
+_u_words_1 = frozenset([u'andes', u'atlas', u'bias', u'cosmos', u'dying', u'early', u'gently', u'howe', u'idly', u'lying', u'news', u'only', u'singly', u'skies', u'skis', u'sky', u'tying', u'ugly'])
+_u_words_2 = frozenset([u'andes', u'atlas', u'bias', u'cosmos', u'dying', u'early', u'gently', u'howe', u'idly', u'lying', u'news', u'only', u'singly', u'skies', u'skis', u'sky', u'tying', u'ugly'])
+_u_last_3 = frozenset([u"'", u'Y', u'c', u'd', u'e', u'g', u'i', u'l', u'm', u'n', u'r', u's', u't', u'y'])
+_u_chars_3 = frozenset([u"'", u'Y', u'd', u'e', u'g', u'i', u'l', u'o', u's', u't', u'u', u'y'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word) and word not in _u_words_0) or
+            (word[-1:] not in _u_last_1 and _u_chars_1.isdisjoint(word) and word not in _u_words_1) or
+            (len(word) < 3 and word not in _u_words_2) or
+            (word[-1:] not in _u_last_3 and _u_chars_3.isdisjoint(word)))
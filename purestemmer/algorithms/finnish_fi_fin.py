@@ -0,0 +1,739 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:52:32 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_AEI = frozenset(u'a\xe4ei')
+_g_V1 = frozenset(u'aeiouy\xe4\xf6')
+_g_V2 = frozenset(u'aeiou\xe4\xf6')
+_g_particle_end = frozenset((_g_V1 | set(u'nt')))
+_a_1 = ((u'kaan', '', 0), (u'k\xe4\xe4n', '', 0), (u'kin', '', 0), (u'han', '', 0), (u'h\xe4n', '', 0), (u'sti', '', 1), (u'ko', '', 0), (u'k\xf6', '', 0), (u'pa', '', 0), (u'p\xe4', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'nsa', '', 2), (u'ns\xe4', '', 2), (u'mme', '', 2), (u'nne', '', 2), (u'si', '', 0), (u'ni', '', 1), (u'an', '', 3), (u'\xe4n', '', 4), (u'en', '', 5),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'ssa', '', 0), (u'sta', '', 0), (u'lla', '', 0), (u'lta', '', 0), (u'ta', '', 0), (u'na', '', 0),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'ss\xe4', '', 0), (u'st\xe4', '', 0), (u'll\xe4', '', 0), (u'lt\xe4', '', 0), (u't\xe4', '', 0), (u'n\xe4', '', 0),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'lle', '', 0), (u'ine', '', 0),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'aa', '', 0), (u'ee', '', 0), (u'ii', '', 0), (u'oo', '', 0), (u'uu', '', 0), (u'\xe4\xe4', '', 0), (u'\xf6\xf6', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'siin', 'r_VI', 6), (u'seen', 'r_LONG', 6), (u'tten', 'r_VI', 6), (u'han', '', 0), (u'hen', '', 1), (u'hin', '', 2), (u'hon', '', 3), (u'h\xe4n', '', 4), (u'h\xf6n', '', 5), (u'den', 'r_VI', 6), (u'tta', '', 9), (u'tt\xe4', '', 9), (u'ssa', '', 10), (u'ss\xe4', '', 10), (u'sta', '', 10), (u'st\xe4', '', 10), (u'lla', '', 10), (u'll\xe4', '', 10), (u'lta', '', 10), (u'lt\xe4', '', 10), (u'lle', '', 10), (u'ksi', '', 10), (u'ine', '', 10), (u'ta', '', 10), (u't\xe4', '', 10), (u'na', '', 10), (u'n\xe4', '', 10), (u'n', '', 7), (u'a', '', 8), (u'\xe4', '', 8),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'impi', '', 1), (u'impa', '', 1), (u'imp\xe4', '', 1), (u'immi', '', 1), (u'imma', '', 1), (u'imm\xe4', '', 1), (u'mpi', '', 0), (u'mpa', '', 0), (u'mp\xe4', '', 0), (u'mmi', '', 0), (u'mma', '', 0), (u'mm\xe4', '', 0), (u'eja', '', 1), (u'ej\xe4', '', 1),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'i', '', 0), (u'j', '', 0),)
+_t_9 = _make_among_table(_a_9)
+_a_10 = ((u'imma', '', 1), (u'mma', '', 0),)
+_t_10 = _make_among_table(_a_10)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+        self.i_p2 = 0
+        self.s_x = _String('')
+        self.b_ending_removed = True
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            self.i_p2 = s.limit
+            r = True
+            if r:
+                for var0 in xrange(s.cursor, s.limit, 1):  ##
+                    if s.chars[var0] in _g_V1:             #
+                        s.cursor = var0                    #
+                        r = True                           #
+                        break                              # goto
+                else:                                      #
+                    s.cursor = s.limit                     #
+                    r = False                              ##
+                if r:
+                    for var1 in xrange(s.cursor, s.limit, 1):  ##
+                        if s.chars[var1] not in _g_V1:         #
+                            s.cursor = var1 + 1                #
+                            r = True                           #
+                            break                              # gopast
+                    else:                                      #
+                        s.cursor = s.limit                     #
+                        r = False                              ##
+                    if r:
+                        self.i_p1 = s.cursor  ##
+                        r = True              ## setmark
+                        if r:
+                            for var2 in xrange(s.cursor, s.limit, 1):  ##
+                                if s.chars[var2] in _g_V1:             #
+                                    s.cursor = var2                    #
+                                    r = True                           #
+                                    break                              # goto
+                            else:                                      #
+                                s.cursor = s.limit                     #
+                                r = False                              ##
+                            if r:
+                                for var3 in xrange(s.cursor, s.limit, 1):  ##
+                                    if s.chars[var3] not in _g_V1:         #
+                                        s.cursor = var3 + 1                #
+                                        r = True                           #
+                                        break                              # gopast
+                                else:                                      #
+                                    s.cursor = s.limit                     #
+                                    r = False                              ##
+                                if r:
+                                    self.i_p2 = s.cursor  ##
+                                    r = True              ## setmark
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_particle_etc(self, s):
+        r = True
+        var4 = len(s.chars) - s.cursor                          ##
+        var5 = s.limit                                    #
+        r = s.to_mark(self.i_p1)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var4                      #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_1 = _find_among(s, _t_1)  ##            #
+                r = a_1 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var5                                ##
+        if r:
+            if a_1 == 0:                                                            ##
+                if s.cursor == s.limit:                           ##                #
+                    r = False                                     #                 #
+                else:                                             #                 #
+                    r = s.chars[s.cursor - 1] in _g_particle_end  # grouping check  # among
+                if r:                                             #                 #
+                    s.cursor -= 1                                 ##                #
+            if a_1 == 1:                                                            #
+                r = self.r_R2(s)  # routine call                                    ##
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_possessive(self, s):
+        r = True
+        var6 = len(s.chars) - s.cursor                          ##
+        var7 = s.limit                                    #
+        r = s.to_mark(self.i_p1)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var6                      #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_2 = _find_among(s, _t_2)  ##            #
+                r = a_2 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var7                                ##
+        if r:
+            if a_2 == 0:                                                              ##
+                var8 = len(s.chars) - s.cursor                    ##                        #
+                r = s.starts_with(u'k')  # character check  #                         #
+                if not r:                                   # not                     #
+                    s.cursor = len(s.chars) - var8                #                         #
+                r = not r                                   ##                        #
+                if r:                                                                 #
+                    r = s.set_range(self.left, self.right, u'')  # delete             #
+            if a_2 == 1:                                                              #
+                r = s.set_range(self.left, self.right, u'')  # delete                 #
+                if r:                                                                 #
+                    self.left = s.cursor  ##                                          #
+                    r = True              ## [                                        #
+                    if r:                                                             #
+                        r = s.starts_with(u'kse')  # character check                  #
+                        if r:                                                         #
+                            self.right = s.cursor  ##                                 #
+                            r = True               ## ]                               #
+                            if r:                                                     #
+                                r = s.set_range(self.left, self.right, u'ksi')  # <-  #
+            if a_2 == 2:                                                              #
+                r = s.set_range(self.left, self.right, u'')  # delete                 #
+            if a_2 == 3:                                                              #
+                a_3 = _find_among(s, _t_3)  ##                                        # among
+                r = a_3 is not None         #                                         #
+                if r:                       # among                                   #
+                    if a_3 == 0:            #                                         #
+                        r = True            ##                                        #
+                if r:                                                                 #
+                    r = s.set_range(self.left, self.right, u'')  # delete             #
+            if a_2 == 4:                                                              #
+                a_4 = _find_among(s, _t_4)  ##                                        #
+                r = a_4 is not None         #                                         #
+                if r:                       # among                                   #
+                    if a_4 == 0:            #                                         #
+                        r = True            ##                                        #
+                if r:                                                                 #
+                    r = s.set_range(self.left, self.right, u'')  # delete             #
+            if a_2 == 5:                                                              #
+                a_5 = _find_among(s, _t_5)  ##                                        #
+                r = a_5 is not None         #                                         #
+                if r:                       # among                                   #
+                    if a_5 == 0:            #                                         #
+                        r = True            ##                                        #
+                if r:                                                                 #
+                    r = s.set_range(self.left, self.right, u'')  # delete             ##
+        return r
+    
+    def r_LONG(self, s):
+        r = True
+        a_6 = _find_among(s, _t_6)  ##
+        r = a_6 is not None         #
+        if r:                       # among
+            if a_6 == 0:            #
+                r = True            ##
+        return r
+    
+    def r_VI(self, s):
+        r = True
+        r = s.starts_with(u'i')  # character check
+        if r:
+            if s.cursor == s.limit:                 ##
+                r = False                           #
+            else:                                   #
+                r = s.chars[s.cursor - 1] in _g_V2  # grouping check
+            if r:                                   #
+                s.cursor -= 1                       ##
+        return r
+    
+    def r_case_ending(self, s):
+        r = True
+        var14 = len(s.chars) - s.cursor                                                  ##
+        var15 = s.limit                                                            #
+        r = s.to_mark(self.i_p1)  # tomark                                         #
+        if r:                                                                      #
+            s.limit = s.cursor                                                     #
+            s.cursor = len(s.chars) - var14                                              #
+            self.left = s.cursor  ##                                               #
+            r = True              ## [                                             #
+            if r:                                                                  #
+                a_7 = None                                            ##           #
+                r = False                                             #            #
+                var9 = s.cursor                                       #            #
+                for var13, var12, var11 in _find_among_all(s, _t_7):  #            # setlimit
+                    s.cursor = var9 + len(var13) * s.direction        #            #
+                    var10 = s.cursor                                  #            #
+                    r = (not var12) or getattr(self, var12)(s)        # substring  #
+                    if r:                                             #            #
+                        s.cursor = var10                              #            #
+                        a_7 = var11                                   #            #
+                        break                                         #            #
+                    s.cursor = var9                                   ##           #
+                if r:                                                              #
+                    self.right = s.cursor  ##                                      #
+                    r = True               ## ]                                    #
+            s.limit = var15                                                        ##
+        if r:
+            if a_7 == 0:                                                                   ##
+                r = s.starts_with(u'a')  # character check                                 #
+            if a_7 == 1:                                                                   #
+                r = s.starts_with(u'e')  # character check                                 #
+            if a_7 == 2:                                                                   #
+                r = s.starts_with(u'i')  # character check                                 #
+            if a_7 == 3:                                                                   #
+                r = s.starts_with(u'o')  # character check                                 #
+            if a_7 == 4:                                                                   #
+                r = s.starts_with(u'\xe4')  # character check                              #
+            if a_7 == 5:                                                                   #
+                r = s.starts_with(u'\xf6')  # character check                              #
+            if a_7 == 6:                                                                   #
+                pass                                                                       #
+            if a_7 == 7:                                                                   #
+                var18 = len(s.chars) - s.cursor                                     ##           #
+                var17 = len(s.chars) - s.cursor                              ##     #            #
+                var16 = len(s.chars) - s.cursor                        ##    #      #            #
+                r = self.r_LONG(s)  # routine call               #     #      #            #
+                if not r:                                        # or  #      #            #
+                    s.cursor = len(s.chars) - var16                    #     # and  #            #
+                    r = s.starts_with(u'ie')  # character check  ##    #      #            #
+                if r:                                                  #      #            #
+                    s.cursor = len(s.chars) - var17                          #      # try        #
+                    r = s.hop(1)  # next                               ##     #            # among
+                if r:                                                         #            #
+                    self.right = s.cursor  ##                                 #            #
+                    r = True               ## ]                               #            #
+                if not r:                                                     #            #
+                    r = True                                                  #            #
+                    s.cursor = len(s.chars) - var18                                 ##           #
+            if a_7 == 8:                                                                   #
+                if s.cursor == s.limit:                 ##                                 #
+                    r = False                           #                                  #
+                else:                                   #                                  #
+                    r = s.chars[s.cursor - 1] in _g_V1  # grouping check                   #
+                if r:                                   #                                  #
+                    s.cursor -= 1                       ##                                 #
+                if r:                                                                      #
+                    if s.cursor == s.limit:                     ##                         #
+                        r = False                               #                          #
+                    else:                                       #                          #
+                        r = s.chars[s.cursor - 1] not in _g_V1  # negative grouping check  #
+                    if r:                                       #                          #
+                        s.cursor -= 1                           ##                         #
+            if a_7 == 9:                                                                   #
+                r = s.starts_with(u'e')  # character check                                 #
+            if a_7 == 10:                                                                  #
+                r = True                                                                   ##
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+                if r:
+                    self.b_ending_removed = True  ##
+                    r = True                      ## set
+        return r
+    
+    def r_other_endings(self, s):
+        r = True
+        var19 = len(s.chars) - s.cursor                         ##
+        var20 = s.limit                                   #
+        r = s.to_mark(self.i_p2)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var19                     #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_8 = _find_among(s, _t_8)  ##            #
+                r = a_8 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var20                               ##
+        if r:
+            if a_8 == 0:                                            ##
+                var21 = len(s.chars) - s.cursor                    ##     #
+                r = s.starts_with(u'po')  # character check  #      #
+                if not r:                                    # not  #
+                    s.cursor = len(s.chars) - var21                #      # among
+                r = not r                                    ##     #
+            if a_8 == 1:                                            #
+                r = True                                            ##
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_i_plural(self, s):
+        r = True
+        var22 = len(s.chars) - s.cursor                         ##
+        var23 = s.limit                                   #
+        r = s.to_mark(self.i_p1)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var22                     #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_9 = _find_among(s, _t_9)  ##            #
+                r = a_9 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var23                               ##
+        if r:
+            if a_9 == 0:  ##
+                r = True  ## among
+            if r:
+                r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_t_plural(self, s):
+        r = True
+        var25 = len(s.chars) - s.cursor                                                         ##
+        var26 = s.limit                                                                   #
+        r = s.to_mark(self.i_p1)  # tomark                                                #
+        if r:                                                                             #
+            s.limit = s.cursor                                                            #
+            s.cursor = len(s.chars) - var25                                                     #
+            self.left = s.cursor  ##                                                      #
+            r = True              ## [                                                    #
+            if r:                                                                         #
+                r = s.starts_with(u't')  # character check                                #
+                if r:                                                                     #
+                    self.right = s.cursor  ##                                             #
+                    r = True               ## ]                                           # setlimit
+                    if r:                                                                 #
+                        var24 = len(s.chars) - s.cursor                                 ##      #
+                        if s.cursor == s.limit:                 ##                #       #
+                            r = False                           #                 #       #
+                        else:                                   #                 #       #
+                            r = s.chars[s.cursor - 1] in _g_V1  # grouping check  # test  #
+                        if r:                                   #                 #       #
+                            s.cursor -= 1                       ##                #       #
+                        s.cursor = len(s.chars) - var24                                 ##      #
+                        if r:                                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete         #
+            s.limit = var26                                                               ##
+        if r:
+            var27 = len(s.chars) - s.cursor                           ##
+            var28 = s.limit                                     #
+            r = s.to_mark(self.i_p2)  # tomark                  #
+            if r:                                               #
+                s.limit = s.cursor                              #
+                s.cursor = len(s.chars) - var27                       #
+                self.left = s.cursor  ##                        #
+                r = True              ## [                      # setlimit
+                if r:                                           #
+                    a_10 = _find_among(s, _t_10)  ##            #
+                    r = a_10 is not None          ## substring  #
+                    if r:                                       #
+                        self.right = s.cursor  ##               #
+                        r = True               ## ]             #
+                s.limit = var28                                 ##
+            if r:
+                if a_10 == 0:                                           ##
+                    var29 = len(s.chars) - s.cursor                    ##     #
+                    r = s.starts_with(u'po')  # character check  #      #
+                    if not r:                                    # not  #
+                        s.cursor = len(s.chars) - var29                #      # among
+                    r = not r                                    ##     #
+                if a_10 == 1:                                           #
+                    r = True                                            ##
+                if r:
+                    r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_tidy(self, s):
+        r = True
+        var36 = len(s.chars) - s.cursor                                                                        ##
+        var37 = s.limit                                                                                  #
+        r = s.to_mark(self.i_p1)  # tomark                                                               #
+        if r:                                                                                            #
+            s.limit = s.cursor                                                                           #
+            s.cursor = len(s.chars) - var36                                                                    #
+            var31 = len(s.chars) - s.cursor                                                     ##             #
+            var30 = len(s.chars) - s.cursor                                              ##     #              #
+            r = self.r_LONG(s)  # routine call                                     #      #              #
+            if r:                                                                  #      #              #
+                s.cursor = len(s.chars) - var30                                          #      #              #
+                self.left = s.cursor  ##                                           #      #              #
+                r = True              ## [                                         #      #              #
+                if r:                                                              # and  #              #
+                    r = s.hop(1)  # next                                           #      # do           #
+                    if r:                                                          #      #              #
+                        self.right = s.cursor  ##                                  #      #              #
+                        r = True               ## ]                                #      #              #
+                        if r:                                                      #      #              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##     #              #
+            s.cursor = len(s.chars) - var31                                                     #              #
+            r = True                                                                      ##             #
+            if r:                                                                                        #
+                var32 = len(s.chars) - s.cursor                                                          ##    #
+                self.left = s.cursor  ##                                                           #     #
+                r = True              ## [                                                         #     #
+                if r:                                                                              #     #
+                    if s.cursor == s.limit:                  ##                                    #     #
+                        r = False                            #                                     #     #
+                    else:                                    #                                     #     #
+                        r = s.chars[s.cursor - 1] in _g_AEI  # grouping check                      #     #
+                    if r:                                    #                                     #     #
+                        s.cursor -= 1                        ##                                    #     #
+                    if r:                                                                          #     #
+                        self.right = s.cursor  ##                                                  #     #
+                        r = True               ## ]                                                # do  #
+                        if r:                                                                      #     #
+                            if s.cursor == s.limit:                     ##                         #     #
+                                r = False                               #                          #     #
+                            else:                                       #                          #     #
+                                r = s.chars[s.cursor - 1] not in _g_V1  # negative grouping check  #     #
+                            if r:                                       #                          #     # setlimit
+                                s.cursor -= 1                           ##                         #     #
+                            if r:                                                                  #     #
+                                r = s.set_range(self.left, self.right, u'')  # delete              #     #
+                s.cursor = len(s.chars) - var32                                                          #     #
+                r = True                                                                           ##    #
+                if r:                                                                                    #
+                    var34 = len(s.chars) - s.cursor                                              ##            #
+                    self.left = s.cursor  ##                                               #             #
+                    r = True              ## [                                             #             #
+                    if r:                                                                  #             #
+                        r = s.starts_with(u'j')  # character check                         #             #
+                        if r:                                                              #             #
+                            self.right = s.cursor  ##                                      #             #
+                            r = True               ## ]                                    #             #
+                            if r:                                                          #             #
+                                var33 = len(s.chars) - s.cursor                       ##         # do          #
+                                r = s.starts_with(u'o')  # character check      #          #             #
+                                if not r:                                       # or       #             #
+                                    s.cursor = len(s.chars) - var33                   #          #             #
+                                    r = s.starts_with(u'u')  # character check  ##         #             #
+                                if r:                                                      #             #
+                                    r = s.set_range(self.left, self.right, u'')  # delete  #             #
+                    s.cursor = len(s.chars) - var34                                              #             #
+                    r = True                                                               ##            #
+                    if r:                                                                                #
+                        var35 = len(s.chars) - s.cursor                                              ##        #
+                        self.left = s.cursor  ##                                               #         #
+                        r = True              ## [                                             #         #
+                        if r:                                                                  #         #
+                            r = s.starts_with(u'o')  # character check                         #         #
+                            if r:                                                              #         #
+                                self.right = s.cursor  ##                                      #         #
+                                r = True               ## ]                                    # do      #
+                                if r:                                                          #         #
+                                    r = s.starts_with(u'j')  # character check                 #         #
+                                    if r:                                                      #         #
+                                        r = s.set_range(self.left, self.right, u'')  # delete  #         #
+                        s.cursor = len(s.chars) - var35                                              #         #
+                        r = True                                                               ##        #
+            s.limit = var37                                                                              ##
+        if r:
+            for var38 in xrange(s.cursor - 1, s.limit - 1, -1):  ##
+                if s.chars[var38] not in _g_V1:                  #
+                    s.cursor = var38 + 1                         #
+                    r = True                                     #
+                    break                                        # goto
+            else:                                                #
+                s.cursor = s.limit                               #
+                r = False                                        ##
+            if r:
+                self.left = s.cursor  ##
+                r = True              ## [
+                if r:
+                    r = s.hop(1)  # next
+                    if r:
+                        self.right = s.cursor  ##
+                        r = True               ## ]
+                        if r:
+                            r = self.s_x.set_chars(s.get_range(self.left, self.right))  # ->
+                            if r:
+                                r = s.starts_with(self.s_x.chars)  # character check
+                                if r:
+                                    r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var39 = s.cursor                            ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var39                            # do
+        r = True                                    ##
+        if r:
+            self.b_ending_removed = False  ##
+            r = True                       ## unset
+            if r:
+                var48 = s.cursor                                                           ##
+                var49 = len(s.chars) - s.limit                                                   #
+                s.direction *= -1                                                          #
+                s.cursor, s.limit = s.limit, s.cursor                                      #
+                var40 = len(s.chars) - s.cursor                   ##                             #
+                r = self.r_particle_etc(s)  # routine call  #                              #
+                s.cursor = len(s.chars) - var40                   # do                           #
+                r = True                                    ##                             #
+                if r:                                                                      #
+                    var41 = len(s.chars) - s.cursor                 ##                           #
+                    r = self.r_possessive(s)  # routine call  #                            #
+                    s.cursor = len(s.chars) - var41                 # do                         #
+                    r = True                                  ##                           #
+                    if r:                                                                  #
+                        var42 = len(s.chars) - s.cursor                  ##                      #
+                        r = self.r_case_ending(s)  # routine call  #                       #
+                        s.cursor = len(s.chars) - var42                  # do                    #
+                        r = True                                   ##                      #
+                        if r:                                                              #
+                            var43 = len(s.chars) - s.cursor                    ##                #
+                            r = self.r_other_endings(s)  # routine call  #                 #
+                            s.cursor = len(s.chars) - var43                    # do              #
+                            r = True                                     ##                # backwards
+                            if r:                                                          #
+                                var46 = len(s.chars) - s.cursor                            ##    #
+                                r = self.b_ending_removed  # boolean variable check  #     #
+                                if r:                                                #     #
+                                    var44 = len(s.chars) - s.cursor               ##       #     #
+                                    r = self.r_i_plural(s)  # routine call  #        #     #
+                                    s.cursor = len(s.chars) - var44               # do     #     #
+                                    r = True                                ##       # or  #
+                                if not r:                                            #     #
+                                    s.cursor = len(s.chars) - var46                        #     #
+                                    var45 = len(s.chars) - s.cursor               ##       #     #
+                                    r = self.r_t_plural(s)  # routine call  #        #     #
+                                    s.cursor = len(s.chars) - var45               # do     #     #
+                                    r = True                                ##       ##    #
+                                if r:                                                      #
+                                    var47 = len(s.chars) - s.cursor           ##                 #
+                                    r = self.r_tidy(s)  # routine call  #                  #
+                                    s.cursor = len(s.chars) - var47           # do               #
+                                    r = True                            ##                 #
+                s.direction *= -1                                                          #
+                s.cursor = var48                                                           #
+                s.limit = len(s.chars) - var49                                                   ##
+        return r
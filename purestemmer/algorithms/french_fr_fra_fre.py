@@ -0,0 +1,951 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:52:53 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy\xe2\xe0\xeb\xe9\xea\xe8\xef\xee\xf4\xfb\xf9')
+_a_1 = ((u'par', '', 0), (u'col', '', 0), (u'tap', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'I', '', 0), (u'U', '', 1), (u'Y', '', 2), (u'', '', 3),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'issements', '', 11), (u'issement', '', 11), (u'atrices', '', 1), (u'atrice', '', 1), (u'ateurs', '', 1), (u'ations', '', 1), (u'logies', '', 2), (u'usions', '', 3), (u'utions', '', 3), (u'ements', '', 5), (u'amment', '', 12), (u'emment', '', 13), (u'ances', '', 0), (u'iqUes', '', 0), (u'ismes', '', 0), (u'ables', '', 0), (u'istes', '', 0), (u'ateur', '', 1), (u'ation', '', 1), (u'logie', '', 2), (u'usion', '', 3), (u'ution', '', 3), (u'ences', '', 4), (u'ement', '', 5), (u'euses', '', 10), (u'ments', '', 14), (u'ance', '', 0), (u'iqUe', '', 0), (u'isme', '', 0), (u'able', '', 0), (u'iste', '', 0), (u'ence', '', 4), (u'it\xe9s', '', 6), (u'ives', '', 7), (u'eaux', '', 8), (u'euse', '', 10), (u'ment', '', 14), (u'eux', '', 0), (u'it\xe9', '', 6), (u'ive', '', 7), (u'ifs', '', 7), (u'aux', '', 9), (u'if', '', 7),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'eus', '', 1), (u'abl', '', 2), (u'iqU', '', 2), (u'i\xe8r', '', 3), (u'I\xe8r', '', 3), (u'iv', '', 0),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'abil', '', 0), (u'ic', '', 1), (u'iv', '', 2),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'issaIent', '', 0), (u'issantes', '', 0), (u'iraIent', '', 0), (u'issante', '', 0), (u'issants', '', 0), (u'issions', '', 0), (u'irions', '', 0), (u'issais', '', 0), (u'issait', '', 0), (u'issant', '', 0), (u'issent', '', 0), (u'issiez', '', 0), (u'issons', '', 0), (u'irais', '', 0), (u'irait', '', 0), (u'irent', '', 0), (u'iriez', '', 0), (u'irons', '', 0), (u'iront', '', 0), (u'isses', '', 0), (u'issez', '', 0), (u'\xeemes', '', 0), (u'\xeetes', '', 0), (u'irai', '', 0), (u'iras', '', 0), (u'irez', '', 0), (u'isse', '', 0), (u'ies', '', 0), (u'ira', '', 0), (u'\xeet', '', 0), (u'ie', '', 0), (u'ir', '', 0), (u'is', '', 0), (u'it', '', 0), (u'i', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'eraIent', '', 1), (u'assions', '', 2), (u'erions', '', 1), (u'assent', '', 2), (u'assiez', '', 2), (u'\xe8rent', '', 1), (u'erais', '', 1), (u'erait', '', 1), (u'eriez', '', 1), (u'erons', '', 1), (u'eront', '', 1), (u'aIent', '', 2), (u'antes', '', 2), (u'asses', '', 2), (u'ions', '', 0), (u'erai', '', 1), (u'eras', '', 1), (u'erez', '', 1), (u'\xe2mes', '', 2), (u'\xe2tes', '', 2), (u'ante', '', 2), (u'ants', '', 2), (u'asse', '', 2), (u'\xe9es', '', 1), (u'era', '', 1), (u'iez', '', 1), (u'ais', '', 2), (u'ait', '', 2), (u'ant', '', 2), (u'\xe9e', '', 1), (u'\xe9s', '', 1), (u'er', '', 1), (u'ez', '', 1), (u'\xe2t', '', 2), (u'ai', '', 2), (u'as', '', 2), (u'\xe9', '', 1), (u'a', '', 2),)
+_t_7 = _make_among_table(_a_7)
+_g_keep_with_s = frozenset(u'aiou\xe8s')
+_a_8 = ((u'i\xe8re', '', 1), (u'I\xe8re', '', 1), (u'ion', '', 0), (u'ier', '', 1), (u'Ier', '', 1), (u'e', '', 2), (u'\xeb', '', 3),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'eill', '', 0), (u'enn', '', 0), (u'onn', '', 0), (u'ett', '', 0), (u'ell', '', 0),)
+_t_9 = _make_among_table(_a_9)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_pV = 0
+        self.i_p1 = 0
+        self.i_p2 = 0
+
+    def r_prelude(self, s):
+        r = True
+        while True:                                                                                                         ##
+            var5 = s.cursor                                                                                                 #
+            while True:                                                                                             ##      #
+                var4 = s.cursor                                                                                     #       #
+                var3 = s.cursor                                                                               ##    #       #
+                var2 = s.cursor                                                                         ##    #     #       #
+                if s.cursor == s.limit:            ##                                                   #     #     #       #
+                    r = False                      #                                                    #     #     #       #
+                else:                              #                                                    #     #     #       #
+                    r = s.chars[s.cursor] in _g_v  # grouping check                                     #     #     #       #
+                if r:                              #                                                    #     #     #       #
+                    s.cursor += 1                  ##                                                   #     #     #       #
+                if r:                                                                                   #     #     #       #
+                    self.left = s.cursor  ##                                                            #     #     #       #
+                    r = True              ## [                                                          #     #     #       #
+                    if r:                                                                               #     #     #       #
+                        var1 = s.cursor                                                           ##    #     #     #       #
+                        var0 = s.cursor                                                     ##    #     #     #     #       #
+                        r = s.starts_with(u'u')  # character check                          #     #     #     #     #       #
+                        if r:                                                               #     #     #     #     #       #
+                            self.right = s.cursor  ##                                       #     #     #     #     #       #
+                            r = True               ## ]                                     #     #     #     #     #       #
+                            if r:                                                           #     #     #     #     #       #
+                                if s.cursor == s.limit:            ##                       #     #     #     #     #       #
+                                    r = False                      #                        #     #     #     #     #       #
+                                else:                              #                        #     #     #     #     #       #
+                                    r = s.chars[s.cursor] in _g_v  # grouping check         #     #     #     #     #       #
+                                if r:                              #                        #     #     #     #     #       #
+                                    s.cursor += 1                  ##                       #     #     #     #     #       #
+                                if r:                                                       #     #     #     #     #       #
+                                    r = s.set_range(self.left, self.right, u'U')  # <-      #     #     #     #     #       #
+                        if not r:                                                           # or  #     #     #     #       #
+                            s.cursor = var0                                                 #     #     #     #     #       #
+                            r = s.starts_with(u'i')  # character check                      #     #     #     #     #       #
+                            if r:                                                           #     #     #     #     #       #
+                                self.right = s.cursor  ##                                   #     # or  #     #     #       #
+                                r = True               ## ]                                 #     #     #     #     #       #
+                                if r:                                                       #     #     #     #     #       #
+                                    if s.cursor == s.limit:            ##                   #     #     # or  #     #       #
+                                        r = False                      #                    #     #     #     #     #       #
+                                    else:                              #                    #     #     #     #     #       #
+                                        r = s.chars[s.cursor] in _g_v  # grouping check     #     #     #     #     #       #
+                                    if r:                              #                    #     #     #     #     #       #
+                                        s.cursor += 1                  ##                   #     #     #     #     #       #
+                                    if r:                                                   #     #     #     # or  #       #
+                                        r = s.set_range(self.left, self.right, u'I')  # <-  ##    #     #     #     # goto  #
+                        if not r:                                                                 #     #     #     #       # repeat
+                            s.cursor = var1                                                       #     #     #     #       #
+                            r = s.starts_with(u'y')  # character check                            #     #     #     #       #
+                            if r:                                                                 #     #     #     #       #
+                                self.right = s.cursor  ##                                         #     #     #     #       #
+                                r = True               ## ]                                       #     #     #     #       #
+                                if r:                                                             #     #     #     #       #
+                                    r = s.set_range(self.left, self.right, u'Y')  # <-            ##    #     #     #       #
+                if not r:                                                                               #     #     #       #
+                    s.cursor = var2                                                                     #     #     #       #
+                    self.left = s.cursor  ##                                                            #     #     #       #
+                    r = True              ## [                                                          #     #     #       #
+                    if r:                                                                               #     #     #       #
+                        r = s.starts_with(u'y')  # character check                                      #     #     #       #
+                        if r:                                                                           #     #     #       #
+                            self.right = s.cursor  ##                                                   #     #     #       #
+                            r = True               ## ]                                                 #     #     #       #
+                            if r:                                                                       #     #     #       #
+                                if s.cursor == s.limit:            ##                                   #     #     #       #
+                                    r = False                      #                                    #     #     #       #
+                                else:                              #                                    #     #     #       #
+                                    r = s.chars[s.cursor] in _g_v  # grouping check                     #     #     #       #
+                                if r:                              #                                    #     #     #       #
+                                    s.cursor += 1                  ##                                   #     #     #       #
+                                if r:                                                                   #     #     #       #
+                                    r = s.set_range(self.left, self.right, u'Y')  # <-                  ##    #     #       #
+                if not r:                                                                                     #     #       #
+                    s.cursor = var3                                                                           #     #       #
+                    r = s.starts_with(u'q')  # character check                                                #     #       #
+                    if r:                                                                                     #     #       #
+                        self.left = s.cursor  ##                                                              #     #       #
+                        r = True              ## [                                                            #     #       #
+                        if r:                                                                                 #     #       #
+                            r = s.starts_with(u'u')  # character check                                        #     #       #
+                            if r:                                                                             #     #       #
+                                self.right = s.cursor  ##                                                     #     #       #
+                                r = True               ## ]                                                   #     #       #
+                                if r:                                                                         #     #       #
+                                    r = s.set_range(self.left, self.right, u'U')  # <-                        ##    #       #
+                if r or s.cursor == s.limit:                                                                        #       #
+                    s.cursor = var4                                                                                 #       #
+                    break                                                                                           #       #
+                s.cursor = var4 + 1                                                                                 ##      #
+            if not r:                                                                                                       #
+                s.cursor = var5                                                                                             #
+                break                                                                                                       #
+        r = True                                                                                                            ##
+        return r
+    
+    def r_mark_regions(self, s):
+        r = True
+        self.i_pV = s.limit
+        r = True
+        if r:
+            self.i_p1 = s.limit
+            r = True
+            if r:
+                self.i_p2 = s.limit
+                r = True
+                if r:
+                    var9 = s.cursor                                                      ##
+                    var8 = s.cursor                                                ##    #
+                    var6 = s.cursor                                          ##    #     #
+                    if s.cursor == s.limit:            ##                    #     #     #
+                        r = False                      #                     #     #     #
+                    else:                              #                     #     #     #
+                        r = s.chars[s.cursor] in _g_v  # grouping check      #     #     #
+                    if r:                              #                     #     #     #
+                        s.cursor += 1                  ##                    #     #     #
+                    if r:                                                    #     #     #
+                        if s.cursor == s.limit:            ##                #     #     #
+                            r = False                      #                 #     #     #
+                        else:                              #                 #     #     #
+                            r = s.chars[s.cursor] in _g_v  # grouping check  # or  #     #
+                        if r:                              #                 #     #     #
+                            s.cursor += 1                  ##                #     #     #
+                        if r:                                                #     #     #
+                            r = s.hop(1)  # next                             #     #     #
+                    if not r:                                                #     #     #
+                        s.cursor = var6                                      #     # or  #
+                        a_1 = _find_among(s, _t_1)  ##                       #     #     #
+                        r = a_1 is not None         #                        #     #     # do
+                        if r:                       # among                  #     #     #
+                            if a_1 == 0:            #                        #     #     #
+                                r = True            ##                       ##    #     #
+                    if not r:                                                      #     #
+                        s.cursor = var8                                            #     #
+                        r = s.hop(1)  # next                                       #     #
+                        if r:                                                      #     #
+                            for var7 in xrange(s.cursor, s.limit, 1):  ##          #     #
+                                if s.chars[var7] in _g_v:              #           #     #
+                                    s.cursor = var7 + 1                #           #     #
+                                    r = True                           #           #     #
+                                    break                              # gopast    #     #
+                            else:                                      #           #     #
+                                s.cursor = s.limit                     #           #     #
+                                r = False                              ##          ##    #
+                    if r:                                                                #
+                        self.i_pV = s.cursor  ##                                         #
+                        r = True              ## setmark                                 #
+                    s.cursor = var9                                                      #
+                    r = True                                                             ##
+                    if r:
+                        var14 = s.cursor                                                      ##
+                        for var10 in xrange(s.cursor, s.limit, 1):  ##                        #
+                            if s.chars[var10] in _g_v:              #                         #
+                                s.cursor = var10 + 1                #                         #
+                                r = True                            #                         #
+                                break                               # gopast                  #
+                        else:                                       #                         #
+                            s.cursor = s.limit                      #                         #
+                            r = False                               ##                        #
+                        if r:                                                                 #
+                            for var11 in xrange(s.cursor, s.limit, 1):  ##                    #
+                                if s.chars[var11] not in _g_v:          #                     #
+                                    s.cursor = var11 + 1                #                     #
+                                    r = True                            #                     #
+                                    break                               # gopast              #
+                            else:                                       #                     #
+                                s.cursor = s.limit                      #                     #
+                                r = False                               ##                    #
+                            if r:                                                             #
+                                self.i_p1 = s.cursor  ##                                      #
+                                r = True              ## setmark                              #
+                                if r:                                                         #
+                                    for var12 in xrange(s.cursor, s.limit, 1):  ##            # do
+                                        if s.chars[var12] in _g_v:              #             #
+                                            s.cursor = var12 + 1                #             #
+                                            r = True                            #             #
+                                            break                               # gopast      #
+                                    else:                                       #             #
+                                        s.cursor = s.limit                      #             #
+                                        r = False                               ##            #
+                                    if r:                                                     #
+                                        for var13 in xrange(s.cursor, s.limit, 1):  ##        #
+                                            if s.chars[var13] not in _g_v:          #         #
+                                                s.cursor = var13 + 1                #         #
+                                                r = True                            #         #
+                                                break                               # gopast  #
+                                        else:                                       #         #
+                                            s.cursor = s.limit                      #         #
+                                            r = False                               ##        #
+                                        if r:                                                 #
+                                            self.i_p2 = s.cursor  ##                          #
+                                            r = True              ## setmark                  #
+                        s.cursor = var14                                                      #
+                        r = True                                                              ##
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        while True:                                                                      ##
+            var15 = s.cursor                                                             #
+            self.left = s.cursor  ##                                                     #
+            r = True              ## [                                                   #
+            if r:                                                                        #
+                a_2 = _find_among(s, _t_2)  ##                                           #
+                r = a_2 is not None         ## substring                                 #
+                if r:                                                                    #
+                    self.right = s.cursor  ##                                            #
+                    r = True               ## ]                                          #
+                    if r:                                                                #
+                        if a_2 == 0:                                            ##       # repeat
+                            r = s.set_range(self.left, self.right, u'i')  # <-  #        #
+                        if a_2 == 1:                                            #        #
+                            r = s.set_range(self.left, self.right, u'u')  # <-  #        #
+                        if a_2 == 2:                                            # among  #
+                            r = s.set_range(self.left, self.right, u'y')  # <-  #        #
+                        if a_2 == 3:                                            #        #
+                            r = s.hop(1)  # next                                ##       #
+            if not r:                                                                    #
+                s.cursor = var15                                                         #
+                break                                                                    #
+        r = True                                                                         ##
+        return r
+    
+    def r_RV(self, s):
+        r = True
+        r = self.i_pV <= s.cursor  # <=
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_standard_suffix(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_3 = _find_among(s, _t_3)  ##
+            r = a_3 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_3 == 0:                                                                                                               ##
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                    if a_3 == 1:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var17 = len(s.chars) - s.cursor                                                    ##                                #
+                                self.left = s.cursor  ##                                                     #                                 #
+                                r = True              ## [                                                   #                                 #
+                                if r:                                                                        #                                 #
+                                    r = s.starts_with(u'ic')  # character check                              #                                 #
+                                    if r:                                                                    #                                 #
+                                        self.right = s.cursor  ##                                            #                                 #
+                                        r = True               ## ]                                          #                                 #
+                                        if r:                                                                #                                 #
+                                            var16 = len(s.chars) - s.cursor                                  ##    # try                             #
+                                            r = self.r_R2(s)  # routine call                           #     #                                 #
+                                            if r:                                                      #     #                                 #
+                                                r = s.set_range(self.left, self.right, u'')  # delete  # or  #                                 #
+                                            if not r:                                                  #     #                                 #
+                                                s.cursor = len(s.chars) - var16                              #     #                                 #
+                                                r = s.set_range(self.left, self.right, u'iqU')  # <-   ##    #                                 #
+                                if not r:                                                                    #                                 #
+                                    r = True                                                                 #                                 #
+                                    s.cursor = len(s.chars) - var17                                                ##                                #
+                    if a_3 == 2:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'log')  # <-                                                               #
+                    if a_3 == 3:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'u')  # <-                                                                 #
+                    if a_3 == 4:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'ent')  # <-                                                               #
+                    if a_3 == 5:                                                                                                               #
+                        r = self.r_RV(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var19 = len(s.chars) - s.cursor                                                                               ##     #
+                                self.left = s.cursor  ##                                                                                #      #
+                                r = True              ## [                                                                              #      #
+                                if r:                                                                                                   #      #
+                                    a_4 = _find_among(s, _t_4)  ##                                                                      #      #
+                                    r = a_4 is not None         ## substring                                                            #      #
+                                    if r:                                                                                               #      #
+                                        self.right = s.cursor  ##                                                                       #      #
+                                        r = True               ## ]                                                                     #      #
+                                        if r:                                                                                           #      #
+                                            if a_4 == 0:                                                                       ##       #      #
+                                                r = self.r_R2(s)  # routine call                                               #        #      #
+                                                if r:                                                                          #        #      #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete                      #        #      #
+                                                    if r:                                                                      #        #      #
+                                                        self.left = s.cursor  ##                                               #        #      #
+                                                        r = True              ## [                                             #        #      #
+                                                        if r:                                                                  #        #      #
+                                                            r = s.starts_with(u'at')  # character check                        #        #      #
+                                                            if r:                                                              #        #      #
+                                                                self.right = s.cursor  ##                                      #        #      #
+                                                                r = True               ## ]                                    #        #      #
+                                                                if r:                                                          #        #      #
+                                                                    r = self.r_R2(s)  # routine call                           #        # try  #
+                                                                    if r:                                                      #        #      #
+                                                                        r = s.set_range(self.left, self.right, u'')  # delete  #        #      #
+                                            if a_4 == 1:                                                                       #        #      #
+                                                var18 = len(s.chars) - s.cursor                                     ##               # among  #      #
+                                                r = self.r_R2(s)  # routine call                              #                #        #      #
+                                                if r:                                                         #                #        #      #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete     #                #        #      #
+                                                if not r:                                                     # or             #        #      #
+                                                    s.cursor = len(s.chars) - var18                                 #                #        #      #
+                                                    r = self.r_R1(s)  # routine call                          #                #        #      #
+                                                    if r:                                                     #                #        #      #
+                                                        r = s.set_range(self.left, self.right, u'eux')  # <-  ##               #        #      #
+                                            if a_4 == 2:                                                                       #        #      #
+                                                r = self.r_R2(s)  # routine call                                               #        #      #
+                                                if r:                                                                          #        #      #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete                      #        #      #
+                                            if a_4 == 3:                                                                       #        #      #
+                                                r = self.r_RV(s)  # routine call                                               #        #      #
+                                                if r:                                                                          #        #      #
+                                                    r = s.set_range(self.left, self.right, u'i')  # <-                         ##       #      #
+                                if not r:                                                                                               #      #
+                                    r = True                                                                                            #      #
+                                    s.cursor = len(s.chars) - var19                                                                           ##     #
+                    if a_3 == 6:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var22 = len(s.chars) - s.cursor                                                                 ##                   #
+                                self.left = s.cursor  ##                                                                  #                    #
+                                r = True              ## [                                                                #                    #
+                                if r:                                                                                     #                    #
+                                    a_5 = _find_among(s, _t_5)  ##                                                        #                    #
+                                    r = a_5 is not None         ## substring                                              #                    #
+                                    if r:                                                                                 #                    #
+                                        self.right = s.cursor  ##                                                         #                    #
+                                        r = True               ## ]                                                       #                    #
+                                        if r:                                                                             #                    #
+                                            if a_5 == 0:                                                         ##       #                    #
+                                                var20 = len(s.chars) - s.cursor                                  ##    #        #                    # among
+                                                r = self.r_R2(s)  # routine call                           #     #        #                    #
+                                                if r:                                                      #     #        #                    #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  # or  #        #                    #
+                                                if not r:                                                  #     #        #                    #
+                                                    s.cursor = len(s.chars) - var20                              #     #        # try                #
+                                                    r = s.set_range(self.left, self.right, u'abl')  # <-   ##    #        #                    #
+                                            if a_5 == 1:                                                         #        #                    #
+                                                var21 = len(s.chars) - s.cursor                                  ##    #        #                    #
+                                                r = self.r_R2(s)  # routine call                           #     # among  #                    #
+                                                if r:                                                      #     #        #                    #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  # or  #        #                    #
+                                                if not r:                                                  #     #        #                    #
+                                                    s.cursor = len(s.chars) - var21                              #     #        #                    #
+                                                    r = s.set_range(self.left, self.right, u'iqU')  # <-   ##    #        #                    #
+                                            if a_5 == 2:                                                         #        #                    #
+                                                r = self.r_R2(s)  # routine call                                 #        #                    #
+                                                if r:                                                            #        #                    #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete        ##       #                    #
+                                if not r:                                                                                 #                    #
+                                    r = True                                                                              #                    #
+                                    s.cursor = len(s.chars) - var22                                                             ##                   #
+                    if a_3 == 7:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var24 = len(s.chars) - s.cursor                                                                        ##            #
+                                self.left = s.cursor  ##                                                                         #             #
+                                r = True              ## [                                                                       #             #
+                                if r:                                                                                            #             #
+                                    r = s.starts_with(u'at')  # character check                                                  #             #
+                                    if r:                                                                                        #             #
+                                        self.right = s.cursor  ##                                                                #             #
+                                        r = True               ## ]                                                              #             #
+                                        if r:                                                                                    #             #
+                                            r = self.r_R2(s)  # routine call                                                     #             #
+                                            if r:                                                                                #             #
+                                                r = s.set_range(self.left, self.right, u'')  # delete                            #             #
+                                                if r:                                                                            #             #
+                                                    self.left = s.cursor  ##                                                     #             #
+                                                    r = True              ## [                                                   #             #
+                                                    if r:                                                                        # try         #
+                                                        r = s.starts_with(u'ic')  # character check                              #             #
+                                                        if r:                                                                    #             #
+                                                            self.right = s.cursor  ##                                            #             #
+                                                            r = True               ## ]                                          #             #
+                                                            if r:                                                                #             #
+                                                                var23 = len(s.chars) - s.cursor                                  ##    #             #
+                                                                r = self.r_R2(s)  # routine call                           #     #             #
+                                                                if r:                                                      #     #             #
+                                                                    r = s.set_range(self.left, self.right, u'')  # delete  # or  #             #
+                                                                if not r:                                                  #     #             #
+                                                                    s.cursor = len(s.chars) - var23                              #     #             #
+                                                                    r = s.set_range(self.left, self.right, u'iqU')  # <-   ##    #             #
+                                if not r:                                                                                        #             #
+                                    r = True                                                                                     #             #
+                                    s.cursor = len(s.chars) - var24                                                                    ##            #
+                    if a_3 == 8:                                                                                                               #
+                        r = s.set_range(self.left, self.right, u'eau')  # <-                                                                   #
+                    if a_3 == 9:                                                                                                               #
+                        r = self.r_R1(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'al')  # <-                                                                #
+                    if a_3 == 10:                                                                                                              #
+                        var25 = len(s.chars) - s.cursor                                     ##                                                       #
+                        r = self.r_R2(s)  # routine call                              #                                                        #
+                        if r:                                                         #                                                        #
+                            r = s.set_range(self.left, self.right, u'')  # delete     #                                                        #
+                        if not r:                                                     # or                                                     #
+                            s.cursor = len(s.chars) - var25                                 #                                                        #
+                            r = self.r_R1(s)  # routine call                          #                                                        #
+                            if r:                                                     #                                                        #
+                                r = s.set_range(self.left, self.right, u'eux')  # <-  ##                                                       #
+                    if a_3 == 11:                                                                                                              #
+                        r = self.r_R1(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            if s.cursor == s.limit:                    ##                                                                      #
+                                r = False                              #                                                                       #
+                            else:                                      #                                                                       #
+                                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check                                               #
+                            if r:                                      #                                                                       #
+                                s.cursor -= 1                          ##                                                                      #
+                            if r:                                                                                                              #
+                                r = s.set_range(self.left, self.right, u'')  # delete                                                          #
+                    if a_3 == 12:                                                                                                              #
+                        r = self.r_RV(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'ant')  # <-  ##                                                           #
+                            r = False                                             ## fail                                                      #
+                    if a_3 == 13:                                                                                                              #
+                        r = self.r_RV(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'ent')  # <-  ##                                                           #
+                            r = False                                             ## fail                                                      #
+                    if a_3 == 14:                                                                                                              #
+                        var26 = len(s.chars) - s.cursor                                ##                                                            #
+                        if s.cursor == s.limit:                ##                #                                                             #
+                            r = False                          #                 #                                                             #
+                        else:                                  #                 #                                                             #
+                            r = s.chars[s.cursor - 1] in _g_v  # grouping check  #                                                             #
+                        if r:                                  #                 # test                                                        #
+                            s.cursor -= 1                      ##                #                                                             #
+                        if r:                                                    #                                                             #
+                            r = self.r_RV(s)  # routine call                     #                                                             #
+                        s.cursor = len(s.chars) - var26                                ##                                                            #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##                                                          #
+                            r = False                                              ## fail                                                     ##
+        return r
+    
+    def r_i_verb_suffix(self, s):
+        r = True
+        var27 = len(s.chars) - s.cursor                                                                          ##
+        var28 = s.limit                                                                                    #
+        r = s.to_mark(self.i_pV)  # tomark                                                                 #
+        if r:                                                                                              #
+            s.limit = s.cursor                                                                             #
+            s.cursor = len(s.chars) - var27                                                                      #
+            self.left = s.cursor  ##                                                                       #
+            r = True              ## [                                                                     #
+            if r:                                                                                          #
+                a_6 = _find_among(s, _t_6)  ##                                                             #
+                r = a_6 is not None         ## substring                                                   #
+                if r:                                                                                      #
+                    self.right = s.cursor  ##                                                              # setlimit
+                    r = True               ## ]                                                            #
+                    if r:                                                                                  #
+                        if a_6 == 0:                                                              ##       #
+                            if s.cursor == s.limit:                    ##                         #        #
+                                r = False                              #                          #        #
+                            else:                                      #                          #        #
+                                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  # among  #
+                            if r:                                      #                          #        #
+                                s.cursor -= 1                          ##                         #        #
+                            if r:                                                                 #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete             ##       #
+            s.limit = var28                                                                                ##
+        return r
+    
+    def r_verb_suffix(self, s):
+        r = True
+        var30 = len(s.chars) - s.cursor                                                                                  ##
+        var31 = s.limit                                                                                            #
+        r = s.to_mark(self.i_pV)  # tomark                                                                         #
+        if r:                                                                                                      #
+            s.limit = s.cursor                                                                                     #
+            s.cursor = len(s.chars) - var30                                                                              #
+            self.left = s.cursor  ##                                                                               #
+            r = True              ## [                                                                             #
+            if r:                                                                                                  #
+                a_7 = _find_among(s, _t_7)  ##                                                                     #
+                r = a_7 is not None         ## substring                                                           #
+                if r:                                                                                              #
+                    self.right = s.cursor  ##                                                                      #
+                    r = True               ## ]                                                                    #
+                    if r:                                                                                          #
+                        if a_7 == 0:                                                                      ##       #
+                            r = self.r_R2(s)  # routine call                                              #        #
+                            if r:                                                                         #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete                     #        #
+                        if a_7 == 1:                                                                      #        # setlimit
+                            r = s.set_range(self.left, self.right, u'')  # delete                         #        #
+                        if a_7 == 2:                                                                      #        #
+                            r = s.set_range(self.left, self.right, u'')  # delete                         #        #
+                            if r:                                                                         #        #
+                                var29 = len(s.chars) - s.cursor                                          ##     #        #
+                                self.left = s.cursor  ##                                           #      #        #
+                                r = True              ## [                                         #      # among  #
+                                if r:                                                              #      #        #
+                                    r = s.starts_with(u'e')  # character check                     #      #        #
+                                    if r:                                                          #      #        #
+                                        self.right = s.cursor  ##                                  # try  #        #
+                                        r = True               ## ]                                #      #        #
+                                        if r:                                                      #      #        #
+                                            r = s.set_range(self.left, self.right, u'')  # delete  #      #        #
+                                if not r:                                                          #      #        #
+                                    r = True                                                       #      #        #
+                                    s.cursor = len(s.chars) - var29                                      ##     ##       #
+            s.limit = var31                                                                                        ##
+        return r
+    
+    def r_residual_suffix(self, s):
+        r = True
+        var33 = len(s.chars) - s.cursor                                                                           ##
+        self.left = s.cursor  ##                                                                            #
+        r = True              ## [                                                                          #
+        if r:                                                                                               #
+            r = s.starts_with(u's')  # character check                                                      #
+            if r:                                                                                           #
+                self.right = s.cursor  ##                                                                   #
+                r = True               ## ]                                                                 #
+                if r:                                                                                       #
+                    var32 = len(s.chars) - s.cursor                                                       ##      #
+                    if s.cursor == s.limit:                              ##                         #       #
+                        r = False                                        #                          #       # try
+                    else:                                                #                          #       #
+                        r = s.chars[s.cursor - 1] not in _g_keep_with_s  # negative grouping check  # test  #
+                    if r:                                                #                          #       #
+                        s.cursor -= 1                                    ##                         #       #
+                    s.cursor = len(s.chars) - var32                                                       ##      #
+                    if r:                                                                                   #
+                        r = s.set_range(self.left, self.right, u'')  # delete                               #
+        if not r:                                                                                           #
+            r = True                                                                                        #
+            s.cursor = len(s.chars) - var33                                                                       ##
+        if r:
+            var35 = len(s.chars) - s.cursor                                                                   ##
+            var36 = s.limit                                                                             #
+            r = s.to_mark(self.i_pV)  # tomark                                                          #
+            if r:                                                                                       #
+                s.limit = s.cursor                                                                      #
+                s.cursor = len(s.chars) - var35                                                               #
+                self.left = s.cursor  ##                                                                #
+                r = True              ## [                                                              #
+                if r:                                                                                   #
+                    a_8 = _find_among(s, _t_8)  ##                                                      #
+                    r = a_8 is not None         ## substring                                            #
+                    if r:                                                                               #
+                        self.right = s.cursor  ##                                                       #
+                        r = True               ## ]                                                     #
+                        if r:                                                                           #
+                            if a_8 == 0:                                                       ##       #
+                                r = self.r_R2(s)  # routine call                               #        #
+                                if r:                                                          #        # setlimit
+                                    var34 = len(s.chars) - s.cursor                       ##         #        #
+                                    r = s.starts_with(u's')  # character check      #          #        #
+                                    if not r:                                       # or       #        #
+                                        s.cursor = len(s.chars) - var34                   #          #        #
+                                        r = s.starts_with(u't')  # character check  ##         #        #
+                                    if r:                                                      #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete  # among  #
+                            if a_8 == 1:                                                       #        #
+                                r = s.set_range(self.left, self.right, u'i')  # <-             #        #
+                            if a_8 == 2:                                                       #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete          #        #
+                            if a_8 == 3:                                                       #        #
+                                r = s.starts_with(u'gu')  # character check                    #        #
+                                if r:                                                          #        #
+                                    r = s.set_range(self.left, self.right, u'')  # delete      ##       #
+                s.limit = var36                                                                         ##
+        return r
+    
+    def r_un_double(self, s):
+        r = True
+        var37 = len(s.chars) - s.cursor            ##
+        a_9 = _find_among(s, _t_9)  ##       #
+        r = a_9 is not None         #        #
+        if r:                       # among  # test
+            if a_9 == 0:            #        #
+                r = True            ##       #
+        s.cursor = len(s.chars) - var37            ##
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                r = s.hop(1)  # next
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_un_accent(self, s):
+        r = True
+        for var38 in xrange(1):                                                       ##
+            if s.cursor == s.limit:                    ##                             #
+                r = False                              #                              #
+            else:                                      #                              #
+                r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check      #
+            if r:                                      #                              #
+                s.cursor -= 1                          ##                             #
+            if not r:                                                                 #
+                break                                                                 #
+        if r:                                                                         #
+            while True:                                                               #
+                var38 = len(s.chars) - s.cursor                                             # atleast
+                if s.cursor == s.limit:                    ##                         #
+                    r = False                              #                          #
+                else:                                      #                          #
+                    r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check  #
+                if r:                                      #                          #
+                    s.cursor -= 1                          ##                         #
+                if not r:                                                             #
+                    s.cursor = len(s.chars) - var38                                         #
+                    break                                                             #
+            r = True                                                                  ##
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                var39 = len(s.chars) - s.cursor                          ##
+                r = s.starts_with(u'\xe9')  # character check      #
+                if not r:                                          # or
+                    s.cursor = len(s.chars) - var39                      #
+                    r = s.starts_with(u'\xe8')  # character check  ##
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = s.set_range(self.left, self.right, u'e')  # <-
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var40 = s.cursor                       ##
+        r = self.r_prelude(s)  # routine call  #
+        s.cursor = var40                       # do
+        r = True                               ##
+        if r:
+            var41 = s.cursor                            ##
+            r = self.r_mark_regions(s)  # routine call  #
+            s.cursor = var41                            # do
+            r = True                                    ##
+            if r:
+                var51 = s.cursor                                                                                        ##
+                var52 = len(s.chars) - s.limit                                                                                #
+                s.direction *= -1                                                                                       #
+                s.cursor, s.limit = s.limit, s.cursor                                                                   #
+                var48 = len(s.chars) - s.cursor                                                                         ##    #
+                var47 = len(s.chars) - s.cursor                                                                   ##    #     #
+                var46 = len(s.chars) - s.cursor                                                            ##     #     #     #
+                var43 = len(s.chars) - s.cursor                              ##                            #      #     #     #
+                var42 = len(s.chars) - s.cursor                        ##    #                             #      #     #     #
+                r = self.r_standard_suffix(s)  # routine call    #     #                             #      #     #     #
+                if not r:                                        # or  #                             #      #     #     #
+                    s.cursor = len(s.chars) - var42                    #     # or                          #      #     #     #
+                    r = self.r_i_verb_suffix(s)  # routine call  ##    #                             #      #     #     #
+                if not r:                                              #                             #      #     #     #
+                    s.cursor = len(s.chars) - var43                          #                             #      #     #     #
+                    r = self.r_verb_suffix(s)  # routine call          ##                            #      #     #     #
+                if r:                                                                                #      #     #     #
+                    s.cursor = len(s.chars) - var46                                                        #      #     #     #
+                    var45 = len(s.chars) - s.cursor                                                 ##     #      #     #     #
+                    self.left = s.cursor  ##                                                  #      #      #     #     #
+                    r = True              ## [                                                #      #      #     #     #
+                    if r:                                                                     #      #      #     #     #
+                        var44 = len(s.chars) - s.cursor                                       ##    #      #      #     #     #
+                        r = s.starts_with(u'Y')  # character check                      #     #      # and  #     #     #
+                        if r:                                                           #     #      #      # or  # do  #
+                            self.right = s.cursor  ##                                   #     #      #      #     #     #
+                            r = True               ## ]                                 #     #      #      #     #     #
+                            if r:                                                       #     #      #      #     #     #
+                                r = s.set_range(self.left, self.right, u'i')  # <-      #     #      #      #     #     #
+                        if not r:                                                       # or  # try  #      #     #     # backwards
+                            s.cursor = len(s.chars) - var44                                   #     #      #      #     #     #
+                            r = s.starts_with(u'\xe7')  # character check               #     #      #      #     #     #
+                            if r:                                                       #     #      #      #     #     #
+                                self.right = s.cursor  ##                               #     #      #      #     #     #
+                                r = True               ## ]                             #     #      #      #     #     #
+                                if r:                                                   #     #      #      #     #     #
+                                    r = s.set_range(self.left, self.right, u'c')  # <-  ##    #      #      #     #     #
+                    if not r:                                                                 #      #      #     #     #
+                        r = True                                                              #      #      #     #     #
+                        s.cursor = len(s.chars) - var45                                             ##     ##     #     #     #
+                if not r:                                                                                   #     #     #
+                    s.cursor = len(s.chars) - var47                                                               #     #     #
+                    r = self.r_residual_suffix(s)  # routine call                                           ##    #     #
+                s.cursor = len(s.chars) - var48                                                                         #     #
+                r = True                                                                                          ##    #
+                if r:                                                                                                   #
+                    var49 = len(s.chars) - s.cursor                ##                                                         #
+                    r = self.r_un_double(s)  # routine call  #                                                          #
+                    s.cursor = len(s.chars) - var49                # do                                                       #
+                    r = True                                 ##                                                         #
+                    if r:                                                                                               #
+                        var50 = len(s.chars) - s.cursor                ##                                                     #
+                        r = self.r_un_accent(s)  # routine call  #                                                      #
+                        s.cursor = len(s.chars) - var50                # do                                                   #
+                        r = True                                 ##                                                     #
+                s.direction *= -1                                                                                       #
+                s.cursor = var51                                                                                        #
+                s.limit = len(s.chars) - var52                                                                                ##
+                if r:
+                    var53 = s.cursor                        ##
+                    r = self.r_postlude(s)  # routine call  #
+                    s.cursor = var53                        # do
+                    r = True                                ##
+        return r
+
+_u_last_0 = frozenset([u'a', u'e', u'f', u'i', u'l', u'n', u'r', u's', u't', u'x', u'z', u'\xe9'])
+_u_chars_0 = frozenset([u'I', u'U', u'Y', u'i', u'u', u'y', u'\xe8', u'\xe9'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)))
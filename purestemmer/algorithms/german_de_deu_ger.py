@@ -0,0 +1,584 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:55:19 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy\xe4\xf6\xfc')
+_g_s_ending = frozenset(u'bdfghklmnrt')
+_g_st_ending = frozenset((_g_s_ending - set(u'r')))
+_a_1 = ((u'Y', '', 0), (u'U', '', 1), (u'\xe4', '', 2), (u'\xf6', '', 3), (u'\xfc', '', 4), (u'', '', 5),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'ern', '', 0), (u'em', '', 0), (u'er', '', 0), (u'en', '', 1), (u'es', '', 1), (u'e', '', 1), (u's', '', 2),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'est', '', 0), (u'en', '', 0), (u'er', '', 0), (u'st', '', 1),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'isch', '', 1), (u'lich', '', 2), (u'heit', '', 2), (u'keit', '', 3), (u'end', '', 0), (u'ung', '', 0), (u'ig', '', 1), (u'ik', '', 1),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'lich', '', 0), (u'ig', '', 0),)
+_t_5 = _make_among_table(_a_5)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+        self.i_p2 = 0
+        self.i_x = 0
+
+    def r_prelude(self, s):
+        r = True
+        var2 = s.cursor                                                                      ##
+        while True:                                                                ##        #
+            var1 = s.cursor                                                        #         #
+            var0 = s.cursor                                                  ##    #         #
+            self.left = s.cursor  ##                                         #     #         #
+            r = True              ## [                                       #     #         #
+            if r:                                                            #     #         #
+                r = s.starts_with(u'\xdf')  # character check                #     #         #
+                if r:                                                        #     #         #
+                    self.right = s.cursor  ##                                # or  #         #
+                    r = True               ## ]                              #     # repeat  # test
+                    if r:                                                    #     #         #
+                        r = s.set_range(self.left, self.right, u'ss')  # <-  #     #         #
+            if not r:                                                        #     #         #
+                s.cursor = var0                                              #     #         #
+                r = s.hop(1)  # next                                         ##    #         #
+            if not r:                                                              #         #
+                s.cursor = var1                                                    #         #
+                break                                                              #         #
+        r = True                                                                   ##        #
+        s.cursor = var2                                                                      ##
+        if r:
+            while True:                                                                                       ##
+                var5 = s.cursor                                                                               #
+                while True:                                                                           ##      #
+                    var4 = s.cursor                                                                   #       #
+                    if s.cursor == s.limit:            ##                                             #       #
+                        r = False                      #                                              #       #
+                    else:                              #                                              #       #
+                        r = s.chars[s.cursor] in _g_v  # grouping check                               #       #
+                    if r:                              #                                              #       #
+                        s.cursor += 1                  ##                                             #       #
+                    if r:                                                                             #       #
+                        self.left = s.cursor  ##                                                      #       #
+                        r = True              ## [                                                    #       #
+                        if r:                                                                         #       #
+                            var3 = s.cursor                                                     ##    #       #
+                            r = s.starts_with(u'u')  # character check                          #     #       #
+                            if r:                                                               #     #       #
+                                self.right = s.cursor  ##                                       #     #       #
+                                r = True               ## ]                                     #     #       #
+                                if r:                                                           #     #       #
+                                    if s.cursor == s.limit:            ##                       #     #       #
+                                        r = False                      #                        #     #       #
+                                    else:                              #                        #     #       #
+                                        r = s.chars[s.cursor] in _g_v  # grouping check         #     #       #
+                                    if r:                              #                        #     # goto  #
+                                        s.cursor += 1                  ##                       #     #       # repeat
+                                    if r:                                                       #     #       #
+                                        r = s.set_range(self.left, self.right, u'U')  # <-      #     #       #
+                            if not r:                                                           # or  #       #
+                                s.cursor = var3                                                 #     #       #
+                                r = s.starts_with(u'y')  # character check                      #     #       #
+                                if r:                                                           #     #       #
+                                    self.right = s.cursor  ##                                   #     #       #
+                                    r = True               ## ]                                 #     #       #
+                                    if r:                                                       #     #       #
+                                        if s.cursor == s.limit:            ##                   #     #       #
+                                            r = False                      #                    #     #       #
+                                        else:                              #                    #     #       #
+                                            r = s.chars[s.cursor] in _g_v  # grouping check     #     #       #
+                                        if r:                              #                    #     #       #
+                                            s.cursor += 1                  ##                   #     #       #
+                                        if r:                                                   #     #       #
+                                            r = s.set_range(self.left, self.right, u'Y')  # <-  ##    #       #
+                    if r or s.cursor == s.limit:                                                      #       #
+                        s.cursor = var4                                                               #       #
+                        break                                                                         #       #
+                    s.cursor = var4 + 1                                                               ##      #
+                if not r:                                                                                     #
+                    s.cursor = var5                                                                           #
+                    break                                                                                     #
+            r = True                                                                                          ##
+        return r
+    
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            self.i_p2 = s.limit
+            r = True
+            if r:
+                var6 = s.cursor                      ##
+                r = s.hop(3)  # hop                  #
+                if r:                                #
+                    self.i_x = s.cursor  ##          # test
+                    r = True             ## setmark  #
+                s.cursor = var6                      ##
+                if r:
+                    for var7 in xrange(s.cursor, s.limit, 1):  ##
+                        if s.chars[var7] in _g_v:              #
+                            s.cursor = var7 + 1                #
+                            r = True                           #
+                            break                              # gopast
+                    else:                                      #
+                        s.cursor = s.limit                     #
+                        r = False                              ##
+                    if r:
+                        for var8 in xrange(s.cursor, s.limit, 1):  ##
+                            if s.chars[var8] not in _g_v:          #
+                                s.cursor = var8 + 1                #
+                                r = True                           #
+                                break                              # gopast
+                        else:                                      #
+                            s.cursor = s.limit                     #
+                            r = False                              ##
+                        if r:
+                            self.i_p1 = s.cursor  ##
+                            r = True              ## setmark
+                            if r:
+                                var9 = s.cursor                ##
+                                r = self.i_p1 < self.i_x  # <  #
+                                if r:                          #
+                                    self.i_p1 = self.i_x       #
+                                    r = True                   # try
+                                if not r:                      #
+                                    r = True                   #
+                                    s.cursor = var9            ##
+                                if r:
+                                    for var10 in xrange(s.cursor, s.limit, 1):  ##
+                                        if s.chars[var10] in _g_v:              #
+                                            s.cursor = var10 + 1                #
+                                            r = True                            #
+                                            break                               # gopast
+                                    else:                                       #
+                                        s.cursor = s.limit                      #
+                                        r = False                               ##
+                                    if r:
+                                        for var11 in xrange(s.cursor, s.limit, 1):  ##
+                                            if s.chars[var11] not in _g_v:          #
+                                                s.cursor = var11 + 1                #
+                                                r = True                            #
+                                                break                               # gopast
+                                        else:                                       #
+                                            s.cursor = s.limit                      #
+                                            r = False                               ##
+                                        if r:
+                                            self.i_p2 = s.cursor  ##
+                                            r = True              ## setmark
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        while True:                                                                      ##
+            var12 = s.cursor                                                             #
+            self.left = s.cursor  ##                                                     #
+            r = True              ## [                                                   #
+            if r:                                                                        #
+                a_1 = _find_among(s, _t_1)  ##                                           #
+                r = a_1 is not None         ## substring                                 #
+                if r:                                                                    #
+                    self.right = s.cursor  ##                                            #
+                    r = True               ## ]                                          #
+                    if r:                                                                #
+                        if a_1 == 0:                                            ##       #
+                            r = s.set_range(self.left, self.right, u'y')  # <-  #        #
+                        if a_1 == 1:                                            #        # repeat
+                            r = s.set_range(self.left, self.right, u'u')  # <-  #        #
+                        if a_1 == 2:                                            #        #
+                            r = s.set_range(self.left, self.right, u'a')  # <-  #        #
+                        if a_1 == 3:                                            # among  #
+                            r = s.set_range(self.left, self.right, u'o')  # <-  #        #
+                        if a_1 == 4:                                            #        #
+                            r = s.set_range(self.left, self.right, u'u')  # <-  #        #
+                        if a_1 == 5:                                            #        #
+                            r = s.hop(1)  # next                                ##       #
+            if not r:                                                                    #
+                s.cursor = var12                                                         #
+                break                                                                    #
+        r = True                                                                         ##
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_standard_suffix(self, s):
+        r = True
+        var14 = len(s.chars) - s.cursor                                                                                      ##
+        self.left = s.cursor  ##                                                                                       #
+        r = True              ## [                                                                                     #
+        if r:                                                                                                          #
+            a_2 = _find_among(s, _t_2)  ##                                                                             #
+            r = a_2 is not None         ## substring                                                                   #
+            if r:                                                                                                      #
+                self.right = s.cursor  ##                                                                              #
+                r = True               ## ]                                                                            #
+                if r:                                                                                                  #
+                    r = self.r_R1(s)  # routine call                                                                   #
+                    if r:                                                                                              #
+                        if a_2 == 0:                                                                          ##       #
+                            r = s.set_range(self.left, self.right, u'')  # delete                             #        #
+                        if a_2 == 1:                                                                          #        #
+                            r = s.set_range(self.left, self.right, u'')  # delete                             #        #
+                            if r:                                                                             #        #
+                                var13 = len(s.chars) - s.cursor                                              ##     #        #
+                                self.left = s.cursor  ##                                               #      #        #
+                                r = True              ## [                                             #      #        #
+                                if r:                                                                  #      #        #
+                                    r = s.starts_with(u's')  # character check                         #      #        # do
+                                    if r:                                                              #      #        #
+                                        self.right = s.cursor  ##                                      #      #        #
+                                        r = True               ## ]                                    # try  #        #
+                                        if r:                                                          #      #        #
+                                            r = s.starts_with(u'nis')  # character check               #      # among  #
+                                            if r:                                                      #      #        #
+                                                r = s.set_range(self.left, self.right, u'')  # delete  #      #        #
+                                if not r:                                                              #      #        #
+                                    r = True                                                           #      #        #
+                                    s.cursor = len(s.chars) - var13                                          ##     #        #
+                        if a_2 == 2:                                                                          #        #
+                            if s.cursor == s.limit:                       ##                                  #        #
+                                r = False                                 #                                   #        #
+                            else:                                         #                                   #        #
+                                r = s.chars[s.cursor - 1] in _g_s_ending  # grouping check                    #        #
+                            if r:                                         #                                   #        #
+                                s.cursor -= 1                             ##                                  #        #
+                            if r:                                                                             #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete                         ##       #
+        s.cursor = len(s.chars) - var14                                                                                      #
+        r = True                                                                                                       ##
+        if r:
+            var15 = len(s.chars) - s.cursor                                                                     ##
+            self.left = s.cursor  ##                                                                      #
+            r = True              ## [                                                                    #
+            if r:                                                                                         #
+                a_3 = _find_among(s, _t_3)  ##                                                            #
+                r = a_3 is not None         ## substring                                                  #
+                if r:                                                                                     #
+                    self.right = s.cursor  ##                                                             #
+                    r = True               ## ]                                                           #
+                    if r:                                                                                 #
+                        r = self.r_R1(s)  # routine call                                                  #
+                        if r:                                                                             #
+                            if a_3 == 0:                                                         ##       #
+                                r = s.set_range(self.left, self.right, u'')  # delete            #        # do
+                            if a_3 == 1:                                                         #        #
+                                if s.cursor == s.limit:                        ##                #        #
+                                    r = False                                  #                 #        #
+                                else:                                          #                 #        #
+                                    r = s.chars[s.cursor - 1] in _g_st_ending  # grouping check  # among  #
+                                if r:                                          #                 #        #
+                                    s.cursor -= 1                              ##                #        #
+                                if r:                                                            #        #
+                                    r = s.hop(3)  # hop                                          #        #
+                                    if r:                                                        #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete    ##       #
+            s.cursor = len(s.chars) - var15                                                                     #
+            r = True                                                                                      ##
+            if r:
+                var22 = len(s.chars) - s.cursor                                                                                                    ##
+                self.left = s.cursor  ##                                                                                                     #
+                r = True              ## [                                                                                                   #
+                if r:                                                                                                                        #
+                    a_4 = _find_among(s, _t_4)  ##                                                                                           #
+                    r = a_4 is not None         ## substring                                                                                 #
+                    if r:                                                                                                                    #
+                        self.right = s.cursor  ##                                                                                            #
+                        r = True               ## ]                                                                                          #
+                        if r:                                                                                                                #
+                            r = self.r_R2(s)  # routine call                                                                                 #
+                            if r:                                                                                                            #
+                                if a_4 == 0:                                                                                        ##       #
+                                    r = s.set_range(self.left, self.right, u'')  # delete                                           #        #
+                                    if r:                                                                                           #        #
+                                        var17 = len(s.chars) - s.cursor                                                  ##               #        #
+                                        self.left = s.cursor  ##                                                   #                #        #
+                                        r = True              ## [                                                 #                #        #
+                                        if r:                                                                      #                #        #
+                                            r = s.starts_with(u'ig')  # character check                            #                #        #
+                                            if r:                                                                  #                #        #
+                                                self.right = s.cursor  ##                                          #                #        #
+                                                r = True               ## ]                                        #                #        #
+                                                if r:                                                              #                #        #
+                                                    var16 = len(s.chars) - s.cursor                   ##                 #                #        #
+                                                    r = s.starts_with(u'e')  # character check  #                  # try            #        #
+                                                    if not r:                                   # not              #                #        #
+                                                        s.cursor = len(s.chars) - var16               #                  #                #        #
+                                                    r = not r                                   ##                 #                #        #
+                                                    if r:                                                          #                #        #
+                                                        r = self.r_R2(s)  # routine call                           #                #        #
+                                                        if r:                                                      #                #        #
+                                                            r = s.set_range(self.left, self.right, u'')  # delete  #                #        #
+                                        if not r:                                                                  #                #        #
+                                            r = True                                                               #                #        #
+                                            s.cursor = len(s.chars) - var17                                              ##               #        #
+                                if a_4 == 1:                                                                                        #        #
+                                    var18 = len(s.chars) - s.cursor                   ##                                                  #        #
+                                    r = s.starts_with(u'e')  # character check  #                                                   #        #
+                                    if not r:                                   # not                                               #        #
+                                        s.cursor = len(s.chars) - var18               #                                                   #        #
+                                    r = not r                                   ##                                                  #        #
+                                    if r:                                                                                           #        #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                       #        #
+                                if a_4 == 2:                                                                                        #        # do
+                                    r = s.set_range(self.left, self.right, u'')  # delete                                           #        #
+                                    if r:                                                                                           #        #
+                                        var20 = len(s.chars) - s.cursor                                              ##                   #        #
+                                        self.left = s.cursor  ##                                               #                    #        #
+                                        r = True              ## [                                             #                    # among  #
+                                        if r:                                                                  #                    #        #
+                                            var19 = len(s.chars) - s.cursor                        ##                #                    #        #
+                                            r = s.starts_with(u'er')  # character check      #                 #                    #        #
+                                            if not r:                                        # or              #                    #        #
+                                                s.cursor = len(s.chars) - var19                    #                 #                    #        #
+                                                r = s.starts_with(u'en')  # character check  ##                #                    #        #
+                                            if r:                                                              # try                #        #
+                                                self.right = s.cursor  ##                                      #                    #        #
+                                                r = True               ## ]                                    #                    #        #
+                                                if r:                                                          #                    #        #
+                                                    r = self.r_R1(s)  # routine call                           #                    #        #
+                                                    if r:                                                      #                    #        #
+                                                        r = s.set_range(self.left, self.right, u'')  # delete  #                    #        #
+                                        if not r:                                                              #                    #        #
+                                            r = True                                                           #                    #        #
+                                            s.cursor = len(s.chars) - var20                                          ##                   #        #
+                                if a_4 == 3:                                                                                        #        #
+                                    r = s.set_range(self.left, self.right, u'')  # delete                                           #        #
+                                    if r:                                                                                           #        #
+                                        var21 = len(s.chars) - s.cursor                                                            ##     #        #
+                                        self.left = s.cursor  ##                                                             #      #        #
+                                        r = True              ## [                                                           #      #        #
+                                        if r:                                                                                #      #        #
+                                            a_5 = _find_among(s, _t_5)  ##                                                   #      #        #
+                                            r = a_5 is not None         ## substring                                         #      #        #
+                                            if r:                                                                            #      #        #
+                                                self.right = s.cursor  ##                                                    #      #        #
+                                                r = True               ## ]                                                  # try  #        #
+                                                if r:                                                                        #      #        #
+                                                    r = self.r_R2(s)  # routine call                                         #      #        #
+                                                    if r:                                                                    #      #        #
+                                                        if a_5 == 0:                                               ##        #      #        #
+                                                            r = s.set_range(self.left, self.right, u'')  # delete  ## among  #      #        #
+                                        if not r:                                                                            #      #        #
+                                            r = True                                                                         #      #        #
+                                            s.cursor = len(s.chars) - var21                                                        ##     ##       #
+                s.cursor = len(s.chars) - var22                                                                                                    #
+                r = True                                                                                                                     ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var23 = s.cursor                       ##
+        r = self.r_prelude(s)  # routine call  #
+        s.cursor = var23                       # do
+        r = True                               ##
+        if r:
+            var24 = s.cursor                            ##
+            r = self.r_mark_regions(s)  # routine call  #
+            s.cursor = var24                            # do
+            r = True                                    ##
+            if r:
+                var26 = s.cursor                                     ##
+                var27 = len(s.chars) - s.limit                             #
+                s.direction *= -1                                    #
+                s.cursor, s.limit = s.limit, s.cursor                #
+                var25 = len(s.chars) - s.cursor                      ##    #
+                r = self.r_standard_suffix(s)  # routine call  #     # backwards
+                s.cursor = len(s.chars) - var25                      # do  #
+                r = True                                       ##    #
+                s.direction *= -1                                    #
+                s.cursor = var26                                     #
+                s.limit = len(s.chars) - var27                             ##
+                if r:
+                    var28 = s.cursor                        ##
+                    r = self.r_postlude(s)  # routine call  #
+                    s.cursor = var28                        # do
+                    r = True                                ##
+        return r
+
+_u_last_0 = frozenset([u'd', u'e', u'g', u'h', u'k', u'm', u'n', u'r', u's', u't'])
+_u_chars_0 = frozenset([u'U', u'Y', u'u', u'y', u'\xdf', u'\xe4', u'\xf6', u'\xfc'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)))
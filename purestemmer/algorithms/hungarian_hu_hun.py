@@ -0,0 +1,681 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:00 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiou\xe1\xe9\xed\xf3\xf6\xf5\xfa\xfc\xfb')
+_a_1 = ((u'dzs', '', 0), (u'cs', '', 0), (u'gy', '', 0), (u'ly', '', 0), (u'ny', '', 0), (u'sz', '', 0), (u'ty', '', 0), (u'zs', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'\xe1', '', 0), (u'\xe9', '', 1),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'ccs', '', 0), (u'ggy', '', 0), (u'lly', '', 0), (u'nny', '', 0), (u'ssz', '', 0), (u'tty', '', 0), (u'zzs', '', 0), (u'bb', '', 0), (u'cc', '', 0), (u'dd', '', 0), (u'ff', '', 0), (u'gg', '', 0), (u'jj', '', 0), (u'kk', '', 0), (u'll', '', 0), (u'mm', '', 0), (u'nn', '', 0), (u'pp', '', 0), (u'rr', '', 0), (u'ss', '', 0), (u'tt', '', 0), (u'vv', '', 0), (u'zz', '', 0),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'al', '', 0), (u'el', '', 1),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'k\xe9ppen', '', 0), (u'onk\xe9nt', '', 0), (u'enk\xe9nt', '', 0), (u'ank\xe9nt', '', 0), (u'k\xe9pp', '', 0), (u'k\xe9nt', '', 0), (u'ban', '', 0), (u'ben', '', 0), (u'nak', '', 0), (u'nek', '', 0), (u'val', '', 0), (u'vel', '', 0), (u't\xf3l', '', 0), (u't\xf5l', '', 0), (u'r\xf3l', '', 0), (u'r\xf5l', '', 0), (u'b\xf3l', '', 0), (u'b\xf5l', '', 0), (u'hoz', '', 0), (u'hez', '', 0), (u'h\xf6z', '', 0), (u'n\xe1l', '', 0), (u'n\xe9l', '', 0), (u'\xe9rt', '', 0), (u'kor', '', 0), (u'ba', '', 0), (u'be', '', 0), (u'ra', '', 0), (u're', '', 0), (u'ig', '', 0), (u'at', '', 0), (u'et', '', 0), (u'ot', '', 0), (u'\xf6t', '', 0), (u'ul', '', 0), (u'\xfcl', '', 0), (u'v\xe1', '', 0), (u'v\xe9', '', 0), (u'en', '', 0), (u'on', '', 0), (u'an', '', 0), (u'\xf6n', '', 0), (u'n', '', 0), (u't', '', 0),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'\xe1nk\xe9nt', '', 2), (u'\xe9n', '', 0), (u'\xe1n', '', 1),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'astul', '', 0), (u'est\xfcl', '', 0), (u'\xe1stul', '', 2), (u'\xe9st\xfcl', '', 3), (u'stul', '', 1), (u'st\xfcl', '', 1),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'\xe1', '', 0), (u'\xe9', '', 1),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'\xe1k', '', 0), (u'\xe9k', '', 1), (u'\xf6k', '', 2), (u'ak', '', 3), (u'ok', '', 4), (u'ek', '', 5), (u'k', '', 6),)
+_t_9 = _make_among_table(_a_9)
+_a_10 = ((u'ok\xe9', '', 0), (u'\xf6k\xe9', '', 0), (u'ak\xe9', '', 0), (u'ek\xe9', '', 0), (u'\xe9k\xe9', '', 1), (u'\xe1k\xe9', '', 2), (u'\xe9\xe9i', '', 4), (u'\xe1\xe9i', '', 5), (u'k\xe9', '', 3), (u'\xe9i', '', 6), (u'\xe9\xe9', '', 7), (u'\xe9', '', 8),)
+_t_10 = _make_among_table(_a_10)
+_a_11 = ((u'\xe1juk', '', 4), (u'\xe9j\xfck', '', 5), (u'\xfcnk', '', 0), (u'unk', '', 0), (u'\xe1nk', '', 1), (u'\xe9nk', '', 2), (u'juk', '', 6), (u'j\xfck', '', 6), (u'nk', '', 3), (u'uk', '', 7), (u'\xfck', '', 7), (u'em', '', 8), (u'om', '', 8), (u'am', '', 8), (u'\xe1m', '', 9), (u'\xe9m', '', 10), (u'od', '', 12), (u'ed', '', 12), (u'ad', '', 12), (u'\xf6d', '', 12), (u'\xe1d', '', 13), (u'\xe9d', '', 14), (u'ja', '', 16), (u'je', '', 16), (u'm', '', 11), (u'd', '', 15), (u'a', '', 17), (u'e', '', 17), (u'o', '', 17), (u'\xe1', '', 18), (u'\xe9', '', 19),)
+_t_11 = _make_among_table(_a_11)
+_a_12 = ((u'jaitok', '', 19), (u'jeitek', '', 19), (u'jaink', '', 15), (u'jeink', '', 15), (u'aitok', '', 20), (u'eitek', '', 20), (u'\xe1itok', '', 21), (u'\xe9itek', '', 22), (u'jaim', '', 0), (u'jeim', '', 0), (u'jaid', '', 5), (u'jeid', '', 5), (u'eink', '', 16), (u'aink', '', 16), (u'\xe1ink', '', 17), (u'\xe9ink', '', 18), (u'itek', '', 23), (u'jeik', '', 24), (u'jaik', '', 24), (u'\xe1im', '', 1), (u'\xe9im', '', 2), (u'aim', '', 3), (u'eim', '', 3), (u'\xe1id', '', 6), (u'\xe9id', '', 7), (u'aid', '', 8), (u'eid', '', 8), (u'jai', '', 10), (u'jei', '', 10), (u'ink', '', 19), (u'aik', '', 25), (u'eik', '', 25), (u'\xe1ik', '', 26), (u'\xe9ik', '', 27), (u'im', '', 4), (u'id', '', 9), (u'\xe1i', '', 11), (u'\xe9i', '', 12), (u'ai', '', 13), (u'ei', '', 13), (u'ik', '', 28), (u'i', '', 14),)
+_t_12 = _make_among_table(_a_12)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            var3 = s.cursor                                                       ##
+            if s.cursor == s.limit:            ##                                 #
+                r = False                      #                                  #
+            else:                              #                                  #
+                r = s.chars[s.cursor] in _g_v  # grouping check                   #
+            if r:                              #                                  #
+                s.cursor += 1                  ##                                 #
+            if r:                                                                 #
+                for var0 in xrange(s.cursor, s.limit, 1):  ##                     #
+                    if s.chars[var0] not in _g_v:          #                      #
+                        s.cursor = var0                    #                      #
+                        r = True                           #                      #
+                        break                              # goto                 #
+                else:                                      #                      #
+                    s.cursor = s.limit                     #                      #
+                    r = False                              ##                     #
+                if r:                                                             #
+                    var1 = s.cursor                      ##                       #
+                    a_1 = _find_among(s, _t_1)  ##       #                        #
+                    r = a_1 is not None         #        #                        #
+                    if r:                       # among  #                        #
+                        if a_1 == 0:            #        # or                     #
+                            r = True            ##       #                        #
+                    if not r:                            #                        #
+                        s.cursor = var1                  #                        # or
+                        r = s.hop(1)  # next             ##                       #
+                    if r:                                                         #
+                        self.i_p1 = s.cursor  ##                                  #
+                        r = True              ## setmark                          #
+            if not r:                                                             #
+                s.cursor = var3                                                   #
+                if s.cursor == s.limit:                ##                         #
+                    r = False                          #                          #
+                else:                                  #                          #
+                    r = s.chars[s.cursor] not in _g_v  # negative grouping check  #
+                if r:                                  #                          #
+                    s.cursor += 1                      ##                         #
+                if r:                                                             #
+                    for var2 in xrange(s.cursor, s.limit, 1):  ##                 #
+                        if s.chars[var2] in _g_v:              #                  #
+                            s.cursor = var2 + 1                #                  #
+                            r = True                           #                  #
+                            break                              # gopast           #
+                    else:                                      #                  #
+                        s.cursor = s.limit                     #                  #
+                        r = False                              ##                 #
+                    if r:                                                         #
+                        self.i_p1 = s.cursor  ##                                  #
+                        r = True              ## setmark                          ##
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_v_ending(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_2 = _find_among(s, _t_2)  ##
+            r = a_2 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_2 == 0:                                            ##
+                            r = s.set_range(self.left, self.right, u'a')  # <-  #
+                        if a_2 == 1:                                            # among
+                            r = s.set_range(self.left, self.right, u'e')  # <-  ##
+        return r
+    
+    def r_double(self, s):
+        r = True
+        var4 = len(s.chars) - s.cursor             ##
+        a_3 = _find_among(s, _t_3)  ##       #
+        r = a_3 is not None         #        #
+        if r:                       # among  # test
+            if a_3 == 0:            #        #
+                r = True            ##       #
+        s.cursor = len(s.chars) - var4             ##
+        return r
+    
+    def r_undouble(self, s):
+        r = True
+        r = s.hop(1)  # next
+        if r:
+            self.left = s.cursor  ##
+            r = True              ## [
+            if r:
+                r = s.hop(1)  # hop
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_instrum(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_4 == 0:                              ##
+                            r = self.r_double(s)  # routine call  #
+                        if a_4 == 1:                              # among
+                            r = self.r_double(s)  # routine call  ##
+                        if r:
+                            r = s.set_range(self.left, self.right, u'')  # delete
+                            if r:
+                                r = self.r_undouble(s)  # routine call
+        return r
+    
+    def r_case(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_5 = _find_among(s, _t_5)  ##
+            r = a_5 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_5 == 0:  ##
+                            r = True  ## among
+                        if r:
+                            r = s.set_range(self.left, self.right, u'')  # delete
+                            if r:
+                                r = self.r_v_ending(s)  # routine call
+        return r
+    
+    def r_case_special(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_6 = _find_among(s, _t_6)  ##
+            r = a_6 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_6 == 0:                                            ##
+                            r = s.set_range(self.left, self.right, u'e')  # <-  #
+                        if a_6 == 1:                                            #
+                            r = s.set_range(self.left, self.right, u'a')  # <-  # among
+                        if a_6 == 2:                                            #
+                            r = s.set_range(self.left, self.right, u'a')  # <-  ##
+        return r
+    
+    def r_case_other(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_7 = _find_among(s, _t_7)  ##
+            r = a_7 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_7 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_7 == 1:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_7 == 2:                                               # among
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_7 == 3:                                               #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     ##
+        return r
+    
+    def r_factive(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_8 = _find_among(s, _t_8)  ##
+            r = a_8 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_8 == 0:                              ##
+                            r = self.r_double(s)  # routine call  #
+                        if a_8 == 1:                              # among
+                            r = self.r_double(s)  # routine call  ##
+                        if r:
+                            r = s.set_range(self.left, self.right, u'')  # delete
+                            if r:
+                                r = self.r_undouble(s)  # routine call
+        return r
+    
+    def r_plural(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_9 = _find_among(s, _t_9)  ##
+            r = a_9 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_9 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_9 == 1:                                               #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_9 == 2:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_9 == 3:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  # among
+                        if a_9 == 4:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_9 == 5:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_9 == 6:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_owned(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_10 = _find_among(s, _t_10)  ##
+            r = a_10 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_10 == 0:                                              ##
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_10 == 1:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_10 == 2:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_10 == 3:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_10 == 4:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     # among
+                        if a_10 == 5:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_10 == 6:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_10 == 7:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_10 == 8:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_sing_owner(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_11 = _find_among(s, _t_11)  ##
+            r = a_11 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_11 == 0:                                              ##
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 1:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_11 == 2:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_11 == 3:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 4:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_11 == 5:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_11 == 6:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 7:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 8:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 9:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_11 == 10:                                             # among
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_11 == 11:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 12:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 13:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_11 == 14:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_11 == 15:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 16:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 17:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_11 == 18:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_11 == 19:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     ##
+        return r
+    
+    def r_plur_owner(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_12 = _find_among(s, _t_12)  ##
+            r = a_12 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_12 == 0:                                              ##
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 1:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 2:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 3:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 4:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 5:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 6:                                              #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 7:                                              #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 8:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 9:                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 10:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 11:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 12:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 13:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 14:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  # among
+                        if a_12 == 15:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 16:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 17:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 18:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 19:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 20:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 21:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 22:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 23:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 24:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 25:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                        if a_12 == 26:                                             #
+                            r = s.set_range(self.left, self.right, u'a')  # <-     #
+                        if a_12 == 27:                                             #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_12 == 28:                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var5 = s.cursor                             ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var5                             # do
+        r = True                                    ##
+        if r:
+            var15 = s.cursor                                                            ##
+            var16 = len(s.chars) - s.limit                                                    #
+            s.direction *= -1                                                           #
+            s.cursor, s.limit = s.limit, s.cursor                                       #
+            var6 = len(s.chars) - s.cursor               ##                                   #
+            r = self.r_instrum(s)  # routine call  #                                    #
+            s.cursor = len(s.chars) - var6               # do                                 #
+            r = True                               ##                                   #
+            if r:                                                                       #
+                var7 = len(s.chars) - s.cursor            ##                                  #
+                r = self.r_case(s)  # routine call  #                                   #
+                s.cursor = len(s.chars) - var7            # do                                #
+                r = True                            ##                                  #
+                if r:                                                                   #
+                    var8 = len(s.chars) - s.cursor                    ##                      #
+                    r = self.r_case_special(s)  # routine call  #                       #
+                    s.cursor = len(s.chars) - var8                    # do                    #
+                    r = True                                    ##                      #
+                    if r:                                                               #
+                        var9 = len(s.chars) - s.cursor                  ##                    #
+                        r = self.r_case_other(s)  # routine call  #                     #
+                        s.cursor = len(s.chars) - var9                  # do                  #
+                        r = True                                  ##                    #
+                        if r:                                                           #
+                            var10 = len(s.chars) - s.cursor              ##                   #
+                            r = self.r_factive(s)  # routine call  #                    # backwards
+                            s.cursor = len(s.chars) - var10              # do                 #
+                            r = True                               ##                   #
+                            if r:                                                       #
+                                var11 = len(s.chars) - s.cursor            ##                 #
+                                r = self.r_owned(s)  # routine call  #                  #
+                                s.cursor = len(s.chars) - var11            # do               #
+                                r = True                             ##                 #
+                                if r:                                                   #
+                                    var12 = len(s.chars) - s.cursor                 ##        #
+                                    r = self.r_sing_owner(s)  # routine call  #         #
+                                    s.cursor = len(s.chars) - var12                 # do      #
+                                    r = True                                  ##        #
+                                    if r:                                               #
+                                        var13 = len(s.chars) - s.cursor                 ##    #
+                                        r = self.r_plur_owner(s)  # routine call  #     #
+                                        s.cursor = len(s.chars) - var13                 # do  #
+                                        r = True                                  ##    #
+                                        if r:                                           #
+                                            var14 = len(s.chars) - s.cursor             ##    #
+                                            r = self.r_plural(s)  # routine call  #     #
+                                            s.cursor = len(s.chars) - var14             # do  #
+                                            r = True                              ##    #
+            s.direction *= -1                                                           #
+            s.cursor = var15                                                            #
+            s.limit = len(s.chars) - var16                                                    ##
+        return r
+
+_u_last_0 = frozenset([u'a', u'd', u'e', u'g', u'i', u'k', u'l', u'm', u'n', u'o', u'p', u'r', u't', u'z', u'\xe1', u'\xe9'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0))
@@ -0,0 +1,659 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:10 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy')
+_g_v_WXY = frozenset((_g_v | set(u'wxY')))
+_a_1 = ((u'sses', '', 0), (u'ies', '', 1), (u'ss', '', 2), (u's', '', 3),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'eed', '', 0), (u'ing', '', 1), (u'ed', '', 1),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'at', '', 0), (u'bl', '', 0), (u'iz', '', 0), (u'bb', '', 1), (u'dd', '', 1), (u'ff', '', 1), (u'gg', '', 1), (u'mm', '', 1), (u'nn', '', 1), (u'pp', '', 1), (u'rr', '', 1), (u'tt', '', 1), (u'', '', 2),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'ization', '', 6), (u'ational', '', 7), (u'fulness', '', 10), (u'ousness', '', 11), (u'iveness', '', 12), (u'tional', '', 0), (u'biliti', '', 13), (u'entli', '', 4), (u'ation', '', 7), (u'alism', '', 9), (u'aliti', '', 9), (u'ousli', '', 11), (u'iviti', '', 12), (u'enci', '', 1), (u'anci', '', 2), (u'abli', '', 3), (u'izer', '', 6), (u'ator', '', 7), (u'alli', '', 8), (u'eli', '', 5),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'alize', '', 0), (u'icate', '', 1), (u'iciti', '', 1), (u'ative', '', 2), (u'ical', '', 1), (u'ness', '', 2), (u'ful', '', 2),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'ement', '', 0), (u'ance', '', 0), (u'ence', '', 0), (u'able', '', 0), (u'ible', '', 0), (u'ment', '', 0), (u'ant', '', 0), (u'ent', '', 0), (u'ism', '', 0), (u'ate', '', 0), (u'iti', '', 0), (u'ous', '', 0), (u'ive', '', 0), (u'ize', '', 0), (u'ion', '', 1), (u'al', '', 0), (u'er', '', 0), (u'ic', '', 0), (u'ou', '', 0),)
+_t_6 = _make_among_table(_a_6)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+        self.i_p2 = 0
+        self.b_Y_found = True
+
+    def r_shortv(self, s):
+        r = True
+        if s.cursor == s.limit:                        ##
+            r = False                                  #
+        else:                                          #
+            r = s.chars[s.cursor - 1] not in _g_v_WXY  # negative grouping check
+        if r:                                          #
+            s.cursor -= 1                              ##
+        if r:
+            if s.cursor == s.limit:                ##
+                r = False                          #
+            else:                                  #
+                r = s.chars[s.cursor - 1] in _g_v  # grouping check
+            if r:                                  #
+                s.cursor -= 1                      ##
+            if r:
+                if s.cursor == s.limit:                    ##
+                    r = False                              #
+                else:                                      #
+                    r = s.chars[s.cursor - 1] not in _g_v  # negative grouping check
+                if r:                                      #
+                    s.cursor -= 1                          ##
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_Step_1a(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_1 = _find_among(s, _t_1)  ##
+            r = a_1 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_1 == 0:                                               ##
+                        r = s.set_range(self.left, self.right, u'ss')  # <-    #
+                    if a_1 == 1:                                               #
+                        r = s.set_range(self.left, self.right, u'i')  # <-     #
+                    if a_1 == 2:                                               # among
+                        pass                                                   #
+                    if a_1 == 3:                                               #
+                        r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_Step_1b(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_2 = _find_among(s, _t_2)  ##
+            r = a_2 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_2 == 0:                                                                                    ##
+                        r = self.r_R1(s)  # routine call                                                            #
+                        if r:                                                                                       #
+                            r = s.set_range(self.left, self.right, u'ee')  # <-                                     #
+                    if a_2 == 1:                                                                                    #
+                        var1 = len(s.chars) - s.cursor                                      ##                            #
+                        for var0 in xrange(s.cursor - 1, s.limit - 1, -1):  ##        #                             #
+                            if s.chars[var0] in _g_v:                       #         #                             #
+                                s.cursor = var0                             #         #                             #
+                                r = True                                    #         #                             #
+                                break                                       # gopast  # test                        #
+                        else:                                               #         #                             #
+                            s.cursor = s.limit                              #         #                             #
+                            r = False                                       ##        #                             #
+                        s.cursor = len(s.chars) - var1                                      ##                            #
+                        if r:                                                                                       #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                   #
+                            if r:                                                                                   #
+                                var2 = len(s.chars) - s.cursor                  ##                                        #
+                                a_3 = _find_among(s, _t_3)  ##            #                                         #
+                                r = a_3 is not None         ## substring  # test                                    #
+                                s.cursor = len(s.chars) - var2                  ##                                        # among
+                                if r:                                                                               #
+                                    if a_3 == 0:                                                           ##       #
+                                        r = s.insert(u'e')  # insert                                       #        #
+                                    if a_3 == 1:                                                           #        #
+                                        self.left = s.cursor  ##                                           #        #
+                                        r = True              ## [                                         #        #
+                                        if r:                                                              #        #
+                                            r = s.hop(1)  # next                                           #        #
+                                            if r:                                                          #        #
+                                                self.right = s.cursor  ##                                  #        #
+                                                r = True               ## ]                                #        #
+                                                if r:                                                      # among  #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  #        #
+                                    if a_3 == 2:                                                           #        #
+                                        r = (s.cursor == self.i_p1)  # atmark                              #        #
+                                        if r:                                                              #        #
+                                            var3 = len(s.chars) - s.cursor              ##                       #        #
+                                            r = self.r_shortv(s)  # routine call  # test                   #        #
+                                            s.cursor = len(s.chars) - var3              ##                       #        #
+                                            if r:                                                          #        #
+                                                r = s.insert(u'e')  # insert                               ##       ##
+        return r
+    
+    def r_Step_1c(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            var4 = len(s.chars) - s.cursor                        ##
+            r = s.starts_with(u'y')  # character check      #
+            if not r:                                       # or
+                s.cursor = len(s.chars) - var4                    #
+                r = s.starts_with(u'Y')  # character check  ##
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    for var5 in xrange(s.cursor - 1, s.limit - 1, -1):  ##
+                        if s.chars[var5] in _g_v:                       #
+                            s.cursor = var5                             #
+                            r = True                                    #
+                            break                                       # gopast
+                    else:                                               #
+                        s.cursor = s.limit                              #
+                        r = False                                       ##
+                    if r:
+                        r = s.set_range(self.left, self.right, u'i')  # <-
+        return r
+    
+    def r_Step_2(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_4 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'tion')  # <-  #
+                        if a_4 == 1:                                               #
+                            r = s.set_range(self.left, self.right, u'ence')  # <-  #
+                        if a_4 == 2:                                               #
+                            r = s.set_range(self.left, self.right, u'ance')  # <-  #
+                        if a_4 == 3:                                               #
+                            r = s.set_range(self.left, self.right, u'able')  # <-  #
+                        if a_4 == 4:                                               #
+                            r = s.set_range(self.left, self.right, u'ent')  # <-   #
+                        if a_4 == 5:                                               #
+                            r = s.set_range(self.left, self.right, u'e')  # <-     #
+                        if a_4 == 6:                                               #
+                            r = s.set_range(self.left, self.right, u'ize')  # <-   #
+                        if a_4 == 7:                                               # among
+                            r = s.set_range(self.left, self.right, u'ate')  # <-   #
+                        if a_4 == 8:                                               #
+                            r = s.set_range(self.left, self.right, u'al')  # <-    #
+                        if a_4 == 9:                                               #
+                            r = s.set_range(self.left, self.right, u'al')  # <-    #
+                        if a_4 == 10:                                              #
+                            r = s.set_range(self.left, self.right, u'ful')  # <-   #
+                        if a_4 == 11:                                              #
+                            r = s.set_range(self.left, self.right, u'ous')  # <-   #
+                        if a_4 == 12:                                              #
+                            r = s.set_range(self.left, self.right, u'ive')  # <-   #
+                        if a_4 == 13:                                              #
+                            r = s.set_range(self.left, self.right, u'ble')  # <-   ##
+        return r
+    
+    def r_Step_3(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_5 = _find_among(s, _t_5)  ##
+            r = a_5 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R1(s)  # routine call
+                    if r:
+                        if a_5 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'al')  # <-    #
+                        if a_5 == 1:                                               #
+                            r = s.set_range(self.left, self.right, u'ic')  # <-    # among
+                        if a_5 == 2:                                               #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_Step_4(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_6 = _find_among(s, _t_6)  ##
+            r = a_6 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R2(s)  # routine call
+                    if r:
+                        if a_6 == 0:                                                   ##
+                            r = s.set_range(self.left, self.right, u'')  # delete      #
+                        if a_6 == 1:                                                   #
+                            var6 = len(s.chars) - s.cursor                        ##         #
+                            r = s.starts_with(u's')  # character check      #          #
+                            if not r:                                       # or       # among
+                                s.cursor = len(s.chars) - var6                    #          #
+                                r = s.starts_with(u't')  # character check  ##         #
+                            if r:                                                      #
+                                r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_Step_5a(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            r = s.starts_with(u'e')  # character check
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    var8 = len(s.chars) - s.cursor                             ##
+                    r = self.r_R2(s)  # routine call                     #
+                    if not r:                                            #
+                        s.cursor = len(s.chars) - var8                         #
+                        r = self.r_R1(s)  # routine call                 #
+                        if r:                                            # or
+                            var7 = len(s.chars) - s.cursor              ##     #
+                            r = self.r_shortv(s)  # routine call  #      #
+                            if not r:                             # not  #
+                                s.cursor = len(s.chars) - var7          #      #
+                            r = not r                             ##     ##
+                    if r:
+                        r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_Step_5b(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            r = s.starts_with(u'l')  # character check
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R2(s)  # routine call
+                    if r:
+                        r = s.starts_with(u'l')  # character check
+                        if r:
+                            r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        self.b_Y_found = False  ##
+        r = True                ## unset
+        if r:
+            var9 = s.cursor                                                 ##
+            self.left = s.cursor  ##                                        #
+            r = True              ## [                                      #
+            if r:                                                           #
+                r = s.starts_with(u'y')  # character check                  #
+                if r:                                                       #
+                    self.right = s.cursor  ##                               #
+                    r = True               ## ]                             # do
+                    if r:                                                   #
+                        r = s.set_range(self.left, self.right, u'Y')  # <-  #
+                        if r:                                               #
+                            self.b_Y_found = True  ##                       #
+                            r = True               ## set                   #
+            s.cursor = var9                                                 #
+            r = True                                                        ##
+            if r:
+                var12 = s.cursor                                                               ##
+                while True:                                                          ##        #
+                    var11 = s.cursor                                                 #         #
+                    while True:                                              ##      #         #
+                        var10 = s.cursor                                     #       #         #
+                        if s.cursor == s.limit:            ##                #       #         #
+                            r = False                      #                 #       #         #
+                        else:                              #                 #       #         #
+                            r = s.chars[s.cursor] in _g_v  # grouping check  #       #         #
+                        if r:                              #                 #       #         #
+                            s.cursor += 1                  ##                #       #         #
+                        if r:                                                #       #         #
+                            self.left = s.cursor  ##                         #       #         #
+                            r = True              ## [                       # goto  #         #
+                            if r:                                            #       #         #
+                                r = s.starts_with(u'y')  # character check   #       #         #
+                                if r:                                        #       # repeat  #
+                                    self.right = s.cursor  ##                #       #         # do
+                                    r = True               ## ]              #       #         #
+                        if r or s.cursor == s.limit:                         #       #         #
+                            s.cursor = var10                                 #       #         #
+                            break                                            #       #         #
+                        s.cursor = var10 + 1                                 ##      #         #
+                    if r:                                                            #         #
+                        r = s.set_range(self.left, self.right, u'Y')  # <-           #         #
+                        if r:                                                        #         #
+                            self.b_Y_found = True  ##                                #         #
+                            r = True               ## set                            #         #
+                    if not r:                                                        #         #
+                        s.cursor = var11                                             #         #
+                        break                                                        #         #
+                r = True                                                             ##        #
+                s.cursor = var12                                                               #
+                r = True                                                                       ##
+                if r:
+                    self.i_p1 = s.limit
+                    r = True
+                    if r:
+                        self.i_p2 = s.limit
+                        r = True
+                        if r:
+                            var17 = s.cursor                                                      ##
+                            for var13 in xrange(s.cursor, s.limit, 1):  ##                        #
+                                if s.chars[var13] in _g_v:              #                         #
+                                    s.cursor = var13 + 1                #                         #
+                                    r = True                            #                         #
+                                    break                               # gopast                  #
+                            else:                                       #                         #
+                                s.cursor = s.limit                      #                         #
+                                r = False                               ##                        #
+                            if r:                                                                 #
+                                for var14 in xrange(s.cursor, s.limit, 1):  ##                    #
+                                    if s.chars[var14] not in _g_v:          #                     #
+                                        s.cursor = var14 + 1                #                     #
+                                        r = True                            #                     #
+                                        break                               # gopast              #
+                                else:                                       #                     #
+                                    s.cursor = s.limit                      #                     #
+                                    r = False                               ##                    #
+                                if r:                                                             #
+                                    self.i_p1 = s.cursor  ##                                      #
+                                    r = True              ## setmark                              #
+                                    if r:                                                         #
+                                        for var15 in xrange(s.cursor, s.limit, 1):  ##            # do
+                                            if s.chars[var15] in _g_v:              #             #
+                                                s.cursor = var15 + 1                #             #
+                                                r = True                            #             #
+                                                break                               # gopast      #
+                                        else:                                       #             #
+                                            s.cursor = s.limit                      #             #
+                                            r = False                               ##            #
+                                        if r:                                                     #
+                                            for var16 in xrange(s.cursor, s.limit, 1):  ##        #
+                                                if s.chars[var16] not in _g_v:          #         #
+                                                    s.cursor = var16 + 1                #         #
+                                                    r = True                            #         #
+                                                    break                               # gopast  #
+                                            else:                                       #         #
+                                                s.cursor = s.limit                      #         #
+                                                r = False                               ##        #
+                                            if r:                                                 #
+                                                self.i_p2 = s.cursor  ##                          #
+                                                r = True              ## setmark                  #
+                            s.cursor = var17                                                      #
+                            r = True                                                              ##
+                            if r:
+                                var26 = s.cursor                                                         ##
+                                var27 = len(s.chars) - s.limit                                                 #
+                                s.direction *= -1                                                        #
+                                s.cursor, s.limit = s.limit, s.cursor                                    #
+                                var18 = len(s.chars) - s.cursor              ##                                #
+                                r = self.r_Step_1a(s)  # routine call  #                                 #
+                                s.cursor = len(s.chars) - var18              # do                              #
+                                r = True                               ##                                #
+                                if r:                                                                    #
+                                    var19 = len(s.chars) - s.cursor              ##                            #
+                                    r = self.r_Step_1b(s)  # routine call  #                             #
+                                    s.cursor = len(s.chars) - var19              # do                          #
+                                    r = True                               ##                            #
+                                    if r:                                                                #
+                                        var20 = len(s.chars) - s.cursor              ##                        #
+                                        r = self.r_Step_1c(s)  # routine call  #                         #
+                                        s.cursor = len(s.chars) - var20              # do                      #
+                                        r = True                               ##                        #
+                                        if r:                                                            #
+                                            var21 = len(s.chars) - s.cursor             ##                     #
+                                            r = self.r_Step_2(s)  # routine call  #                      #
+                                            s.cursor = len(s.chars) - var21             # do                   #
+                                            r = True                              ##                     #
+                                            if r:                                                        # backwards
+                                                var22 = len(s.chars) - s.cursor             ##                 #
+                                                r = self.r_Step_3(s)  # routine call  #                  #
+                                                s.cursor = len(s.chars) - var22             # do               #
+                                                r = True                              ##                 #
+                                                if r:                                                    #
+                                                    var23 = len(s.chars) - s.cursor             ##             #
+                                                    r = self.r_Step_4(s)  # routine call  #              #
+                                                    s.cursor = len(s.chars) - var23             # do           #
+                                                    r = True                              ##             #
+                                                    if r:                                                #
+                                                        var24 = len(s.chars) - s.cursor              ##        #
+                                                        r = self.r_Step_5a(s)  # routine call  #         #
+                                                        s.cursor = len(s.chars) - var24              # do      #
+                                                        r = True                               ##        #
+                                                        if r:                                            #
+                                                            var25 = len(s.chars) - s.cursor              ##    #
+                                                            r = self.r_Step_5b(s)  # routine call  #     #
+                                                            s.cursor = len(s.chars) - var25              # do  #
+                                                            r = True                               ##    #
+                                s.direction *= -1                                                        #
+                                s.cursor = var26                                                         #
+                                s.limit = len(s.chars) - var27                                                 ##
+                                if r:
+                                    var30 = s.cursor                                                              ##
+                                    r = self.b_Y_found  # boolean variable check                                  #
+                                    if r:                                                                         #
+                                        while True:                                                     ##        #
+                                            var29 = s.cursor                                            #         #
+                                            while True:                                         ##      #         #
+                                                var28 = s.cursor                                #       #         #
+                                                self.left = s.cursor  ##                        #       #         #
+                                                r = True              ## [                      #       #         #
+                                                if r:                                           #       #         #
+                                                    r = s.starts_with(u'Y')  # character check  #       #         #
+                                                    if r:                                       # goto  #         #
+                                                        self.right = s.cursor  ##               #       #         #
+                                                        r = True               ## ]             #       # repeat  # do
+                                                if r or s.cursor == s.limit:                    #       #         #
+                                                    s.cursor = var28                            #       #         #
+                                                    break                                       #       #         #
+                                                s.cursor = var28 + 1                            ##      #         #
+                                            if r:                                                       #         #
+                                                r = s.set_range(self.left, self.right, u'y')  # <-      #         #
+                                            if not r:                                                   #         #
+                                                s.cursor = var29                                        #         #
+                                                break                                                   #         #
+                                        r = True                                                        ##        #
+                                    s.cursor = var30                                                              #
+                                    r = True                                                                      ##
+        return r
+
+_u_last_0 = frozenset([u'Y', u'c', u'd', u'e', u'g', u'i', u'l', u'm', u'n', u'r', u's', u't', u'u', u'y'])
+_u_chars_0 = frozenset([u'Y', u'y'])
+_u_last_1 = frozenset([u'c', u'd', u'e', u'i', u'l', u'm', u'n', u'r', u's', u't', u'u'])
+_u_chars_1 = frozenset([u'Y', u'a', u'e', u'i', u'o', u'u', u'y'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)) or
+            (word[-1:] not in _u_last_1 and _u_chars_1.isdisjoint(word)))
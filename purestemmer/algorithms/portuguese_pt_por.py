@@ -0,0 +1,700 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:22 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiou\xe1\xe9\xed\xf3\xfa\xe2\xea\xf4')
+_a_1 = ((u'\xe3', '', 0), (u'\xf5', '', 1), (u'', '', 2),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'a~', '', 0), (u'o~', '', 1), (u'', '', 2),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'amentos', '', 0), (u'imentos', '', 0), (u'uciones', '', 2), (u'amento', '', 0), (u'imento', '', 0), (u'adoras', '', 0), (u'adores', '', 0), (u'a\xe7o~es', '', 0), (u'log\xedas', '', 1), (u'\xeancias', '', 3), (u'amente', '', 4), (u'idades', '', 6), (u'ismos', '', 0), (u'istas', '', 0), (u'adora', '', 0), (u'a\xe7a~o', '', 0), (u'antes', '', 0), (u'\xe2ncia', '', 0), (u'log\xeda', '', 1), (u'uci\xf3n', '', 2), (u'\xeancia', '', 3), (u'mente', '', 5), (u'idade', '', 6), (u'ezas', '', 0), (u'icos', '', 0), (u'icas', '', 0), (u'ismo', '', 0), (u'\xe1vel', '', 0), (u'\xedvel', '', 0), (u'ista', '', 0), (u'osos', '', 0), (u'osas', '', 0), (u'ador', '', 0), (u'ante', '', 0), (u'ivas', '', 7), (u'ivos', '', 7), (u'iras', '', 8), (u'eza', '', 0), (u'ico', '', 0), (u'ica', '', 0), (u'oso', '', 0), (u'osa', '', 0), (u'iva', '', 7), (u'ivo', '', 7), (u'ira', '', 8),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'iv', '', 0), (u'os', '', 1), (u'ic', '', 1), (u'ad', '', 1),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'ante', '', 0), (u'avel', '', 0), (u'\xedvel', '', 0),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'abil', '', 0), (u'ic', '', 0), (u'iv', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'ar\xedamos', '', 0), (u'er\xedamos', '', 0), (u'ir\xedamos', '', 0), (u'\xe1ssemos', '', 0), (u'\xeassemos', '', 0), (u'\xedssemos', '', 0), (u'ar\xedeis', '', 0), (u'er\xedeis', '', 0), (u'ir\xedeis', '', 0), (u'\xe1sseis', '', 0), (u'\xe9sseis', '', 0), (u'\xedsseis', '', 0), (u'\xe1ramos', '', 0), (u'\xe9ramos', '', 0), (u'\xedramos', '', 0), (u'\xe1vamos', '', 0), (u'aremos', '', 0), (u'eremos', '', 0), (u'iremos', '', 0), (u'ariam', '', 0), (u'eriam', '', 0), (u'iriam', '', 0), (u'assem', '', 0), (u'essem', '', 0), (u'issem', '', 0), (u'ara~o', '', 0), (u'era~o', '', 0), (u'ira~o', '', 0), (u'arias', '', 0), (u'erias', '', 0), (u'irias', '', 0), (u'ardes', '', 0), (u'erdes', '', 0), (u'irdes', '', 0), (u'asses', '', 0), (u'esses', '', 0), (u'isses', '', 0), (u'astes', '', 0), (u'estes', '', 0), (u'istes', '', 0), (u'\xe1reis', '', 0), (u'areis', '', 0), (u'\xe9reis', '', 0), (u'ereis', '', 0), (u'\xedreis', '', 0), (u'ireis', '', 0), (u'\xe1veis', '', 0), (u'\xedamos', '', 0), (u'armos', '', 0), (u'ermos', '', 0), (u'irmos', '', 0), (u'aria', '', 0), (u'eria', '', 0), (u'iria', '', 0), (u'asse', '', 0), (u'esse', '', 0), (u'isse', '', 0), (u'aste', '', 0), (u'este', '', 0), (u'iste', '', 0), (u'arei', '', 0), (u'erei', '', 0), (u'irei', '', 0), (u'aram', '', 0), (u'eram', '', 0), (u'iram', '', 0), (u'avam', '', 0), (u'arem', '', 0), (u'erem', '', 0), (u'irem', '', 0), (u'ando', '', 0), (u'endo', '', 0), (u'indo', '', 0), (u'adas', '', 0), (u'idas', '', 0), (u'ar\xe1s', '', 0), (u'aras', '', 0), (u'er\xe1s', '', 0), (u'eras', '', 0), (u'ir\xe1s', '', 0), (u'avas', '', 0), (u'ares', '', 0), (u'eres', '', 0), (u'ires', '', 0), (u'\xedeis', '', 0), (u'ados', '', 0), (u'idos', '', 0), (u'\xe1mos', '', 0), (u'amos', '', 0), (u'emos', '', 0), (u'imos', '', 0), (u'iras', '', 0), (u'ada', '', 0), (u'ida', '', 0), (u'ar\xe1', '', 0), (u'ara', '', 0), (u'er\xe1', '', 0), (u'era', '', 0), (u'ir\xe1', '', 0), (u'ava', '', 0), (u'iam', '', 0), (u'ado', '', 0), (u'ido', '', 0), (u'ias', '', 0), (u'ais', '', 0), (u'eis', '', 0), (u'ira', '', 0), (u'ia', '', 0), (u'ei', '', 0), (u'am', '', 0), (u'em', '', 0), (u'ar', '', 0), (u'er', '', 0), (u'ir', '', 0), (u'as', '', 0), (u'es', '', 0), (u'is', '', 0), (u'eu', '', 0), (u'iu', '', 0), (u'ou', '', 0),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'os', '', 0), (u'a', '', 0), (u'i', '', 0), (u'o', '', 0), (u'\xe1', '', 0), (u'\xed', '', 0), (u'\xf3', '', 0),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'e', '', 0), (u'\xe9', '', 0), (u'\xea', '', 0), (u'\xe7', '', 1),)
+_t_9 = _make_among_table(_a_9)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_pV = 0
+        self.i_p1 = 0
+        self.i_p2 = 0
+
+    def r_prelude(self, s):
+        r = True
+        while True:                                                                       ##
+            var0 = s.cursor                                                               #
+            self.left = s.cursor  ##                                                      #
+            r = True              ## [                                                    #
+            if r:                                                                         #
+                a_1 = _find_among(s, _t_1)  ##                                            #
+                r = a_1 is not None         ## substring                                  #
+                if r:                                                                     #
+                    self.right = s.cursor  ##                                             #
+                    r = True               ## ]                                           #
+                    if r:                                                                 # repeat
+                        if a_1 == 0:                                             ##       #
+                            r = s.set_range(self.left, self.right, u'a~')  # <-  #        #
+                        if a_1 == 1:                                             #        #
+                            r = s.set_range(self.left, self.right, u'o~')  # <-  # among  #
+                        if a_1 == 2:                                             #        #
+                            r = s.hop(1)  # next                                 ##       #
+            if not r:                                                                     #
+                s.cursor = var0                                                           #
+                break                                                                     #
+        r = True                                                                          ##
+        return r
+    
+    def r_mark_regions(self, s):
+        r = True
+        self.i_pV = s.limit
+        r = True
+        if r:
+            self.i_p1 = s.limit
+            r = True
+            if r:
+                self.i_p2 = s.limit
+                r = True
+                if r:
+                    var7 = s.cursor                                                                       ##
+                    var6 = s.cursor                                                                 ##    #
+                    if s.cursor == s.limit:            ##                                           #     #
+                        r = False                      #                                            #     #
+                    else:                              #                                            #     #
+                        r = s.chars[s.cursor] in _g_v  # grouping check                             #     #
+                    if r:                              #                                            #     #
+                        s.cursor += 1                  ##                                           #     #
+                    if r:                                                                           #     #
+                        var3 = s.cursor                                                   ##        #     #
+                        if s.cursor == s.limit:                ##                         #         #     #
+                            r = False                          #                          #         #     #
+                        else:                                  #                          #         #     #
+                            r = s.chars[s.cursor] not in _g_v  # negative grouping check  #         #     #
+                        if r:                                  #                          #         #     #
+                            s.cursor += 1                      ##                         #         #     #
+                        if r:                                                             #         #     #
+                            for var1 in xrange(s.cursor, s.limit, 1):  ##                 #         #     #
+                                if s.chars[var1] in _g_v:              #                  #         #     #
+                                    s.cursor = var1 + 1                #                  #         #     #
+                                    r = True                           #                  #         #     #
+                                    break                              # gopast           #         #     #
+                            else:                                      #                  #         #     #
+                                s.cursor = s.limit                     #                  #         #     #
+                                r = False                              ##                 #         #     #
+                        if not r:                                                         # or      #     #
+                            s.cursor = var3                                               #         #     #
+                            if s.cursor == s.limit:            ##                         #         #     #
+                                r = False                      #                          #         #     #
+                            else:                              #                          #         #     #
+                                r = s.chars[s.cursor] in _g_v  # grouping check           #         #     #
+                            if r:                              #                          #         #     #
+                                s.cursor += 1                  ##                         #         #     #
+                            if r:                                                         #         #     #
+                                for var2 in xrange(s.cursor, s.limit, 1):  ##             #         #     #
+                                    if s.chars[var2] not in _g_v:          #              #         #     #
+                                        s.cursor = var2 + 1                #              #         #     #
+                                        r = True                           #              #         #     #
+                                        break                              # gopast       #         #     #
+                                else:                                      #              #         # or  #
+                                    s.cursor = s.limit                     #              #         #     #
+                                    r = False                              ##             ##        #     # do
+                    if not r:                                                                       #     #
+                        s.cursor = var6                                                             #     #
+                        if s.cursor == s.limit:                ##                                   #     #
+                            r = False                          #                                    #     #
+                        else:                                  #                                    #     #
+                            r = s.chars[s.cursor] not in _g_v  # negative grouping check            #     #
+                        if r:                                  #                                    #     #
+                            s.cursor += 1                      ##                                   #     #
+                        if r:                                                                       #     #
+                            var5 = s.cursor                                                   ##    #     #
+                            if s.cursor == s.limit:                ##                         #     #     #
+                                r = False                          #                          #     #     #
+                            else:                                  #                          #     #     #
+                                r = s.chars[s.cursor] not in _g_v  # negative grouping check  #     #     #
+                            if r:                                  #                          #     #     #
+                                s.cursor += 1                      ##                         #     #     #
+                            if r:                                                             #     #     #
+                                for var4 in xrange(s.cursor, s.limit, 1):  ##                 #     #     #
+                                    if s.chars[var4] in _g_v:              #                  #     #     #
+                                        s.cursor = var4 + 1                #                  #     #     #
+                                        r = True                           #                  #     #     #
+                                        break                              # gopast           #     #     #
+                                else:                                      #                  # or  #     #
+                                    s.cursor = s.limit                     #                  #     #     #
+                                    r = False                              ##                 #     #     #
+                            if not r:                                                         #     #     #
+                                s.cursor = var5                                               #     #     #
+                                if s.cursor == s.limit:            ##                         #     #     #
+                                    r = False                      #                          #     #     #
+                                else:                              #                          #     #     #
+                                    r = s.chars[s.cursor] in _g_v  # grouping check           #     #     #
+                                if r:                              #                          #     #     #
+                                    s.cursor += 1                  ##                         #     #     #
+                                if r:                                                         #     #     #
+                                    r = s.hop(1)  # next                                      ##    ##    #
+                    if r:                                                                                 #
+                        self.i_pV = s.cursor  ##                                                          #
+                        r = True              ## setmark                                                  #
+                    s.cursor = var7                                                                       #
+                    r = True                                                                              ##
+                    if r:
+                        var12 = s.cursor                                                      ##
+                        for var8 in xrange(s.cursor, s.limit, 1):  ##                         #
+                            if s.chars[var8] in _g_v:              #                          #
+                                s.cursor = var8 + 1                #                          #
+                                r = True                           #                          #
+                                break                              # gopast                   #
+                        else:                                      #                          #
+                            s.cursor = s.limit                     #                          #
+                            r = False                              ##                         #
+                        if r:                                                                 #
+                            for var9 in xrange(s.cursor, s.limit, 1):  ##                     #
+                                if s.chars[var9] not in _g_v:          #                      #
+                                    s.cursor = var9 + 1                #                      #
+                                    r = True                           #                      #
+                                    break                              # gopast               #
+                            else:                                      #                      #
+                                s.cursor = s.limit                     #                      #
+                                r = False                              ##                     #
+                            if r:                                                             #
+                                self.i_p1 = s.cursor  ##                                      #
+                                r = True              ## setmark                              #
+                                if r:                                                         #
+                                    for var10 in xrange(s.cursor, s.limit, 1):  ##            # do
+                                        if s.chars[var10] in _g_v:              #             #
+                                            s.cursor = var10 + 1                #             #
+                                            r = True                            #             #
+                                            break                               # gopast      #
+                                    else:                                       #             #
+                                        s.cursor = s.limit                      #             #
+                                        r = False                               ##            #
+                                    if r:                                                     #
+                                        for var11 in xrange(s.cursor, s.limit, 1):  ##        #
+                                            if s.chars[var11] not in _g_v:          #         #
+                                                s.cursor = var11 + 1                #         #
+                                                r = True                            #         #
+                                                break                               # gopast  #
+                                        else:                                       #         #
+                                            s.cursor = s.limit                      #         #
+                                            r = False                               ##        #
+                                        if r:                                                 #
+                                            self.i_p2 = s.cursor  ##                          #
+                                            r = True              ## setmark                  #
+                        s.cursor = var12                                                      #
+                        r = True                                                              ##
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        while True:                                                                         ##
+            var13 = s.cursor                                                                #
+            self.left = s.cursor  ##                                                        #
+            r = True              ## [                                                      #
+            if r:                                                                           #
+                a_2 = _find_among(s, _t_2)  ##                                              #
+                r = a_2 is not None         ## substring                                    #
+                if r:                                                                       #
+                    self.right = s.cursor  ##                                               #
+                    r = True               ## ]                                             #
+                    if r:                                                                   # repeat
+                        if a_2 == 0:                                               ##       #
+                            r = s.set_range(self.left, self.right, u'\xe3')  # <-  #        #
+                        if a_2 == 1:                                               #        #
+                            r = s.set_range(self.left, self.right, u'\xf5')  # <-  # among  #
+                        if a_2 == 2:                                               #        #
+                            r = s.hop(1)  # next                                   ##       #
+            if not r:                                                                       #
+                s.cursor = var13                                                            #
+                break                                                                       #
+        r = True                                                                            ##
+        return r
+    
+    def r_RV(self, s):
+        r = True
+        r = self.i_pV <= s.cursor  # <=
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_standard_suffix(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_3 = _find_among(s, _t_3)  ##
+            r = a_3 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_3 == 0:                                                                                                               ##
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                    if a_3 == 1:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'log')  # <-                                                               #
+                    if a_3 == 2:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'u')  # <-                                                                 #
+                    if a_3 == 3:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'ente')  # <-                                                              #
+                    if a_3 == 4:                                                                                                               #
+                        r = self.r_R1(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var14 = len(s.chars) - s.cursor                                                                               ##     #
+                                self.left = s.cursor  ##                                                                                #      #
+                                r = True              ## [                                                                              #      #
+                                if r:                                                                                                   #      #
+                                    a_4 = _find_among(s, _t_4)  ##                                                                      #      #
+                                    r = a_4 is not None         ## substring                                                            #      #
+                                    if r:                                                                                               #      #
+                                        self.right = s.cursor  ##                                                                       #      #
+                                        r = True               ## ]                                                                     #      #
+                                        if r:                                                                                           #      #
+                                            r = self.r_R2(s)  # routine call                                                            #      #
+                                            if r:                                                                                       #      #
+                                                r = s.set_range(self.left, self.right, u'')  # delete                                   #      #
+                                                if r:                                                                                   #      #
+                                                    if a_4 == 0:                                                               ##       #      #
+                                                        self.left = s.cursor  ##                                               #        # try  #
+                                                        r = True              ## [                                             #        #      #
+                                                        if r:                                                                  #        #      #
+                                                            r = s.starts_with(u'at')  # character check                        #        #      #
+                                                            if r:                                                              #        #      #
+                                                                self.right = s.cursor  ##                                      #        #      #
+                                                                r = True               ## ]                                    # among  #      #
+                                                                if r:                                                          #        #      #
+                                                                    r = self.r_R2(s)  # routine call                           #        #      #
+                                                                    if r:                                                      #        #      #
+                                                                        r = s.set_range(self.left, self.right, u'')  # delete  #        #      #
+                                                    if a_4 == 1:                                                               #        #      #
+                                                        r = True                                                               ##       #      #
+                                if not r:                                                                                               #      #
+                                    r = True                                                                                            #      #
+                                    s.cursor = len(s.chars) - var14                                                                           ##     #
+                    if a_3 == 5:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var15 = len(s.chars) - s.cursor                                                           ##                         #
+                                self.left = s.cursor  ##                                                            #                          #
+                                r = True              ## [                                                          #                          #
+                                if r:                                                                               #                          #
+                                    a_5 = _find_among(s, _t_5)  ##                                                  #                          # among
+                                    r = a_5 is not None         ## substring                                        #                          #
+                                    if r:                                                                           #                          #
+                                        self.right = s.cursor  ##                                                   #                          #
+                                        r = True               ## ]                                                 # try                      #
+                                        if r:                                                                       #                          #
+                                            if a_5 == 0:                                                   ##       #                          #
+                                                r = self.r_R2(s)  # routine call                           #        #                          #
+                                                if r:                                                      # among  #                          #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  ##       #                          #
+                                if not r:                                                                           #                          #
+                                    r = True                                                                        #                          #
+                                    s.cursor = len(s.chars) - var15                                                       ##                         #
+                    if a_3 == 6:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var16 = len(s.chars) - s.cursor                                                           ##                         #
+                                self.left = s.cursor  ##                                                            #                          #
+                                r = True              ## [                                                          #                          #
+                                if r:                                                                               #                          #
+                                    a_6 = _find_among(s, _t_6)  ##                                                  #                          #
+                                    r = a_6 is not None         ## substring                                        #                          #
+                                    if r:                                                                           #                          #
+                                        self.right = s.cursor  ##                                                   #                          #
+                                        r = True               ## ]                                                 # try                      #
+                                        if r:                                                                       #                          #
+                                            if a_6 == 0:                                                   ##       #                          #
+                                                r = self.r_R2(s)  # routine call                           #        #                          #
+                                                if r:                                                      # among  #                          #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  ##       #                          #
+                                if not r:                                                                           #                          #
+                                    r = True                                                                        #                          #
+                                    s.cursor = len(s.chars) - var16                                                       ##                         #
+                    if a_3 == 7:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var17 = len(s.chars) - s.cursor                                              ##                                      #
+                                self.left = s.cursor  ##                                               #                                       #
+                                r = True              ## [                                             #                                       #
+                                if r:                                                                  #                                       #
+                                    r = s.starts_with(u'at')  # character check                        #                                       #
+                                    if r:                                                              #                                       #
+                                        self.right = s.cursor  ##                                      #                                       #
+                                        r = True               ## ]                                    # try                                   #
+                                        if r:                                                          #                                       #
+                                            r = self.r_R2(s)  # routine call                           #                                       #
+                                            if r:                                                      #                                       #
+                                                r = s.set_range(self.left, self.right, u'')  # delete  #                                       #
+                                if not r:                                                              #                                       #
+                                    r = True                                                           #                                       #
+                                    s.cursor = len(s.chars) - var17                                          ##                                      #
+                    if a_3 == 8:                                                                                                               #
+                        r = self.r_RV(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.starts_with(u'e')  # character check                                                                         #
+                            if r:                                                                                                              #
+                                r = s.set_range(self.left, self.right, u'ir')  # <-                                                            ##
+        return r
+    
+    def r_verb_suffix(self, s):
+        r = True
+        var18 = len(s.chars) - s.cursor                                                            ##
+        var19 = s.limit                                                                      #
+        r = s.to_mark(self.i_pV)  # tomark                                                   #
+        if r:                                                                                #
+            s.limit = s.cursor                                                               #
+            s.cursor = len(s.chars) - var18                                                        #
+            self.left = s.cursor  ##                                                         #
+            r = True              ## [                                                       #
+            if r:                                                                            #
+                a_7 = _find_among(s, _t_7)  ##                                               # setlimit
+                r = a_7 is not None         ## substring                                     #
+                if r:                                                                        #
+                    self.right = s.cursor  ##                                                #
+                    r = True               ## ]                                              #
+                    if r:                                                                    #
+                        if a_7 == 0:                                               ##        #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ## among  #
+            s.limit = var19                                                                  ##
+        return r
+    
+    def r_residual_suffix(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_8 = _find_among(s, _t_8)  ##
+            r = a_8 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_8 == 0:                                                   ##
+                        r = self.r_RV(s)  # routine call                           #
+                        if r:                                                      # among
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_residual_form(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_9 = _find_among(s, _t_9)  ##
+            r = a_9 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_9 == 0:                                                                          ##
+                        r = self.r_RV(s)  # routine call                                                  #
+                        if r:                                                                             #
+                            r = s.set_range(self.left, self.right, u'')  # delete                         #
+                            if r:                                                                         #
+                                self.left = s.cursor  ##                                                  #
+                                r = True              ## [                                                #
+                                if r:                                                                     #
+                                    var22 = len(s.chars) - s.cursor                                       ##    #
+                                    r = s.starts_with(u'u')  # character check                      #     #
+                                    if r:                                                           #     #
+                                        self.right = s.cursor  ##                                   #     #
+                                        r = True               ## ]                                 #     #
+                                        if r:                                                       #     #
+                                            var20 = len(s.chars) - s.cursor                   ##          #     #
+                                            r = s.starts_with(u'g')  # character check  # test      #     #
+                                            s.cursor = len(s.chars) - var20                   ##          #     # among
+                                    if not r:                                                       # or  #
+                                        s.cursor = len(s.chars) - var22                                   #     #
+                                        r = s.starts_with(u'i')  # character check                  #     #
+                                        if r:                                                       #     #
+                                            self.right = s.cursor  ##                               #     #
+                                            r = True               ## ]                             #     #
+                                            if r:                                                   #     #
+                                                var21 = len(s.chars) - s.cursor                   ##      #     #
+                                                r = s.starts_with(u'c')  # character check  # test  #     #
+                                                s.cursor = len(s.chars) - var21                   ##      ##    #
+                                    if r:                                                                 #
+                                        r = self.r_RV(s)  # routine call                                  #
+                                        if r:                                                             #
+                                            r = s.set_range(self.left, self.right, u'')  # delete         #
+                    if a_9 == 1:                                                                          #
+                        r = s.set_range(self.left, self.right, u'c')  # <-                                ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var23 = s.cursor                       ##
+        r = self.r_prelude(s)  # routine call  #
+        s.cursor = var23                       # do
+        r = True                               ##
+        if r:
+            var24 = s.cursor                            ##
+            r = self.r_mark_regions(s)  # routine call  #
+            s.cursor = var24                            # do
+            r = True                                    ##
+            if r:
+                var32 = s.cursor                                                                                        ##
+                var33 = len(s.chars) - s.limit                                                                                #
+                s.direction *= -1                                                                                       #
+                s.cursor, s.limit = s.limit, s.cursor                                                                   #
+                var30 = len(s.chars) - s.cursor                                                                         ##    #
+                var29 = len(s.chars) - s.cursor                                                                   ##    #     #
+                var28 = len(s.chars) - s.cursor                                                            ##     #     #     #
+                var25 = len(s.chars) - s.cursor                      ##                                    #      #     #     #
+                r = self.r_standard_suffix(s)  # routine call  #                                     #      #     #     #
+                if not r:                                      # or                                  #      #     #     #
+                    s.cursor = len(s.chars) - var25                  #                                     #      #     #     #
+                    r = self.r_verb_suffix(s)  # routine call  ##                                    #      #     #     #
+                if r:                                                                                #      #     #     #
+                    s.cursor = len(s.chars) - var28                                                        #      #     #     #
+                    var27 = len(s.chars) - s.cursor                                                  ##    #      #     #     #
+                    self.left = s.cursor  ##                                                   #     #      #     #     #
+                    r = True              ## [                                                 #     #      #     #     #
+                    if r:                                                                      #     #      #     #     #
+                        r = s.starts_with(u'i')  # character check                             #     #      #     #     #
+                        if r:                                                                  #     # and  #     #     #
+                            self.right = s.cursor  ##                                          #     #      # or  # do  #
+                            r = True               ## ]                                        #     #      #     #     #
+                            if r:                                                              #     #      #     #     # backwards
+                                var26 = len(s.chars) - s.cursor                   ##                 # do  #      #     #     #
+                                r = s.starts_with(u'c')  # character check  # test             #     #      #     #     #
+                                s.cursor = len(s.chars) - var26                   ##                 #     #      #     #     #
+                                if r:                                                          #     #      #     #     #
+                                    r = self.r_RV(s)  # routine call                           #     #      #     #     #
+                                    if r:                                                      #     #      #     #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete  #     #      #     #     #
+                    s.cursor = len(s.chars) - var27                                                  #     #      #     #     #
+                    r = True                                                                   ##    ##     #     #     #
+                if not r:                                                                                   #     #     #
+                    s.cursor = len(s.chars) - var29                                                               #     #     #
+                    r = self.r_residual_suffix(s)  # routine call                                           ##    #     #
+                s.cursor = len(s.chars) - var30                                                                         #     #
+                r = True                                                                                          ##    #
+                if r:                                                                                                   #
+                    var31 = len(s.chars) - s.cursor                    ##                                                     #
+                    r = self.r_residual_form(s)  # routine call  #                                                      #
+                    s.cursor = len(s.chars) - var31                    # do                                                   #
+                    r = True                                     ##                                                     #
+                s.direction *= -1                                                                                       #
+                s.cursor = var32                                                                                        #
+                s.limit = len(s.chars) - var33                                                                                ##
+                if r:
+                    var34 = s.cursor                        ##
+                    r = self.r_postlude(s)  # routine call  #
+                    s.cursor = var34                        # do
+                    r = True                                ##
+        return r
+
+_u_last_0 = frozenset([u'a', u'e', u'i', u'l', u'm', u'n', u'o', u'r', u's', u'u', u'\xe1', u'\xe7', u'\xe9', u'\xea', u'\xed', u'\xf3'])
+_u_chars_0 = frozenset([u'a', u'o', u'\xe3', u'\xf5'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)))
@@ -0,0 +1,514 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:33 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'\u0430\u0435\u0438\u043e\u0443\u044b\u044d\u044e\u044f')
+_a_1 = ((u'\u0438\u0432\u0448\u0438\u0441\u044c', '', 1), (u'\u044b\u0432\u0448\u0438\u0441\u044c', '', 1), (u'\u0432\u0448\u0438\u0441\u044c', '', 0), (u'\u0438\u0432\u0448\u0438', '', 1), (u'\u044b\u0432\u0448\u0438', '', 1), (u'\u0432\u0448\u0438', '', 0), (u'\u0438\u0432', '', 1), (u'\u044b\u0432', '', 1), (u'\u0432', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'\u0438\u043c\u0438', '', 0), (u'\u044b\u043c\u0438', '', 0), (u'\u0435\u0433\u043e', '', 0), (u'\u043e\u0433\u043e', '', 0), (u'\u0435\u043c\u0443', '', 0), (u'\u043e\u043c\u0443', '', 0), (u'\u0435\u0435', '', 0), (u'\u0438\u0435', '', 0), (u'\u044b\u0435', '', 0), (u'\u043e\u0435', '', 0), (u'\u0435\u0439', '', 0), (u'\u0438\u0439', '', 0), (u'\u044b\u0439', '', 0), (u'\u043e\u0439', '', 0), (u'\u0435\u043c', '', 0), (u'\u0438\u043c', '', 0), (u'\u044b\u043c', '', 0), (u'\u043e\u043c', '', 0), (u'\u0438\u0445', '', 0), (u'\u044b\u0445', '', 0), (u'\u0443\u044e', '', 0), (u'\u044e\u044e', '', 0), (u'\u0430\u044f', '', 0), (u'\u044f\u044f', '', 0), (u'\u043e\u044e', '', 0), (u'\u0435\u044e', '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'\u0438\u0432\u0448', '', 1), (u'\u044b\u0432\u0448', '', 1), (u'\u0443\u044e\u0449', '', 1), (u'\u0435\u043c', '', 0), (u'\u043d\u043d', '', 0), (u'\u0432\u0448', '', 0), (u'\u044e\u0449', '', 0), (u'\u0449', '', 0),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'\u0441\u044f', '', 0), (u'\u0441\u044c', '', 0),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'\u0435\u0439\u0442\u0435', '', 1), (u'\u0443\u0439\u0442\u0435', '', 1), (u'\u0435\u0442\u0435', '', 0), (u'\u0439\u0442\u0435', '', 0), (u'\u0435\u0448\u044c', '', 0), (u'\u043d\u043d\u043e', '', 0), (u'\u0438\u043b\u0430', '', 1), (u'\u044b\u043b\u0430', '', 1), (u'\u0435\u043d\u0430', '', 1), (u'\u0438\u0442\u0435', '', 1), (u'\u0438\u043b\u0438', '', 1), (u'\u044b\u043b\u0438', '', 1), (u'\u0438\u043b\u043e', '', 1), (u'\u044b\u043b\u043e', '', 1), (u'\u0435\u043d\u043e', '', 1), (u'\u0443\u0435\u0442', '', 1), (u'\u0443\u044e\u0442', '', 1), (u'\u0435\u043d\u044b', '', 1), (u'\u0438\u0442\u044c', '', 1), (u'\u044b\u0442\u044c', '', 1), (u'\u0438\u0448\u044c', '', 1), (u'\u043b\u0430', '', 0), (u'\u043d\u0430', '', 0), (u'\u043b\u0438', '', 0), (u'\u0435\u043c', '', 0), (u'\u043b\u043e', '', 0), (u'\u043d\u043e', '', 0), (u'\u0435\u0442', '', 0), (u'\u044e\u0442', '', 0), (u'\u043d\u044b', '', 0), (u'\u0442\u044c', '', 0), (u'\u0435\u0439', '', 1), (u'\u0443\u0439', '', 1), (u'\u0438\u043b', '', 1), (u'\u044b\u043b', '', 1), (u'\u0438\u043c', '', 1), (u'\u044b\u043c', '', 1), (u'\u0435\u043d', '', 1), (u'\u044f\u0442', '', 1), (u'\u0438\u0442', '', 1), (u'\u044b\u0442', '', 1), (u'\u0443\u044e', '', 1), (u'\u0439', '', 0), (u'\u043b', '', 0), (u'\u043d', '', 0), (u'\u044e', '', 1),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'\u0438\u044f\u043c\u0438', '', 0), (u'\u044f\u043c\u0438', '', 0), (u'\u0430\u043c\u0438', '', 0), (u'\u0438\u0435\u0439', '', 0), (u'\u0438\u044f\u043c', '', 0), (u'\u0438\u0435\u043c', '', 0), (u'\u0438\u044f\u0445', '', 0), (u'\u0435\u0432', '', 0), (u'\u043e\u0432', '', 0), (u'\u0438\u0435', '', 0), (u'\u044c\u0435', '', 0), (u'\u0435\u0438', '', 0), (u'\u0438\u0438', '', 0), (u'\u0435\u0439', '', 0), (u'\u043e\u0439', '', 0), (u'\u0438\u0439', '', 0), (u'\u044f\u043c', '', 0), (u'\u0435\u043c', '', 0), (u'\u0430\u043c', '', 0), (u'\u043e\u043c', '', 0), (u'\u0430\u0445', '', 0), (u'\u044f\u0445', '', 0), (u'\u0438\u044e', '', 0), (u'\u044c\u044e', '', 0), (u'\u0438\u044f', '', 0), (u'\u044c\u044f', '', 0), (u'\u0430', '', 0), (u'\u0435', '', 0), (u'\u0438', '', 0), (u'\u0439', '', 0), (u'\u043e', '', 0), (u'\u0443', '', 0), (u'\u044b', '', 0), (u'\u044c', '', 0), (u'\u044e', '', 0), (u'\u044f', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'\u043e\u0441\u0442\u044c', '', 0), (u'\u043e\u0441\u0442', '', 0),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'\u0435\u0439\u0448\u0435', '', 0), (u'\u0435\u0439\u0448', '', 0), (u'\u043d', '', 1), (u'\u044c', '', 2),)
+_t_8 = _make_among_table(_a_8)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_pV = 0
+        self.i_p2 = 0
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_pV = s.limit
+        r = True
+        if r:
+            self.i_p2 = s.limit
+            r = True
+            if r:
+                var4 = s.cursor                                                      ##
+                for var0 in xrange(s.cursor, s.limit, 1):  ##                        #
+                    if s.chars[var0] in _g_v:              #                         #
+                        s.cursor = var0 + 1                #                         #
+                        r = True                           #                         #
+                        break                              # gopast                  #
+                else:                                      #                         #
+                    s.cursor = s.limit                     #                         #
+                    r = False                              ##                        #
+                if r:                                                                #
+                    self.i_pV = s.cursor  ##                                         #
+                    r = True              ## setmark                                 #
+                    if r:                                                            #
+                        for var1 in xrange(s.cursor, s.limit, 1):  ##                #
+                            if s.chars[var1] not in _g_v:          #                 #
+                                s.cursor = var1 + 1                #                 #
+                                r = True                           #                 #
+                                break                              # gopast          #
+                        else:                                      #                 #
+                            s.cursor = s.limit                     #                 #
+                            r = False                              ##                #
+                        if r:                                                        #
+                            for var2 in xrange(s.cursor, s.limit, 1):  ##            # do
+                                if s.chars[var2] in _g_v:              #             #
+                                    s.cursor = var2 + 1                #             #
+                                    r = True                           #             #
+                                    break                              # gopast      #
+                            else:                                      #             #
+                                s.cursor = s.limit                     #             #
+                                r = False                              ##            #
+                            if r:                                                    #
+                                for var3 in xrange(s.cursor, s.limit, 1):  ##        #
+                                    if s.chars[var3] not in _g_v:          #         #
+                                        s.cursor = var3 + 1                #         #
+                                        r = True                           #         #
+                                        break                              # gopast  #
+                                else:                                      #         #
+                                    s.cursor = s.limit                     #         #
+                                    r = False                              ##        #
+                                if r:                                                #
+                                    self.i_p2 = s.cursor  ##                         #
+                                    r = True              ## setmark                 #
+                s.cursor = var4                                                      #
+                r = True                                                             ##
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_perfective_gerund(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_1 = _find_among(s, _t_1)  ##
+            r = a_1 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_1 == 0:                                                   ##
+                        var5 = len(s.chars) - s.cursor                             ##    #
+                        r = s.starts_with(u'\u0430')  # character check      #     #
+                        if not r:                                            # or  #
+                            s.cursor = len(s.chars) - var5                         #     #
+                            r = s.starts_with(u'\u044f')  # character check  ##    # among
+                        if r:                                                      #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                    if a_1 == 1:                                                   #
+                        r = s.set_range(self.left, self.right, u'')  # delete      ##
+        return r
+    
+    def r_adjective(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_2 = _find_among(s, _t_2)  ##
+            r = a_2 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_2 == 0:                                               ##
+                        r = s.set_range(self.left, self.right, u'')  # delete  ## among
+        return r
+    
+    def r_adjectival(self, s):
+        r = True
+        r = self.r_adjective(s)  # routine call
+        if r:
+            var7 = len(s.chars) - s.cursor                                                            ##
+            self.left = s.cursor  ##                                                            #
+            r = True              ## [                                                          #
+            if r:                                                                               #
+                a_3 = _find_among(s, _t_3)  ##                                                  #
+                r = a_3 is not None         ## substring                                        #
+                if r:                                                                           #
+                    self.right = s.cursor  ##                                                   #
+                    r = True               ## ]                                                 #
+                    if r:                                                                       #
+                        if a_3 == 0:                                                   ##       #
+                            var6 = len(s.chars) - s.cursor                             ##    #        # try
+                            r = s.starts_with(u'\u0430')  # character check      #     #        #
+                            if not r:                                            # or  #        #
+                                s.cursor = len(s.chars) - var6                         #     #        #
+                                r = s.starts_with(u'\u044f')  # character check  ##    # among  #
+                            if r:                                                      #        #
+                                r = s.set_range(self.left, self.right, u'')  # delete  #        #
+                        if a_3 == 1:                                                   #        #
+                            r = s.set_range(self.left, self.right, u'')  # delete      ##       #
+            if not r:                                                                           #
+                r = True                                                                        #
+                s.cursor = len(s.chars) - var7                                                        ##
+        return r
+    
+    def r_reflexive(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_4 == 0:                                               ##
+                        r = s.set_range(self.left, self.right, u'')  # delete  ## among
+        return r
+    
+    def r_verb(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_5 = _find_among(s, _t_5)  ##
+            r = a_5 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_5 == 0:                                                   ##
+                        var8 = len(s.chars) - s.cursor                             ##    #
+                        r = s.starts_with(u'\u0430')  # character check      #     #
+                        if not r:                                            # or  #
+                            s.cursor = len(s.chars) - var8                         #     #
+                            r = s.starts_with(u'\u044f')  # character check  ##    # among
+                        if r:                                                      #
+                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                    if a_5 == 1:                                                   #
+                        r = s.set_range(self.left, self.right, u'')  # delete      ##
+        return r
+    
+    def r_noun(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_6 = _find_among(s, _t_6)  ##
+            r = a_6 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_6 == 0:                                               ##
+                        r = s.set_range(self.left, self.right, u'')  # delete  ## among
+        return r
+    
+    def r_derivational(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_7 = _find_among(s, _t_7)  ##
+            r = a_7 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    r = self.r_R2(s)  # routine call
+                    if r:
+                        if a_7 == 0:                                               ##
+                            r = s.set_range(self.left, self.right, u'')  # delete  ## among
+        return r
+    
+    def r_tidy_up(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_8 = _find_among(s, _t_8)  ##
+            r = a_8 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_8 == 0:                                                                   ##
+                        r = s.set_range(self.left, self.right, u'')  # delete                      #
+                        if r:                                                                      #
+                            self.left = s.cursor  ##                                               #
+                            r = True              ## [                                             #
+                            if r:                                                                  #
+                                r = s.starts_with(u'\u043d')  # character check                    #
+                                if r:                                                              #
+                                    self.right = s.cursor  ##                                      #
+                                    r = True               ## ]                                    #
+                                    if r:                                                          # among
+                                        r = s.starts_with(u'\u043d')  # character check            #
+                                        if r:                                                      #
+                                            r = s.set_range(self.left, self.right, u'')  # delete  #
+                    if a_8 == 1:                                                                   #
+                        r = s.starts_with(u'\u043d')  # character check                            #
+                        if r:                                                                      #
+                            r = s.set_range(self.left, self.right, u'')  # delete                  #
+                    if a_8 == 2:                                                                   #
+                        r = s.set_range(self.left, self.right, u'')  # delete                      ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var9 = s.cursor                             ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var9                             # do
+        r = True                                    ##
+        if r:
+            var20 = s.cursor                                                                              ##
+            var21 = len(s.chars) - s.limit                                                                      #
+            s.direction *= -1                                                                             #
+            s.cursor, s.limit = s.limit, s.cursor                                                         #
+            var18 = len(s.chars) - s.cursor                                                         ##          #
+            var19 = s.limit                                                                   #           #
+            r = s.to_mark(self.i_pV)  # tomark                                                #           #
+            if r:                                                                             #           #
+                s.limit = s.cursor                                                            #           #
+                s.cursor = len(s.chars) - var18                                                     #           #
+                var14 = len(s.chars) - s.cursor                                           ##        #           #
+                var13 = len(s.chars) - s.cursor                                     ##    #         #           #
+                r = self.r_perfective_gerund(s)  # routine call               #     #         #           #
+                if not r:                                                     #     #         #           #
+                    s.cursor = len(s.chars) - var13                                 #     #         #           #
+                    var10 = len(s.chars) - s.cursor                ##               #     #         #           #
+                    r = self.r_reflexive(s)  # routine call  #                #     #         #           #
+                    if not r:                                # try            #     #         #           #
+                        r = True                             #                #     #         #           #
+                        s.cursor = len(s.chars) - var10            ##               #     #         #           #
+                    if r:                                                     # or  #         #           #
+                        var12 = len(s.chars) - s.cursor                       ##    #     # do      #           #
+                        var11 = len(s.chars) - s.cursor                 ##    #     #     #         #           #
+                        r = self.r_adjectival(s)  # routine call  #     #     #     #         #           #
+                        if not r:                                 # or  #     #     #         #           #
+                            s.cursor = len(s.chars) - var11             #     # or  #     #         #           #
+                            r = self.r_verb(s)  # routine call    ##    #     #     #         #           #
+                        if not r:                                       #     #     #         #           #
+                            s.cursor = len(s.chars) - var12                   #     #     #         #           #
+                            r = self.r_noun(s)  # routine call          ##    ##    #         #           #
+                s.cursor = len(s.chars) - var14                                           #         # setlimit  # backwards
+                r = True                                                            ##        #           #
+                if r:                                                                         #           #
+                    var15 = len(s.chars) - s.cursor                                          ##     #           #
+                    self.left = s.cursor  ##                                           #      #           #
+                    r = True              ## [                                         #      #           #
+                    if r:                                                              #      #           #
+                        r = s.starts_with(u'\u0438')  # character check                #      #           #
+                        if r:                                                          #      #           #
+                            self.right = s.cursor  ##                                  # try  #           #
+                            r = True               ## ]                                #      #           #
+                            if r:                                                      #      #           #
+                                r = s.set_range(self.left, self.right, u'')  # delete  #      #           #
+                    if not r:                                                          #      #           #
+                        r = True                                                       #      #           #
+                        s.cursor = len(s.chars) - var15                                      ##     #           #
+                    if r:                                                                     #           #
+                        var16 = len(s.chars) - s.cursor                   ##                        #           #
+                        r = self.r_derivational(s)  # routine call  #                         #           #
+                        s.cursor = len(s.chars) - var16                   # do                      #           #
+                        r = True                                    ##                        #           #
+                        if r:                                                                 #           #
+                            var17 = len(s.chars) - s.cursor              ##                         #           #
+                            r = self.r_tidy_up(s)  # routine call  #                          #           #
+                            s.cursor = len(s.chars) - var17              # do                       #           #
+                            r = True                               ##                         #           #
+                s.limit = var19                                                               ##          #
+            s.direction *= -1                                                                             #
+            s.cursor = var20                                                                              #
+            s.limit = len(s.chars) - var21                                                                      ##
+        return r
+
+_u_last_0 = frozenset([u'\u0430', u'\u0432', u'\u0435', u'\u0438', u'\u0439', u'\u043b', u'\u043c', u'\u043d', u'\u043e', u'\u0442', u'\u0443', u'\u0445', u'\u0448', u'\u044b', u'\u044c', u'\u044e', u'\u044f'])
+_u_last_1 = frozenset([u'\u0430', u'\u0432', u'\u0435', u'\u0438', u'\u0439', u'\u043b', u'\u043c', u'\u043d', u'\u043e', u'\u0442', u'\u0443', u'\u0445', u'\u044b', u'\u044c', u'\u044e', u'\u044f'])
+_u_chars_1 = frozenset([u'\u0435', u'\u043d', u'\u0448', u'\u044c'])
+_u_last_2 = frozenset([u'\u0432', u'\u0435', u'\u0438', u'\u0448', u'\u044c', u'\u044f'])
+_u_chars_2 = frozenset([u'\u0430', u'\u0432', u'\u0435', u'\u0438', u'\u0439', u'\u043b', u'\u043c', u'\u043d', u'\u043e', u'\u0442', u'\u0443', u'\u0445', u'\u044b', u'\u044c', u'\u044e', u'\u044f'])
+_u_last_3 = frozenset([u'\u0432', u'\u0438', u'\u044c', u'\u044f'])
+_u_chars_3 = frozenset([u'\u0430', u'\u0432', u'\u0435', u'\u0438', u'\u0439', u'\u043b', u'\u043c', u'\u043d', u'\u043e', u'\u0442', u'\u0443', u'\u0445', u'\u0448', u'\u044b', u'\u044c', u'\u044e', u'\u044f'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0) or
+            (word[-1:] not in _u_last_1 and _u_chars_1.isdisjoint(word)) or
+            (word[-1:] not in _u_last_2 and _u_chars_2.isdisjoint(word)) or
+            (word[-1:] not in _u_last_3 and _u_chars_3.isdisjoint(word)))
@@ -0,0 +1,745 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:40 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiou\xe1\xe9\xed\xf3\xfa\xfc')
+_a_1 = ((u'\xe1', '', 0), (u'\xe9', '', 1), (u'\xed', '', 2), (u'\xf3', '', 3), (u'\xfa', '', 4), (u'', '', 5),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'selas', '', 0), (u'selos', '', 0), (u'sela', '', 0), (u'selo', '', 0), (u'las', '', 0), (u'les', '', 0), (u'los', '', 0), (u'nos', '', 0), (u'me', '', 0), (u'se', '', 0), (u'la', '', 0), (u'le', '', 0), (u'lo', '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'i\xe9ndo', '', 0), (u'iendo', '', 5), (u'yendo', '', 6), (u'\xe1ndo', '', 1), (u'ando', '', 5), (u'\xe1r', '', 2), (u'\xe9r', '', 3), (u'\xedr', '', 4), (u'ar', '', 5), (u'er', '', 5), (u'ir', '', 5),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'amientos', '', 0), (u'imientos', '', 0), (u'amiento', '', 0), (u'imiento', '', 0), (u'aciones', '', 1), (u'uciones', '', 3), (u'adoras', '', 1), (u'adores', '', 1), (u'ancias', '', 1), (u'log\xedas', '', 2), (u'encias', '', 4), (u'amente', '', 5), (u'idades', '', 7), (u'anzas', '', 0), (u'ismos', '', 0), (u'ables', '', 0), (u'ibles', '', 0), (u'istas', '', 0), (u'adora', '', 1), (u'aci\xf3n', '', 1), (u'antes', '', 1), (u'ancia', '', 1), (u'log\xeda', '', 2), (u'uci\xf3n', '', 3), (u'encia', '', 4), (u'mente', '', 6), (u'anza', '', 0), (u'icos', '', 0), (u'icas', '', 0), (u'ismo', '', 0), (u'able', '', 0), (u'ible', '', 0), (u'ista', '', 0), (u'osos', '', 0), (u'osas', '', 0), (u'ador', '', 1), (u'ante', '', 1), (u'idad', '', 7), (u'ivas', '', 8), (u'ivos', '', 8), (u'ico', '', 0), (u'ica', '', 0), (u'oso', '', 0), (u'osa', '', 0), (u'iva', '', 8), (u'ivo', '', 8),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'iv', '', 0), (u'os', '', 1), (u'ic', '', 1), (u'ad', '', 1),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'ante', '', 0), (u'able', '', 0), (u'ible', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'abil', '', 0), (u'ic', '', 0), (u'iv', '', 0),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'yeron', '', 0), (u'yendo', '', 0), (u'yamos', '', 0), (u'yais', '', 0), (u'yan', '', 0), (u'yen', '', 0), (u'yas', '', 0), (u'yes', '', 0), (u'ya', '', 0), (u'ye', '', 0), (u'yo', '', 0), (u'y\xf3', '', 0),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'ar\xedamos', '', 1), (u'er\xedamos', '', 1), (u'ir\xedamos', '', 1), (u'i\xe9ramos', '', 1), (u'i\xe9semos', '', 1), (u'ar\xedais', '', 1), (u'aremos', '', 1), (u'er\xedais', '', 1), (u'eremos', '', 1), (u'ir\xedais', '', 1), (u'iremos', '', 1), (u'ierais', '', 1), (u'ieseis', '', 1), (u'asteis', '', 1), (u'isteis', '', 1), (u'\xe1bamos', '', 1), (u'\xe1ramos', '', 1), (u'\xe1semos', '', 1), (u'ar\xedan', '', 1), (u'ar\xedas', '', 1), (u'ar\xe9is', '', 1), (u'er\xedan', '', 1), (u'er\xedas', '', 1), (u'er\xe9is', '', 1), (u'ir\xedan', '', 1), (u'ir\xedas', '', 1), (u'ir\xe9is', '', 1), (u'ieran', '', 1), (u'iesen', '', 1), (u'ieron', '', 1), (u'iendo', '', 1), (u'ieras', '', 1), (u'ieses', '', 1), (u'abais', '', 1), (u'arais', '', 1), (u'aseis', '', 1), (u'\xedamos', '', 1), (u'emos', '', 0), (u'ar\xe1n', '', 1), (u'ar\xe1s', '', 1), (u'ar\xeda', '', 1), (u'er\xe1n', '', 1), (u'er\xe1s', '', 1), (u'er\xeda', '', 1), (u'ir\xe1n', '', 1), (u'ir\xe1s', '', 1), (u'ir\xeda', '', 1), (u'iera', '', 1), (u'iese', '', 1), (u'aste', '', 1), (u'iste', '', 1), (u'aban', '', 1), (u'aran', '', 1), (u'asen', '', 1), (u'aron', '', 1), (u'ando', '', 1), (u'abas', '', 1), (u'adas', '', 1), (u'idas', '', 1), (u'aras', '', 1), (u'ases', '', 1), (u'\xedais', '', 1), (u'ados', '', 1), (u'idos', '', 1), (u'amos', '', 1), (u'imos', '', 1), (u'\xe9is', '', 0), (u'ar\xe1', '', 1), (u'ar\xe9', '', 1), (u'er\xe1', '', 1), (u'er\xe9', '', 1), (u'ir\xe1', '', 1), (u'ir\xe9', '', 1), (u'aba', '', 1), (u'ada', '', 1), (u'ida', '', 1), (u'ara', '', 1), (u'ase', '', 1), (u'\xedan', '', 1), (u'ado', '', 1), (u'ido', '', 1), (u'\xedas', '', 1), (u'\xe1is', '', 1), (u'en', '', 0), (u'es', '', 0), (u'\xeda', '', 1), (u'ad', '', 1), (u'ed', '', 1), (u'id', '', 1), (u'an', '', 1), (u'i\xf3', '', 1), (u'ar', '', 1), (u'er', '', 1), (u'ir', '', 1), (u'as', '', 1), (u'\xeds', '', 1),)
+_t_9 = _make_among_table(_a_9)
+_a_10 = ((u'os', '', 0), (u'a', '', 0), (u'o', '', 0), (u'\xe1', '', 0), (u'\xed', '', 0), (u'\xf3', '', 0), (u'e', '', 1), (u'\xe9', '', 1),)
+_t_10 = _make_among_table(_a_10)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_pV = 0
+        self.i_p1 = 0
+        self.i_p2 = 0
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_pV = s.limit
+        r = True
+        if r:
+            self.i_p1 = s.limit
+            r = True
+            if r:
+                self.i_p2 = s.limit
+                r = True
+                if r:
+                    var6 = s.cursor                                                                       ##
+                    var5 = s.cursor                                                                 ##    #
+                    if s.cursor == s.limit:            ##                                           #     #
+                        r = False                      #                                            #     #
+                    else:                              #                                            #     #
+                        r = s.chars[s.cursor] in _g_v  # grouping check                             #     #
+                    if r:                              #                                            #     #
+                        s.cursor += 1                  ##                                           #     #
+                    if r:                                                                           #     #
+                        var2 = s.cursor                                                   ##        #     #
+                        if s.cursor == s.limit:                ##                         #         #     #
+                            r = False                          #                          #         #     #
+                        else:                                  #                          #         #     #
+                            r = s.chars[s.cursor] not in _g_v  # negative grouping check  #         #     #
+                        if r:                                  #                          #         #     #
+                            s.cursor += 1                      ##                         #         #     #
+                        if r:                                                             #         #     #
+                            for var0 in xrange(s.cursor, s.limit, 1):  ##                 #         #     #
+                                if s.chars[var0] in _g_v:              #                  #         #     #
+                                    s.cursor = var0 + 1                #                  #         #     #
+                                    r = True                           #                  #         #     #
+                                    break                              # gopast           #         #     #
+                            else:                                      #                  #         #     #
+                                s.cursor = s.limit                     #                  #         #     #
+                                r = False                              ##                 #         #     #
+                        if not r:                                                         # or      #     #
+                            s.cursor = var2                                               #         #     #
+                            if s.cursor == s.limit:            ##                         #         #     #
+                                r = False                      #                          #         #     #
+                            else:                              #                          #         #     #
+                                r = s.chars[s.cursor] in _g_v  # grouping check           #         #     #
+                            if r:                              #                          #         #     #
+                                s.cursor += 1                  ##                         #         #     #
+                            if r:                                                         #         #     #
+                                for var1 in xrange(s.cursor, s.limit, 1):  ##             #         #     #
+                                    if s.chars[var1] not in _g_v:          #              #         #     #
+                                        s.cursor = var1 + 1                #              #         #     #
+                                        r = True                           #              #         #     #
+                                        break                              # gopast       #         #     #
+                                else:                                      #              #         # or  #
+                                    s.cursor = s.limit                     #              #         #     #
+                                    r = False                              ##             ##        #     # do
+                    if not r:                                                                       #     #
+                        s.cursor = var5                                                             #     #
+                        if s.cursor == s.limit:                ##                                   #     #
+                            r = False                          #                                    #     #
+                        else:                                  #                                    #     #
+                            r = s.chars[s.cursor] not in _g_v  # negative grouping check            #     #
+                        if r:                                  #                                    #     #
+                            s.cursor += 1                      ##                                   #     #
+                        if r:                                                                       #     #
+                            var4 = s.cursor                                                   ##    #     #
+                            if s.cursor == s.limit:                ##                         #     #     #
+                                r = False                          #                          #     #     #
+                            else:                                  #                          #     #     #
+                                r = s.chars[s.cursor] not in _g_v  # negative grouping check  #     #     #
+                            if r:                                  #                          #     #     #
+                                s.cursor += 1                      ##                         #     #     #
+                            if r:                                                             #     #     #
+                                for var3 in xrange(s.cursor, s.limit, 1):  ##                 #     #     #
+                                    if s.chars[var3] in _g_v:              #                  #     #     #
+                                        s.cursor = var3 + 1                #                  #     #     #
+                                        r = True                           #                  #     #     #
+                                        break                              # gopast           #     #     #
+                                else:                                      #                  # or  #     #
+                                    s.cursor = s.limit                     #                  #     #     #
+                                    r = False                              ##                 #     #     #
+                            if not r:                                                         #     #     #
+                                s.cursor = var4                                               #     #     #
+                                if s.cursor == s.limit:            ##                         #     #     #
+                                    r = False                      #                          #     #     #
+                                else:                              #                          #     #     #
+                                    r = s.chars[s.cursor] in _g_v  # grouping check           #     #     #
+                                if r:                              #                          #     #     #
+                                    s.cursor += 1                  ##                         #     #     #
+                                if r:                                                         #     #     #
+                                    r = s.hop(1)  # next                                      ##    ##    #
+                    if r:                                                                                 #
+                        self.i_pV = s.cursor  ##                                                          #
+                        r = True              ## setmark                                                  #
+                    s.cursor = var6                                                                       #
+                    r = True                                                                              ##
+                    if r:
+                        var11 = s.cursor                                                      ##
+                        for var7 in xrange(s.cursor, s.limit, 1):  ##                         #
+                            if s.chars[var7] in _g_v:              #                          #
+                                s.cursor = var7 + 1                #                          #
+                                r = True                           #                          #
+                                break                              # gopast                   #
+                        else:                                      #                          #
+                            s.cursor = s.limit                     #                          #
+                            r = False                              ##                         #
+                        if r:                                                                 #
+                            for var8 in xrange(s.cursor, s.limit, 1):  ##                     #
+                                if s.chars[var8] not in _g_v:          #                      #
+                                    s.cursor = var8 + 1                #                      #
+                                    r = True                           #                      #
+                                    break                              # gopast               #
+                            else:                                      #                      #
+                                s.cursor = s.limit                     #                      #
+                                r = False                              ##                     #
+                            if r:                                                             #
+                                self.i_p1 = s.cursor  ##                                      #
+                                r = True              ## setmark                              #
+                                if r:                                                         #
+                                    for var9 in xrange(s.cursor, s.limit, 1):  ##             # do
+                                        if s.chars[var9] in _g_v:              #              #
+                                            s.cursor = var9 + 1                #              #
+                                            r = True                           #              #
+                                            break                              # gopast       #
+                                    else:                                      #              #
+                                        s.cursor = s.limit                     #              #
+                                        r = False                              ##             #
+                                    if r:                                                     #
+                                        for var10 in xrange(s.cursor, s.limit, 1):  ##        #
+                                            if s.chars[var10] not in _g_v:          #         #
+                                                s.cursor = var10 + 1                #         #
+                                                r = True                            #         #
+                                                break                               # gopast  #
+                                        else:                                       #         #
+                                            s.cursor = s.limit                      #         #
+                                            r = False                               ##        #
+                                        if r:                                                 #
+                                            self.i_p2 = s.cursor  ##                          #
+                                            r = True              ## setmark                  #
+                        s.cursor = var11                                                      #
+                        r = True                                                              ##
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        while True:                                                                      ##
+            var12 = s.cursor                                                             #
+            self.left = s.cursor  ##                                                     #
+            r = True              ## [                                                   #
+            if r:                                                                        #
+                a_1 = _find_among(s, _t_1)  ##                                           #
+                r = a_1 is not None         ## substring                                 #
+                if r:                                                                    #
+                    self.right = s.cursor  ##                                            #
+                    r = True               ## ]                                          #
+                    if r:                                                                #
+                        if a_1 == 0:                                            ##       #
+                            r = s.set_range(self.left, self.right, u'a')  # <-  #        #
+                        if a_1 == 1:                                            #        # repeat
+                            r = s.set_range(self.left, self.right, u'e')  # <-  #        #
+                        if a_1 == 2:                                            #        #
+                            r = s.set_range(self.left, self.right, u'i')  # <-  #        #
+                        if a_1 == 3:                                            # among  #
+                            r = s.set_range(self.left, self.right, u'o')  # <-  #        #
+                        if a_1 == 4:                                            #        #
+                            r = s.set_range(self.left, self.right, u'u')  # <-  #        #
+                        if a_1 == 5:                                            #        #
+                            r = s.hop(1)  # next                                ##       #
+            if not r:                                                                    #
+                s.cursor = var12                                                         #
+                break                                                                    #
+        r = True                                                                         ##
+        return r
+    
+    def r_RV(self, s):
+        r = True
+        r = self.i_pV <= s.cursor  # <=
+        return r
+    
+    def r_R1(self, s):
+        r = True
+        r = self.i_p1 <= s.cursor  # <=
+        return r
+    
+    def r_R2(self, s):
+        r = True
+        r = self.i_p2 <= s.cursor  # <=
+        return r
+    
+    def r_attached_pronoun(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_2 = _find_among(s, _t_2)  ##
+            r = a_2 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_2 == 0:  ##
+                        r = True  ## among
+                    if r:
+                        a_3 = _find_among(s, _t_3)  ##
+                        r = a_3 is not None         ## substring
+                        if r:
+                            r = self.r_RV(s)  # routine call
+                            if r:
+                                if a_3 == 0:                                                    ##
+                                    self.right = s.cursor  ##                                   #
+                                    r = True               ## ]                                 #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'iendo')  # <-  #
+                                if a_3 == 1:                                                    #
+                                    self.right = s.cursor  ##                                   #
+                                    r = True               ## ]                                 #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'ando')  # <-   #
+                                if a_3 == 2:                                                    #
+                                    self.right = s.cursor  ##                                   #
+                                    r = True               ## ]                                 #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'ar')  # <-     #
+                                if a_3 == 3:                                                    # among
+                                    self.right = s.cursor  ##                                   #
+                                    r = True               ## ]                                 #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'er')  # <-     #
+                                if a_3 == 4:                                                    #
+                                    self.right = s.cursor  ##                                   #
+                                    r = True               ## ]                                 #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'ir')  # <-     #
+                                if a_3 == 5:                                                    #
+                                    r = s.set_range(self.left, self.right, u'')  # delete       #
+                                if a_3 == 6:                                                    #
+                                    r = s.starts_with(u'u')  # character check                  #
+                                    if r:                                                       #
+                                        r = s.set_range(self.left, self.right, u'')  # delete   ##
+        return r
+    
+    def r_standard_suffix(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_4 == 0:                                                                                                               ##
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                    if a_4 == 1:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var13 = len(s.chars) - s.cursor                                              ##                                      #
+                                self.left = s.cursor  ##                                               #                                       #
+                                r = True              ## [                                             #                                       #
+                                if r:                                                                  #                                       #
+                                    r = s.starts_with(u'ic')  # character check                        #                                       #
+                                    if r:                                                              #                                       #
+                                        self.right = s.cursor  ##                                      #                                       #
+                                        r = True               ## ]                                    # try                                   #
+                                        if r:                                                          #                                       #
+                                            r = self.r_R2(s)  # routine call                           #                                       #
+                                            if r:                                                      #                                       #
+                                                r = s.set_range(self.left, self.right, u'')  # delete  #                                       #
+                                if not r:                                                              #                                       #
+                                    r = True                                                           #                                       #
+                                    s.cursor = len(s.chars) - var13                                          ##                                      #
+                    if a_4 == 2:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'log')  # <-                                                               #
+                    if a_4 == 3:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'u')  # <-                                                                 #
+                    if a_4 == 4:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'ente')  # <-                                                              #
+                    if a_4 == 5:                                                                                                               #
+                        r = self.r_R1(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var14 = len(s.chars) - s.cursor                                                                               ##     #
+                                self.left = s.cursor  ##                                                                                #      #
+                                r = True              ## [                                                                              #      #
+                                if r:                                                                                                   #      #
+                                    a_5 = _find_among(s, _t_5)  ##                                                                      #      #
+                                    r = a_5 is not None         ## substring                                                            #      #
+                                    if r:                                                                                               #      #
+                                        self.right = s.cursor  ##                                                                       #      #
+                                        r = True               ## ]                                                                     #      #
+                                        if r:                                                                                           #      #
+                                            r = self.r_R2(s)  # routine call                                                            #      #
+                                            if r:                                                                                       #      #
+                                                r = s.set_range(self.left, self.right, u'')  # delete                                   #      #
+                                                if r:                                                                                   #      #
+                                                    if a_5 == 0:                                                               ##       #      #
+                                                        self.left = s.cursor  ##                                               #        # try  #
+                                                        r = True              ## [                                             #        #      #
+                                                        if r:                                                                  #        #      #
+                                                            r = s.starts_with(u'at')  # character check                        #        #      #
+                                                            if r:                                                              #        #      #
+                                                                self.right = s.cursor  ##                                      #        #      #
+                                                                r = True               ## ]                                    # among  #      #
+                                                                if r:                                                          #        #      #
+                                                                    r = self.r_R2(s)  # routine call                           #        #      #
+                                                                    if r:                                                      #        #      #
+                                                                        r = s.set_range(self.left, self.right, u'')  # delete  #        #      #
+                                                    if a_5 == 1:                                                               #        #      #
+                                                        r = True                                                               ##       #      # among
+                                if not r:                                                                                               #      #
+                                    r = True                                                                                            #      #
+                                    s.cursor = len(s.chars) - var14                                                                           ##     #
+                    if a_4 == 6:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var15 = len(s.chars) - s.cursor                                                           ##                         #
+                                self.left = s.cursor  ##                                                            #                          #
+                                r = True              ## [                                                          #                          #
+                                if r:                                                                               #                          #
+                                    a_6 = _find_among(s, _t_6)  ##                                                  #                          #
+                                    r = a_6 is not None         ## substring                                        #                          #
+                                    if r:                                                                           #                          #
+                                        self.right = s.cursor  ##                                                   #                          #
+                                        r = True               ## ]                                                 # try                      #
+                                        if r:                                                                       #                          #
+                                            if a_6 == 0:                                                   ##       #                          #
+                                                r = self.r_R2(s)  # routine call                           #        #                          #
+                                                if r:                                                      # among  #                          #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  ##       #                          #
+                                if not r:                                                                           #                          #
+                                    r = True                                                                        #                          #
+                                    s.cursor = len(s.chars) - var15                                                       ##                         #
+                    if a_4 == 7:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var16 = len(s.chars) - s.cursor                                                           ##                         #
+                                self.left = s.cursor  ##                                                            #                          #
+                                r = True              ## [                                                          #                          #
+                                if r:                                                                               #                          #
+                                    a_7 = _find_among(s, _t_7)  ##                                                  #                          #
+                                    r = a_7 is not None         ## substring                                        #                          #
+                                    if r:                                                                           #                          #
+                                        self.right = s.cursor  ##                                                   #                          #
+                                        r = True               ## ]                                                 # try                      #
+                                        if r:                                                                       #                          #
+                                            if a_7 == 0:                                                   ##       #                          #
+                                                r = self.r_R2(s)  # routine call                           #        #                          #
+                                                if r:                                                      # among  #                          #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  ##       #                          #
+                                if not r:                                                                           #                          #
+                                    r = True                                                                        #                          #
+                                    s.cursor = len(s.chars) - var16                                                       ##                         #
+                    if a_4 == 8:                                                                                                               #
+                        r = self.r_R2(s)  # routine call                                                                                       #
+                        if r:                                                                                                                  #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                              #
+                            if r:                                                                                                              #
+                                var17 = len(s.chars) - s.cursor                                              ##                                      #
+                                self.left = s.cursor  ##                                               #                                       #
+                                r = True              ## [                                             #                                       #
+                                if r:                                                                  #                                       #
+                                    r = s.starts_with(u'at')  # character check                        #                                       #
+                                    if r:                                                              #                                       #
+                                        self.right = s.cursor  ##                                      #                                       #
+                                        r = True               ## ]                                    # try                                   #
+                                        if r:                                                          #                                       #
+                                            r = self.r_R2(s)  # routine call                           #                                       #
+                                            if r:                                                      #                                       #
+                                                r = s.set_range(self.left, self.right, u'')  # delete  #                                       #
+                                if not r:                                                              #                                       #
+                                    r = True                                                           #                                       #
+                                    s.cursor = len(s.chars) - var17                                          ##                                      ##
+        return r
+    
+    def r_y_verb_suffix(self, s):
+        r = True
+        var18 = len(s.chars) - s.cursor                         ##
+        var19 = s.limit                                   #
+        r = s.to_mark(self.i_pV)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var18                     #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_8 = _find_among(s, _t_8)  ##            #
+                r = a_8 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var19                               ##
+        if r:
+            if a_8 == 0:                                                   ##
+                r = s.starts_with(u'u')  # character check                 #
+                if r:                                                      # among
+                    r = s.set_range(self.left, self.right, u'')  # delete  ##
+        return r
+    
+    def r_verb_suffix(self, s):
+        r = True
+        var20 = len(s.chars) - s.cursor                         ##
+        var21 = s.limit                                   #
+        r = s.to_mark(self.i_pV)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var20                     #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_9 = _find_among(s, _t_9)  ##            #
+                r = a_9 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var21                               ##
+        if r:
+            if a_9 == 0:                                                       ##
+                var23 = len(s.chars) - s.cursor                               ##     #
+                r = s.starts_with(u'u')  # character check              #      #
+                if r:                                                   #      #
+                    var22 = len(s.chars) - s.cursor                   ##      #      #
+                    r = s.starts_with(u'g')  # character check  # test  # try  #
+                    s.cursor = len(s.chars) - var22                   ##      #      #
+                if not r:                                               #      #
+                    r = True                                            #      # among
+                    s.cursor = len(s.chars) - var23                           ##     #
+                if r:                                                          #
+                    self.right = s.cursor  ##                                  #
+                    r = True               ## ]                                #
+                    if r:                                                      #
+                        r = s.set_range(self.left, self.right, u'')  # delete  #
+            if a_9 == 1:                                                       #
+                r = s.set_range(self.left, self.right, u'')  # delete          ##
+        return r
+    
+    def r_residual_suffix(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_10 = _find_among(s, _t_10)  ##
+            r = a_10 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_10 == 0:                                                                                 ##
+                        r = self.r_RV(s)  # routine call                                                          #
+                        if r:                                                                                     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                 #
+                    if a_10 == 1:                                                                                 #
+                        r = self.r_RV(s)  # routine call                                                          #
+                        if r:                                                                                     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                 #
+                            if r:                                                                                 #
+                                var25 = len(s.chars) - s.cursor                                                  ##     #
+                                self.left = s.cursor  ##                                                   #      #
+                                r = True              ## [                                                 #      #
+                                if r:                                                                      #      #
+                                    r = s.starts_with(u'u')  # character check                             #      #
+                                    if r:                                                                  #      # among
+                                        self.right = s.cursor  ##                                          #      #
+                                        r = True               ## ]                                        #      #
+                                        if r:                                                              #      #
+                                            var24 = len(s.chars) - s.cursor                   ##                 # try  #
+                                            r = s.starts_with(u'g')  # character check  # test             #      #
+                                            s.cursor = len(s.chars) - var24                   ##                 #      #
+                                            if r:                                                          #      #
+                                                r = self.r_RV(s)  # routine call                           #      #
+                                                if r:                                                      #      #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete  #      #
+                                if not r:                                                                  #      #
+                                    r = True                                                               #      #
+                                    s.cursor = len(s.chars) - var25                                              ##     ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var26 = s.cursor                            ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var26                            # do
+        r = True                                    ##
+        if r:
+            var32 = s.cursor                                                       ##
+            var33 = len(s.chars) - s.limit                                               #
+            s.direction *= -1                                                      #
+            s.cursor, s.limit = s.limit, s.cursor                                  #
+            var27 = len(s.chars) - s.cursor                       ##                     #
+            r = self.r_attached_pronoun(s)  # routine call  #                      #
+            s.cursor = len(s.chars) - var27                       # do                   #
+            r = True                                        ##                     #
+            if r:                                                                  #
+                var30 = len(s.chars) - s.cursor                                    ##    #
+                var29 = len(s.chars) - s.cursor                              ##    #     #
+                var28 = len(s.chars) - s.cursor                        ##    #     #     #
+                r = self.r_standard_suffix(s)  # routine call    #     #     #     #
+                if not r:                                        # or  #     #     #
+                    s.cursor = len(s.chars) - var28                    #     # or  #     # backwards
+                    r = self.r_y_verb_suffix(s)  # routine call  ##    #     # do  #
+                if not r:                                              #     #     #
+                    s.cursor = len(s.chars) - var29                          #     #     #
+                    r = self.r_verb_suffix(s)  # routine call          ##    #     #
+                s.cursor = len(s.chars) - var30                                    #     #
+                r = True                                                     ##    #
+                if r:                                                              #
+                    var31 = len(s.chars) - s.cursor                      ##              #
+                    r = self.r_residual_suffix(s)  # routine call  #               #
+                    s.cursor = len(s.chars) - var31                      # do            #
+                    r = True                                       ##              #
+            s.direction *= -1                                                      #
+            s.cursor = var32                                                       #
+            s.limit = len(s.chars) - var33                                               ##
+            if r:
+                var34 = s.cursor                        ##
+                r = self.r_postlude(s)  # routine call  #
+                s.cursor = var34                        # do
+                r = True                                ##
+        return r
+
+_u_last_0 = frozenset([u'a', u'd', u'e', u'n', u'o', u'r', u's', u'\xe1', u'\xe9', u'\xed', u'\xf3'])
+_u_chars_0 = frozenset([u'\xe1', u'\xe9', u'\xed', u'\xf3', u'\xfa'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0 and _u_chars_0.isdisjoint(word)))
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:53:42 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_g_v = frozenset(u'aeiouy\xe4\xe5\xf6')
+_g_s_ending = frozenset(u'bcdfghjklmnoprtvy')
+_a_1 = ((u'heterna', '', 0), (u'hetens', '', 0), (u'anden', '', 0), (u'heten', '', 0), (u'heter', '', 0), (u'arnas', '', 0), (u'ernas', '', 0), (u'ornas', '', 0), (u'andes', '', 0), (u'arens', '', 0), (u'andet', '', 0), (u'arna', '', 0), (u'erna', '', 0), (u'orna', '', 0), (u'ande', '', 0), (u'arne', '', 0), (u'aste', '', 0), (u'aren', '', 0), (u'ades', '', 0), (u'erns', '', 0), (u'ade', '', 0), (u'are', '', 0), (u'ern', '', 0), (u'ens', '', 0), (u'het', '', 0), (u'ast', '', 0), (u'ad', '', 0), (u'en', '', 0), (u'ar', '', 0), (u'er', '', 0), (u'or', '', 0), (u'as', '', 0), (u'es', '', 0), (u'at', '', 0), (u'a', '', 0), (u'e', '', 0), (u's', '', 1),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'dd', '', 0), (u'gd', '', 0), (u'nn', '', 0), (u'dt', '', 0), (u'gt', '', 0), (u'kt', '', 0), (u'tt', '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'fullt', '', 2), (u'l\xf6st', '', 1), (u'lig', '', 0), (u'els', '', 0), (u'ig', '', 0),)
+_t_3 = _make_among_table(_a_3)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_p1 = 0
+        self.i_x = 0
+
+    def r_mark_regions(self, s):
+        r = True
+        self.i_p1 = s.limit
+        r = True
+        if r:
+            var0 = s.cursor                      ##
+            r = s.hop(3)  # hop                  #
+            if r:                                #
+                self.i_x = s.cursor  ##          # test
+                r = True             ## setmark  #
+            s.cursor = var0                      ##
+            if r:
+                for var1 in xrange(s.cursor, s.limit, 1):  ##
+                    if s.chars[var1] in _g_v:              #
+                        s.cursor = var1                    #
+                        r = True                           #
+                        break                              # goto
+                else:                                      #
+                    s.cursor = s.limit                     #
+                    r = False                              ##
+                if r:
+                    for var2 in xrange(s.cursor, s.limit, 1):  ##
+                        if s.chars[var2] not in _g_v:          #
+                            s.cursor = var2 + 1                #
+                            r = True                           #
+                            break                              # gopast
+                    else:                                      #
+                        s.cursor = s.limit                     #
+                        r = False                              ##
+                    if r:
+                        self.i_p1 = s.cursor  ##
+                        r = True              ## setmark
+                        if r:
+                            var3 = s.cursor                ##
+                            r = self.i_p1 < self.i_x  # <  #
+                            if r:                          #
+                                self.i_p1 = self.i_x       #
+                                r = True                   # try
+                            if not r:                      #
+                                r = True                   #
+                                s.cursor = var3            ##
+        return r
+    
+    def r_main_suffix(self, s):
+        r = True
+        var4 = len(s.chars) - s.cursor                          ##
+        var5 = s.limit                                    #
+        r = s.to_mark(self.i_p1)  # tomark                #
+        if r:                                             #
+            s.limit = s.cursor                            #
+            s.cursor = len(s.chars) - var4                      #
+            self.left = s.cursor  ##                      #
+            r = True              ## [                    # setlimit
+            if r:                                         #
+                a_1 = _find_among(s, _t_1)  ##            #
+                r = a_1 is not None         ## substring  #
+                if r:                                     #
+                    self.right = s.cursor  ##             #
+                    r = True               ## ]           #
+            s.limit = var5                                ##
+        if r:
+            if a_1 == 0:                                                        ##
+                r = s.set_range(self.left, self.right, u'')  # delete           #
+            if a_1 == 1:                                                        #
+                if s.cursor == s.limit:                       ##                #
+                    r = False                                 #                 #
+                else:                                         #                 # among
+                    r = s.chars[s.cursor - 1] in _g_s_ending  # grouping check  #
+                if r:                                         #                 #
+                    s.cursor -= 1                             ##                #
+                if r:                                                           #
+                    r = s.set_range(self.left, self.right, u'')  # delete       ##
+        return r
+    
+    def r_consonant_pair(self, s):
+        r = True
+        var7 = len(s.chars) - s.cursor                                                          ##
+        var8 = s.limit                                                                    #
+        r = s.to_mark(self.i_p1)  # tomark                                                #
+        if r:                                                                             #
+            s.limit = s.cursor                                                            #
+            s.cursor = len(s.chars) - var7                                                      #
+            var6 = len(s.chars) - s.cursor                                               ##     #
+            a_2 = _find_among(s, _t_2)  ##                                         #      #
+            r = a_2 is not None         #                                          #      #
+            if r:                       # among                                    #      #
+                if a_2 == 0:            #                                          #      #
+                    r = True            ##                                         #      #
+            if r:                                                                  #      # setlimit
+                s.cursor = len(s.chars) - var6                                           #      #
+                self.left = s.cursor  ##                                           # and  #
+                r = True              ## [                                         #      #
+                if r:                                                              #      #
+                    r = s.hop(1)  # next                                           #      #
+                    if r:                                                          #      #
+                        self.right = s.cursor  ##                                  #      #
+                        r = True               ## ]                                #      #
+                        if r:                                                      #      #
+                            r = s.set_range(self.left, self.right, u'')  # delete  ##     #
+            s.limit = var8                                                                ##
+        return r
+    
+    def r_other_suffix(self, s):
+        r = True
+        var9 = len(s.chars) - s.cursor                                                              ##
+        var10 = s.limit                                                                       #
+        r = s.to_mark(self.i_p1)  # tomark                                                    #
+        if r:                                                                                 #
+            s.limit = s.cursor                                                                #
+            s.cursor = len(s.chars) - var9                                                          #
+            self.left = s.cursor  ##                                                          #
+            r = True              ## [                                                        #
+            if r:                                                                             #
+                a_3 = _find_among(s, _t_3)  ##                                                #
+                r = a_3 is not None         ## substring                                      #
+                if r:                                                                         # setlimit
+                    self.right = s.cursor  ##                                                 #
+                    r = True               ## ]                                               #
+                    if r:                                                                     #
+                        if a_3 == 0:                                                 ##       #
+                            r = s.set_range(self.left, self.right, u'')  # delete    #        #
+                        if a_3 == 1:                                                 #        #
+                            r = s.set_range(self.left, self.right, u'l\xf6s')  # <-  # among  #
+                        if a_3 == 2:                                                 #        #
+                            r = s.set_range(self.left, self.right, u'full')  # <-    ##       #
+            s.limit = var10                                                                   ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        var11 = s.cursor                            ##
+        r = self.r_mark_regions(s)  # routine call  #
+        s.cursor = var11                            # do
+        r = True                                    ##
+        if r:
+            var15 = s.cursor                                          ##
+            var16 = len(s.chars) - s.limit                                  #
+            s.direction *= -1                                         #
+            s.cursor, s.limit = s.limit, s.cursor                     #
+            var12 = len(s.chars) - s.cursor                  ##             #
+            r = self.r_main_suffix(s)  # routine call  #              #
+            s.cursor = len(s.chars) - var12                  # do           #
+            r = True                                   ##             #
+            if r:                                                     #
+                var13 = len(s.chars) - s.cursor                     ##      #
+                r = self.r_consonant_pair(s)  # routine call  #       # backwards
+                s.cursor = len(s.chars) - var13                     # do    #
+                r = True                                      ##      #
+                if r:                                                 #
+                    var14 = len(s.chars) - s.cursor                   ##    #
+                    r = self.r_other_suffix(s)  # routine call  #     #
+                    s.cursor = len(s.chars) - var14                   # do  #
+                    r = True                                    ##    #
+            s.direction *= -1                                         #
+            s.cursor = var15                                          #
+            s.limit = len(s.chars) - var16                                  ##
+        return r
+
+_u_last_0 = frozenset([u'a', u'd', u'e', u'g', u'n', u'r', u's', u't'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0))
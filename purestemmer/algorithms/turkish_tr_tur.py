@@ -0,0 +1,1809 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf-8
+
+
+
+# This file was auto-generated on 2026-10-18 10:54:24 using
+# version 0.1.0-2 of the sbl2py Snowball-to-Python compiler.
+
+import sys
+
+class _String(object):
+
+    __slots__ = ('chars', 'cursor', 'limit', 'direction')
+
+    def __init__(self, s):
+        self.chars = list(unicode(s))
+        self.cursor = 0
+        self.limit = len(self.chars)
+        self.direction = 1
+
+    def __unicode__(self):
+        return u''.join(self.chars)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_range(self, start, stop):
+        if self.direction == 1:
+            return self.chars[start:stop]
+        else:
+            return self.chars[stop:start]
+
+    def set_range(self, start, stop, chars):
+        if self.direction == 1:
+            self.chars[start:stop] = chars
+        else:
+            self.chars[stop:start] = chars
+        change = self.direction * (len(chars) - (stop - start))
+        if self.direction == 1:
+            if self.cursor >= stop:
+                self.cursor += change
+                self.limit += change
+        else:
+            if self.cursor > start:
+                self.cursor += change
+            if self.limit > start:
+                self.limit += change
+        return True
+
+    def insert(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.cursor += len(chars)
+            self.limit += len(chars)
+        return True
+
+    def attach(self, chars):
+        self.chars[self.cursor:self.cursor] = chars
+        if self.direction == 1:
+            self.limit += len(chars)
+        else:
+            self.cursor += len(chars)
+        return True
+
+    def set_chars(self, chars):
+        self.chars = chars
+        if self.direction == 1:
+            self.cursor = 0
+            self.limit = len(chars)
+        else:
+            self.cursor = len(chars)
+            self.limit = 0
+        return True
+
+    def starts_with(self, chars):
+        n = len(chars)
+        if not n:
+            return True
+        if self.direction == 1:
+            start = self.cursor
+            stop = start + n
+            if stop > self.limit:
+                return False
+        else:
+            stop = self.cursor
+            start = stop - n
+            if start < self.limit:
+                return False
+        buf = self.chars
+        if buf[start] != chars[0]:
+            return False
+        if n > 1 and u''.join(buf[start:stop]) != u''.join(chars):
+            return False
+        self.cursor += n * self.direction
+        return True
+
+    def hop(self, n):
+        if n < 0:
+            return False
+        if n and self.direction == 1:
+            if self.cursor + n > self.limit:
+                return False
+        elif n:
+            if self.cursor - n < self.limit:
+                return False
+        self.cursor += n * self.direction
+        return True
+
+    def to_mark(self, mark):
+        if self.direction == 1:
+            if self.cursor > mark or self.limit < mark:
+                return False
+        else:
+            if self.cursor < mark or self.limit > mark:
+                return False
+        self.cursor = mark
+        return True
+
+def _make_among_table(entries):
+    strings = {}
+    for entry in entries:
+        strings.setdefault(entry[0], []).append(entry)
+    lengths = sorted(set(len(s) for s in strings), reverse=True)
+    return strings, lengths, lengths[0]
+
+def _find_among(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[:n])
+                if entries is not None:
+                    s.cursor = cursor + n
+                    return entries[0][2]
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                entries = strings.get(text[size - n:])
+                if entries is not None:
+                    s.cursor = cursor - n
+                    return entries[0][2]
+    return None
+
+def _find_among_all(s, table):
+    strings, lengths, max_length = table
+    cursor = s.cursor
+    matches = []
+    if s.direction == 1:
+        text = u''.join(s.chars[cursor:min(s.limit, cursor + max_length)])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[:n], ()))
+    else:
+        text = u''.join(s.chars[max(s.limit, cursor - max_length):cursor])
+        size = len(text)
+        for n in lengths:
+            if n <= size:
+                matches.extend(strings.get(text[size - n:], ()))
+    return matches
+
+_g_vowel = frozenset(u'ae\u0131io\xf6u\xfc')
+_g_U = frozenset(u'\u0131iu\xfc')
+_g_vowel1 = frozenset(u'a\u0131ou')
+_g_vowel2 = frozenset(u'ei\xf6\xfc')
+_g_vowel3 = frozenset(u'a\u0131')
+_g_vowel4 = frozenset(u'ei')
+_g_vowel5 = frozenset(u'ou')
+_g_vowel6 = frozenset(u'\xf6\xfc')
+
+def stem(s):
+    s = _String(s)
+    _Program().r_stem(s)
+    return unicode(s)
+
+_a_1 = ((u'm\u0131z', '', 0), (u'miz', '', 0), (u'muz', '', 0), (u'm\xfcz', '', 0), (u'n\u0131z', '', 0), (u'niz', '', 0), (u'nuz', '', 0), (u'n\xfcz', '', 0), (u'm', '', 0), (u'n', '', 0),)
+_t_1 = _make_among_table(_a_1)
+_a_2 = ((u'leri', '', 0), (u'lar\u0131', '', 0),)
+_t_2 = _make_among_table(_a_2)
+_a_3 = ((u'n\u0131', '', 0), (u'ni', '', 0), (u'nu', '', 0), (u'n\xfc', '', 0),)
+_t_3 = _make_among_table(_a_3)
+_a_4 = ((u'\u0131n', '', 0), (u'in', '', 0), (u'un', '', 0), (u'\xfcn', '', 0),)
+_t_4 = _make_among_table(_a_4)
+_a_5 = ((u'a', '', 0), (u'e', '', 0),)
+_t_5 = _make_among_table(_a_5)
+_a_6 = ((u'na', '', 0), (u'ne', '', 0),)
+_t_6 = _make_among_table(_a_6)
+_a_7 = ((u'da', '', 0), (u'de', '', 0), (u'ta', '', 0), (u'te', '', 0),)
+_t_7 = _make_among_table(_a_7)
+_a_8 = ((u'nda', '', 0), (u'nde', '', 0),)
+_t_8 = _make_among_table(_a_8)
+_a_9 = ((u'dan', '', 0), (u'den', '', 0), (u'tan', '', 0), (u'ten', '', 0),)
+_t_9 = _make_among_table(_a_9)
+_a_10 = ((u'ndan', '', 0), (u'nden', '', 0),)
+_t_10 = _make_among_table(_a_10)
+_a_11 = ((u'la', '', 0), (u'le', '', 0),)
+_t_11 = _make_among_table(_a_11)
+_a_12 = ((u'ca', '', 0), (u'ce', '', 0),)
+_t_12 = _make_among_table(_a_12)
+_a_13 = ((u'\u0131m', '', 0), (u'im', '', 0), (u'um', '', 0), (u'\xfcm', '', 0),)
+_t_13 = _make_among_table(_a_13)
+_a_14 = ((u's\u0131n', '', 0), (u'sin', '', 0), (u'sun', '', 0), (u's\xfcn', '', 0),)
+_t_14 = _make_among_table(_a_14)
+_a_15 = ((u'\u0131z', '', 0), (u'iz', '', 0), (u'uz', '', 0), (u'\xfcz', '', 0),)
+_t_15 = _make_among_table(_a_15)
+_a_16 = ((u's\u0131n\u0131z', '', 0), (u'siniz', '', 0), (u'sunuz', '', 0), (u's\xfcn\xfcz', '', 0),)
+_t_16 = _make_among_table(_a_16)
+_a_17 = ((u'ler', '', 0), (u'lar', '', 0),)
+_t_17 = _make_among_table(_a_17)
+_a_18 = ((u'n\u0131z', '', 0), (u'niz', '', 0), (u'nuz', '', 0), (u'n\xfcz', '', 0),)
+_t_18 = _make_among_table(_a_18)
+_a_19 = ((u't\u0131r', '', 0), (u'tir', '', 0), (u'tur', '', 0), (u't\xfcr', '', 0), (u'd\u0131r', '', 0), (u'dir', '', 0), (u'dur', '', 0), (u'd\xfcr', '', 0),)
+_t_19 = _make_among_table(_a_19)
+_a_20 = ((u'cas\u0131na', '', 0), (u'cesine', '', 0),)
+_t_20 = _make_among_table(_a_20)
+_a_21 = ((u't\u0131m', '', 0), (u'tim', '', 0), (u'tum', '', 0), (u't\xfcm', '', 0), (u'd\u0131m', '', 0), (u'dim', '', 0), (u'dum', '', 0), (u'd\xfcm', '', 0), (u't\u0131n', '', 0), (u'tin', '', 0), (u'tun', '', 0), (u't\xfcn', '', 0), (u'd\u0131n', '', 0), (u'din', '', 0), (u'dun', '', 0), (u'd\xfcn', '', 0), (u't\u0131k', '', 0), (u'tik', '', 0), (u'tuk', '', 0), (u't\xfck', '', 0), (u'd\u0131k', '', 0), (u'dik', '', 0), (u'duk', '', 0), (u'd\xfck', '', 0), (u't\u0131', '', 0), (u'ti', '', 0), (u'tu', '', 0), (u't\xfc', '', 0), (u'd\u0131', '', 0), (u'di', '', 0), (u'du', '', 0), (u'd\xfc', '', 0),)
+_t_21 = _make_among_table(_a_21)
+_a_22 = ((u'sam', '', 0), (u'san', '', 0), (u'sak', '', 0), (u'sem', '', 0), (u'sen', '', 0), (u'sek', '', 0), (u'sa', '', 0), (u'se', '', 0),)
+_t_22 = _make_among_table(_a_22)
+_a_23 = ((u'm\u0131\u015f', '', 0), (u'mi\u015f', '', 0), (u'mu\u015f', '', 0), (u'm\xfc\u015f', '', 0),)
+_t_23 = _make_among_table(_a_23)
+_a_24 = ((u'b', '', 0), (u'c', '', 1), (u'd', '', 2), (u'\u011f', '', 3),)
+_t_24 = _make_among_table(_a_24)
+
+class _Program(object):
+    def __init__(self):
+        self.left = None
+        self.right = None
+        self.i_strlen = 0
+        self.b_continue_stemming_noun_suffixes = True
+
+    def r_check_vowel_harmony(self, s):
+        r = True
+        var16 = len(s.chars) - s.cursor                                                                                         ##
+        for var0 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                                                            #
+            if s.chars[var0] in _g_vowel:                   #                                                             #
+                s.cursor = var0 + 1                         #                                                             #
+                r = True                                    #                                                             #
+                break                                       # goto                                                        #
+        else:                                               #                                                             #
+            s.cursor = s.limit                              #                                                             #
+            r = False                                       ##                                                            #
+        if r:                                                                                                             #
+            var15 = len(s.chars) - s.cursor                                                                               ##    #
+            var13 = len(s.chars) - s.cursor                                                                         ##    #     #
+            var11 = len(s.chars) - s.cursor                                                                   ##    #     #     #
+            var9 = len(s.chars) - s.cursor                                                              ##    #     #     #     #
+            var7 = len(s.chars) - s.cursor                                                        ##    #     #     #     #     #
+            var5 = len(s.chars) - s.cursor                                                  ##    #     #     #     #     #     #
+            var3 = len(s.chars) - s.cursor                                            ##    #     #     #     #     #     #     #
+            r = s.starts_with(u'a')  # character check                          #     #     #     #     #     #     #     #
+            if r:                                                               #     #     #     #     #     #     #     #
+                for var1 in xrange(s.cursor - 1, s.limit - 1, -1):  ##          #     #     #     #     #     #     #     #
+                    if s.chars[var1] in _g_vowel1:                  #           #     #     #     #     #     #     #     #
+                        s.cursor = var1 + 1                         #           #     #     #     #     #     #     #     #
+                        r = True                                    #           #     #     #     #     #     #     #     #
+                        break                                       # goto      #     #     #     #     #     #     #     #
+                else:                                               #           #     #     #     #     #     #     #     #
+                    s.cursor = s.limit                              #           #     #     #     #     #     #     #     #
+                    r = False                                       ##          #     #     #     #     #     #     #     #
+            if not r:                                                           # or  #     #     #     #     #     #     #
+                s.cursor = len(s.chars) - var3                                        #     #     #     #     #     #     #     #
+                r = s.starts_with(u'e')  # character check                      #     #     #     #     #     #     #     #
+                if r:                                                           #     #     #     #     #     #     #     #
+                    for var2 in xrange(s.cursor - 1, s.limit - 1, -1):  ##      #     #     #     #     #     #     #     #
+                        if s.chars[var2] in _g_vowel2:                  #       #     #     #     #     #     #     #     #
+                            s.cursor = var2 + 1                         #       #     # or  #     #     #     #     #     #
+                            r = True                                    #       #     #     #     #     #     #     #     #
+                            break                                       # goto  #     #     #     #     #     #     #     #
+                    else:                                               #       #     #     #     #     #     #     #     #
+                        s.cursor = s.limit                              #       #     #     #     #     #     #     #     #
+                        r = False                                       ##      ##    #     # or  #     #     #     #     #
+            if not r:                                                                 #     #     #     #     #     #     #
+                s.cursor = len(s.chars) - var5                                              #     #     #     #     #     #     #
+                r = s.starts_with(u'\u0131')  # character check                       #     #     #     #     #     #     #
+                if r:                                                                 #     #     #     #     #     #     #
+                    for var4 in xrange(s.cursor - 1, s.limit - 1, -1):  ##            #     #     #     #     #     #     #
+                        if s.chars[var4] in _g_vowel3:                  #             #     #     # or  #     #     #     #
+                            s.cursor = var4 + 1                         #             #     #     #     #     #     #     #
+                            r = True                                    #             #     #     #     #     #     #     #
+                            break                                       # goto        #     #     #     #     #     #     #
+                    else:                                               #             #     #     #     #     #     #     #
+                        s.cursor = s.limit                              #             #     #     #     # or  #     #     #
+                        r = False                                       ##            ##    #     #     #     #     #     #
+            if not r:                                                                       #     #     #     #     #     #
+                s.cursor = len(s.chars) - var7                                                    #     #     #     #     #     #
+                r = s.starts_with(u'i')  # character check                                  #     #     #     #     #     #
+                if r:                                                                       #     #     #     #     #     #
+                    for var6 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                  #     #     #     # or  #     #
+                        if s.chars[var6] in _g_vowel4:                  #                   #     #     #     #     #     # test
+                            s.cursor = var6 + 1                         #                   #     #     #     #     #     #
+                            r = True                                    #                   #     #     #     #     #     #
+                            break                                       # goto              #     #     #     #     #     #
+                    else:                                               #                   #     #     #     #     # or  #
+                        s.cursor = s.limit                              #                   #     #     #     #     #     #
+                        r = False                                       ##                  ##    #     #     #     #     #
+            if not r:                                                                             #     #     #     #     #
+                s.cursor = len(s.chars) - var9                                                          #     #     #     #     #
+                r = s.starts_with(u'o')  # character check                                        #     #     #     #     #
+                if r:                                                                             #     #     #     #     #
+                    for var8 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                        #     #     #     #     #
+                        if s.chars[var8] in _g_vowel5:                  #                         #     #     #     #     #
+                            s.cursor = var8 + 1                         #                         #     #     #     #     #
+                            r = True                                    #                         #     #     #     #     #
+                            break                                       # goto                    #     #     #     #     #
+                    else:                                               #                         #     #     #     #     #
+                        s.cursor = s.limit                              #                         #     #     #     #     #
+                        r = False                                       ##                        ##    #     #     #     #
+            if not r:                                                                                   #     #     #     #
+                s.cursor = len(s.chars) - var11                                                               #     #     #     #
+                r = s.starts_with(u'\xf6')  # character check                                           #     #     #     #
+                if r:                                                                                   #     #     #     #
+                    for var10 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                             #     #     #     #
+                        if s.chars[var10] in _g_vowel6:                  #                              #     #     #     #
+                            s.cursor = var10 + 1                         #                              #     #     #     #
+                            r = True                                     #                              #     #     #     #
+                            break                                        # goto                         #     #     #     #
+                    else:                                                #                              #     #     #     #
+                        s.cursor = s.limit                               #                              #     #     #     #
+                        r = False                                        ##                             ##    #     #     #
+            if not r:                                                                                         #     #     #
+                s.cursor = len(s.chars) - var13                                                                     #     #     #
+                r = s.starts_with(u'u')  # character check                                                    #     #     #
+                if r:                                                                                         #     #     #
+                    for var12 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                                   #     #     #
+                        if s.chars[var12] in _g_vowel5:                  #                                    #     #     #
+                            s.cursor = var12 + 1                         #                                    #     #     #
+                            r = True                                     #                                    #     #     #
+                            break                                        # goto                               #     #     #
+                    else:                                                #                                    #     #     #
+                        s.cursor = s.limit                               #                                    #     #     #
+                        r = False                                        ##                                   ##    #     #
+            if not r:                                                                                               #     #
+                s.cursor = len(s.chars) - var15                                                                           #     #
+                r = s.starts_with(u'\xfc')  # character check                                                       #     #
+                if r:                                                                                               #     #
+                    for var14 in xrange(s.cursor - 1, s.limit - 1, -1):  ##                                         #     #
+                        if s.chars[var14] in _g_vowel6:                  #                                          #     #
+                            s.cursor = var14 + 1                         #                                          #     #
+                            r = True                                     #                                          #     #
+                            break                                        # goto                                     #     #
+                    else:                                                #                                          #     #
+                        s.cursor = s.limit                               #                                          #     #
+                        r = False                                        ##                                         ##    #
+        s.cursor = len(s.chars) - var16                                                                                         ##
+        return r
+    
+    def r_mark_suffix_with_optional_n_consonant(self, s):
+        r = True
+        var23 = len(s.chars) - s.cursor                                                                ##
+        var17 = len(s.chars) - s.cursor                   ##                                           #
+        r = s.starts_with(u'n')  # character check  # test                                       #
+        s.cursor = len(s.chars) - var17                   ##                                           #
+        if r:                                                                                    #
+            r = s.hop(1)  # next                                                                 #
+            if r:                                                                                #
+                var18 = len(s.chars) - s.cursor                                    ##                  #
+                if s.cursor == s.limit:                    ##                #                   #
+                    r = False                              #                 #                   #
+                else:                                      #                 #                   #
+                    r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test              #
+                if r:                                      #                 #                   #
+                    s.cursor -= 1                          ##                #                   #
+                s.cursor = len(s.chars) - var18                                    ##                  #
+        if not r:                                                                                #
+            s.cursor = len(s.chars) - var23                                                            #
+            var20 = len(s.chars) - s.cursor                           ##                               #
+            var19 = len(s.chars) - s.cursor                   ##      #                                # or
+            r = s.starts_with(u'n')  # character check  # test  #                                #
+            s.cursor = len(s.chars) - var19                   ##      # not                            #
+            if not r:                                           #                                #
+                s.cursor = len(s.chars) - var20                       #                                #
+            r = not r                                           ##                               #
+            if r:                                                                                #
+                var22 = len(s.chars) - s.cursor                                                ##      #
+                r = s.hop(1)  # next                                                     #       #
+                if r:                                                                    #       #
+                    var21 = len(s.chars) - s.cursor                                    ##      #       #
+                    if s.cursor == s.limit:                    ##                #       #       #
+                        r = False                              #                 #       #       #
+                    else:                                      #                 #       # test  #
+                        r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test  #       #
+                    if r:                                      #                 #       #       #
+                        s.cursor -= 1                          ##                #       #       #
+                    s.cursor = len(s.chars) - var21                                    ##      #       #
+                s.cursor = len(s.chars) - var22                                                ##      ##
+        return r
+    
+    def r_mark_suffix_with_optional_s_consonant(self, s):
+        r = True
+        var30 = len(s.chars) - s.cursor                                                                ##
+        var24 = len(s.chars) - s.cursor                   ##                                           #
+        r = s.starts_with(u's')  # character check  # test                                       #
+        s.cursor = len(s.chars) - var24                   ##                                           #
+        if r:                                                                                    #
+            r = s.hop(1)  # next                                                                 #
+            if r:                                                                                #
+                var25 = len(s.chars) - s.cursor                                    ##                  #
+                if s.cursor == s.limit:                    ##                #                   #
+                    r = False                              #                 #                   #
+                else:                                      #                 #                   #
+                    r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test              #
+                if r:                                      #                 #                   #
+                    s.cursor -= 1                          ##                #                   #
+                s.cursor = len(s.chars) - var25                                    ##                  #
+        if not r:                                                                                #
+            s.cursor = len(s.chars) - var30                                                            #
+            var27 = len(s.chars) - s.cursor                           ##                               #
+            var26 = len(s.chars) - s.cursor                   ##      #                                # or
+            r = s.starts_with(u's')  # character check  # test  #                                #
+            s.cursor = len(s.chars) - var26                   ##      # not                            #
+            if not r:                                           #                                #
+                s.cursor = len(s.chars) - var27                       #                                #
+            r = not r                                           ##                               #
+            if r:                                                                                #
+                var29 = len(s.chars) - s.cursor                                                ##      #
+                r = s.hop(1)  # next                                                     #       #
+                if r:                                                                    #       #
+                    var28 = len(s.chars) - s.cursor                                    ##      #       #
+                    if s.cursor == s.limit:                    ##                #       #       #
+                        r = False                              #                 #       #       #
+                    else:                                      #                 #       # test  #
+                        r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test  #       #
+                    if r:                                      #                 #       #       #
+                        s.cursor -= 1                          ##                #       #       #
+                    s.cursor = len(s.chars) - var28                                    ##      #       #
+                s.cursor = len(s.chars) - var29                                                ##      ##
+        return r
+    
+    def r_mark_suffix_with_optional_y_consonant(self, s):
+        r = True
+        var37 = len(s.chars) - s.cursor                                                                ##
+        var31 = len(s.chars) - s.cursor                   ##                                           #
+        r = s.starts_with(u'y')  # character check  # test                                       #
+        s.cursor = len(s.chars) - var31                   ##                                           #
+        if r:                                                                                    #
+            r = s.hop(1)  # next                                                                 #
+            if r:                                                                                #
+                var32 = len(s.chars) - s.cursor                                    ##                  #
+                if s.cursor == s.limit:                    ##                #                   #
+                    r = False                              #                 #                   #
+                else:                                      #                 #                   #
+                    r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test              #
+                if r:                                      #                 #                   #
+                    s.cursor -= 1                          ##                #                   #
+                s.cursor = len(s.chars) - var32                                    ##                  #
+        if not r:                                                                                #
+            s.cursor = len(s.chars) - var37                                                            #
+            var34 = len(s.chars) - s.cursor                           ##                               #
+            var33 = len(s.chars) - s.cursor                   ##      #                                # or
+            r = s.starts_with(u'y')  # character check  # test  #                                #
+            s.cursor = len(s.chars) - var33                   ##      # not                            #
+            if not r:                                           #                                #
+                s.cursor = len(s.chars) - var34                       #                                #
+            r = not r                                           ##                               #
+            if r:                                                                                #
+                var36 = len(s.chars) - s.cursor                                                ##      #
+                r = s.hop(1)  # next                                                     #       #
+                if r:                                                                    #       #
+                    var35 = len(s.chars) - s.cursor                                    ##      #       #
+                    if s.cursor == s.limit:                    ##                #       #       #
+                        r = False                              #                 #       #       #
+                    else:                                      #                 #       # test  #
+                        r = s.chars[s.cursor - 1] in _g_vowel  # grouping check  # test  #       #
+                    if r:                                      #                 #       #       #
+                        s.cursor -= 1                          ##                #       #       #
+                    s.cursor = len(s.chars) - var35                                    ##      #       #
+                s.cursor = len(s.chars) - var36                                                ##      ##
+        return r
+    
+    def r_mark_suffix_with_optional_U_vowel(self, s):
+        r = True
+        var44 = len(s.chars) - s.cursor                                                                             ##
+        var38 = len(s.chars) - s.cursor                                ##                                           #
+        if s.cursor == s.limit:                ##                #                                            #
+            r = False                          #                 #                                            #
+        else:                                  #                 #                                            #
+            r = s.chars[s.cursor - 1] in _g_U  # grouping check  # test                                       #
+        if r:                                  #                 #                                            #
+            s.cursor -= 1                      ##                #                                            #
+        s.cursor = len(s.chars) - var38                                ##                                           #
+        if r:                                                                                                 #
+            r = s.hop(1)  # next                                                                              #
+            if r:                                                                                             #
+                var39 = len(s.chars) - s.cursor                                                 ##                  #
+                if s.cursor == s.limit:                        ##                         #                   #
+                    r = False                                  #                          #                   #
+                else:                                          #                          #                   #
+                    r = s.chars[s.cursor - 1] not in _g_vowel  # negative grouping check  # test              #
+                if r:                                          #                          #                   #
+                    s.cursor -= 1                              ##                         #                   #
+                s.cursor = len(s.chars) - var39                                                 ##                  #
+        if not r:                                                                                             #
+            s.cursor = len(s.chars) - var44                                                                         #
+            var41 = len(s.chars) - s.cursor                                        ##                               #
+            var40 = len(s.chars) - s.cursor                                ##      #                                # or
+            if s.cursor == s.limit:                ##                #       #                                #
+                r = False                          #                 #       #                                #
+            else:                                  #                 #       #                                #
+                r = s.chars[s.cursor - 1] in _g_U  # grouping check  # test  #                                #
+            if r:                                  #                 #       # not                            #
+                s.cursor -= 1                      ##                #       #                                #
+            s.cursor = len(s.chars) - var40                                ##      #                                #
+            if not r:                                                        #                                #
+                s.cursor = len(s.chars) - var41                                    #                                #
+            r = not r                                                        ##                               #
+            if r:                                                                                             #
+                var43 = len(s.chars) - s.cursor                                                             ##      #
+                r = s.hop(1)  # next                                                                  #       #
+                if r:                                                                                 #       #
+                    var42 = len(s.chars) - s.cursor                                                 ##      #       #
+                    if s.cursor == s.limit:                        ##                         #       #       #
+                        r = False                                  #                          #       #       #
+                    else:                                          #                          #       # test  #
+                        r = s.chars[s.cursor - 1] not in _g_vowel  # negative grouping check  # test  #       #
+                    if r:                                          #                          #       #       #
+                        s.cursor -= 1                              ##                         #       #       #
+                    s.cursor = len(s.chars) - var42                                                 ##      #       #
+                s.cursor = len(s.chars) - var43                                                             ##      ##
+        return r
+    
+    def r_mark_possessives(self, s):
+        r = True
+        a_1 = _find_among(s, _t_1)  ##
+        r = a_1 is not None         #
+        if r:                       # among
+            if a_1 == 0:            #
+                r = True            ##
+        if r:
+            r = self.r_mark_suffix_with_optional_U_vowel(s)  # routine call
+        return r
+    
+    def r_mark_sU(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            if s.cursor == s.limit:                ##
+                r = False                          #
+            else:                                  #
+                r = s.chars[s.cursor - 1] in _g_U  # grouping check
+            if r:                                  #
+                s.cursor -= 1                      ##
+            if r:
+                r = self.r_mark_suffix_with_optional_s_consonant(s)  # routine call
+        return r
+    
+    def r_mark_lArI(self, s):
+        r = True
+        a_2 = _find_among(s, _t_2)  ##
+        r = a_2 is not None         #
+        if r:                       # among
+            if a_2 == 0:            #
+                r = True            ##
+        return r
+    
+    def r_mark_yU(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            if s.cursor == s.limit:                ##
+                r = False                          #
+            else:                                  #
+                r = s.chars[s.cursor - 1] in _g_U  # grouping check
+            if r:                                  #
+                s.cursor -= 1                      ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_nU(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_3 = _find_among(s, _t_3)  ##
+            r = a_3 is not None         #
+            if r:                       # among
+                if a_3 == 0:            #
+                    r = True            ##
+        return r
+    
+    def r_mark_nUn(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_4 = _find_among(s, _t_4)  ##
+            r = a_4 is not None         #
+            if r:                       # among
+                if a_4 == 0:            #
+                    r = True            ##
+            if r:
+                r = self.r_mark_suffix_with_optional_n_consonant(s)  # routine call
+        return r
+    
+    def r_mark_yA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_5 = _find_among(s, _t_5)  ##
+            r = a_5 is not None         #
+            if r:                       # among
+                if a_5 == 0:            #
+                    r = True            ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_nA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_6 = _find_among(s, _t_6)  ##
+            r = a_6 is not None         #
+            if r:                       # among
+                if a_6 == 0:            #
+                    r = True            ##
+        return r
+    
+    def r_mark_DA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_7 = _find_among(s, _t_7)  ##
+            r = a_7 is not None         #
+            if r:                       # among
+                if a_7 == 0:            #
+                    r = True            ##
+        return r
+    
+    def r_mark_ndA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_8 = _find_among(s, _t_8)  ##
+            r = a_8 is not None         #
+            if r:                       # among
+                if a_8 == 0:            #
+                    r = True            ##
+        return r
+    
+    def r_mark_DAn(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_9 = _find_among(s, _t_9)  ##
+            r = a_9 is not None         #
+            if r:                       # among
+                if a_9 == 0:            #
+                    r = True            ##
+        return r
+    
+    def r_mark_ndAn(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_10 = _find_among(s, _t_10)  ##
+            r = a_10 is not None          #
+            if r:                         # among
+                if a_10 == 0:             #
+                    r = True              ##
+        return r
+    
+    def r_mark_ylA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_11 = _find_among(s, _t_11)  ##
+            r = a_11 is not None          #
+            if r:                         # among
+                if a_11 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_ki(self, s):
+        r = True
+        r = s.starts_with(u'ki')  # character check
+        return r
+    
+    def r_mark_ncA(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_12 = _find_among(s, _t_12)  ##
+            r = a_12 is not None          #
+            if r:                         # among
+                if a_12 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_n_consonant(s)  # routine call
+        return r
+    
+    def r_mark_yUm(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_13 = _find_among(s, _t_13)  ##
+            r = a_13 is not None          #
+            if r:                         # among
+                if a_13 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_sUn(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_14 = _find_among(s, _t_14)  ##
+            r = a_14 is not None          #
+            if r:                         # among
+                if a_14 == 0:             #
+                    r = True              ##
+        return r
+    
+    def r_mark_yUz(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_15 = _find_among(s, _t_15)  ##
+            r = a_15 is not None          #
+            if r:                         # among
+                if a_15 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_sUnUz(self, s):
+        r = True
+        a_16 = _find_among(s, _t_16)  ##
+        r = a_16 is not None          #
+        if r:                         # among
+            if a_16 == 0:             #
+                r = True              ##
+        return r
+    
+    def r_mark_lAr(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_17 = _find_among(s, _t_17)  ##
+            r = a_17 is not None          #
+            if r:                         # among
+                if a_17 == 0:             #
+                    r = True              ##
+        return r
+    
+    def r_mark_nUz(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_18 = _find_among(s, _t_18)  ##
+            r = a_18 is not None          #
+            if r:                         # among
+                if a_18 == 0:             #
+                    r = True              ##
+        return r
+    
+    def r_mark_DUr(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_19 = _find_among(s, _t_19)  ##
+            r = a_19 is not None          #
+            if r:                         # among
+                if a_19 == 0:             #
+                    r = True              ##
+        return r
+    
+    def r_mark_cAsInA(self, s):
+        r = True
+        a_20 = _find_among(s, _t_20)  ##
+        r = a_20 is not None          #
+        if r:                         # among
+            if a_20 == 0:             #
+                r = True              ##
+        return r
+    
+    def r_mark_yDU(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_21 = _find_among(s, _t_21)  ##
+            r = a_21 is not None          #
+            if r:                         # among
+                if a_21 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_ysA(self, s):
+        r = True
+        a_22 = _find_among(s, _t_22)  ##
+        r = a_22 is not None          #
+        if r:                         # among
+            if a_22 == 0:             #
+                r = True              ##
+        if r:
+            r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_ymUs_(self, s):
+        r = True
+        r = self.r_check_vowel_harmony(s)  # routine call
+        if r:
+            a_23 = _find_among(s, _t_23)  ##
+            r = a_23 is not None          #
+            if r:                         # among
+                if a_23 == 0:             #
+                    r = True              ##
+            if r:
+                r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_mark_yken(self, s):
+        r = True
+        r = s.starts_with(u'ken')  # character check
+        if r:
+            r = self.r_mark_suffix_with_optional_y_consonant(s)  # routine call
+        return r
+    
+    def r_stem_nominal_verb_suffixes(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            self.b_continue_stemming_noun_suffixes = True  ##
+            r = True                                       ## set
+            if r:
+                var72 = len(s.chars) - s.cursor                                                                                  ##
+                var65 = len(s.chars) - s.cursor                                                                            ##    #
+                var60 = len(s.chars) - s.cursor                                                                      ##    #     #
+                var58 = len(s.chars) - s.cursor                                                                ##    #     #     #
+                var53 = len(s.chars) - s.cursor                                                         ##     #     #     #     #
+                var47 = len(s.chars) - s.cursor                               ##                        #      #     #     #     #
+                var46 = len(s.chars) - s.cursor                         ##    #                         #      #     #     #     #
+                var45 = len(s.chars) - s.cursor                   ##    #     #                         #      #     #     #     #
+                r = self.r_mark_ymUs_(s)  # routine call    #     #     #                         #      #     #     #     #
+                if not r:                                   # or  #     #                         #      #     #     #     #
+                    s.cursor = len(s.chars) - var45               #     # or  #                         #      #     #     #     #
+                    r = self.r_mark_yDU(s)  # routine call  ##    #     # or                      #      #     #     #     #
+                if not r:                                         #     #                         #      #     #     #     #
+                    s.cursor = len(s.chars) - var46                     #     #                         #      #     #     #     #
+                    r = self.r_mark_ysA(s)  # routine call        ##    #                         #      #     #     #     #
+                if not r:                                               #                         #      #     #     #     #
+                    s.cursor = len(s.chars) - var47                           #                         #      #     #     #     #
+                    r = self.r_mark_yken(s)  # routine call             ##                        #      #     #     #     #
+                if not r:                                                                         #      #     #     #     #
+                    s.cursor = len(s.chars) - var53                                                     #      #     #     #     #
+                    r = self.r_mark_cAsInA(s)  # routine call                                     #      #     #     #     #
+                    if r:                                                                         #      #     #     #     #
+                        var52 = len(s.chars) - s.cursor                                           ##    #      #     #     #     #
+                        var51 = len(s.chars) - s.cursor                                     ##    #     #      #     #     #     #
+                        var50 = len(s.chars) - s.cursor                               ##    #     #     # or   #     #     #     #
+                        var49 = len(s.chars) - s.cursor                         ##    #     #     #     #      #     #     #     #
+                        var48 = len(s.chars) - s.cursor                   ##    #     #     #     #     #      #     #     #     #
+                        r = self.r_mark_sUnUz(s)  # routine call    #     #     #     #     #     #      #     #     #     #
+                        if not r:                                   # or  #     #     #     #     #      #     #     #     #
+                            s.cursor = len(s.chars) - var48               #     # or  #     #     #     #      #     #     #     #
+                            r = self.r_mark_lAr(s)  # routine call  ##    #     # or  #     #     #      #     #     #     #
+                        if not r:                                         #     #     # or  #     #      #     #     #     #
+                            s.cursor = len(s.chars) - var49                     #     #     #     # or  #      #     #     #     #
+                            r = self.r_mark_yUm(s)  # routine call        ##    #     #     #     #      #     #     #     #
+                        if not r:                                               #     #     #     #      #     #     #     #
+                            s.cursor = len(s.chars) - var50                           #     #     #     #      #     #     #     #
+                            r = self.r_mark_sUn(s)  # routine call              ##    #     #     #      #     #     #     #
+                        if not r:                                                     #     #     #      #     #     #     #
+                            s.cursor = len(s.chars) - var51                                 #     #     #      #     #     #     #
+                            r = self.r_mark_yUz(s)  # routine call                    ##    #     #      #     #     #     #
+                        if not r:                                                           #     #      # or  #     #     #
+                            s.cursor = len(s.chars) - var52                                       #     #      #     #     #     #
+                            r = True  # true                                                ##    #      #     #     #     #
+                        if r:                                                                     #      #     #     #     #
+                            r = self.r_mark_ymUs_(s)  # routine call                              ##     #     # or  #     #
+                if not r:                                                                                #     #     #     #
+                    s.cursor = len(s.chars) - var58                                                            #     #     #     #
+                    r = self.r_mark_lAr(s)  # routine call                                               #     #     #     #
+                    if r:                                                                                #     #     #     #
+                        self.right = s.cursor  ##                                                        #     #     #     #
+                        r = True               ## ]                                                      #     #     #     #
+                        if r:                                                                            #     #     #     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                        #     #     #     #
+                            if r:                                                                        #     #     #     #
+                                var57 = len(s.chars) - s.cursor                                         ##     #     #     #     #
+                                self.left = s.cursor  ##                                          #      #     #     #     #
+                                r = True              ## [                                        #      #     #     #     #
+                                if r:                                                             #      #     #     #     #
+                                    var56 = len(s.chars) - s.cursor                               ##    #      #     #     # or  #
+                                    var55 = len(s.chars) - s.cursor                         ##    #     #      #     #     #     #
+                                    var54 = len(s.chars) - s.cursor                   ##    #     #     #      #     #     #     #
+                                    r = self.r_mark_DUr(s)  # routine call      #     #     #     #      #     #     #     #
+                                    if not r:                                   # or  #     #     #      #     #     #     #
+                                        s.cursor = len(s.chars) - var54               #     # or  #     #      #     #     #     #
+                                        r = self.r_mark_yDU(s)  # routine call  ##    #     # or  # try  #     #     #     #
+                                    if not r:                                         #     #     #      #     #     #     #
+                                        s.cursor = len(s.chars) - var55                     #     #     #      #     #     #     #
+                                        r = self.r_mark_ysA(s)  # routine call        ##    #     #      #     #     #     #
+                                    if not r:                                               #     #      #     #     #     #
+                                        s.cursor = len(s.chars) - var56                           #     #      #     #     #     #
+                                        r = self.r_mark_ymUs_(s)  # routine call            ##    #      #     #     #     #
+                                if not r:                                                         #      #     #     #     #
+                                    r = True                                                      #      #     #     #     #
+                                    s.cursor = len(s.chars) - var57                                     ##     #     #     #     #
+                                if r:                                                                    #     #     #     #
+                                    self.b_continue_stemming_noun_suffixes = False  ##                   #     #     #     #
+                                    r = True                                        ## unset             ##    #     #     #
+                if not r:                                                                                      #     #     # or
+                    s.cursor = len(s.chars) - var60                                                                  #     #     #
+                    r = self.r_mark_nUz(s)  # routine call                                                     #     #     #
+                    if r:                                                                                      #     #     #
+                        var59 = len(s.chars) - s.cursor                   ##                                         #     #     #
+                        r = self.r_mark_yDU(s)  # routine call      #                                          #     #     #
+                        if not r:                                   # or                                       #     #     #
+                            s.cursor = len(s.chars) - var59               #                                          #     #     #
+                            r = self.r_mark_ysA(s)  # routine call  ##                                         ##    #     #
+                if not r:                                                                                            #     #
+                    s.cursor = len(s.chars) - var65                                                                        #     #
+                    var63 = len(s.chars) - s.cursor                               ##                                       #     #
+                    var62 = len(s.chars) - s.cursor                         ##    #                                        #     #
+                    var61 = len(s.chars) - s.cursor                   ##    #     #                                        #     #
+                    r = self.r_mark_sUnUz(s)  # routine call    #     #     #                                        #     #
+                    if not r:                                   # or  #     #                                        #     #
+                        s.cursor = len(s.chars) - var61               #     # or  #                                        #     #
+                        r = self.r_mark_yUz(s)  # routine call  ##    #     # or                                     #     #
+                    if not r:                                         #     #                                        #     #
+                        s.cursor = len(s.chars) - var62                     #     #                                        #     #
+                        r = self.r_mark_sUn(s)  # routine call        ##    #                                        #     #
+                    if not r:                                               #                                        #     #
+                        s.cursor = len(s.chars) - var63                           #                                        #     #
+                        r = self.r_mark_yUm(s)  # routine call              ##                                       #     #
+                    if r:                                                                                            #     #
+                        self.right = s.cursor  ##                                                                    #     #
+                        r = True               ## ]                                                                  #     #
+                        if r:                                                                                        #     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                    #     #
+                            if r:                                                                                    #     #
+                                var64 = len(s.chars) - s.cursor                     ##                                     #     #
+                                self.left = s.cursor  ##                      #                                      #     #
+                                r = True              ## [                    #                                      #     #
+                                if r:                                         #                                      #     #
+                                    r = self.r_mark_ymUs_(s)  # routine call  # try                                  #     #
+                                if not r:                                     #                                      #     #
+                                    r = True                                  #                                      #     #
+                                    s.cursor = len(s.chars) - var64                 ##                                     ##    #
+                if not r:                                                                                                  #
+                    s.cursor = len(s.chars) - var72                                                                              #
+                    r = self.r_mark_DUr(s)  # routine call                                                                 #
+                    if r:                                                                                                  #
+                        self.right = s.cursor  ##                                                                          #
+                        r = True               ## ]                                                                        #
+                        if r:                                                                                              #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                          #
+                            if r:                                                                                          #
+                                var71 = len(s.chars) - s.cursor                                                     ##           #
+                                self.left = s.cursor  ##                                                      #            #
+                                r = True              ## [                                                    #            #
+                                if r:                                                                         #            #
+                                    var70 = len(s.chars) - s.cursor                                           ##    #            #
+                                    var69 = len(s.chars) - s.cursor                                     ##    #     #            #
+                                    var68 = len(s.chars) - s.cursor                               ##    #     #     #            #
+                                    var67 = len(s.chars) - s.cursor                         ##    #     #     #     #            #
+                                    var66 = len(s.chars) - s.cursor                   ##    #     #     #     #     #            #
+                                    r = self.r_mark_sUnUz(s)  # routine call    #     #     #     #     #     #            #
+                                    if not r:                                   # or  #     #     #     #     #            #
+                                        s.cursor = len(s.chars) - var66               #     # or  #     #     #     #            #
+                                        r = self.r_mark_lAr(s)  # routine call  ##    #     # or  #     #     #            #
+                                    if not r:                                         #     #     # or  #     #            #
+                                        s.cursor = len(s.chars) - var67                     #     #     #     # or  #            #
+                                        r = self.r_mark_yUm(s)  # routine call        ##    #     #     #     # try        #
+                                    if not r:                                               #     #     #     #            #
+                                        s.cursor = len(s.chars) - var68                           #     #     #     #            #
+                                        r = self.r_mark_sUn(s)  # routine call              ##    #     #     #            #
+                                    if not r:                                                     #     #     #            #
+                                        s.cursor = len(s.chars) - var69                                 #     #     #            #
+                                        r = self.r_mark_yUz(s)  # routine call                    ##    #     #            #
+                                    if not r:                                                           #     #            #
+                                        s.cursor = len(s.chars) - var70                                       #     #            #
+                                        r = True  # true                                                ##    #            #
+                                    if r:                                                                     #            #
+                                        r = self.r_mark_ymUs_(s)  # routine call                              #            #
+                                if not r:                                                                     #            #
+                                    r = True                                                                  #            #
+                                    s.cursor = len(s.chars) - var71                                                 ##           ##
+                if r:
+                    self.right = s.cursor  ##
+                    r = True               ## ]
+                    if r:
+                        r = s.set_range(self.left, self.right, u'')  # delete
+        return r
+    
+    def r_stem_suffix_chain_before_ki(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            r = self.r_mark_ki(s)  # routine call
+            if r:
+                var86 = len(s.chars) - s.cursor                                                                                                                          ##
+                var82 = len(s.chars) - s.cursor                                                                                                                    ##    #
+                r = self.r_mark_DA(s)  # routine call                                                                                                        #     #
+                if r:                                                                                                                                        #     #
+                    self.right = s.cursor  ##                                                                                                                #     #
+                    r = True               ## ]                                                                                                              #     #
+                    if r:                                                                                                                                    #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                #     #
+                        if r:                                                                                                                                #     #
+                            var76 = len(s.chars) - s.cursor                                                                                   ##                   #     #
+                            self.left = s.cursor  ##                                                                                    #                    #     #
+                            r = True              ## [                                                                                  #                    #     #
+                            if r:                                                                                                       #                    #     #
+                                var75 = len(s.chars) - s.cursor                                                                         ##    #                    #     #
+                                r = self.r_mark_lAr(s)  # routine call                                                            #     #                    #     #
+                                if r:                                                                                             #     #                    #     #
+                                    self.right = s.cursor  ##                                                                     #     #                    #     #
+                                    r = True               ## ]                                                                   #     #                    #     #
+                                    if r:                                                                                         #     #                    #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                     #     #                    #     #
+                                        if r:                                                                                     #     #                    #     #
+                                            var73 = len(s.chars) - s.cursor                                  ##                         #     #                    #     #
+                                            r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #                          #     #                    #     #
+                                            if not r:                                                  # try                      #     #                    #     #
+                                                r = True                                               #                          #     #                    #     #
+                                                s.cursor = len(s.chars) - var73                              ##                         #     #                    #     #
+                                if not r:                                                                                         #     #                    #     #
+                                    s.cursor = len(s.chars) - var75                                                                     #     #                    #     #
+                                    r = self.r_mark_possessives(s)  # routine call                                                #     #                    #     #
+                                    if r:                                                                                         #     #                    #     #
+                                        self.right = s.cursor  ##                                                                 #     #                    #     #
+                                        r = True               ## ]                                                               # or  # try                #     #
+                                        if r:                                                                                     #     #                    #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                                 #     #                    #     #
+                                            if r:                                                                                 #     #                    #     #
+                                                var74 = len(s.chars) - s.cursor                                                  ##     #     #                    #     #
+                                                self.left = s.cursor  ##                                                   #      #     #                    #     #
+                                                r = True              ## [                                                 #      #     #                    #     #
+                                                if r:                                                                      #      #     #                    #     #
+                                                    r = self.r_mark_lAr(s)  # routine call                                 #      #     #                    #     #
+                                                    if r:                                                                  #      #     #                    #     #
+                                                        self.right = s.cursor  ##                                          #      #     #                    #     #
+                                                        r = True               ## ]                                        # try  #     #                    #     #
+                                                        if r:                                                              #      #     #                    #     #
+                                                            r = s.set_range(self.left, self.right, u'')  # delete          #      #     #                    #     #
+                                                            if r:                                                          #      #     #                    #     #
+                                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #                    #     #
+                                                if not r:                                                                  #      #     #                    #     #
+                                                    r = True                                                               #      #     #                    #     #
+                                                    s.cursor = len(s.chars) - var74                                              ##     ##    #                    #     #
+                            if not r:                                                                                                   #                    #     #
+                                r = True                                                                                                #                    #     #
+                                s.cursor = len(s.chars) - var76                                                                               ##                   #     #
+                if not r:                                                                                                                                    #     #
+                    s.cursor = len(s.chars) - var82                                                                                                                #     #
+                    r = self.r_mark_nUn(s)  # routine call                                                                                                   #     #
+                    if r:                                                                                                                                    # or  #
+                        self.right = s.cursor  ##                                                                                                            #     #
+                        r = True               ## ]                                                                                                          #     #
+                        if r:                                                                                                                                #     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                                                            #     #
+                            if r:                                                                                                                            #     #
+                                var81 = len(s.chars) - s.cursor                                                                                             ##     #     #
+                                self.left = s.cursor  ##                                                                                              #      #     #
+                                r = True              ## [                                                                                            #      #     #
+                                if r:                                                                                                                 #      #     #
+                                    var80 = len(s.chars) - s.cursor                                                                                   ##    #      #     #
+                                    var79 = len(s.chars) - s.cursor                                                                             ##    #     #      #     #
+                                    r = self.r_mark_lArI(s)  # routine call                                                               #     #     #      #     #
+                                    if r:                                                                                                 #     #     #      #     #
+                                        self.right = s.cursor  ##                                                                         #     #     #      #     #
+                                        r = True               ## ]                                                                       #     #     #      #     #
+                                        if r:                                                                                             #     #     #      #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                                         #     #     #      #     #
+                                    if not r:                                                                                             #     #     #      #     #
+                                        s.cursor = len(s.chars) - var79                                                                         #     #     #      #     # or
+                                        self.left = s.cursor  ##                                                                          #     #     #      #     #
+                                        r = True              ## [                                                                        #     #     #      #     #
+                                        if r:                                                                                             #     #     #      #     #
+                                            var77 = len(s.chars) - s.cursor                       ##                                            #     #     #      #     #
+                                            r = self.r_mark_possessives(s)  # routine call  #                                             #     #     #      #     #
+                                            if not r:                                       # or                                          #     #     #      #     #
+                                                s.cursor = len(s.chars) - var77                   #                                             #     #     #      #     #
+                                                r = self.r_mark_sU(s)  # routine call       ##                                            #     #     #      #     #
+                                            if r:                                                                                         #     #     #      #     #
+                                                self.right = s.cursor  ##                                                                 #     #     #      #     #
+                                                r = True               ## ]                                                               # or  #     # try  #     #
+                                                if r:                                                                                     #     # or  #      #     #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete                                 #     #     #      #     #
+                                                    if r:                                                                                 #     #     #      #     #
+                                                        var78 = len(s.chars) - s.cursor                                                  ##     #     #     #      #     #
+                                                        self.left = s.cursor  ##                                                   #      #     #     #      #     #
+                                                        r = True              ## [                                                 #      #     #     #      #     #
+                                                        if r:                                                                      #      #     #     #      #     #
+                                                            r = self.r_mark_lAr(s)  # routine call                                 #      #     #     #      #     #
+                                                            if r:                                                                  #      #     #     #      #     #
+                                                                self.right = s.cursor  ##                                          #      #     #     #      #     #
+                                                                r = True               ## ]                                        # try  #     #     #      #     #
+                                                                if r:                                                              #      #     #     #      #     #
+                                                                    r = s.set_range(self.left, self.right, u'')  # delete          #      #     #     #      #     #
+                                                                    if r:                                                          #      #     #     #      #     #
+                                                                        r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #     #      #     #
+                                                        if not r:                                                                  #      #     #     #      #     #
+                                                            r = True                                                               #      #     #     #      #     #
+                                                            s.cursor = len(s.chars) - var78                                              ##     ##    #     #      #     #
+                                    if not r:                                                                                                   #     #      #     #
+                                        s.cursor = len(s.chars) - var80                                                                               #     #      #     #
+                                        r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                               ##    #      #     #
+                                if not r:                                                                                                             #      #     #
+                                    r = True                                                                                                          #      #     #
+                                    s.cursor = len(s.chars) - var81                                                                                         ##     ##    #
+                if not r:                                                                                                                                          #
+                    s.cursor = len(s.chars) - var86                                                                                                                      #
+                    r = self.r_mark_ndA(s)  # routine call                                                                                                         #
+                    if r:                                                                                                                                          #
+                        var85 = len(s.chars) - s.cursor                                                                               ##                                 #
+                        var84 = len(s.chars) - s.cursor                                                                         ##    #                                  #
+                        r = self.r_mark_lArI(s)  # routine call                                                           #     #                                  #
+                        if r:                                                                                             #     #                                  #
+                            self.right = s.cursor  ##                                                                     #     #                                  #
+                            r = True               ## ]                                                                   #     #                                  #
+                            if r:                                                                                         #     #                                  #
+                                r = s.set_range(self.left, self.right, u'')  # delete                                     #     #                                  #
+                        if not r:                                                                                         #     #                                  #
+                            s.cursor = len(s.chars) - var84                                                                     #     #                                  #
+                            r = self.r_mark_sU(s)  # routine call                                                         #     #                                  #
+                            if r:                                                                                         #     #                                  #
+                                self.right = s.cursor  ##                                                                 #     #                                  #
+                                r = True               ## ]                                                               #     #                                  #
+                                if r:                                                                                     #     #                                  #
+                                    r = s.set_range(self.left, self.right, u'')  # delete                                 #     #                                  #
+                                    if r:                                                                                 # or  #                                  #
+                                        var83 = len(s.chars) - s.cursor                                                  ##     #     # or                               #
+                                        self.left = s.cursor  ##                                                   #      #     #                                  #
+                                        r = True              ## [                                                 #      #     #                                  #
+                                        if r:                                                                      #      #     #                                  #
+                                            r = self.r_mark_lAr(s)  # routine call                                 #      #     #                                  #
+                                            if r:                                                                  #      #     #                                  #
+                                                self.right = s.cursor  ##                                          #      #     #                                  #
+                                                r = True               ## ]                                        # try  #     #                                  #
+                                                if r:                                                              #      #     #                                  #
+                                                    r = s.set_range(self.left, self.right, u'')  # delete          #      #     #                                  #
+                                                    if r:                                                          #      #     #                                  #
+                                                        r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #                                  #
+                                        if not r:                                                                  #      #     #                                  #
+                                            r = True                                                               #      #     #                                  #
+                                            s.cursor = len(s.chars) - var83                                              ##     ##    #                                  #
+                        if not r:                                                                                               #                                  #
+                            s.cursor = len(s.chars) - var85                                                                           #                                  #
+                            r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                           ##                                 ##
+        return r
+    
+    def r_stem_noun_suffixes(self, s):
+        r = True
+        var126 = len(s.chars) - s.cursor                                                                                                                                                                   ##
+        var123 = len(s.chars) - s.cursor                                                                                                                                                             ##    #
+        var117 = len(s.chars) - s.cursor                                                                                                                                                       ##    #     #
+        var116 = len(s.chars) - s.cursor                                                                                                                                                 ##    #     #     #
+        var115 = len(s.chars) - s.cursor                                                                                                                                           ##    #     #     #     #
+        var108 = len(s.chars) - s.cursor                                                                                                                                     ##    #     #     #     #     #
+        var102 = len(s.chars) - s.cursor                                                                                                                               ##    #     #     #     #     #     #
+        var98 = len(s.chars) - s.cursor                                                                                                                          ##    #     #     #     #     #     #     #
+        var93 = len(s.chars) - s.cursor                                                                                                                    ##    #     #     #     #     #     #     #     #
+        self.left = s.cursor  ##                                                                                                                     #     #     #     #     #     #     #     #     #
+        r = True              ## [                                                                                                                   #     #     #     #     #     #     #     #     #
+        if r:                                                                                                                                        #     #     #     #     #     #     #     #     #
+            r = self.r_mark_lAr(s)  # routine call                                                                                                   #     #     #     #     #     #     #     #     #
+            if r:                                                                                                                                    #     #     #     #     #     #     #     #     #
+                self.right = s.cursor  ##                                                                                                            #     #     #     #     #     #     #     #     #
+                r = True               ## ]                                                                                                          #     #     #     #     #     #     #     #     #
+                if r:                                                                                                                                #     #     #     #     #     #     #     #     #
+                    r = s.set_range(self.left, self.right, u'')  # delete                                                                            #     #     #     #     #     #     #     #     #
+                    if r:                                                                                                                            #     #     #     #     #     #     #     #     #
+                        var87 = len(s.chars) - s.cursor                                  ##                                                                #     #     #     #     #     #     #     #     #
+                        r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #                                                                 #     #     #     #     #     #     #     #     #
+                        if not r:                                                  # try                                                             #     #     #     #     #     #     #     #     #
+                            r = True                                               #                                                                 #     #     #     #     #     #     #     #     #
+                            s.cursor = len(s.chars) - var87                              ##                                                                #     #     #     #     #     #     #     #     #
+        if not r:                                                                                                                                    #     #     #     #     #     #     #     #     #
+            s.cursor = len(s.chars) - var93                                                                                                                #     #     #     #     #     #     #     #     #
+            self.left = s.cursor  ##                                                                                                                 #     #     #     #     #     #     #     #     #
+            r = True              ## [                                                                                                               #     #     #     #     #     #     #     #     #
+            if r:                                                                                                                                    #     #     #     #     #     #     #     #     #
+                r = self.r_mark_ncA(s)  # routine call                                                                                               #     #     #     #     #     #     #     #     #
+                if r:                                                                                                                                #     #     #     #     #     #     #     #     #
+                    self.right = s.cursor  ##                                                                                                        #     #     #     #     #     #     #     #     #
+                    r = True               ## ]                                                                                                      #     #     #     #     #     #     #     #     #
+                    if r:                                                                                                                            #     #     #     #     #     #     #     #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                        #     #     #     #     #     #     #     #     #
+                        if r:                                                                                                                        #     #     #     #     #     #     #     #     #
+                            var92 = len(s.chars) - s.cursor                                                                                         ##     #     #     #     #     #     #     #     #     #
+                            var91 = len(s.chars) - s.cursor                                                                                   ##    #      #     #     #     #     #     #     #     #     #
+                            var90 = len(s.chars) - s.cursor                                                                             ##    #     #      #     #     #     #     #     #     #     #     #
+                            self.left = s.cursor  ##                                                                              #     #     #      #     #     #     #     #     #     #     #     #
+                            r = True              ## [                                                                            #     #     #      #     #     #     #     #     #     #     #     #
+                            if r:                                                                                                 #     #     #      #     #     #     #     #     #     #     #     #
+                                r = self.r_mark_lArI(s)  # routine call                                                           #     #     #      #     #     #     #     #     #     #     #     #
+                                if r:                                                                                             #     #     #      #     #     #     #     #     #     #     #     #
+                                    self.right = s.cursor  ##                                                                     #     #     #      #     #     #     #     #     #     #     #     #
+                                    r = True               ## ]                                                                   #     #     #      #     #     #     #     #     #     #     #     #
+                                    if r:                                                                                         #     #     #      #     #     #     #     #     #     #     #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                     #     #     #      #     #     #     #     #     #     #     #     #
+                            if not r:                                                                                             #     #     #      #     #     #     #     #     #     #     #     #
+                                s.cursor = len(s.chars) - var90                                                                         #     #     #      #     #     #     #     #     #     #     #     #
+                                self.left = s.cursor  ##                                                                          #     #     #      #     #     #     #     #     #     #     #     #
+                                r = True              ## [                                                                        #     #     #      # or  #     #     #     #     #     #     #     #
+                                if r:                                                                                             #     #     #      #     #     #     #     #     #     #     #     #
+                                    var88 = len(s.chars) - s.cursor                       ##                                            #     #     #      #     #     #     #     #     #     #     #     #
+                                    r = self.r_mark_possessives(s)  # routine call  #                                             #     #     #      #     #     #     #     #     #     #     #     #
+                                    if not r:                                       # or                                          #     #     #      #     #     #     #     #     #     #     #     #
+                                        s.cursor = len(s.chars) - var88                   #                                             #     #     #      #     #     #     #     #     #     #     #     #
+                                        r = self.r_mark_sU(s)  # routine call       ##                                            #     #     #      #     #     #     #     #     #     #     #     #
+                                    if r:                                                                                         # or  #     #      #     #     #     #     #     #     #     #     #
+                                        self.right = s.cursor  ##                                                                 #     #     #      #     #     #     #     #     #     #     #     #
+                                        r = True               ## ]                                                               #     #     #      #     #     #     #     #     #     #     #     #
+                                        if r:                                                                                     #     #     #      #     #     #     #     #     #     #     #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                                 #     #     #      #     #     #     #     #     #     #     #     #
+                                            if r:                                                                                 #     #     #      #     #     #     #     #     #     #     #     #
+                                                var89 = len(s.chars) - s.cursor                                                  ##     #     # or  #      #     #     #     #     #     #     #     #     #
+                                                self.left = s.cursor  ##                                                   #      #     #     # try  #     #     #     #     #     #     #     #     #
+                                                r = True              ## [                                                 #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                if r:                                                                      #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                    r = self.r_mark_lAr(s)  # routine call                                 #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                    if r:                                                                  #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                        self.right = s.cursor  ##                                          #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                        r = True               ## ]                                        # try  #     #     #      #     #     #     #     #     #     #     #     #
+                                                        if r:                                                              #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                            r = s.set_range(self.left, self.right, u'')  # delete          #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                            if r:                                                          #      #     #     #      #     # or  #     #     #     #     #     #     #
+                                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                if not r:                                                                  #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                    r = True                                                               #      #     #     #      #     #     #     #     #     #     #     #     #
+                                                    s.cursor = len(s.chars) - var89                                              ##     ##    #     #      #     #     #     #     #     #     #     #     #
+                            if not r:                                                                                                   #     #      #     #     #     #     #     #     #     #     #
+                                s.cursor = len(s.chars) - var91                                                                               #     #      #     #     #     #     #     #     #     #     #
+                                self.left = s.cursor  ##                                                                                #     #      #     #     #     #     #     #     #     #     #
+                                r = True              ## [                                                                              #     #      #     #     #     #     #     #     #     #     #
+                                if r:                                                                                                   #     #      #     #     #     #     #     #     #     #     #
+                                    r = self.r_mark_lAr(s)  # routine call                                                              #     #      #     #     #     #     #     #     #     #     #
+                                    if r:                                                                                               #     #      #     #     #     #     #     #     #     #     #
+                                        self.right = s.cursor  ##                                                                       #     #      #     #     #     #     #     #     #     #     #
+                                        r = True               ## ]                                                                     #     #      #     #     #     #     #     #     #     #     #
+                                        if r:                                                                                           #     #      #     #     #     #     #     #     #     #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                                       #     #      #     #     #     #     #     #     #     #     #
+                                            if r:                                                                                       #     #      #     #     #     #     #     #     #     #     #
+                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call                               ##    #      #     #     #     #     #     #     #     #     #
+                            if not r:                                                                                                         #      #     #     # or  #     #     #     #     #     #
+                                r = True                                                                                                      #      #     #     #     #     #     #     #     #     #
+                                s.cursor = len(s.chars) - var92                                                                                     ##     ##    #     #     #     #     #     #     #     #
+        if not r:                                                                                                                                          #     #     #     #     #     #     #     #
+            s.cursor = len(s.chars) - var98                                                                                                                      #     #     #     #     #     #     #     #
+            self.left = s.cursor  ##                                                                                                                       #     #     #     #     #     #     #     #
+            r = True              ## [                                                                                                                     #     #     #     #     #     #     #     #
+            if r:                                                                                                                                          #     #     #     #     #     #     #     #
+                var94 = len(s.chars) - s.cursor                  ##                                                                                              #     #     #     #     #     #     #     #
+                r = self.r_mark_ndA(s)  # routine call     #                                                                                               #     #     #     #     #     #     #     #
+                if not r:                                  # or                                                                                            #     #     #     #     #     #     #     #
+                    s.cursor = len(s.chars) - var94              #                                                                                               #     #     #     #     #     #     #     #
+                    r = self.r_mark_nA(s)  # routine call  ##                                                                                              #     #     #     #     #     #     #     #
+                if r:                                                                                                                                      #     #     #     #     #     #     #     #
+                    var97 = len(s.chars) - s.cursor                                                                               ##                             #     #     #     #     #     #     #     #
+                    var96 = len(s.chars) - s.cursor                                                                         ##    #                              #     #     #     #     #     #     #     #
+                    r = self.r_mark_lArI(s)  # routine call                                                           #     #                              #     #     #     #     #     #     #     #
+                    if r:                                                                                             #     #                              #     #     #     #     #     #     #     #
+                        self.right = s.cursor  ##                                                                     #     #                              #     #     #     #     #     #     #     #
+                        r = True               ## ]                                                                   #     #                              #     #     #     #     #     #     #     #
+                        if r:                                                                                         #     #                              #     #     #     #     #     #     #     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                     #     #                              #     #     #     #     #     #     #     #
+                    if not r:                                                                                         #     #                              #     #     #     #     #     #     #     #
+                        s.cursor = len(s.chars) - var96                                                                     #     #                              #     #     #     #     #     #     #     #
+                        r = self.r_mark_sU(s)  # routine call                                                         #     #                              #     #     #     #     #     #     #     #
+                        if r:                                                                                         #     #                              #     #     #     #     #     #     #     #
+                            self.right = s.cursor  ##                                                                 #     #                              #     #     #     #     #     #     #     #
+                            r = True               ## ]                                                               #     #                              #     #     #     #     #     #     #     #
+                            if r:                                                                                     #     #                              #     #     #     #     #     #     #     #
+                                r = s.set_range(self.left, self.right, u'')  # delete                                 #     #                              #     #     # or  #     #     #     #     #
+                                if r:                                                                                 # or  #                              #     #     #     #     #     #     #     #
+                                    var95 = len(s.chars) - s.cursor                                                  ##     #     # or                           #     #     #     #     #     #     #     #
+                                    self.left = s.cursor  ##                                                   #      #     #                              #     #     #     #     #     #     #     #
+                                    r = True              ## [                                                 #      #     #                              #     #     #     #     #     #     #     #
+                                    if r:                                                                      #      #     #                              #     #     #     #     #     #     #     #
+                                        r = self.r_mark_lAr(s)  # routine call                                 #      #     #                              #     #     #     #     #     #     #     #
+                                        if r:                                                                  #      #     #                              #     #     #     #     #     #     #     #
+                                            self.right = s.cursor  ##                                          #      #     #                              #     #     #     #     #     #     #     #
+                                            r = True               ## ]                                        # try  #     #                              #     #     #     #     #     #     #     #
+                                            if r:                                                              #      #     #                              #     #     #     #     #     #     #     #
+                                                r = s.set_range(self.left, self.right, u'')  # delete          #      #     #                              #     #     #     #     #     #     #     #
+                                                if r:                                                          #      #     #                              #     #     #     #     #     #     #     #
+                                                    r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #                              #     #     #     #     #     #     #     #
+                                    if not r:                                                                  #      #     #                              #     #     #     #     #     #     #     #
+                                        r = True                                                               #      #     #                              #     #     #     #     #     #     #     #
+                                        s.cursor = len(s.chars) - var95                                              ##     ##    #                              #     #     #     #     #     #     #     #
+                    if not r:                                                                                               #                              #     #     #     #     #     #     #     #
+                        s.cursor = len(s.chars) - var97                                                                           #                              #     #     #     #     #     #     #     #
+                        r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                           ##                             ##    #     #     #     #     #     #     #
+        if not r:                                                                                                                                                #     #     #     #     #     #     #
+            s.cursor = len(s.chars) - var102                                                                                                                           #     #     #     #     #     #     #
+            self.left = s.cursor  ##                                                                                                                             #     #     #     #     #     #     #
+            r = True              ## [                                                                                                                           #     #     #     #     #     #     #
+            if r:                                                                                                                                                #     #     #     #     #     #     #
+                var99 = len(s.chars) - s.cursor                  ##                                                                                                    #     #     #     #     #     #     #
+                r = self.r_mark_ndAn(s)  # routine call    #                                                                                                     #     #     #     #     #     #     #
+                if not r:                                  # or                                                                                                  #     #     #     #     #     #     #
+                    s.cursor = len(s.chars) - var99              #                                                                                                     #     #     #     #     #     #     #
+                    r = self.r_mark_nU(s)  # routine call  ##                                                                                                    #     #     #     #     #     #     #
+                if r:                                                                                                                                            #     #     #     #     #     #     #
+                    var101 = len(s.chars) - s.cursor                                                                    ##                                             #     #     #     #     #     #     #
+                    r = self.r_mark_sU(s)  # routine call                                                         #                                              #     #     #     #     #     #     #
+                    if r:                                                                                         #                                              #     #     # or  #     #     #     #
+                        self.right = s.cursor  ##                                                                 #                                              #     #     #     #     #     #     #
+                        r = True               ## ]                                                               #                                              #     #     #     #     #     #     #
+                        if r:                                                                                     #                                              #     #     #     #     #     #     #
+                            r = s.set_range(self.left, self.right, u'')  # delete                                 #                                              #     #     #     #     #     #     #
+                            if r:                                                                                 #                                              #     #     #     # or  #     #     #
+                                var100 = len(s.chars) - s.cursor                                                 ##     #                                              #     #     #     #     # or  #     #
+                                self.left = s.cursor  ##                                                   #      #                                              #     #     #     #     #     #     #
+                                r = True              ## [                                                 #      #                                              #     #     #     #     #     #     #
+                                if r:                                                                      #      #                                              #     #     #     #     #     #     #
+                                    r = self.r_mark_lAr(s)  # routine call                                 #      #                                              #     #     #     #     #     #     #
+                                    if r:                                                                  #      # or                                           #     #     #     #     #     #     #
+                                        self.right = s.cursor  ##                                          #      #                                              #     #     #     #     #     #     #
+                                        r = True               ## ]                                        # try  #                                              #     #     #     #     #     #     #
+                                        if r:                                                              #      #                                              #     #     #     #     #     #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete          #      #                                              #     #     #     #     #     #     #
+                                            if r:                                                          #      #                                              #     #     #     #     #     #     #
+                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #                                              #     #     #     #     #     #     #
+                                if not r:                                                                  #      #                                              #     #     #     #     #     #     #
+                                    r = True                                                               #      #                                              #     #     #     #     #     #     #
+                                    s.cursor = len(s.chars) - var100                                             ##     #                                              #     #     #     #     #     #     #
+                    if not r:                                                                                     #                                              #     #     #     #     #     #     #
+                        s.cursor = len(s.chars) - var101                                                                #                                              #     #     #     #     #     #     #
+                        r = self.r_mark_lArI(s)  # routine call                                                   ##                                             ##    #     #     #     #     #     #
+        if not r:                                                                                                                                                      #     #     #     #     #     #
+            s.cursor = len(s.chars) - var108                                                                                                                                 #     #     #     #     #     #
+            self.left = s.cursor  ##                                                                                                                                   #     #     #     #     #     #
+            r = True              ## [                                                                                                                                 #     #     #     #     #     #
+            if r:                                                                                                                                                      #     #     #     #     #     #
+                r = self.r_mark_DAn(s)  # routine call                                                                                                                 #     #     #     #     #     #
+                if r:                                                                                                                                                  #     #     #     #     #     #
+                    self.right = s.cursor  ##                                                                                                                          #     #     #     #     #     #
+                    r = True               ## ]                                                                                                                        #     #     #     #     #     #
+                    if r:                                                                                                                                              #     #     #     #     #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                          #     #     #     #     # or  #
+                        if r:                                                                                                                                          #     #     #     #     #     #
+                            var107 = len(s.chars) - s.cursor                                                                                    ##                           #     #     #     #     #     #
+                            self.left = s.cursor  ##                                                                                      #                            #     #     #     #     #     #
+                            r = True              ## [                                                                                    #                            #     #     #     #     #     #
+                            if r:                                                                                                         #                            #     #     #     #     #     #
+                                var106 = len(s.chars) - s.cursor                                                                          ##    #                            #     #     #     #     #     #
+                                var105 = len(s.chars) - s.cursor                                                                    ##    #     #                            #     #     #     #     #     #
+                                r = self.r_mark_possessives(s)  # routine call                                                #     #     #                            #     #     #     #     #     #
+                                if r:                                                                                         #     #     #                            #     #     #     #     #     #
+                                    self.right = s.cursor  ##                                                                 #     #     #                            #     #     #     #     #     #
+                                    r = True               ## ]                                                               #     #     #                            #     #     #     #     #     #
+                                    if r:                                                                                     #     #     #                            #     #     #     #     #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                 #     #     #                            #     #     #     #     #     #
+                                        if r:                                                                                 #     #     #                            #     #     #     #     #     #
+                                            var103 = len(s.chars) - s.cursor                                                 ##     #     #     #                            #     #     #     #     #     # or
+                                            self.left = s.cursor  ##                                                   #      #     #     #                            #     #     #     #     #     #
+                                            r = True              ## [                                                 #      #     #     #                            #     #     #     #     #     #
+                                            if r:                                                                      #      #     #     #                            #     #     #     #     #     #
+                                                r = self.r_mark_lAr(s)  # routine call                                 #      #     #     #                            #     #     #     #     #     #
+                                                if r:                                                                  #      #     #     #                            #     #     #     #     #     #
+                                                    self.right = s.cursor  ##                                          #      #     #     #                            #     #     #     #     #     #
+                                                    r = True               ## ]                                        # try  #     #     #                            #     #     #     #     #     #
+                                                    if r:                                                              #      #     #     #                            #     #     #     #     #     #
+                                                        r = s.set_range(self.left, self.right, u'')  # delete          #      #     #     #                            #     #     #     #     #     #
+                                                        if r:                                                          #      # or  #     #                            #     #     #     #     #     #
+                                                            r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     # or  # try                        #     #     #     #     #     #
+                                            if not r:                                                                  #      #     #     #                            #     #     #     #     #     #
+                                                r = True                                                               #      #     #     #                            #     #     #     #     #     #
+                                                s.cursor = len(s.chars) - var103                                             ##     #     #     #                            #     #     #     #     #     #
+                                if not r:                                                                                     #     #     #                            #     #     #     #     #     #
+                                    s.cursor = len(s.chars) - var105                                                                #     #     #                            #     #     #     #     #     #
+                                    r = self.r_mark_lAr(s)  # routine call                                                    #     #     #                            #     #     #     #     #     #
+                                    if r:                                                                                     #     #     #                            #     #     #     #     #     #
+                                        self.right = s.cursor  ##                                                             #     #     #                            #     #     #     #     #     #
+                                        r = True               ## ]                                                           #     #     #                            #     #     #     #     #     #
+                                        if r:                                                                                 #     #     #                            #     #     #     #     #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                             #     #     #                            #     #     #     #     #     #
+                                            if r:                                                                             #     #     #                            #     #     #     #     #     #
+                                                var104 = len(s.chars) - s.cursor                                 ##                 #     #     #                            #     #     #     #     #     #
+                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #                  #     #     #                            #     #     #     #     #     #
+                                                if not r:                                                  # try              #     #     #                            #     #     #     #     #     #
+                                                    r = True                                               #                  #     #     #                            #     #     #     #     #     #
+                                                    s.cursor = len(s.chars) - var104                             ##                 ##    #     #                            #     #     #     #     #     #
+                                if not r:                                                                                           #     #                            #     #     #     #     #     #
+                                    s.cursor = len(s.chars) - var106                                                                      #     #                            #     #     #     #     #     #
+                                    r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                       ##    #                            #     #     #     #     #     #
+                            if not r:                                                                                                     #                            #     #     #     #     #     #
+                                r = True                                                                                                  #                            #     #     #     #     #     #
+                                s.cursor = len(s.chars) - var107                                                                                ##                           ##    #     #     #     #     #
+        if not r:                                                                                                                                                            #     #     #     #     #
+            s.cursor = len(s.chars) - var115                                                                                                                                       #     #     #     #     #
+            self.left = s.cursor  ##                                                                                                                                         #     #     #     #     #
+            r = True              ## [                                                                                                                                       #     #     #     #     #
+            if r:                                                                                                                                                            #     #     #     #     #
+                var109 = len(s.chars) - s.cursor                  ##                                                                                                               #     #     #     #     #
+                r = self.r_mark_nUn(s)  # routine call      #                                                                                                                #     #     #     #     #
+                if not r:                                   # or                                                                                                             #     #     #     #     #
+                    s.cursor = len(s.chars) - var109              #                                                                                                                #     #     #     #     #
+                    r = self.r_mark_ylA(s)  # routine call  ##                                                                                                               #     #     #     #     #
+                if r:                                                                                                                                                        #     #     #     #     #
+                    self.right = s.cursor  ##                                                                                                                                #     #     #     #     #
+                    r = True               ## ]                                                                                                                              #     #     #     #     #
+                    if r:                                                                                                                                                    #     #     #     #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                                #     #     #     #     #
+                        if r:                                                                                                                                                #     #     #     #     #
+                            var114 = len(s.chars) - s.cursor                                                                                        ##                             #     #     #     #     #
+                            var113 = len(s.chars) - s.cursor                                                                                  ##    #                              #     #     #     #     #
+                            var112 = len(s.chars) - s.cursor                                                                            ##    #     #                              #     #     #     #     #
+                            self.left = s.cursor  ##                                                                              #     #     #                              #     #     #     #     #
+                            r = True              ## [                                                                            #     #     #                              #     #     #     #     #
+                            if r:                                                                                                 #     #     #                              #     #     #     #     #
+                                r = self.r_mark_lAr(s)  # routine call                                                            #     #     #                              #     #     #     #     #
+                                if r:                                                                                             #     #     #                              #     #     #     #     #
+                                    self.right = s.cursor  ##                                                                     #     #     #                              #     #     #     #     #
+                                    r = True               ## ]                                                                   #     #     #                              #     #     #     #     #
+                                    if r:                                                                                         #     #     #                              #     #     #     #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete                                     #     #     #                              #     #     #     #     #
+                                        if r:                                                                                     #     #     #                              #     #     #     #     #
+                                            r = self.r_stem_suffix_chain_before_ki(s)  # routine call                             #     #     #                              #     #     #     #     #
+                            if not r:                                                                                             #     #     #                              #     #     #     #     #
+                                s.cursor = len(s.chars) - var112                                                                        #     #     #                              #     #     #     #     #
+                                self.left = s.cursor  ##                                                                          #     #     #                              #     #     #     #     #
+                                r = True              ## [                                                                        #     #     #                              #     #     #     #     #
+                                if r:                                                                                             #     #     #                              #     #     #     #     #
+                                    var110 = len(s.chars) - s.cursor                      ##                                            #     #     #                              #     #     #     #     #
+                                    r = self.r_mark_possessives(s)  # routine call  #                                             #     #     #                              #     #     #     #     #
+                                    if not r:                                       # or                                          #     #     #                              #     #     #     #     #
+                                        s.cursor = len(s.chars) - var110                  #                                             #     #     #                              #     #     #     #     #
+                                        r = self.r_mark_sU(s)  # routine call       ##                                            # or  #     #                              #     #     #     #     #
+                                    if r:                                                                                         #     # or  #                              #     #     #     #     #
+                                        self.right = s.cursor  ##                                                                 #     #     # try                          #     #     #     #     #
+                                        r = True               ## ]                                                               #     #     #                              #     #     #     #     #
+                                        if r:                                                                                     #     #     #                              #     #     #     #     #
+                                            r = s.set_range(self.left, self.right, u'')  # delete                                 #     #     #                              #     #     #     #     #
+                                            if r:                                                                                 #     #     #                              #     #     #     #     #
+                                                var111 = len(s.chars) - s.cursor                                                 ##     #     #     #                              #     #     #     #     #
+                                                self.left = s.cursor  ##                                                   #      #     #     #                              #     #     #     #     #
+                                                r = True              ## [                                                 #      #     #     #                              #     #     #     #     #
+                                                if r:                                                                      #      #     #     #                              #     #     #     #     #
+                                                    r = self.r_mark_lAr(s)  # routine call                                 #      #     #     #                              #     #     #     #     #
+                                                    if r:                                                                  #      #     #     #                              #     #     #     #     #
+                                                        self.right = s.cursor  ##                                          #      #     #     #                              #     #     #     #     #
+                                                        r = True               ## ]                                        # try  #     #     #                              #     #     #     #     #
+                                                        if r:                                                              #      #     #     #                              #     #     #     #     #
+                                                            r = s.set_range(self.left, self.right, u'')  # delete          #      #     #     #                              #     #     #     #     #
+                                                            if r:                                                          #      #     #     #                              #     #     #     #     #
+                                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #      #     #     #                              #     #     #     #     #
+                                                if not r:                                                                  #      #     #     #                              #     #     #     #     #
+                                                    r = True                                                               #      #     #     #                              #     #     #     #     #
+                                                    s.cursor = len(s.chars) - var111                                             ##     ##    #     #                              #     #     #     #     #
+                            if not r:                                                                                                   #     #                              #     #     #     #     #
+                                s.cursor = len(s.chars) - var113                                                                              #     #                              #     #     #     #     #
+                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                               ##    #                              #     #     #     #     #
+                            if not r:                                                                                                         #                              #     #     #     #     #
+                                r = True                                                                                                      #                              #     #     #     #     #
+                                s.cursor = len(s.chars) - var114                                                                                    ##                             ##    #     #     #     #
+        if not r:                                                                                                                                                                  #     #     #     #
+            s.cursor = len(s.chars) - var116                                                                                                                                             #     #     #     #
+            self.left = s.cursor  ##                                                                                                                                               #     #     #     #
+            r = True              ## [                                                                                                                                             #     #     #     #
+            if r:                                                                                                                                                                  #     #     #     #
+                r = self.r_mark_lArI(s)  # routine call                                                                                                                            #     #     #     #
+                if r:                                                                                                                                                              #     #     #     #
+                    self.right = s.cursor  ##                                                                                                                                      #     #     #     #
+                    r = True               ## ]                                                                                                                                    #     #     #     #
+                    if r:                                                                                                                                                          #     #     #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                                      ##    #     #     #
+        if not r:                                                                                                                                                                        #     #     #
+            s.cursor = len(s.chars) - var117                                                                                                                                                   #     #     #
+            r = self.r_stem_suffix_chain_before_ki(s)  # routine call                                                                                                                    ##    #     #
+        if not r:                                                                                                                                                                              #     #
+            s.cursor = len(s.chars) - var123                                                                                                                                                         #     #
+            self.left = s.cursor  ##                                                                                                                                                           #     #
+            r = True              ## [                                                                                                                                                         #     #
+            if r:                                                                                                                                                                              #     #
+                var119 = len(s.chars) - s.cursor                       ##                                                                                                                            #     #
+                var118 = len(s.chars) - s.cursor                 ##    #                                                                                                                             #     #
+                r = self.r_mark_DA(s)  # routine call      #     #                                                                                                                             #     #
+                if not r:                                  # or  #                                                                                                                             #     #
+                    s.cursor = len(s.chars) - var118             #     # or                                                                                                                          #     #
+                    r = self.r_mark_yU(s)  # routine call  ##    #                                                                                                                             #     #
+                if not r:                                        #                                                                                                                             #     #
+                    s.cursor = len(s.chars) - var119                   #                                                                                                                             #     #
+                    r = self.r_mark_yA(s)  # routine call        ##                                                                                                                            #     #
+                if r:                                                                                                                                                                          #     #
+                    self.right = s.cursor  ##                                                                                                                                                  #     #
+                    r = True               ## ]                                                                                                                                                #     #
+                    if r:                                                                                                                                                                      #     #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                                                  #     #
+                        if r:                                                                                                                                                                  #     #
+                            var122 = len(s.chars) - s.cursor                                                     ##                                                                                  #     #
+                            self.left = s.cursor  ##                                                       #                                                                                   #     #
+                            r = True              ## [                                                     #                                                                                   #     #
+                            if r:                                                                          #                                                                                   #     #
+                                var121 = len(s.chars) - s.cursor                                     ##          #                                                                                   #     #
+                                r = self.r_mark_possessives(s)  # routine call                 #           #                                                                                   #     #
+                                if r:                                                          #           #                                                                                   #     #
+                                    self.right = s.cursor  ##                                  #           #                                                                                   #     #
+                                    r = True               ## ]                                #           #                                                                                   #     #
+                                    if r:                                                      #           #                                                                                   #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete  #           #                                                                                   #     #
+                                        if r:                                                  #           #                                                                                   #     #
+                                            var120 = len(s.chars) - s.cursor                  ##     #           #                                                                                   #     #
+                                            self.left = s.cursor  ##                    #      # or        #                                                                                   #     #
+                                            r = True              ## [                  #      #           #                                                                                   #     #
+                                            if r:                                       #      #           #                                                                                   #     #
+                                                r = self.r_mark_lAr(s)  # routine call  # try  #           #                                                                                   #     #
+                                            if not r:                                   #      #           #                                                                                   #     #
+                                                r = True                                #      #           # try                                                                               #     #
+                                                s.cursor = len(s.chars) - var120              ##     #           #                                                                                   #     #
+                                if not r:                                                      #           #                                                                                   #     #
+                                    s.cursor = len(s.chars) - var121                                 #           #                                                                                   #     #
+                                    r = self.r_mark_lAr(s)  # routine call                     ##          #                                                                                   #     #
+                                if r:                                                                      #                                                                                   #     #
+                                    self.right = s.cursor  ##                                              #                                                                                   #     #
+                                    r = True               ## ]                                            #                                                                                   #     #
+                                    if r:                                                                  #                                                                                   #     #
+                                        r = s.set_range(self.left, self.right, u'')  # delete              #                                                                                   #     #
+                                        if r:                                                              #                                                                                   #     #
+                                            self.left = s.cursor  ##                                       #                                                                                   #     #
+                                            r = True              ## [                                     #                                                                                   #     #
+                                            if r:                                                          #                                                                                   #     #
+                                                r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #                                                                                   #     #
+                            if not r:                                                                      #                                                                                   #     #
+                                r = True                                                                   #                                                                                   #     #
+                                s.cursor = len(s.chars) - var122                                                 ##                                                                                  ##    #
+        if not r:                                                                                                                                                                                    #
+            s.cursor = len(s.chars) - var126                                                                                                                                                               #
+            self.left = s.cursor  ##                                                                                                                                                                 #
+            r = True              ## [                                                                                                                                                               #
+            if r:                                                                                                                                                                                    #
+                var124 = len(s.chars) - s.cursor                      ##                                                                                                                                   #
+                r = self.r_mark_possessives(s)  # routine call  #                                                                                                                                    #
+                if not r:                                       # or                                                                                                                                 #
+                    s.cursor = len(s.chars) - var124                  #                                                                                                                                    #
+                    r = self.r_mark_sU(s)  # routine call       ##                                                                                                                                   #
+                if r:                                                                                                                                                                                #
+                    self.right = s.cursor  ##                                                                                                                                                        #
+                    r = True               ## ]                                                                                                                                                      #
+                    if r:                                                                                                                                                                            #
+                        r = s.set_range(self.left, self.right, u'')  # delete                                                                                                                        #
+                        if r:                                                                                                                                                                        #
+                            var125 = len(s.chars) - s.cursor                                                 ##                                                                                            #
+                            self.left = s.cursor  ##                                                   #                                                                                             #
+                            r = True              ## [                                                 #                                                                                             #
+                            if r:                                                                      #                                                                                             #
+                                r = self.r_mark_lAr(s)  # routine call                                 #                                                                                             #
+                                if r:                                                                  #                                                                                             #
+                                    self.right = s.cursor  ##                                          #                                                                                             #
+                                    r = True               ## ]                                        # try                                                                                         #
+                                    if r:                                                              #                                                                                             #
+                                        r = s.set_range(self.left, self.right, u'')  # delete          #                                                                                             #
+                                        if r:                                                          #                                                                                             #
+                                            r = self.r_stem_suffix_chain_before_ki(s)  # routine call  #                                                                                             #
+                            if not r:                                                                  #                                                                                             #
+                                r = True                                                               #                                                                                             #
+                                s.cursor = len(s.chars) - var125                                             ##                                                                                            ##
+        return r
+    
+    def r_post_process_last_consonants(self, s):
+        r = True
+        self.left = s.cursor  ##
+        r = True              ## [
+        if r:
+            a_24 = _find_among(s, _t_24)  ##
+            r = a_24 is not None          ## substring
+            if r:
+                self.right = s.cursor  ##
+                r = True               ## ]
+                if r:
+                    if a_24 == 0:                                              ##
+                        r = s.set_range(self.left, self.right, u'p')  # <-     #
+                    if a_24 == 1:                                              #
+                        r = s.set_range(self.left, self.right, u'\xe7')  # <-  #
+                    if a_24 == 2:                                              # among
+                        r = s.set_range(self.left, self.right, u't')  # <-     #
+                    if a_24 == 3:                                              #
+                        r = s.set_range(self.left, self.right, u'k')  # <-     ##
+        return r
+    
+    def r_append_U_to_stems_ending_with_d_or_g(self, s):
+        r = True
+        var128 = len(s.chars) - s.cursor                            ##
+        var127 = len(s.chars) - s.cursor                      ##    #
+        r = s.starts_with(u'd')  # character check      #     #
+        if not r:                                       # or  # test
+            s.cursor = len(s.chars) - var127                  #     #
+            r = s.starts_with(u'g')  # character check  ##    #
+        s.cursor = len(s.chars) - var128                            ##
+        if r:
+            var143 = len(s.chars) - s.cursor                                                            ##
+            var139 = len(s.chars) - s.cursor                                                      ##    #
+            var135 = len(s.chars) - s.cursor                                                ##    #     #
+            var131 = len(s.chars) - s.cursor                                     ##         #     #     #
+            for var129 in xrange(s.cursor - 1, s.limit - 1, -1):  ##       #          #     #     #
+                if s.chars[var129] in _g_vowel:                   #        #          #     #     #
+                    s.cursor = var129 + 1                         #        #          #     #     #
+                    r = True                                      #        #          #     #     #
+                    break                                         # goto   #          #     #     #
+            else:                                                 #        #          #     #     #
+                s.cursor = s.limit                                #        #          #     #     #
+                r = False                                         ##       # test     #     #     #
+            if r:                                                          #          #     #     #
+                var130 = len(s.chars) - s.cursor                           ##    #          #     #     #
+                r = s.starts_with(u'a')  # character check           #     #          #     #     #
+                if not r:                                            # or  #          #     #     #
+                    s.cursor = len(s.chars) - var130                       #     #          #     #     #
+                    r = s.starts_with(u'\u0131')  # character check  ##    #          #     #     #
+            s.cursor = len(s.chars) - var131                                     ##         #     #     #
+            if r:                                                                     #     #     #
+                r = s.insert(u'\u0131')  # insert                                     #     #     #
+            if not r:                                                                 # or  #     #
+                s.cursor = len(s.chars) - var135                                            #     #     #
+                var134 = len(s.chars) - s.cursor                                    ##      #     #     #
+                for var132 in xrange(s.cursor - 1, s.limit - 1, -1):  ##      #       #     #     #
+                    if s.chars[var132] in _g_vowel:                   #       #       #     #     #
+                        s.cursor = var132 + 1                         #       #       #     #     #
+                        r = True                                      #       #       #     #     #
+                        break                                         # goto  #       #     #     #
+                else:                                                 #       #       #     #     #
+                    s.cursor = s.limit                                #       #       #     #     #
+                    r = False                                         ##      # test  #     # or  #
+                if r:                                                         #       #     #     #
+                    var133 = len(s.chars) - s.cursor                      ##        #       #     #     #
+                    r = s.starts_with(u'e')  # character check      #         #       #     #     #
+                    if not r:                                       # or      #       #     #     #
+                        s.cursor = len(s.chars) - var133                  #         #       #     #     #
+                        r = s.starts_with(u'i')  # character check  ##        #       #     #     #
+                s.cursor = len(s.chars) - var134                                    ##      #     #     #
+                if r:                                                                 #     #     #
+                    r = s.insert(u'i')  # insert                                      ##    #     # or
+            if not r:                                                                       #     #
+                s.cursor = len(s.chars) - var139                                                  #     #
+                var138 = len(s.chars) - s.cursor                                    ##            #     #
+                for var136 in xrange(s.cursor - 1, s.limit - 1, -1):  ##      #             #     #
+                    if s.chars[var136] in _g_vowel:                   #       #             #     #
+                        s.cursor = var136 + 1                         #       #             #     #
+                        r = True                                      #       #             #     #
+                        break                                         # goto  #             #     #
+                else:                                                 #       #             #     #
+                    s.cursor = s.limit                                #       #             #     #
+                    r = False                                         ##      # test        #     #
+                if r:                                                         #             #     #
+                    var137 = len(s.chars) - s.cursor                      ##        #             #     #
+                    r = s.starts_with(u'o')  # character check      #         #             #     #
+                    if not r:                                       # or      #             #     #
+                        s.cursor = len(s.chars) - var137                  #         #             #     #
+                        r = s.starts_with(u'u')  # character check  ##        #             #     #
+                s.cursor = len(s.chars) - var138                                    ##            #     #
+                if r:                                                                       #     #
+                    r = s.insert(u'u')  # insert                                            ##    #
+            if not r:                                                                             #
+                s.cursor = len(s.chars) - var143                                                        #
+                var142 = len(s.chars) - s.cursor                                    ##                  #
+                for var140 in xrange(s.cursor - 1, s.limit - 1, -1):  ##      #                   #
+                    if s.chars[var140] in _g_vowel:                   #       #                   #
+                        s.cursor = var140 + 1                         #       #                   #
+                        r = True                                      #       #                   #
+                        break                                         # goto  #                   #
+                else:                                                 #       #                   #
+                    s.cursor = s.limit                                #       #                   #
+                    r = False                                         ##      # test              #
+                if r:                                                         #                   #
+                    var141 = len(s.chars) - s.cursor                         ##     #                   #
+                    r = s.starts_with(u'\xf6')  # character check      #      #                   #
+                    if not r:                                          # or   #                   #
+                        s.cursor = len(s.chars) - var141                     #      #                   #
+                        r = s.starts_with(u'\xfc')  # character check  ##     #                   #
+                s.cursor = len(s.chars) - var142                                    ##                  #
+                if r:                                                                             #
+                    r = s.insert(u'\xfc')  # insert                                               ##
+        return r
+    
+    def r_more_than_one_syllable_word(self, s):
+        r = True
+        var146 = s.cursor                                                         ##
+        for var145 in xrange(2):                                       ##         #
+            for var144 in xrange(s.cursor, s.limit, 1):  ##            #          #
+                if s.chars[var144] in _g_vowel:          #             #          #
+                    s.cursor = var144 + 1                #             #          #
+                    r = True                             #             #          #
+                    break                                # gopast      #          #
+            else:                                        #             #          #
+                s.cursor = s.limit                       #             #          #
+                r = False                                ##            #          #
+            if not r:                                                  #          #
+                break                                                  #          #
+        if r:                                                          #          #
+            while True:                                                #          #
+                var145 = s.cursor                                      # atleast  # test
+                for var144 in xrange(s.cursor, s.limit, 1):  ##        #          #
+                    if s.chars[var144] in _g_vowel:          #         #          #
+                        s.cursor = var144 + 1                #         #          #
+                        r = True                             #         #          #
+                        break                                # gopast  #          #
+                else:                                        #         #          #
+                    s.cursor = s.limit                       #         #          #
+                    r = False                                ##        #          #
+                if not r:                                              #          #
+                    s.cursor = var145                                  #          #
+                    break                                              #          #
+            r = True                                                   ##         #
+        s.cursor = var146                                                         ##
+        return r
+    
+    def r_is_reserved_word(self, s):
+        r = True
+        var149 = s.cursor                                                         ##
+        var147 = s.cursor                                          ##             #
+        while True:                                      ##        #              #
+            r = s.starts_with(u'ad')  # character check  #         #              #
+            if r or s.cursor == s.limit:                 # gopast  #              #
+                break                                    #         #              #
+            s.cursor += 1                                ##        #              #
+        if r:                                                      # test         #
+            self.i_strlen = 2                                      #              #
+            r = True                                               #              #
+            if r:                                                  #              #
+                r = self.i_strlen == s.limit  # ==                 #              #
+        s.cursor = var147                                          ##             #
+        if not r:                                                                 # or
+            s.cursor = var149                                                     #
+            var148 = s.cursor                                             ##      #
+            while True:                                         ##        #       #
+                r = s.starts_with(u'soyad')  # character check  #         #       #
+                if r or s.cursor == s.limit:                    # gopast  #       #
+                    break                                       #         #       #
+                s.cursor += 1                                   ##        #       #
+            if r:                                                         # test  #
+                self.i_strlen = 5                                         #       #
+                r = True                                                  #       #
+                if r:                                                     #       #
+                    r = self.i_strlen == s.limit  # ==                    #       #
+            s.cursor = var148                                             ##      ##
+        return r
+    
+    def r_postlude(self, s):
+        r = True
+        var150 = s.cursor                               ##
+        r = self.r_is_reserved_word(s)  # routine call  #
+        if not r:                                       # not
+            s.cursor = var150                           #
+        r = not r                                       ##
+        if r:
+            var153 = s.cursor                                                         ##
+            var154 = len(s.chars) - s.limit                                                 #
+            s.direction *= -1                                                         #
+            s.cursor, s.limit = s.limit, s.cursor                                     #
+            var151 = len(s.chars) - s.cursor                                          ##    #
+            r = self.r_append_U_to_stems_ending_with_d_or_g(s)  # routine call  #     #
+            s.cursor = len(s.chars) - var151                                          # do  #
+            r = True                                                            ##    #
+            if r:                                                                     # backwards
+                var152 = len(s.chars) - s.cursor                                  ##        #
+                r = self.r_post_process_last_consonants(s)  # routine call  #         #
+                s.cursor = len(s.chars) - var152                                  # do      #
+                r = True                                                    ##        #
+            s.direction *= -1                                                         #
+            s.cursor = var153                                                         #
+            s.limit = len(s.chars) - var154                                                 ##
+        return r
+    
+    def r_stem(self, s):
+        r = True
+        r = self.r_more_than_one_syllable_word(s)  # routine call
+        if r:
+            var157 = s.cursor                                                         ##
+            var158 = len(s.chars) - s.limit                                                 #
+            s.direction *= -1                                                         #
+            s.cursor, s.limit = s.limit, s.cursor                                     #
+            var155 = len(s.chars) - s.cursor                                ##              #
+            r = self.r_stem_nominal_verb_suffixes(s)  # routine call  #               #
+            s.cursor = len(s.chars) - var155                                # do            #
+            r = True                                                  ##              #
+            if r:                                                                     #
+                r = self.b_continue_stemming_noun_suffixes  # boolean variable check  # backwards
+                if r:                                                                 #
+                    var156 = len(s.chars) - s.cursor                        ##              #
+                    r = self.r_stem_noun_suffixes(s)  # routine call  #               #
+                    s.cursor = len(s.chars) - var156                        # do            #
+                    r = True                                          ##              #
+            s.direction *= -1                                                         #
+            s.cursor = var157                                                         #
+            s.limit = len(s.chars) - var158                                                 ##
+            if r:
+                r = self.r_postlude(s)  # routine call
+        return r
+
+_u_last_0 = frozenset([u'a', u'b', u'c', u'd', u'e', u'g', u'i', u'k', u'm', u'n', u'r', u'u', u'z', u'\xfc', u'\u011f', u'\u0131', u'\u015f'])
+_u_last_1 = frozenset([u'b', u'c', u'd', u'i', u'm', u'n', u'z', u'\u011f', u'\u0131'])
+_u_chars_1 = frozenset([u'a', u'e', u'i', u'o', u'u', u'\xf6', u'\xfc', u'\u0131'])
+
+def unchanged(word):
+    """
+    Check quickly if ``stem`` returns a word unchanged.
+
+    If the return value is true then ``stem(word) == word``. The check
+    is conservative, i.e. it may return false for such words, too.
+    """
+    return ((word[-1:] not in _u_last_0) or
+            (word[-1:] not in _u_last_1 and _u_chars_1.isdisjoint(word)))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Stemming of NumPy arrays.
+
+Feature pipelines often keep their tokens in NumPy arrays. Converting
+such an array to a list for ``Stemmer.stemWords`` and the stems back to
+an array is slow and needs a lot of memory for large arrays.
+``stem_array`` avoids that: the distinct values of the array are found
+via ``numpy.unique``, only those are stemmed, and the result is built
+by indexing the array of their stems::
+
+    tokens = numpy.array([u'cats', u'ponies', u'cats'])
+    stems = purestemmer.arrays.stem_array(stemmer, tokens)
+
+Arrays of ``unicode`` (``U``), UTF-8 encoded byte string (``S``) and
+object dtype are supported. Since sorting Python objects is slow, the
+distinct values of object arrays are found via a dict instead. Object
+arrays hold references to Python strings anyway, so for them the gain
+is limited to the integer codes (see ``stem_array``).
+
+NumPy is optional. Without it, ``stem_array`` accepts any sequence of
+words and returns the result of ``Stemmer.stemWords`` instead.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = ['stem_array']
+
+
+def stem_array(stemmer, values, codes=False):
+    """
+    Stem an array of words.
+
+    ``stemmer`` is a ``purestemmer.Stemmer`` instance and ``values`` is
+    a 1-dimensional array of strings (or anything that ``numpy.asarray``
+    turns into one). Each distinct value is stemmed once.
+
+    Returns an array of the stems with the same kind of dtype as
+    ``values``. If ``codes`` is true then a tuple ``(codes, vocabulary)``
+    is returned instead, where ``vocabulary`` is an array of the
+    distinct stems and ``codes`` is a writable array of dtype
+    ``numpy.intp`` that contains the index of each word's stem in
+    ``vocabulary``.
+
+    In object arrays, ``str`` and ``unicode`` values can be mixed. As
+    with ``Stemmer.stemWords``, each stem has the type of its word and
+    the vocabulary contains separate entries for ``str`` and
+    ``unicode`` stems. The vocabulary of other arrays is sorted.
+
+    If NumPy is not installed then ``values`` can be any iterable of
+    words. The return value is that of ``stemmer.stemWords`` with
+    ``factorize`` set to ``codes``.
+
+    Raises ``ValueError`` if ``values`` is not a 1-dimensional array of
+    strings.
+    """
+    if numpy is None:
+        return stemmer.stemWords(values, factorize=codes)
+    values = numpy.asarray(values)
+    if values.ndim != 1:
+        raise ValueError('Only 1-dimensional arrays can be stemmed.')
+    kind = values.dtype.kind
+    if kind not in 'USO':
+        raise ValueError('Cannot stem an array of dtype %s.' % values.dtype)
+    if kind == 'O':
+        # Sorting Python objects is slow, hence ``numpy.unique`` is not
+        # used. ``stemWords`` finds the distinct words via a dict and
+        # keeps equal ``str`` and ``unicode`` words apart.
+        if not codes:
+            stems = numpy.empty(len(values), dtype=object)
+            stems[:] = stemmer.stemWords(values.tolist())
+            return stems
+        ids, table = stemmer.stemWords(values.tolist(), factorize=True)
+        vocabulary = numpy.empty(len(table), dtype=object)
+        vocabulary[:] = table
+        ids = numpy.frombuffer(ids, dtype=numpy.intc).astype(numpy.intp)
+        return ids, vocabulary
+    # Comparing the raw bytes is faster than comparing strings, and the
+    # order of the distinct words does not matter.
+    raw = values.view('V%d' % values.dtype.itemsize)
+    words, inverse = numpy.unique(raw, return_inverse=True)
+    words = words.view(values.dtype)
+    stems = numpy.array(stemmer.stemWords(words.tolist()), dtype=kind)
+    if not codes:
+        return stems[inverse]
+    vocabulary, stem_codes = numpy.unique(stems, return_inverse=True)
+    return stem_codes[inverse].astype(numpy.intp, copy=False), vocabulary
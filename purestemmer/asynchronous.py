@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Non-blocking stemming for event loops.
+
+Stemming a large batch of words with ``Stemmer.stemWords`` blocks the
+calling thread until all words are stemmed. An ``AsyncStemmer`` instead
+returns a future immediately and does the work in small steps that are
+run by an event loop:
+
+- Words are looked up in the stemmer's cache (and stem dictionary) on
+  the event loop, at most ``tickSize`` words per step.
+
+- Words that are not found there are collected in batches of
+  ``batchSize`` words, which are stemmed by a thread or process pool.
+
+The event loop is not hard-wired. Instead, an ``AsyncStemmer`` is given
+a ``schedule`` function which must run a callable on the event loop
+thread as soon as possible, and which must be safe to call from other
+threads. For example::
+
+    loop.call_soon_threadsafe        # asyncio or trollius
+    IOLoop.current().add_callback    # Tornado
+    reactor.callFromThread           # Twisted
+
+Results are returned as ``concurrent.futures.Future`` instances if the
+``concurrent.futures`` module is available (the ``futures`` backport on
+Python 2), so that they can be wrapped by the event loop's own futures
+(e.g. via ``asyncio.wrap_future``). Otherwise a ``Future`` class with
+the same basic interface is used.
+"""
+
+import itertools
+import multiprocessing.pool
+import threading
+
+from purestemmer.parallel import _stem_chunk
+
+
+__all__ = ['AsyncStemmer', 'Future']
+
+
+try:
+    from concurrent.futures import Future
+except ImportError:
+    class Future(object):
+        """
+        The result of an asynchronous computation.
+
+        Implements the basic interface of ``concurrent.futures.Future``.
+        """
+
+        def __init__(self):
+            self._event = threading.Event()
+            self._lock = threading.Lock()
+            self._result = None
+            self._exception = None
+            self._callbacks = []
+
+        def done(self):
+            return self._event.is_set()
+
+        def result(self, timeout=None):
+            """
+            Get the result, waiting at most ``timeout`` seconds for it.
+
+            Raises the exception of the computation if it failed.
+            """
+            exception = self.exception(timeout)
+            if exception is not None:
+                raise exception
+            return self._result
+
+        def exception(self, timeout=None):
+            """
+            Get the exception of the computation, waiting at most
+            ``timeout`` seconds for it.
+
+            Returns ``None`` if the computation succeeded.
+            """
+            if not self._event.wait(timeout):
+                raise RuntimeError('Timeout while waiting for the result.')
+            return self._exception
+
+        def add_done_callback(self, fn):
+            """
+            Call ``fn`` with the future once it is done.
+            """
+            with self._lock:
+                if not self._event.is_set():
+                    self._callbacks.append(fn)
+                    return
+            fn(self)
+
+        def set_result(self, result):
+            self._result = result
+            self._set_done()
+
+        def set_exception(self, exception):
+            self._exception = exception
+            self._set_done()
+
+        def _set_done(self):
+            with self._lock:
+                self._event.set()
+                callbacks, self._callbacks = self._callbacks, []
+            for fn in callbacks:
+                fn(self)
+
+
+def _stem_batch(task):
+    """
+    Stem a batch of words in a pool worker.
+
+    ``task`` is a tuple containing the algorithm name and a list of
+    ``unicode`` words. Returns a tuple ``(True, stems)`` or, if stemming
+    failed, ``(False, exception)``, since ``apply_async`` has no way to
+    report errors.
+    """
+    try:
+        return True, _stem_chunk(task)
+    except Exception as e:
+        return False, e
+
+
+class _Job(object):
+    """
+    A call to ``AsyncStemmer.stemWords``.
+
+    All methods except for the pool callbacks are run on the event loop.
+    """
+
+    def __init__(self, owner, words, future):
+        self.owner = owner
+        self.words = words
+        self.future = future
+        self.looked_up = 0
+        # Stems of ``unicode`` and ``str`` words that were found in the
+        # respective cache of the stemmer
+        self.stems = {}
+        self.bytes_stems = {}
+        # Stems of the other words, by their decoded text
+        self.text_stems = {}
+        # Texts of uncached words, by type of the word. Only stems from
+        # the pool are cached, each in the cache for its word's type.
+        self.unicode_texts = set()
+        self.bytes_words = {}
+        self.pending = []
+        self.queued = set()
+        self.in_flight = 0
+        self.results = []
+        self.failed = False
+
+    def run(self, step):
+        """
+        Run a step, failing the job if it raises an exception.
+        """
+        if self.failed:
+            return
+        try:
+            step()
+        except Exception as e:
+            self.fail(e)
+
+    def schedule(self, step):
+        self.owner._schedule(lambda: self.run(step))
+
+    def fail(self, exception):
+        self.failed = True
+        self.future.set_exception(exception)
+
+    def look_up(self):
+        """
+        Look up the next words in the caches and the stem dictionary.
+        """
+        owner = self.owner
+        stemmer = owner.stemmer
+        start = self.looked_up
+        chunk = self.words[start:start + owner.tickSize]
+        self.looked_up += len(chunk)
+        # As in ``Stemmer``, ``str`` words have their own cache so that
+        # cached ones need not be decoded.
+        unicode_words = [w for w in chunk if isinstance(w, unicode)]
+        bytes_words = [w for w in chunk if not isinstance(w, unicode)]
+        stems = self.stems
+        bytes_stems = self.bytes_stems
+        if unicode_words:
+            stems.update(stemmer._cache.get_many(unicode_words))
+        if bytes_words:
+            bytes_stems.update(stemmer._bytes_cache.get_many(bytes_words))
+        for word in chunk:
+            if isinstance(word, unicode):
+                if word in stems:
+                    continue
+                text = word
+                self.unicode_texts.add(text)
+            else:
+                if word in bytes_stems:
+                    continue
+                text = word.decode('utf8')
+                self.bytes_words[text] = word
+            self.resolve(text)
+        if self.looked_up < len(self.words):
+            self.schedule(self.look_up)
+            return
+        if self.pending:
+            self.submit()
+        if not self.in_flight:
+            self.schedule(self.assemble)
+
+    def resolve(self, text):
+        """
+        Find the stem of an uncached text or queue it for the pool.
+        """
+        if text in self.text_stems or text in self.queued:
+            return
+        stemmer = self.owner.stemmer
+        unchanged = stemmer._unchanged
+        if unchanged is not None and unchanged(text):
+            self.text_stems[text] = text
+            return
+        dictionary = stemmer._dictionary
+        if dictionary is not None:
+            stem = dictionary.get(text)
+            if stem is not None:
+                self.text_stems[text] = stem
+                return
+        self.queued.add(text)
+        self.pending.append(text)
+        if len(self.pending) >= self.owner.batchSize:
+            self.submit()
+
+    def submit(self):
+        """
+        Send the pending words to the pool.
+        """
+        batch, self.pending = self.pending, []
+        self.in_flight += 1
+        task = (self.owner.stemmer._algorithm, batch)
+
+        def callback(result):
+            # Called in a thread of the pool
+            self.schedule(lambda: self.batch_done(batch, result))
+
+        self.owner._pool.apply_async(_stem_batch, (task,), callback=callback)
+
+    def batch_done(self, batch, result):
+        """
+        Store the stems of a batch that was stemmed by the pool.
+        """
+        self.in_flight -= 1
+        ok, value = result
+        if not ok:
+            raise value
+        new_stems = zip(batch, value)
+        self.text_stems.update(new_stems)
+        stemmer = self.owner.stemmer
+        unicode_texts = self.unicode_texts
+        bytes_words = self.bytes_words
+        stemmer._cache.put_many([(text, stem) for text, stem in new_stems
+                                 if text in unicode_texts])
+        stemmer._bytes_cache.put_many([
+                (bytes_words[text], stem.encode('utf8'))
+                for text, stem in new_stems if text in bytes_words])
+        if not self.in_flight and self.looked_up == len(self.words):
+            self.schedule(self.assemble)
+
+    def assemble(self):
+        """
+        Put the stems in input order, converting them to the input type.
+        """
+        start = len(self.results)
+        stop = start + self.owner.tickSize
+        stems = self.stems
+        bytes_stems = self.bytes_stems
+        text_stems = self.text_stems
+        for word in self.words[start:stop]:
+            if isinstance(word, unicode):
+                stem = stems.get(word)
+                if stem is None:
+                    stem = text_stems[word]
+            else:
+                stem = bytes_stems.get(word)
+                if stem is None:
+                    stem = text_stems[word.decode('utf8')].encode('utf8')
+            self.results.append(stem)
+        if len(self.results) < len(self.words):
+            self.schedule(self.assemble)
+        else:
+            self.future.set_result(self.results)
+
+
+class AsyncStemmer(object):
+    """
+    Non-blocking front end for a ``purestemmer.Stemmer``.
+
+    See the module documentation for details. Instances can be used as
+    context managers. The pool is closed when the context is left,
+    unless it was passed in by the caller.
+
+    Statistics of the stemmer (see ``Stemmer.enableStats``) do not
+    include words stemmed via an ``AsyncStemmer``.
+    """
+
+    def __init__(self, stemmer, schedule, pool=None, batchSize=1000,
+                 tickSize=1000):
+        """
+        Initialise an asynchronous stemmer.
+
+        ``stemmer`` is a ``purestemmer.Stemmer`` instance whose cache
+        and stem dictionary are used. ``schedule`` is a thread-safe
+        function that runs a callable on the event loop.
+
+        ``pool`` is a ``multiprocessing.Pool`` or a
+        ``multiprocessing.pool.ThreadPool`` that stems the words which
+        are not in the cache, in batches of at most ``batchSize`` words.
+        By default, a thread pool with a single thread is used. A
+        process pool uses more than one CPU core but has to send the
+        words to its workers and back.
+
+        At most ``tickSize`` words are processed in a single call of a
+        callable passed to ``schedule``, so that the event loop can run
+        other callbacks in between.
+        """
+        self.stemmer = stemmer
+        self.batchSize = batchSize
+        self.tickSize = tickSize
+        self._schedule = schedule
+        self._own_pool = pool is None
+        if pool is None:
+            pool = multiprocessing.pool.ThreadPool(1)
+        self._pool = pool
+
+    def close(self):
+        """
+        Shut down the pool.
+
+        Does nothing if the pool was passed in by the caller.
+        """
+        if self._own_pool:
+            self._pool.close()
+            self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def stemWords(self, words):
+        """
+        Stem a list of words asynchronously.
+
+        ``words`` must be an iterable containing ``str`` and/or
+        ``unicode`` instances, as for ``Stemmer.stemWords``.
+
+        Returns a future whose result is the list of stems, in the same
+        order and with the same types as returned by
+        ``Stemmer.stemWords``.
+        """
+        future = Future()
+        job = _Job(self, list(words), future)
+        job.schedule(job.look_up)
+        return future
+
+    def iterStems(self, words, chunkSize=10000):
+        """
+        Stem an iterable of words asynchronously, in chunks.
+
+        ``words`` can be any iterable, for example a generator. It is
+        consumed lazily in chunks of ``chunkSize`` words.
+
+        Returns an iterator over futures, one for each chunk, whose
+        results are the lists of stems of the chunks. Each chunk is
+        only submitted when its future is requested from the iterator.
+        """
+        words = iter(words)
+        while True:
+            chunk = list(itertools.islice(words, chunkSize))
+            if not chunk:
+                return
+            yield self.stemWords(chunk)
@@ -0,0 +1,1207 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Bounded caches for word stems.
+
+All caches in this module work like a normal dict, but keep only a
+limited number of entries. Getting, storing and evicting an entry takes
+constant time. The caches are thread-safe.
+
+``CompactCache`` is an LRU cache that needs much less memory per entry
+than ``LRUCache``, at the price of slightly slower lookups.
+
+``ShardedCache`` splits a cache into independent segments to reduce
+lock contention when many threads share a cache. ``CacheView`` works
+the other way round and lets several users share the size of one cache.
+
+``AdaptiveCache`` resizes another cache based on the observed hit rate
+and bypasses it if caching does not pay off.
+
+Each cache has a ``stats`` attribute. If it is set to a
+``purestemmer.stats.StemmerStats`` instance then evictions are recorded
+there.
+"""
+
+import array
+import collections
+import itertools
+import threading
+import timeit
+
+
+__all__ = ['AdaptiveCache', 'CacheView', 'CompactCache', 'LRUCache',
+           'ShardedCache', 'TwoQueueCache', 'make_cache', 'policies']
+
+
+# Indices of the fields of a link in a doubly-linked list. Each link is
+# a list ``[prev, next, key, value]``. Every list has a root link which
+# is its own predecessor and successor if the list is empty.
+_PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
+
+def _make_root():
+    root = [None, None, None, None]
+    root[_PREV] = root[_NEXT] = root
+    return root
+
+
+def _unlink(link):
+    prev, next_ = link[_PREV], link[_NEXT]
+    prev[_NEXT] = next_
+    next_[_PREV] = prev
+
+
+def _append(root, link):
+    last = root[_PREV]
+    last[_NEXT] = root[_PREV] = link
+    link[_PREV] = last
+    link[_NEXT] = root
+
+
+class LRUCache(collections.MutableMapping):
+    """
+    Cache with limited size and least-recently-used eviction.
+
+    If the cache is full then storing a new entry discards the entry
+    which has not been used for the longest time.
+    """
+
+    def __init__(self, max_size=10000):
+        """
+        Constructor.
+
+        ``max_size`` is the maximum number of entries. Can also be set
+        via the property of the same name. A size of 0 disables the
+        cache.
+        """
+        self._links = {}
+        self._root = _make_root()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self.stats = None
+
+    def __getitem__(self, key):
+        # This is the hot path, hence the list operations are inlined
+        with self._lock:
+            link = self._links[key]
+            prev, next_ = link[_PREV], link[_NEXT]
+            prev[_NEXT] = next_
+            next_[_PREV] = prev
+            root = self._root
+            last = root[_PREV]
+            last[_NEXT] = root[_PREV] = link
+            link[_PREV] = last
+            link[_NEXT] = root
+            return link[_VALUE]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        found = {}
+        with self._lock:
+            links = self._links
+            root = self._root
+            for key in keys:
+                link = links.get(key)
+                if link is None:
+                    continue
+                _unlink(link)
+                _append(root, link)
+                found[key] = link[_VALUE]
+        return found
+
+    def __setitem__(self, key, value):
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._put(key, value)
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            for key, value in items:
+                self._put(key, value)
+
+    def _put(self, key, value):
+        """
+        Store an entry.
+
+        Must be called with the lock held.
+        """
+        links = self._links
+        try:
+            link = links[key]
+        except KeyError:
+            if len(links) >= self._max_size:
+                self._evict(len(links) - self._max_size + 1)
+            link = [None, None, key, value]
+            links[key] = link
+        else:
+            link[_VALUE] = value
+            _unlink(link)
+        _append(self._root, link)
+
+    def __delitem__(self, key):
+        with self._lock:
+            _unlink(self._links.pop(key))
+
+    def __iter__(self):
+        return iter(self._links.keys())
+
+    def __len__(self):
+        return len(self._links)
+
+    def clear(self):
+        with self._lock:
+            self._links = {}
+            self._root = _make_root()
+
+    def _evict(self, n):
+        """
+        Discard the ``n`` least recently used entries.
+
+        Must be called with the lock held.
+        """
+        stats = self.stats
+        if stats is not None:
+            start = timeit.default_timer()
+        root = self._root
+        for i in xrange(n):
+            link = root[_NEXT]
+            _unlink(link)
+            del self._links[link[_KEY]]
+        if stats is not None:
+            stats.record_evictions(n, timeit.default_timer() - start)
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = value
+        if value <= 0:
+            self.clear()
+            return
+        with self._lock:
+            excess = len(self._links) - value
+            if excess > 0:
+                self._evict(excess)
+
+
+class TwoQueueCache(collections.MutableMapping):
+    """
+    Cache with limited size and scan-resistant eviction.
+
+    This is the simplified "2Q" algorithm by Johnson and Shasha. New
+    entries are put into a FIFO queue (``A1in``). Entries which are
+    evicted from that queue are forgotten, but their keys are remembered
+    for a while (``A1out``). Only if such a key is stored again is its
+    entry promoted to the main LRU queue (``Am``). Hence a single pass
+    over many words that are only seen once cannot flush the frequently
+    used words from the cache.
+    """
+
+    def __init__(self, max_size=10000, in_ratio=0.25, out_ratio=0.5):
+        """
+        Constructor.
+
+        ``max_size`` is the maximum number of entries. Can also be set
+        via the property of the same name. A size of 0 disables the
+        cache.
+
+        ``in_ratio`` is the share of ``max_size`` that is reserved for
+        the FIFO queue of new entries and ``out_ratio`` is the number of
+        remembered keys of evicted new entries relative to ``max_size``.
+        """
+        self.in_ratio = in_ratio
+        self.out_ratio = out_ratio
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self.stats = None
+        self._reset()
+
+    def _reset(self):
+        # Maps keys to ``(link, in_main)``
+        self._links = {}
+        self._in = _make_root()
+        self._main = _make_root()
+        self._in_size = 0
+        # Remembered keys of evicted new entries, in insertion order
+        self._out = collections.OrderedDict()
+        self._set_limits()
+
+    def _set_limits(self):
+        self._in_limit = max(1, int(self.in_ratio * self._max_size))
+        self._out_limit = max(1, int(self.out_ratio * self._max_size))
+
+    def __getitem__(self, key):
+        with self._lock:
+            link, in_main = self._links[key]
+            if in_main:
+                _unlink(link)
+                _append(self._main, link)
+            return link[_VALUE]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        found = {}
+        with self._lock:
+            links = self._links
+            main = self._main
+            for key in keys:
+                try:
+                    link, in_main = links[key]
+                except KeyError:
+                    continue
+                if in_main:
+                    _unlink(link)
+                    _append(main, link)
+                found[key] = link[_VALUE]
+        return found
+
+    def __setitem__(self, key, value):
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._put(key, value)
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            for key, value in items:
+                self._put(key, value)
+
+    def _put(self, key, value):
+        """
+        Store an entry.
+
+        Must be called with the lock held.
+        """
+        try:
+            link, in_main = self._links[key]
+        except KeyError:
+            pass
+        else:
+            link[_VALUE] = value
+            return
+        # Must be checked before evicting, since that may forget the key
+        seen = self._out.pop(key, True) is None
+        if len(self._links) >= self._max_size:
+            self._evict()
+        link = [None, None, key, value]
+        if seen:
+            # Seen before, promote to main queue
+            _append(self._main, link)
+            self._links[key] = (link, True)
+        else:
+            _append(self._in, link)
+            self._in_size += 1
+            self._links[key] = (link, False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            link, in_main = self._links.pop(key)
+            _unlink(link)
+            if not in_main:
+                self._in_size -= 1
+
+    def __iter__(self):
+        return iter(self._links.keys())
+
+    def __len__(self):
+        return len(self._links)
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def _evict(self):
+        """
+        Discard a single entry.
+
+        Must be called with the lock held.
+        """
+        stats = self.stats
+        if stats is not None:
+            start = timeit.default_timer()
+        if self._in_size > self._in_limit or self._main[_NEXT] is self._main:
+            link = self._in[_NEXT]
+            self._in_size -= 1
+            out = self._out
+            out[link[_KEY]] = None
+            if len(out) > self._out_limit:
+                out.popitem(last=False)
+        else:
+            link = self._main[_NEXT]
+        _unlink(link)
+        del self._links[link[_KEY]]
+        if stats is not None:
+            stats.record_evictions(1, timeit.default_timer() - start)
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = value
+        if value <= 0:
+            self.clear()
+            return
+        with self._lock:
+            self._set_limits()
+            while len(self._links) > value:
+                self._evict()
+            while len(self._out) > self._out_limit:
+                self._out.popitem(last=False)
+
+
+class CompactCache(collections.MutableMapping):
+    """
+    Cache with limited size, least-recently-used eviction and a compact
+    memory layout.
+
+    Behaves like ``LRUCache``, but needs less memory per entry, which
+    makes a difference for caches with hundreds of thousands of
+    entries. ``LRUCache`` keeps a list of four references and the stem
+    string for each entry. Here, an entry consists of a dict item that
+    maps its key to a slot number (an ``int`` object), a reference to
+    the key in a list, 14 bytes in arrays and, only if the stem is not
+    a prefix of the key, a share of a suffix string:
+
+    - Each entry occupies a numbered slot. The recency order is a
+      doubly-linked list of slot numbers that is stored in two arrays.
+
+    - A value is stored as the length of the prefix that it shares with
+      its key plus the remaining suffix. Stems usually are a prefix of
+      their word, so the suffix is often empty or very short. Suffixes
+      are kept in a table with reference counts, hence all entries with
+      the same suffix share a single string.
+
+    For English words, ``benchmark.py memory`` measures about 110 bytes
+    per entry, compared to about 240 bytes for ``LRUCache``.
+
+    Values are rebuilt from the key on access, which makes lookups
+    slightly slower than with ``LRUCache``. Values which are not of the
+    same string type as their key are stored entirely in the suffix
+    table and must therefore be hashable.
+    """
+
+    def __init__(self, max_size=10000):
+        """
+        Constructor.
+
+        ``max_size`` is the maximum number of entries. Can also be set
+        via the property of the same name. A size of 0 disables the
+        cache.
+        """
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self.stats = None
+        self._reset()
+
+    def _reset(self):
+        # Maps keys to slots
+        self._slots = {}
+        # Per-slot data. Slot 0 is the root of the recency list.
+        self._keys = [None]
+        self._prev = array.array('i', [0])
+        self._next = array.array('i', [0])
+        self._prefixes = array.array('H', [0])
+        self._suffixes = array.array('i', [0])
+        self._free = []
+        # Suffix table. Maps ``(suffix, type)`` to the suffix's number,
+        # so that equal ``str`` and ``unicode`` suffixes are separate.
+        self._table = {}
+        self._strings = []
+        self._refs = array.array('i')
+        self._free_strings = []
+
+    def __getitem__(self, key):
+        # This is the hot path, hence the list operations are inlined
+        with self._lock:
+            slot = self._slots[key]
+            prev = self._prev
+            next_ = self._next
+            p = prev[slot]
+            n = next_[slot]
+            next_[p] = n
+            prev[n] = p
+            last = prev[0]
+            next_[last] = slot
+            prev[0] = slot
+            prev[slot] = last
+            next_[slot] = 0
+            suffix = self._strings[self._suffixes[slot]]
+            n = self._prefixes[slot]
+        if not n:
+            return suffix
+        if suffix:
+            return key[:n] + suffix
+        return key[:n]
+
+    def _value(self, key, slot):
+        """
+        Rebuild the value of an entry.
+        """
+        suffix = self._strings[self._suffixes[slot]]
+        n = self._prefixes[slot]
+        if not n:
+            return suffix
+        if suffix:
+            return key[:n] + suffix
+        return key[:n]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        found = {}
+        with self._lock:
+            slots = self._slots
+            for key in keys:
+                slot = slots.get(key)
+                if slot is None:
+                    continue
+                self._unlink(slot)
+                self._append(slot)
+                found[key] = self._value(key, slot)
+        return found
+
+    def __setitem__(self, key, value):
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._put(key, value)
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            for key, value in items:
+                self._put(key, value)
+
+    def _put(self, key, value):
+        """
+        Store an entry.
+
+        Must be called with the lock held.
+        """
+        slots = self._slots
+        slot = slots.get(key)
+        if slot is None:
+            if len(slots) >= self._max_size:
+                self._evict(len(slots) - self._max_size + 1)
+            if self._free:
+                slot = self._free.pop()
+                self._keys[slot] = key
+            else:
+                slot = len(self._keys)
+                self._keys.append(key)
+                self._prev.append(0)
+                self._next.append(0)
+                self._prefixes.append(0)
+                self._suffixes.append(0)
+            slots[key] = slot
+        else:
+            self._release(self._suffixes[slot])
+            self._unlink(slot)
+        if type(key) is type(value) and isinstance(key, basestring):
+            n = _common_prefix_length(key, value)
+        else:
+            n = 0
+        self._prefixes[slot] = n
+        self._suffixes[slot] = self._intern(value[n:] if n else value)
+        self._append(slot)
+
+    def _intern(self, string):
+        """
+        Get the number of a suffix, adding it to the table if necessary.
+        """
+        ident = (string, type(string))
+        index = self._table.get(ident)
+        if index is not None:
+            self._refs[index] += 1
+            return index
+        if self._free_strings:
+            index = self._free_strings.pop()
+            self._strings[index] = string
+            self._refs[index] = 1
+        else:
+            index = len(self._strings)
+            self._strings.append(string)
+            self._refs.append(1)
+        self._table[ident] = index
+        return index
+
+    def _release(self, index):
+        """
+        Drop a reference to a suffix.
+        """
+        refs = self._refs
+        refs[index] -= 1
+        if not refs[index]:
+            string = self._strings[index]
+            del self._table[(string, type(string))]
+            self._strings[index] = None
+            self._free_strings.append(index)
+
+    def _unlink(self, slot):
+        prev = self._prev
+        next_ = self._next
+        p = prev[slot]
+        n = next_[slot]
+        next_[p] = n
+        prev[n] = p
+
+    def _append(self, slot):
+        prev = self._prev
+        last = prev[0]
+        self._next[last] = slot
+        prev[0] = slot
+        prev[slot] = last
+        self._next[slot] = 0
+
+    def _remove(self, slot):
+        """
+        Remove the entry in a slot.
+
+        Must be called with the lock held.
+        """
+        self._unlink(slot)
+        self._release(self._suffixes[slot])
+        del self._slots[self._keys[slot]]
+        self._keys[slot] = None
+        self._free.append(slot)
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(self._slots[key])
+
+    def __iter__(self):
+        return iter(self._slots.keys())
+
+    def __len__(self):
+        return len(self._slots)
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def _evict(self, n):
+        """
+        Discard the ``n`` least recently used entries.
+
+        Must be called with the lock held.
+        """
+        stats = self.stats
+        if stats is not None:
+            start = timeit.default_timer()
+        next_ = self._next
+        for i in xrange(n):
+            self._remove(next_[0])
+        if stats is not None:
+            stats.record_evictions(n, timeit.default_timer() - start)
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = value
+        if value <= 0:
+            self.clear()
+            return
+        with self._lock:
+            excess = len(self._slots) - value
+            if excess > 0:
+                self._evict(excess)
+
+
+# Largest value of an unsigned short
+_MAX_PREFIX = 0xFFFF
+
+
+def _common_prefix_length(a, b):
+    """
+    Get the length of the common prefix of two strings.
+
+    The result is limited to what fits into ``CompactCache``'s prefix
+    array.
+    """
+    if a.startswith(b):
+        n = len(b)
+    else:
+        n = 0
+        for x, y in itertools.izip(a, b):
+            if x != y:
+                break
+            n += 1
+    return min(n, _MAX_PREFIX)
+
+
+class ShardedCache(collections.MutableMapping):
+    """
+    Cache that is split into independent shards.
+
+    Each key is assigned to one of several caches (the shards) based on
+    its hash. Each shard has its own lock and evicts its own entries,
+    so threads that access different shards do not block each other and
+    an eviction in one shard does not affect the others. The eviction
+    policy is applied per shard, i.e. for LRU the least recently used
+    entry of the key's shard is discarded. For keys with well-spread
+    hashes this approximates the policy of a single cache.
+    """
+
+    def __init__(self, factory, max_size=10000, shards=16):
+        """
+        Constructor.
+
+        ``factory`` is a callable that creates a shard when given its
+        maximum size, for example ``LRUCache``. ``max_size`` is the
+        maximum total number of entries and is split evenly among the
+        ``shards`` shards. It can also be set via the property of the
+        same name. A size of 0 disables the cache. Otherwise the size
+        must be at least the number of shards, since a shard of size 0
+        would never cache the keys assigned to it.
+        """
+        if shards < 1:
+            raise ValueError('The number of shards must be positive.')
+        self._shards = [factory(size) for size in
+                        _split_size(max_size, shards)]
+        self._max_size = max_size
+
+    def _shard(self, key):
+        shards = self._shards
+        return shards[hash(key) % len(shards)]
+
+    def __getitem__(self, key):
+        shards = self._shards
+        return shards[hash(key) % len(shards)][key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _group(self, keys, key_func=None):
+        """
+        Group keys (or items) by shard.
+
+        Returns a list which contains a list of the keys for each shard.
+        """
+        shards = self._shards
+        n = len(shards)
+        groups = [[] for shard in shards]
+        for key in keys:
+            k = key if key_func is None else key_func(key)
+            groups[hash(k) % n].append(key)
+        return groups
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        found = {}
+        for shard, group in zip(self._shards, self._group(keys)):
+            if group:
+                found.update(shard.get_many(group))
+        return found
+
+    def __setitem__(self, key, value):
+        self._shard(key)[key] = value
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        groups = self._group(items, lambda item: item[0])
+        for shard, group in zip(self._shards, groups):
+            if group:
+                shard.put_many(group)
+
+    def __delitem__(self, key):
+        del self._shard(key)[key]
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._shards)
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def clear(self):
+        for shard in self._shards:
+            shard.clear()
+
+    @property
+    def stats(self):
+        return self._shards[0].stats
+
+    @stats.setter
+    def stats(self, value):
+        for shard in self._shards:
+            shard.stats = value
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        sizes = _split_size(value, len(self._shards))
+        self._max_size = value
+        for shard, size in zip(self._shards, sizes):
+            shard.max_size = size
+
+
+class CacheView(collections.MutableMapping):
+    """
+    Part of a cache that is shared with other views.
+
+    A view stores its entries in an underlying cache, using the key
+    ``(namespace, key)`` for the entry ``key``. Views with different
+    namespaces on the same cache hence have separate entries but share
+    the cache's size and eviction policy, so that a busy view gets more
+    of the cache than an idle one.
+
+    ``stats`` and ``max_size`` are those of the underlying cache, so
+    they describe all views together, and setting ``max_size`` resizes
+    the underlying cache. A view does not know which of its entries the
+    underlying cache evicts, so ``len()``, iteration and ``clear`` scan
+    all entries of the underlying cache and take time proportional to
+    its size, not to the size of the view.
+    """
+
+    def __init__(self, cache, namespace):
+        """
+        Constructor.
+
+        ``cache`` is the underlying cache and ``namespace`` is a
+        hashable value that no other view of the cache uses.
+        """
+        self._cache = cache
+        self._namespace = namespace
+
+    def __getitem__(self, key):
+        return self._cache[(self._namespace, key)]
+
+    def get(self, key, default=None):
+        return self._cache.get((self._namespace, key), default)
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        namespace = self._namespace
+        found = self._cache.get_many([(namespace, key) for key in keys])
+        return dict((key[1], value) for key, value in found.iteritems())
+
+    def __setitem__(self, key, value):
+        self._cache[(self._namespace, key)] = value
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        namespace = self._namespace
+        self._cache.put_many([((namespace, key), value)
+                              for key, value in items])
+
+    def __delitem__(self, key):
+        del self._cache[(self._namespace, key)]
+
+    def __iter__(self):
+        namespace = self._namespace
+        return (key[1] for key in list(self._cache) if key[0] == namespace)
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def clear(self):
+        for key in list(self):
+            self._cache.pop((self._namespace, key), None)
+
+    @property
+    def stats(self):
+        return self._cache.stats
+
+    @stats.setter
+    def stats(self, value):
+        self._cache.stats = value
+
+    @property
+    def max_size(self):
+        return self._cache.max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._cache.max_size = value
+
+
+# Thresholds of ``AdaptiveCache``. Below ``_BYPASS_HIT_RATE`` storing
+# and evicting entries costs more than the hits save (a miss costs about
+# a twentieth of stemming an English word). A cache is doubled if that
+# gains at least ``_GROW_GAIN`` hits per lookup and halved if that loses
+# less than ``_SHRINK_LOSS``.
+_BYPASS_HIT_RATE = 0.05
+_GROW_GAIN = 0.01
+_SHRINK_LOSS = 0.002
+
+# Keys are sampled based on the higher bits of their hash (shifted by
+# this amount), so that sampling is independent of the shard selection
+# of ``ShardedCache``.
+_SAMPLE_SHIFT = 12
+
+
+class AdaptiveCache(collections.MutableMapping):
+    """
+    Cache that adapts its size to the observed hit rate.
+
+    ``AdaptiveCache`` wraps a cache of another policy. Besides that
+    cache, it simulates three miniature caches of the same policy which
+    only see a sample of the keys: one of half, one of the same and one
+    of twice the current size, scaled down by the sampling rate. Keys
+    are sampled by their hash, so a sampled key is always sampled and
+    the hit rates of the miniature caches approximate those of caches
+    of the corresponding size that see all keys. After every ``window``
+    sampled lookups the hit rates are compared:
+
+    * If even the larger cache hits in less than 5% of the lookups then
+      the cache is bypassed: new entries are not stored, so that no
+      time is spent on storing and evicting entries that are never
+      used again. Lookups still work, so the entries that are already
+      cached continue to be used. The miniature caches continue to be
+      updated, and the cache is used again once the hit rate reaches
+      twice that value.
+
+    * If the larger cache hits in at least 1% more of the lookups than
+      the current one then the cache is doubled, up to ``max_size``.
+
+    * If the smaller cache hits in less than 0.2% fewer of the lookups
+      and halving the cache would discard entries then it is halved,
+      down to ``min_size``.
+
+    The cache starts with its maximum size. ``stats`` is that of the
+    wrapped cache.
+    """
+
+    def __init__(self, factory, max_size=10000, min_size=None, window=1024,
+                 sample_rate=32):
+        """
+        Constructor.
+
+        ``factory`` is a callable that creates a cache when given its
+        maximum size, for example ``LRUCache``. It is used for the
+        wrapped cache and for the miniature caches.
+
+        ``max_size`` and ``min_size`` are the bounds of the cache size.
+        ``min_size`` defaults to a sixteenth of ``max_size``. A maximum
+        size of 0 disables the cache.
+
+        ``window`` is the number of sampled lookups between adaptations
+        and ``1 / sample_rate`` is the share of the keys that is sampled.
+        """
+        max_size = max(0, max_size)
+        if min_size is None:
+            min_size = max(1, max_size // 16)
+        if max_size > 0 and not 1 <= min_size <= max_size:
+            raise ValueError('The minimum cache size must be between 1 ' +
+                             'and the maximum cache size.')
+        self.window = window
+        self._sample_rate = sample_rate
+        self._max_size = max_size
+        self._min_size = min(min_size, max_size)
+        self._size = max_size
+        self._cache = factory(max_size)
+        self._models = [factory(0) for i in xrange(3)]
+        self._bypassed = False
+        self._lookups = 0
+        self._hits = [0, 0, 0]
+        self._lock = threading.Lock()
+        self._set_size(max_size)
+
+    def __getitem__(self, key):
+        if not (hash(key) >> _SAMPLE_SHIFT) % self._sample_rate:
+            self._sample_key(key)
+        return self._cache[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_many(self, keys):
+        """
+        Get the values for several keys at once.
+
+        Returns a dict that contains the keys that were found.
+        """
+        keys = list(keys)
+        rate = self._sample_rate
+        sampled = [key for key in keys
+                   if not (hash(key) >> _SAMPLE_SHIFT) % rate]
+        if sampled:
+            self._sample(sampled)
+        return self._cache.get_many(keys)
+
+    def _sample(self, keys):
+        """
+        Look up sampled keys in the miniature caches.
+
+        Missing keys are stored there, as they would be in the real
+        cache.
+        """
+        with self._lock:
+            hits = self._hits
+            for i, model in enumerate(self._models):
+                found = model.get_many(keys)
+                hits[i] += len(found)
+                if len(found) < len(keys):
+                    model.put_many([(key, True) for key in keys
+                                    if key not in found])
+            self._lookups += len(keys)
+            if self._lookups >= self.window:
+                self._adapt()
+
+    def _sample_key(self, key):
+        """
+        Version of ``_sample`` for a single key.
+        """
+        with self._lock:
+            hits = self._hits
+            for i, model in enumerate(self._models):
+                if model.get(key):
+                    hits[i] += 1
+                else:
+                    model[key] = True
+            self._lookups += 1
+            if self._lookups >= self.window:
+                self._adapt()
+
+    def _adapt(self):
+        """
+        Adapt the cache to the hit rates of the last window.
+
+        Must be called with the lock held.
+        """
+        lookups = float(self._lookups)
+        smaller, same, larger = [hits / lookups for hits in self._hits]
+        self._lookups = 0
+        self._hits = [0, 0, 0]
+        size = self._size
+        if self._bypassed:
+            if larger >= 2 * _BYPASS_HIT_RATE:
+                self._bypassed = False
+        elif larger < _BYPASS_HIT_RATE:
+            self._bypassed = True
+        elif larger - same >= _GROW_GAIN and size < self._max_size:
+            # The miniature caches keep their contents when they take
+            # over the role of a neighbouring size.
+            smaller, same, larger = self._models
+            self._models = [same, larger, smaller]
+            self._set_size(min(2 * size, self._max_size))
+        elif (same - smaller < _SHRINK_LOSS and size > self._min_size and
+              len(self._cache) > size // 2):
+            smaller, same, larger = self._models
+            self._models = [larger, smaller, same]
+            self._set_size(max(size // 2, self._min_size))
+
+    def _set_size(self, size):
+        """
+        Set the size of the cache and of the miniature caches.
+        """
+        self._size = size
+        self._cache.max_size = size
+        sizes = [max(size // 2, self._min_size), size,
+                 min(2 * size, self._max_size)]
+        rate = self._sample_rate
+        for model, model_size in zip(self._models, sizes):
+            model.max_size = (model_size + rate - 1) // rate
+
+    def __setitem__(self, key, value):
+        if not self._bypassed:
+            self._cache[key] = value
+
+    def put_many(self, items):
+        """
+        Store several ``(key, value)`` pairs at once.
+        """
+        if not self._bypassed:
+            self._cache.put_many(items)
+
+    def __delitem__(self, key):
+        del self._cache[key]
+
+    def __iter__(self):
+        return iter(self._cache)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    @property
+    def bypassed(self):
+        """
+        Whether the cache is currently bypassed.
+        """
+        return self._bypassed
+
+    @property
+    def size(self):
+        """
+        The current maximum number of entries.
+        """
+        return self._size
+
+    @property
+    def min_size(self):
+        return self._min_size
+
+    @property
+    def stats(self):
+        return self._cache.stats
+
+    @stats.setter
+    def stats(self, value):
+        self._cache.stats = value
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        with self._lock:
+            self._max_size = max(0, value)
+            self._min_size = min(self._min_size, self._max_size)
+            self._set_size(min(self._size, self._max_size))
+
+
+def _split_size(max_size, n):
+    """
+    Split a maximum cache size into ``n`` almost equal parts.
+
+    Raises ``ValueError`` if some but not all of the parts would be 0.
+    """
+    max_size = max(0, max_size)
+    if 0 < max_size < n:
+        raise ValueError(('A cache with %d shards needs a maximum size of '
+                          + 'at least %d or 0, not %d.') % (n, n, max_size))
+    return [max_size // n + (1 if i < max_size % n else 0)
+            for i in xrange(n)]
+
+
+_POLICIES = {
+    'lru': LRUCache,
+    '2q': TwoQueueCache,
+    'compact': CompactCache,
+}
+
+
+def policies():
+    """
+    Get a list of the names of the available cache policies.
+    """
+    return sorted(_POLICIES.keys())
+
+
+def make_cache(policy='lru', max_size=10000, shards=1, min_size=None):
+    """
+    Create a cache.
+
+    ``policy`` is the name of the eviction policy (see ``policies``)
+    and ``max_size`` is the maximum number of entries. If ``shards`` is
+    greater than 1 then a ``ShardedCache`` with that many shards is
+    created, each of which uses the given policy.
+
+    If ``min_size`` is given then the cache is an ``AdaptiveCache``
+    whose size varies between ``min_size`` and ``max_size``. Each shard
+    of a sharded cache adapts independently and gets its share of the
+    minimum size.
+    """
+    try:
+        cls = _POLICIES[policy]
+    except KeyError:
+        raise ValueError("Unknown cache policy '%s'" % policy)
+    if min_size is not None:
+        if shards > 1:
+            total = max(1, max_size)
+            return ShardedCache(
+                    lambda size: AdaptiveCache(
+                        cls, size, max(1, min_size * size // total)),
+                    max_size, shards)
+        return AdaptiveCache(cls, max_size, min_size)
+    if shards > 1:
+        return ShardedCache(cls, max_size, shards)
+    return cls(max_size)
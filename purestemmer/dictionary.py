@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent stem dictionaries.
+
+A stem dictionary is a file that maps words to their stems. It is
+opened read-only via ``mmap``, so any number of processes can share a
+single copy of it in memory. A ``purestemmer.Stemmer`` can use a stem
+dictionary as a lookup table before it falls back to the stemming
+algorithm::
+
+    purestemmer.dictionary.build('english.dict', 'english', words)
+    stemmer = purestemmer.Stemmer('english', dictionary='english.dict')
+
+Each dictionary records the name of its algorithm and the version of
+purestemmer that created it. A ``Stemmer`` refuses to use a dictionary
+for which these do not match.
+
+The file consists of a header, an open-addressing hash table of record
+offsets (hashed via CRC-32) and the records themselves. Each record
+contains the UTF-8 encoded word and stem.
+"""
+
+import collections
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+import purestemmer
+
+
+__all__ = ['build', 'save', 'save_stemmer', 'StemDictionary']
+
+_MAGIC = 'PURESTEM'
+_FORMAT_VERSION = 1
+
+# Magic, format version, metadata length, number of slots, number of
+# entries
+_HEADER = struct.Struct('<8sIIII')
+
+# Record offset
+_SLOT = struct.Struct('<I')
+
+# Lengths of the UTF-8 encoded word and stem
+_RECORD = struct.Struct('<HH')
+
+_MAX_LENGTH = 0xffff
+
+
+def _num_slots(num_entries):
+    """
+    Number of hash table slots for a number of entries.
+
+    The result is a power of two so that the hash can be masked, and
+    the table is at most half full.
+    """
+    slots = 1
+    while slots < 2 * num_entries:
+        slots *= 2
+    return slots
+
+
+def save(filename, algorithm, mapping):
+    """
+    Save a mapping from words to stems as a stem dictionary.
+
+    ``algorithm`` is the name or an alias of the stemming algorithm
+    that produced the stems in ``mapping``. Words and stems must be
+    ``unicode`` instances. Words whose UTF-8 encoding is longer than
+    65535 bytes are skipped.
+
+    The file is replaced atomically, so processes that have the old
+    file open are not affected.
+    """
+    algorithm = purestemmer._resolve_algorithm(algorithm)
+    metadata = u'%s\0%s' % (algorithm, purestemmer.__version__)
+    metadata = metadata.encode('utf8')
+    records = []
+    for word, stem in mapping.iteritems():
+        word = word.encode('utf8')
+        stem = stem.encode('utf8')
+        if len(word) > _MAX_LENGTH or len(stem) > _MAX_LENGTH:
+            continue
+        records.append((word, stem))
+    num_slots = _num_slots(len(records))
+    mask = num_slots - 1
+    table_start = _HEADER.size + len(metadata)
+    offset = table_start + num_slots * _SLOT.size
+    slots = [0] * num_slots
+    data = []
+    for word, stem in records:
+        index = zlib.crc32(word) & mask
+        while slots[index]:
+            index = (index + 1) & mask
+        slots[index] = offset
+        data.append(_RECORD.pack(len(word), len(stem)))
+        data.append(word)
+        data.append(stem)
+        offset += _RECORD.size + len(word) + len(stem)
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_filename = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(metadata),
+                                 num_slots, len(records)))
+            f.write(metadata)
+            f.write(struct.pack('<%dI' % num_slots, *slots))
+            f.write(''.join(data))
+        # ``mkstemp`` creates files that only the owner can read
+        os.chmod(temp_filename, 0o644)
+        os.rename(temp_filename, filename)
+    except:
+        os.remove(temp_filename)
+        raise
+
+
+def save_stemmer(filename, stemmer):
+    """
+    Save the words cached by a stemmer as a stem dictionary.
+
+    ``stemmer`` is a ``purestemmer.Stemmer`` instance. The words from
+    its caches for ``unicode`` and for ``str`` words are combined.
+    """
+    mapping = dict((word.decode('utf8'), stem.decode('utf8'))
+                   for word, stem in stemmer._bytes_cache.items())
+    mapping.update(stemmer._cache.items())
+    save(filename, stemmer._algorithm, mapping)
+
+
+def build(filename, algorithm, words):
+    """
+    Stem a list of words and save the result as a stem dictionary.
+
+    ``algorithm`` is the name or an alias of a stemming algorithm and
+    ``words`` is an iterable of ``unicode`` instances.
+    """
+    stemmer = purestemmer.Stemmer(algorithm, maxCacheSize=0)
+    mapping = {}
+    for word in words:
+        if word not in mapping:
+            mapping[word] = stemmer.stemWord(word)
+    save(filename, algorithm, mapping)
+
+
+class StemDictionary(collections.Mapping):
+    """
+    A read-only, memory-mapped stem dictionary.
+
+    Works like a read-only dict that maps ``unicode`` words to their
+    ``unicode`` stems. Instances can be used as context managers, in
+    which case the file is closed when the context is left.
+    """
+
+    def __init__(self, filename):
+        """
+        Constructor.
+
+        ``filename`` is the name of a file created by ``save``.
+
+        Raises ``ValueError`` if the file is not a stem dictionary.
+        """
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, format_version, metadata_length, num_slots,
+                    self._len) = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = None
+        if magic != _MAGIC or format_version != _FORMAT_VERSION:
+            self.close()
+            raise ValueError("'%s' is not a stem dictionary" % filename)
+        metadata = self._mmap[_HEADER.size:_HEADER.size + metadata_length]
+        self.algorithm, self.version = metadata.decode('utf8').split(u'\0')
+        self._table_start = _HEADER.size + metadata_length
+        self._mask = num_slots - 1
+        self._data_start = self._table_start + num_slots * _SLOT.size
+
+    def close(self):
+        """
+        Close the underlying file.
+        """
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def is_current(self, algorithm):
+        """
+        Check if this dictionary can be used for an algorithm.
+
+        This is the case if the dictionary was created for the algorithm
+        ``algorithm`` (a name or an alias) using the installed version
+        of purestemmer.
+        """
+        return (self.algorithm == purestemmer._resolve_algorithm(algorithm)
+                and self.version == purestemmer.__version__)
+
+    def __getitem__(self, word):
+        stem = self.get(word)
+        if stem is None:
+            raise KeyError(word)
+        return stem
+
+    def get(self, word, default=None):
+        key = word.encode('utf8')
+        key_length = len(key)
+        data = self._mmap
+        table_start = self._table_start
+        mask = self._mask
+        index = zlib.crc32(key) & mask
+        while True:
+            offset = _SLOT.unpack_from(data, table_start + 4 * index)[0]
+            if not offset:
+                return default
+            word_length, stem_length = _RECORD.unpack_from(data, offset)
+            if word_length == key_length:
+                start = offset + _RECORD.size
+                stop = start + word_length
+                if data[start:stop] == key:
+                    return data[stop:stop + stem_length].decode('utf8')
+            index = (index + 1) & mask
+
+    def iteritems(self):
+        data = self._mmap
+        offset = self._data_start
+        for i in xrange(self._len):
+            word_length, stem_length = _RECORD.unpack_from(data, offset)
+            start = offset + _RECORD.size
+            stop = start + word_length
+            offset = stop + stem_length
+            yield (data[start:stop].decode('utf8'),
+                   data[stop:offset].decode('utf8'))
+
+    def __iter__(self):
+        return (word for word, stem in self.iteritems())
+
+    def __len__(self):
+        return self._len
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Stemming of words and texts in several languages.
+
+A ``MultilingualStemmer`` stems words that are tagged with their
+language::
+
+    stemmer = purestemmer.multilingual.MultilingualStemmer()
+    stemmer.stemWords([('en', u'cats'), ('de', u'katzen')])
+
+Languages are given as algorithm names or as the ISO 639 codes and
+other aliases that ``purestemmer.Stemmer`` accepts. The work of a
+batch is grouped by algorithm, so that each algorithm stems its words
+in a single deduplicated batch via ``Stemmer.stemWords``.
+"""
+
+import itertools
+
+import purestemmer
+from purestemmer.cache import CacheView, make_cache, policies
+
+
+__all__ = ['MultilingualStemmer']
+
+
+class MultilingualStemmer(object):
+    """
+    Stems words and texts of several languages.
+
+    A ``purestemmer.Stemmer`` is created for each algorithm when it is
+    first used. By default each of these has its own cache of
+    ``maxCacheSize`` words with the eviction policy ``cachePolicy``.
+    ``cacheSizes`` can map algorithm names or aliases to different cache
+    sizes, for example to give the main language of the input a larger
+    cache.
+
+    If ``sharedCache`` is true then all algorithms share a single cache
+    of ``maxCacheSize`` words instead, so that the cache budget goes to
+    the languages that are currently busy. ``cacheSizes`` cannot be
+    used in that case. The stemmers returned by ``getStemmer`` then
+    share more than the cache: their ``maxCacheSize`` is that of the
+    shared cache and setting it resizes the cache of all languages, and
+    the cache evictions in their statistics are those of all languages
+    (they are recorded by whichever stemmer enabled statistics last).
+    Only the lookups in the statistics are per language. Counting the
+    entries of one language scans the whole shared cache.
+    """
+
+    def __init__(self, maxCacheSize=10000, cachePolicy='lru',
+                 sharedCache=False, cacheSizes=None):
+        """
+        Initialise a multilingual stemmer.
+
+        See the class documentation for details.
+        """
+        if sharedCache and cacheSizes:
+            raise ValueError('Cache sizes cannot be set for a shared cache.')
+        if cachePolicy not in policies():
+            raise ValueError("Unknown cache policy '%s'" % cachePolicy)
+        self._max_cache_size = maxCacheSize
+        self._cache_policy = cachePolicy
+        self._cache_sizes = dict(
+                (purestemmer._resolve_algorithm(language), size)
+                for language, size in (cacheSizes or {}).iteritems())
+        self._shared_cache = None
+        if sharedCache:
+            self._shared_cache = make_cache(cachePolicy, maxCacheSize)
+        # Stemmers by algorithm name and by the language codes that have
+        # been used so far
+        self._stemmers = {}
+        self._languages = {}
+
+    def getStemmer(self, language):
+        """
+        Get the ``purestemmer.Stemmer`` that is used for a language.
+
+        ``language`` is an algorithm name or alias. Raises ``KeyError``
+        if no algorithm is known for it.
+        """
+        try:
+            return self._languages[language]
+        except KeyError:
+            pass
+        algorithm = purestemmer._resolve_algorithm(language)
+        stemmer = self._stemmers.get(algorithm)
+        if stemmer is None:
+            shared = self._shared_cache
+            if shared is None:
+                size = self._cache_sizes.get(algorithm, self._max_cache_size)
+                stemmer = purestemmer.Stemmer(algorithm, size,
+                                              self._cache_policy)
+            else:
+                stemmer = purestemmer.Stemmer(algorithm, 0)
+                stemmer._cache = CacheView(shared, algorithm)
+                stemmer._bytes_cache = CacheView(shared, algorithm + '/str')
+            self._stemmers[algorithm] = stemmer
+        self._languages[language] = stemmer
+        return stemmer
+
+    def stemWord(self, language, word):
+        """
+        Stem a single word.
+
+        ``language`` is an algorithm name or alias. See
+        ``purestemmer.Stemmer.stemWord`` for details.
+        """
+        return self.getStemmer(language).stemWord(word)
+
+    def stemWords(self, pairs):
+        """
+        Stem a list of words in several languages.
+
+        ``pairs`` is an iterable of ``(language, word)`` tuples, where
+        ``language`` is an algorithm name or alias and ``word`` is a
+        ``str`` or ``unicode`` instance.
+
+        Returns a list of the stems in the same order.
+        """
+        languages = self._languages
+        groups = {}
+        count = 0
+        for index, (language, word) in enumerate(pairs):
+            stemmer = languages.get(language)
+            if stemmer is None:
+                stemmer = self.getStemmer(language)
+            group = groups.get(stemmer)
+            if group is None:
+                group = groups[stemmer] = ([], [])
+            group[0].append(index)
+            group[1].append(word)
+            count = index + 1
+        results = [None] * count
+        for stemmer, (indices, words) in groups.iteritems():
+            for index, stem in itertools.izip(indices,
+                                              stemmer.stemWords(words)):
+                results[index] = stem
+        return results
+
+    def stemDocuments(self, documents, counts=False, chunkSize=100):
+        """
+        Tokenize and stem texts in several languages.
+
+        ``documents`` is an iterable of ``(language, text)`` tuples,
+        where ``language`` is an algorithm name or alias and ``text`` is
+        a ``str`` or ``unicode`` instance. The documents are consumed in
+        chunks of ``chunkSize`` documents, and the documents of each
+        language in a chunk are stemmed together via
+        ``purestemmer.Stemmer.stemDocuments``.
+
+        Returns an iterator over the result for each document, see
+        ``purestemmer.Stemmer.stemText``.
+        """
+        documents = iter(documents)
+        while True:
+            chunk = list(itertools.islice(documents, chunkSize))
+            if not chunk:
+                return
+            groups = {}
+            for index, (language, text) in enumerate(chunk):
+                stemmer = self.getStemmer(language)
+                group = groups.get(stemmer)
+                if group is None:
+                    group = groups[stemmer] = ([], [])
+                group[0].append(index)
+                group[1].append(text)
+            results = [None] * len(chunk)
+            for stemmer, (indices, texts) in groups.iteritems():
+                stemmed = stemmer.stemDocuments(texts, counts, len(texts))
+                for index, result in itertools.izip(indices, stemmed):
+                    results[index] = result
+            for result in results:
+                yield result
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Parallel stemming using multiple processes.
+
+Since the stemming algorithms are implemented in pure Python, a single
+``purestemmer.Stemmer`` can only use one CPU core. A
+``ParallelStemmer`` distributes the work over a pool of worker
+processes instead::
+
+    with purestemmer.parallel.ParallelStemmer('english') as stemmer:
+        stems = stemmer.stemWords(words)
+"""
+
+import itertools
+import multiprocessing
+
+import purestemmer
+
+
+__all__ = ['ParallelStemmer']
+
+
+def _stem_chunk(task):
+    """
+    Stem a chunk of words in a worker process.
+
+    ``task`` is a tuple containing the algorithm name and a list of
+    ``unicode`` words. Returns the list of stems.
+    """
+    algorithm, words = task
+    stem = purestemmer._load_algorithm(algorithm).stem
+    return [stem(word) for word in words]
+
+
+class ParallelStemmer(purestemmer.Stemmer):
+    """
+    A stemmer that uses a pool of worker processes.
+
+    ``ParallelStemmer`` has the same API as ``purestemmer.Stemmer``.
+    The parent process keeps the cache (and the stem dictionary, if
+    any). Words that are found there are not sent to the workers.
+    The remaining distinct words are split into chunks which are
+    stemmed by the workers. Results are always returned in input order.
+
+    Inputs with fewer uncached words than the chunk size, as well as
+    single words passed to ``stemWord``, are stemmed in the parent
+    process, since that is cheaper than a round trip to a worker.
+
+    Instances can be used as context managers. The pool is closed when
+    the context is left, unless it was passed in by the caller.
+    """
+
+    def __init__(self, algorithm, maxCacheSize=10000, cachePolicy='lru',
+                 dictionary=None, processes=None, chunkSize=1000, pool=None,
+                 cacheShards=1, minCacheSize=None):
+        """
+        Initialise a parallel stemmer.
+
+        The first four arguments, ``cacheShards`` and ``minCacheSize``
+        are the same as for ``purestemmer.Stemmer``.
+
+        ``processes`` is the number of worker processes and defaults to
+        the number of CPU cores. ``chunkSize`` is the maximum number of
+        words per task sent to a worker.
+
+        ``pool`` can be an existing ``multiprocessing.Pool`` instance,
+        which is useful for long-running services that use the same
+        pool for many stemmers (even for different algorithms). In that
+        case ``processes`` is ignored and the pool is not closed by
+        ``close``.
+        """
+        super(ParallelStemmer, self).__init__(algorithm, maxCacheSize,
+                                              cachePolicy, dictionary,
+                                              cacheShards, minCacheSize)
+        self.chunkSize = chunkSize
+        self._own_pool = pool is None
+        if pool is None:
+            pool = multiprocessing.Pool(processes)
+        self._pool = pool
+        self._processes = (getattr(pool, '_processes', None) or
+                           multiprocessing.cpu_count())
+
+    def close(self):
+        """
+        Shut down the worker processes.
+
+        Does nothing if the pool was passed in by the caller.
+        """
+        if self._own_pool:
+            self._pool.close()
+            self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _stem_missing(self, words):
+        size = self.chunkSize
+        if len(words) < size:
+            return super(ParallelStemmer, self)._stem_missing(words)
+        chunks = [words[i:i + size] for i in xrange(0, len(words), size)]
+        tasks = [(self._algorithm, chunk) for chunk in chunks]
+        stems = {}
+        for chunk, chunk_stems in itertools.izip(
+                chunks, self._pool.imap(_stem_chunk, tasks)):
+            stems.update(itertools.izip(chunk, chunk_stems))
+        return stems
+
+    def iterStems(self, words, chunkSize=None):
+        """
+        Stem an iterable of words lazily.
+
+        See ``purestemmer.Stemmer.iterStems``. By default, the words are
+        consumed in chunks that are large enough to keep all worker
+        processes busy.
+        """
+        if chunkSize is None:
+            chunkSize = 4 * self._processes * self.chunkSize
+        return super(ParallelStemmer, self).iterStems(words, chunkSize)
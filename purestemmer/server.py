@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Stemming daemon that is shared by several processes.
+
+Each process that uses a ``purestemmer.Stemmer`` imports the algorithm
+modules and fills its own cache. If many small worker processes stem
+words then a ``StemmerServer`` can do that for all of them: it listens
+on a Unix socket, keeps one warm stemmer per algorithm with a large
+cache and stems the uncached words of large batches in a pool of
+worker processes. The server is started via::
+
+    python -m purestemmer.server --socket /tmp/purestemmer.sock
+
+The processes then use a ``StemmerClient``, which has the same
+``stemWord`` and ``stemWords`` methods as ``purestemmer.Stemmer``::
+
+    stemmer = purestemmer.server.StemmerClient('english',
+                                               '/tmp/purestemmer.sock')
+    stems = stemmer.stemWords(words)
+
+Each call is one round trip to the server, hence ``stemWords`` with
+many words at once is much more efficient than ``stemWord``.
+
+The protocol is simple: each message is a 4-byte big-endian unsigned
+length followed by that many bytes of JSON. A request is a list
+``[algorithm, words]``, the response is either ``[true, stems]`` or
+``[false, error_type, message]``. A connection can be used for any
+number of requests.
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import SocketServer
+import stat
+import struct
+import sys
+import tempfile
+import threading
+
+import purestemmer
+from purestemmer.cache import policies
+from purestemmer.parallel import ParallelStemmer
+
+
+__all__ = ['DEFAULT_PATH', 'StemmerClient', 'StemmerServer']
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'purestemmer.sock')
+
+_LENGTH = struct.Struct('!I')
+
+# Largest accepted message, in bytes
+_MAX_MESSAGE_SIZE = 1 << 28
+
+# Exceptions that are passed from the server to the client
+_ERRORS = {
+    'KeyError': KeyError,
+    'ValueError': ValueError,
+}
+
+
+def _send_message(sock, obj):
+    """
+    Send a JSON-serializable object as a message.
+    """
+    data = json.dumps(obj, separators=(',', ':'))
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exactly(sock, size):
+    """
+    Receive exactly ``size`` bytes.
+
+    Returns ``None`` if the connection is closed before the first byte
+    has been received. Raises ``EOFError`` if it is closed later.
+    """
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            if remaining == size:
+                return None
+            raise EOFError('Connection closed in the middle of a message.')
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return ''.join(chunks)
+
+
+def _recv_message(sock):
+    """
+    Receive a message.
+
+    Returns the decoded JSON object, or ``None`` if the connection has
+    been closed.
+    """
+    header = _recv_exactly(sock, _LENGTH.size)
+    if header is None:
+        return None
+    size = _LENGTH.unpack(header)[0]
+    if size > _MAX_MESSAGE_SIZE:
+        raise ValueError('Message of %d bytes is too large.' % size)
+    data = _recv_exactly(sock, size) if size else ''
+    if data is None:
+        raise EOFError('Connection closed in the middle of a message.')
+    return json.loads(data)
+
+
+class _Handler(SocketServer.BaseRequestHandler):
+    """
+    Answers the requests of one client connection.
+    """
+
+    def handle(self):
+        while True:
+            try:
+                request = _recv_message(self.request)
+            except (EOFError, ValueError, socket.error):
+                return
+            if request is None:
+                return
+            try:
+                algorithm, words = request
+                stems = self.server.stemmers.get(algorithm).stemWords(words)
+                response = [True, stems]
+            except Exception as e:
+                # The message of a ``KeyError`` is its only argument
+                message = e.args[0] if len(e.args) == 1 else str(e)
+                if not isinstance(message, basestring):
+                    message = repr(message)
+                response = [False, type(e).__name__, message]
+            try:
+                _send_message(self.request, response)
+            except socket.error:
+                return
+
+
+class _UnixServer(SocketServer.ThreadingMixIn, SocketServer.UnixStreamServer):
+    daemon_threads = True
+
+
+class _Stemmers(object):
+    """
+    The stemmers of a server, created when first requested.
+    """
+
+    def __init__(self, pool, maxCacheSize, cachePolicy, chunkSize):
+        self._pool = pool
+        self._max_cache_size = maxCacheSize
+        self._cache_policy = cachePolicy
+        self._chunk_size = chunkSize
+        self._stemmers = {}
+        self._lock = threading.Lock()
+
+    def get(self, algorithm):
+        """
+        Get the stemmer for an algorithm name or alias.
+
+        Raises ``KeyError`` if the algorithm is unknown.
+        """
+        try:
+            return self._stemmers[algorithm]
+        except KeyError:
+            pass
+        name = purestemmer._resolve_algorithm(algorithm)
+        with self._lock:
+            stemmer = self._stemmers.get(name)
+            if stemmer is None:
+                stemmer = ParallelStemmer(name, self._max_cache_size,
+                                          self._cache_policy,
+                                          chunkSize=self._chunk_size,
+                                          pool=self._pool)
+                self._stemmers[name] = stemmer
+            self._stemmers[algorithm] = stemmer
+        return stemmer
+
+
+def _remove_stale_socket(path):
+    """
+    Remove a socket file that is left over from a previous server.
+
+    Raises ``ValueError`` if ``path`` is not a socket or if another
+    server is listening on it.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError("'%s' exists and is not a socket." % path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except socket.error:
+        os.unlink(path)
+    else:
+        raise ValueError("Another server is listening on '%s'." % path)
+    finally:
+        sock.close()
+
+
+class StemmerServer(object):
+    """
+    Serves stemming requests on a Unix socket.
+
+    There is one ``purestemmer.parallel.ParallelStemmer`` per
+    algorithm, which is created on the first request for the algorithm
+    (or on construction, see ``algorithms``). Each has a cache of
+    ``maxCacheSize`` words with the eviction policy ``cachePolicy``
+    that is shared by all clients. All stemmers use the same pool of
+    ``processes`` worker processes (default: one per CPU core) for
+    batches with at least ``chunkSize`` uncached words.
+
+    Each client connection is handled in its own thread.
+
+    Instances can be used as context managers, which call ``close``
+    when the context is left.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, maxCacheSize=1000000,
+                 cachePolicy='lru', processes=None, chunkSize=1000,
+                 algorithms=None):
+        """
+        Create a server listening on the socket ``path``.
+
+        ``algorithms`` is a list of the algorithm names or aliases whose
+        stemmers are created right away.
+
+        See the class documentation for the other arguments.
+        """
+        self.path = path
+        # Create the pool before any threads are started
+        self._pool = multiprocessing.Pool(processes)
+        self.stemmers = _Stemmers(self._pool, maxCacheSize, cachePolicy,
+                                  chunkSize)
+        for algorithm in algorithms or []:
+            self.stemmers.get(algorithm)
+        try:
+            _remove_stale_socket(path)
+            self._server = _UnixServer(path, _Handler)
+        except Exception:
+            self._pool.terminate()
+            self._pool.join()
+            raise
+        self._server.stemmers = self.stemmers
+        # Identifies the socket file, see ``close``
+        info = os.stat(path)
+        self._socket_id = (info.st_dev, info.st_ino)
+
+    def serve_forever(self):
+        """
+        Handle requests until ``shutdown`` is called.
+        """
+        self._server.serve_forever()
+
+    def shutdown(self):
+        """
+        Stop ``serve_forever``.
+
+        Must be called from another thread.
+        """
+        self._server.shutdown()
+
+    def close(self):
+        """
+        Close the socket and shut down the worker processes.
+        """
+        self._server.server_close()
+        # Only remove the socket file if it has not been replaced, for
+        # example by another server.
+        try:
+            info = os.lstat(self.path)
+        except OSError:
+            pass
+        else:
+            if (info.st_dev, info.st_ino) == self._socket_id:
+                os.unlink(self.path)
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StemmerClient(object):
+    """
+    A stemmer that lets a ``StemmerServer`` do the work.
+
+    ``StemmerClient`` can be used instead of ``purestemmer.Stemmer``:
+    ``stemWord``, ``stemWords`` and ``iterStems`` work the same way and
+    return the same stems. The client has no cache of its own, the
+    server's cache is used instead. Each distinct word of a batch is
+    sent to the server only once.
+
+    The connection to the server is opened on construction, which also
+    checks the algorithm: an unknown algorithm raises ``KeyError``,
+    just like for ``purestemmer.Stemmer``. Instances are thread-safe,
+    but the threads take turns using the connection.
+
+    Instances can be used as context managers, which call ``close``
+    when the context is left.
+    """
+
+    def __init__(self, algorithm, path=DEFAULT_PATH, timeout=None):
+        """
+        Connect to the server listening on the socket ``path``.
+
+        ``timeout`` is the socket timeout in seconds (default: none).
+        """
+        self.algorithm = algorithm
+        self.path = path
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+        try:
+            self._request([])
+        except Exception:
+            self.close()
+            raise
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.path)
+        self._sock = sock
+
+    def _request(self, words):
+        """
+        Let the server stem a list of ``unicode`` words.
+        """
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                _send_message(self._sock, [self.algorithm, words])
+                response = _recv_message(self._sock)
+                if response is None:
+                    raise EOFError('Connection closed by the server.')
+            except (EOFError, socket.error):
+                self.close()
+                raise
+        if response[0]:
+            return response[1]
+        error_type, message = response[1:]
+        raise _ERRORS.get(error_type, RuntimeError)(message)
+
+    def close(self):
+        """
+        Close the connection to the server.
+
+        It is reopened when the client is used again.
+        """
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def stemWord(self, word):
+        """
+        Stem a single word.
+
+        See ``purestemmer.Stemmer.stemWord``.
+        """
+        return self.stemWords([word])[0]
+
+    def stemWords(self, words, factorize=False):
+        """
+        Stem a list of words.
+
+        See ``purestemmer.Stemmer.stemWords``.
+        """
+        unicode_ids = {}
+        str_ids = {}
+        distinct = []
+        ids = []
+        for word in words:
+            known = unicode_ids if isinstance(word, unicode) else str_ids
+            index = known.get(word)
+            if index is None:
+                index = known[word] = len(distinct)
+                distinct.append(word)
+            ids.append(index)
+        encoded = [w for w in distinct if not isinstance(w, unicode)]
+        texts = [w for w in distinct if isinstance(w, unicode)]
+        texts.extend(purestemmer._decode_all(encoded))
+        stems = self._request(texts) if texts else []
+        num_unicode = len(texts) - len(encoded)
+        unicode_stems = iter(stems[:num_unicode])
+        str_stems = iter(purestemmer._encode_all(stems[num_unicode:]))
+        results = [next(unicode_stems) if isinstance(word, unicode)
+                   else next(str_stems) for word in distinct]
+        if factorize:
+            return purestemmer._factorize(results, ids)
+        return [results[index] for index in ids]
+
+    def iterStems(self, words, chunkSize=10000):
+        """
+        Stem an iterable of words lazily.
+
+        See ``purestemmer.Stemmer.iterStems``.
+        """
+        words = iter(words)
+        while True:
+            chunk = list(itertools.islice(words, chunkSize))
+            if not chunk:
+                return
+            for stem in self.stemWords(chunk):
+                yield stem
+
+
+def main():
+    """
+    Run a stemming server.
+    """
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--socket', default=DEFAULT_PATH, metavar='PATH',
+                        help='Path of the Unix socket (default: ' +
+                        '%(default)s)')
+    parser.add_argument('--cache-size', type=int, default=1000000,
+                        metavar='N', help='Maximum number of cached ' +
+                        'words per algorithm (default: %(default)s)')
+    parser.add_argument('--cache-policy', default='lru',
+                        choices=policies(),
+                        help='Cache eviction policy (default: %(default)s)')
+    parser.add_argument('--processes', type=int, metavar='N',
+                        help='Number of worker processes (default: ' +
+                        'number of CPU cores)')
+    parser.add_argument('--chunk-size', type=int, default=1000, metavar='N',
+                        help='Maximum number of words per task sent to ' +
+                        'a worker (default: %(default)s)')
+    parser.add_argument('--preload', action='append', metavar='ALGORITHM',
+                        help='Algorithm to load on startup (can be ' +
+                        'repeated)')
+    args = parser.parse_args()
+    # Clean up on ``kill``, too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with StemmerServer(args.socket, args.cache_size, args.cache_policy,
+                       args.processes, args.chunk_size,
+                       args.preload) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
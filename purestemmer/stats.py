@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Instrumentation for ``purestemmer.Stemmer``.
+
+Statistics are disabled by default. They are enabled per stemmer via
+``Stemmer.enableStats``::
+
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.enableStats()
+    stemmer.stemWords(words)
+    print stemmer.getStats()['hits']
+
+The counters are collected in a ``StemmerStats`` instance. See its
+``snapshot`` method for a description of the counters.
+"""
+
+import collections
+import threading
+import timeit
+
+
+__all__ = ['StemmerStats']
+
+timer = timeit.default_timer
+
+
+class StemmerStats(object):
+    """
+    Counters for the work done by a stemmer and its cache.
+
+    Instances are thread-safe.
+    """
+
+    def __init__(self, callback=None, interval=10000):
+        """
+        Constructor.
+
+        If ``callback`` is given then it is called with a snapshot of the
+        counters (see ``snapshot``) each time another ``interval`` words
+        have been looked up. This can be used to feed the counters into
+        a metrics system.
+        """
+        if interval <= 0:
+            raise ValueError('The interval must be positive.')
+        self.callback = callback
+        self.interval = interval
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all counters to zero.
+        """
+        with self._lock:
+            self._lookups = 0
+            self._hits = 0
+            self._dictionary_hits = 0
+            self._misses = 0
+            self._prefiltered = 0
+            self._evictions = 0
+            self._eviction_time = 0.0
+            self._stem_time = 0.0
+            self._word_lengths = collections.Counter()
+            self._next_report = self.interval
+
+    def snapshot(self):
+        """
+        Get the current values of the counters.
+
+        Returns a dict with the following keys:
+
+        - ``lookups``: Number of words that were looked up. Batch
+          methods like ``Stemmer.stemWords`` look up each distinct word
+          once.
+        - ``hits``: Number of words that were found in the cache.
+        - ``dictionary_hits``: Number of words that were found in the
+          stem dictionary.
+        - ``misses``: Number of words that had to be stemmed by the
+          stemming algorithm.
+        - ``prefiltered``: Number of words that were not in the cache
+          but were recognized by the algorithm's prefilter as words
+          that stemming leaves unchanged.
+        - ``evictions``: Number of entries that were evicted from the
+          cache.
+        - ``eviction_time``: Time spent evicting entries, in seconds.
+        - ``stem_time``: Time spent in the stemming algorithm, in
+          seconds.
+        - ``word_lengths``: A dict that maps word lengths to the number
+          of looked up words of that length.
+        """
+        with self._lock:
+            return {
+                'lookups': self._lookups,
+                'hits': self._hits,
+                'dictionary_hits': self._dictionary_hits,
+                'misses': self._misses,
+                'prefiltered': self._prefiltered,
+                'evictions': self._evictions,
+                'eviction_time': self._eviction_time,
+                'stem_time': self._stem_time,
+                'word_lengths': dict(self._word_lengths),
+            }
+
+    def record_lookups(self, words, hits=0, dictionary_hits=0, misses=0,
+                       stem_time=0.0, prefiltered=0):
+        """
+        Record the outcome of looking up words.
+
+        ``words`` is a list of the looked up words. The lengths of
+        ``str`` words are counted in bytes, since they are only decoded
+        if they are not cached.
+        """
+        with self._lock:
+            self._lookups += len(words)
+            self._hits += hits
+            self._dictionary_hits += dictionary_hits
+            self._misses += misses
+            self._prefiltered += prefiltered
+            self._stem_time += stem_time
+            lengths = self._word_lengths
+            for word in words:
+                lengths[len(word)] += 1
+            report = (self.callback is not None and
+                      self._lookups >= self._next_report)
+            if report:
+                while self._next_report <= self._lookups:
+                    self._next_report += self.interval
+        if report:
+            self.callback(self.snapshot())
+
+    def record_evictions(self, n, elapsed):
+        """
+        Record that ``n`` cache entries were evicted in ``elapsed``
+        seconds.
+        """
+        with self._lock:
+            self._evictions += n
+            self._eviction_time += elapsed
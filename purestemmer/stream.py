@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Stemming of word files with bounded memory usage.
+
+The functions in this module process files that contain one word per
+line, like the test vocabularies that come with purestemmer. Files are
+read in large blocks, each of which is decoded at once and stemmed via
+``Stemmer.stemWords``. Hence memory usage only depends on the block
+size, not on the size of the file.
+"""
+
+import codecs
+import contextlib
+
+
+__all__ = ['iter_blocks', 'iter_file_stems', 'stem_file']
+
+_BLOCK_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _open(f, mode):
+    """
+    Open a file if necessary.
+
+    ``f`` is either a filename or a file-like object. In the latter
+    case it is not closed when the context is left.
+    """
+    if isinstance(f, basestring):
+        with open(f, mode) as f:
+            yield f
+    else:
+        yield f
+
+
+def iter_blocks(infile, block_size=_BLOCK_SIZE, encoding='utf8'):
+    """
+    Read the words in a file block-wise.
+
+    ``infile`` is a filename or a file-like object opened in binary
+    mode. The file must contain one word per line. It is read in blocks
+    of ``block_size`` bytes, and each block is decoded at once.
+
+    Returns an iterator over lists of ``unicode`` words. Taken together,
+    the lists are equal to ``infile.read().decode(encoding).splitlines()``.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    rest = u''
+    with _open(infile, 'rb') as f:
+        while True:
+            data = f.read(block_size)
+            text = rest + decoder.decode(data, final=not data)
+            if not data:
+                break
+            # Lines may continue in the next block. They are split like
+            # ``splitlines`` does, so any of its line breaks ends a line,
+            # but a trailing ``\r`` may be the first half of ``\r\n``.
+            lines = text.splitlines(True)
+            rest = u''
+            if lines:
+                last = lines[-1]
+                if last == last.splitlines()[0] or last.endswith(u'\r'):
+                    rest = last
+            end = len(text) - len(rest)
+            if end:
+                yield text[:end].splitlines()
+    if text:
+        yield text.splitlines()
+
+
+def iter_file_stems(stemmer, infile, block_size=_BLOCK_SIZE,
+                    encoding='utf8'):
+    """
+    Stem the words in a file lazily.
+
+    ``stemmer`` is a ``purestemmer.Stemmer`` instance. See
+    ``iter_blocks`` for the other arguments.
+
+    Returns an iterator over the ``unicode`` stems.
+    """
+    for words in iter_blocks(infile, block_size, encoding):
+        for stem in stemmer.stemWords(words):
+            yield stem
+
+
+def stem_file(stemmer, infile, outfile, block_size=_BLOCK_SIZE,
+              encoding='utf8'):
+    """
+    Stem the words in a file and write the stems to another file.
+
+    ``stemmer`` is a ``purestemmer.Stemmer`` instance. ``outfile`` is a
+    filename or a file-like object opened in binary mode, to which the
+    stems are written one per line. See ``iter_blocks`` for the other
+    arguments.
+
+    Returns the number of stemmed words.
+    """
+    count = 0
+    with _open(outfile, 'wb') as f:
+        for words in iter_blocks(infile, block_size, encoding):
+            stems = stemmer.stemWords(words)
+            stems.append(u'')
+            f.write(u'\n'.join(stems).encode(encoding))
+            count += len(words)
+    return count
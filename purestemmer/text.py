@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tokenization of natural language text.
+
+``tokenize`` splits a text into lower-case tokens that are suitable as
+input for a stemming algorithm. It is used by ``Stemmer.stemText`` and
+``Stemmer.stemDocuments``, which also stem the tokens.
+
+Tokens are maximal runs of letters and digits. Apostrophes separate
+tokens (so that French ``l'homme`` yields ``l`` and ``homme``), except
+for the English algorithms, which expect contractions and possessives
+like ``don't`` and ``dog's`` as single tokens. Case folding uses the
+Turkish rules for dotted and dotless i when the Turkish algorithm is
+used.
+"""
+
+import re
+
+import purestemmer
+
+
+__all__ = ['get_tokenizer', 'tokenize']
+
+_DEFAULT_PATTERN = re.compile(ur"[^\W_]+", re.UNICODE)
+
+_APOSTROPHE_PATTERN = re.compile(ur"[^\W_]+(?:'[^\W_]+)*", re.UNICODE)
+
+# Token patterns for algorithms that differ from the default
+_PATTERNS = {
+    u'english': _APOSTROPHE_PATTERN,
+    u'porter': _APOSTROPHE_PATTERN,
+}
+
+
+def _lower(text):
+    return text.lower()
+
+
+def _lower_turkish(text):
+    # ``unicode.lower`` maps both I and İ to i
+    return text.replace(u'I', u'\u0131').replace(u'\u0130', u'i').lower()
+
+
+# Case folding functions for algorithms that differ from the default
+_LOWER = {
+    u'turkish': _lower_turkish,
+}
+
+
+def get_tokenizer(algorithm):
+    """
+    Get the tokenizer for an algorithm.
+
+    ``algorithm`` is an algorithm name or alias.
+
+    Returns a function that takes a ``unicode`` text and returns a list
+    of its tokens. See ``tokenize``.
+    """
+    algorithm = purestemmer._resolve_algorithm(algorithm)
+    findall = _PATTERNS.get(algorithm, _DEFAULT_PATTERN).findall
+    lower = _LOWER.get(algorithm, _lower)
+    return lambda text: findall(lower(text))
+
+
+def tokenize(text, algorithm='english'):
+    """
+    Split a text into lower-case tokens.
+
+    ``text`` is a ``unicode`` instance and ``algorithm`` is the name or
+    an alias of the stemming algorithm that the tokens are meant for.
+    The text is case folded as a whole and split via a single regular
+    expression search.
+
+    Returns a list of the tokens in the order in which they occur.
+    """
+    return get_tokenizer(algorithm)(text)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Mappings between the words of a vocabulary and their stems.
+
+A ``Vocabulary`` maps each of a set of distinct words to its stem and
+each stem to the words that produce it::
+
+    vocabulary = purestemmer.vocabulary.build('english', words)
+    vocabulary.get_stem(u'running')  # u'run'
+    vocabulary.get_words(u'run')     # [u'run', u'running', u'runs']
+
+It is meant for vocabularies of millions of words. Words and stems are
+stored once each in lists, and the stem of each word and the grouping
+of the words by stem are kept as integer ids in ``array.array``
+instances instead of per-word tuples or lists. Looking up words and
+stems requires two dicts that map them to their ids, which cost a dict
+item and an ``int`` object per word and per stem.
+
+Vocabularies built from different parts of the input, for example in
+different processes, can be merged. They can be saved to a compact file
+and loaded again via ``load``.
+"""
+
+import array
+import itertools
+import struct
+import sys
+
+import purestemmer
+
+
+__all__ = ['build', 'load', 'Vocabulary']
+
+_MAGIC = 'PUREVOCB'
+_FORMAT_VERSION = 1
+
+# Magic, format version, metadata length, number of words, number of
+# stems, length of the encoded words, length of the encoded stems
+_HEADER = struct.Struct('<8sIIIIII')
+
+# Words and stems are stored UTF-8 encoded and separated by this
+_SEPARATOR = u'\0'
+
+_CHUNK_SIZE = 10000
+
+
+def _ids(values=()):
+    """
+    Create an array of integer ids.
+    """
+    return array.array('i', values)
+
+
+def _pack_strings(strings):
+    """
+    Encode a list of ``unicode`` instances for saving.
+
+    Returns the UTF-8 encoded strings, separated by ``_SEPARATOR``, and
+    an array of their lengths in characters.
+    """
+    return (_SEPARATOR.join(strings).encode('utf8'),
+            _ids(len(s) for s in strings))
+
+
+def _unpack_strings(data, lengths):
+    """
+    Decode strings encoded by ``_pack_strings``.
+    """
+    text = data.decode('utf8')
+    strings = text.split(_SEPARATOR)
+    if len(strings) == len(lengths):
+        return strings
+    # Some strings contain the separator
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(text[start:start + length])
+        start += length + 1
+    return strings
+
+
+def _write_ids(f, ids):
+    if sys.byteorder != 'little':
+        ids = _ids(ids)
+        ids.byteswap()
+    ids.tofile(f)
+
+
+def _read_ids(f, n):
+    ids = _ids()
+    ids.fromfile(f, n)
+    if sys.byteorder != 'little':
+        ids.byteswap()
+    return ids
+
+
+class Vocabulary(object):
+    """
+    Mappings between distinct words and their stems.
+
+    Words and stems are ``unicode`` instances. Each word and each stem
+    has an integer id, which is its index in ``words`` and ``stems``,
+    respectively. ``word_stems`` is an ``array.array`` that contains
+    the id of each word's stem. ``version`` is the version of
+    purestemmer that computed the stems.
+    """
+
+    def __init__(self, algorithm):
+        """
+        Constructor.
+
+        Creates an empty vocabulary for the stemming algorithm
+        ``algorithm`` (a name or an alias). Use ``update`` to add words.
+        """
+        self.algorithm = purestemmer._resolve_algorithm(algorithm)
+        self.version = purestemmer.__version__
+        self.words = []
+        self.stems = []
+        self.word_stems = _ids()
+        self._word_ids = {}
+        self._stem_ids = {}
+        self._groups = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self._word_ids
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def _add(self, words, stems):
+        """
+        Add new words and their stems.
+
+        ``words`` is a list of distinct ``unicode`` words that are not
+        in the vocabulary, ``stems`` is a list of their stems.
+        """
+        word_ids = self._word_ids
+        stem_ids = self._stem_ids
+        all_stems = self.stems
+        ids = []
+        for stem in stems:
+            stem_id = stem_ids.get(stem)
+            if stem_id is None:
+                stem_id = stem_ids[stem] = len(all_stems)
+                all_stems.append(stem)
+            ids.append(stem_id)
+        word_ids.update(itertools.izip(
+                words, xrange(len(self.words), len(self.words) + len(words))))
+        self.words.extend(words)
+        self.word_stems.extend(ids)
+        self._groups = None
+
+    def update(self, words, stemmer=None):
+        """
+        Add words to the vocabulary.
+
+        ``words`` is an iterable of ``str`` and/or ``unicode`` instances.
+        The former are assumed to be UTF-8 encoded. Words that are
+        already in the vocabulary are ignored.
+
+        The words are stemmed in chunks via ``stemmer``, which must be a
+        ``purestemmer.Stemmer`` for the vocabulary's algorithm, for
+        example a ``purestemmer.parallel.ParallelStemmer``. By default,
+        a ``Stemmer`` without cache is used, since each word is only
+        stemmed once anyway.
+        """
+        if stemmer is None:
+            stemmer = purestemmer.Stemmer(self.algorithm, maxCacheSize=0)
+        elif stemmer._algorithm != self.algorithm:
+            raise ValueError('Stemmer for %s cannot be used for %s' % (
+                             stemmer._algorithm, self.algorithm))
+        word_ids = self._word_ids
+        words = iter(words)
+        while True:
+            chunk = list(itertools.islice(words, _CHUNK_SIZE))
+            if not chunk:
+                return
+            new_words = []
+            seen = set()
+            for word in chunk:
+                if not isinstance(word, unicode):
+                    word = word.decode('utf8')
+                if word not in word_ids and word not in seen:
+                    seen.add(word)
+                    new_words.append(word)
+            if new_words:
+                self._add(new_words, stemmer.stemWords(new_words))
+
+    def merge(self, other):
+        """
+        Add the words of another vocabulary.
+
+        ``other`` must be a ``Vocabulary`` for the same algorithm whose
+        stems were computed by the same version of purestemmer (see
+        ``version``), otherwise ``ValueError`` is raised. Its words are
+        not stemmed again.
+        """
+        if other.algorithm != self.algorithm:
+            raise ValueError('Vocabulary for %s cannot be merged into %s' % (
+                             other.algorithm, self.algorithm))
+        if other.version != self.version:
+            raise ValueError(('Vocabulary of purestemmer %s cannot be ' +
+                              'merged into one of purestemmer %s') % (
+                             other.version, self.version))
+        word_ids = self._word_ids
+        other_stems = other.stems
+        new_words = []
+        new_stems = []
+        for word, stem_id in itertools.izip(other.words, other.word_stems):
+            if word not in word_ids:
+                new_words.append(word)
+                new_stems.append(other_stems[stem_id])
+        self._add(new_words, new_stems)
+
+    def get_stem(self, word, default=None):
+        """
+        Get the stem of a word.
+
+        Returns ``default`` if the word is not in the vocabulary.
+        """
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            return default
+        return self.stems[self.word_stems[word_id]]
+
+    def get_stem_id(self, stem, default=None):
+        """
+        Get the id of a stem.
+
+        Returns ``default`` if no word in the vocabulary has that stem.
+        """
+        return self._stem_ids.get(stem, default)
+
+    def _get_groups(self):
+        """
+        Get the word ids grouped by stem.
+
+        Returns a tuple ``(offsets, members)`` of arrays. The ids of the
+        words with stem id ``i`` are ``members[offsets[i]:offsets[i + 1]]``
+        in the order in which the words were added.
+        """
+        if self._groups is None:
+            word_stems = self.word_stems
+            members = _ids(sorted(xrange(len(word_stems)),
+                                  key=word_stems.__getitem__))
+            counts = [0] * (len(self.stems) + 1)
+            for stem_id in word_stems:
+                counts[stem_id + 1] += 1
+            offsets = _ids(counts)
+            for i in xrange(1, len(offsets)):
+                offsets[i] += offsets[i - 1]
+            self._groups = offsets, members
+        return self._groups
+
+    def get_words(self, stem):
+        """
+        Get the words that have a certain stem.
+
+        Returns a list of the words in the order in which they were
+        added. The list is empty if no word has that stem.
+        """
+        stem_id = self._stem_ids.get(stem)
+        if stem_id is None:
+            return []
+        offsets, members = self._get_groups()
+        words = self.words
+        return [words[i] for i in
+                members[offsets[stem_id]:offsets[stem_id + 1]]]
+
+    def iter_groups(self):
+        """
+        Iterate over the stems and the words that have them.
+
+        Returns an iterator over tuples ``(stem, words)``, where
+        ``words`` is a list like returned by ``get_words``.
+        """
+        offsets, members = self._get_groups()
+        words = self.words
+        for stem_id, stem in enumerate(self.stems):
+            yield stem, [words[i] for i in
+                         members[offsets[stem_id]:offsets[stem_id + 1]]]
+
+    def save(self, filename):
+        """
+        Save the vocabulary to a file.
+
+        The file can be loaded via ``load``.
+        """
+        metadata = u'%s\0%s' % (self.algorithm, purestemmer.__version__)
+        metadata = metadata.encode('utf8')
+        words, word_lengths = _pack_strings(self.words)
+        stems, stem_lengths = _pack_strings(self.stems)
+        with open(filename, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(metadata),
+                                 len(self.words), len(self.stems),
+                                 len(words), len(stems)))
+            f.write(metadata)
+            _write_ids(f, word_lengths)
+            _write_ids(f, stem_lengths)
+            _write_ids(f, self.word_stems)
+            f.write(words)
+            f.write(stems)
+
+
+def build(algorithm, words, stemmer=None):
+    """
+    Build a vocabulary from an iterable of words.
+
+    See ``Vocabulary.update``.
+    """
+    vocabulary = Vocabulary(algorithm)
+    vocabulary.update(words, stemmer)
+    return vocabulary
+
+
+def load(filename):
+    """
+    Load a vocabulary that has been saved via ``Vocabulary.save``.
+
+    The stems are not recomputed, so a vocabulary that was created by a
+    different version of purestemmer contains the stems of that version,
+    see its ``version`` attribute.
+
+    Raises ``ValueError`` if the file is not a vocabulary.
+    """
+    with open(filename, 'rb') as f:
+        header = f.read(_HEADER.size)
+        try:
+            (magic, format_version, metadata_length, num_words, num_stems,
+                    words_length, stems_length) = _HEADER.unpack(header)
+        except struct.error:
+            magic = None
+        if magic != _MAGIC or format_version != _FORMAT_VERSION:
+            raise ValueError("'%s' is not a vocabulary" % filename)
+        metadata = f.read(metadata_length).decode('utf8')
+        algorithm, version = metadata.split(u'\0')
+        word_lengths = _read_ids(f, num_words)
+        stem_lengths = _read_ids(f, num_stems)
+        word_stems = _read_ids(f, num_words)
+        words = _unpack_strings(f.read(words_length), word_lengths)
+        stems = _unpack_strings(f.read(stems_length), stem_lengths)
+    vocabulary = Vocabulary(algorithm)
+    vocabulary.version = version
+    vocabulary.words = words
+    vocabulary.stems = stems
+    vocabulary.word_stems = word_stems
+    vocabulary._word_ids = dict(itertools.izip(words, itertools.count()))
+    vocabulary._stem_ids = dict(itertools.izip(stems, itertools.count()))
+    return vocabulary
@@ -64,5 +64,13 @@ setup(
         'stemmers',
     ],
     packages=find_packages(exclude='test'),
+    extras_require={
+        'async': ['futures'],
+    },
+    entry_points={
+        'console_scripts': [
+            'purestemmer-server = purestemmer.server:main',
+        ],
+    },
     platforms=['any'],
 )
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tests for ``purestemmer.arrays``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import sys
+
+from nose.plugins.skip import SkipTest
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.arrays
+
+numpy = purestemmer.arrays.numpy
+
+
+WORDS = [u'cats', u'ponies', u'cats', u'\xfcbers', u'running', u'ponies']
+STEMS = [u'cat', u'poni', u'cat', u'\xfcber', u'run', u'poni']
+
+
+def setup():
+    if numpy is None:
+        raise SkipTest('NumPy is not installed.')
+
+
+def check_array(values, expected, kind):
+    """
+    Check the stems and codes of an array.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stems = purestemmer.arrays.stem_array(stemmer, values)
+    assert stems.dtype.kind == kind
+    assert stems.tolist() == expected
+    codes, vocabulary = purestemmer.arrays.stem_array(stemmer, values,
+                                                      codes=True)
+    assert vocabulary.dtype.kind == kind
+    assert codes.dtype == numpy.intp
+    assert codes.flags.writeable
+    assert vocabulary[codes].tolist() == expected
+    assert len(vocabulary) == len(set(expected))
+
+
+def test_unicode_array():
+    """
+    Test stemming an array of ``unicode`` dtype.
+    """
+    check_array(numpy.array(WORDS), STEMS, 'U')
+
+
+def test_bytes_array():
+    """
+    Test stemming an array of byte strings.
+    """
+    values = numpy.array([w.encode('utf8') for w in WORDS])
+    check_array(values, [s.encode('utf8') for s in STEMS], 'S')
+
+
+def test_object_array():
+    """
+    Test stemming an array of objects.
+    """
+    check_array(numpy.array(WORDS, dtype=object), STEMS, 'O')
+
+
+def test_mixed_object_array():
+    """
+    Test stemming an object array with ``str`` and ``unicode`` words.
+    """
+    values = numpy.array([u'cats', 'cats', u'cats'], dtype=object)
+    stems = purestemmer.arrays.stem_array(purestemmer.Stemmer('english'),
+                                          values)
+    assert [type(s) for s in stems] == [unicode, str, unicode]
+    codes, vocabulary = purestemmer.arrays.stem_array(
+            purestemmer.Stemmer('english'), values, codes=True)
+    assert codes.tolist() == [0, 1, 0]
+    assert codes.dtype == numpy.intp and codes.flags.writeable
+    assert len(vocabulary) == 2
+
+
+def test_non_contiguous_array():
+    """
+    Test stemming a strided array.
+    """
+    values = numpy.array(WORDS)[::2]
+    check_array(values, STEMS[::2], 'U')
+
+
+def test_empty_array():
+    """
+    Test stemming an empty array.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    for dtype in ['U', 'S', object]:
+        values = numpy.array([], dtype=dtype)
+        assert len(purestemmer.arrays.stem_array(stemmer, values)) == 0
+        codes, vocabulary = purestemmer.arrays.stem_array(stemmer, values,
+                                                          codes=True)
+        assert len(codes) == 0 and len(vocabulary) == 0
+        assert codes.dtype == numpy.intp
+
+
+def test_invalid_arrays():
+    """
+    Make sure that unsupported arrays are rejected.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    for values in [numpy.array([[u'cats']]), numpy.arange(3)]:
+        try:
+            purestemmer.arrays.stem_array(stemmer, values)
+        except ValueError:
+            pass
+        else:
+            assert False, 'No ValueError for %r.' % values
+
+
+def test_without_numpy():
+    """
+    Test the fallback if NumPy is not installed.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    purestemmer.arrays.numpy = None
+    try:
+        assert purestemmer.arrays.stem_array(stemmer, WORDS) == STEMS
+        ids, table = purestemmer.arrays.stem_array(stemmer, WORDS, codes=True)
+        assert [table[i] for i in ids] == STEMS
+    finally:
+        purestemmer.arrays.numpy = numpy
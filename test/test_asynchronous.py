@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.asynchronous``.
+
+Intended to be run via nosetests.
+"""
+
+
+import multiprocessing
+import os.path
+import Queue
+import sys
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.asynchronous
+
+
+class EventLoop(object):
+    """
+    Minimal event loop for testing.
+    """
+
+    def __init__(self):
+        self.queue = Queue.Queue()
+        self.steps = 0
+
+    def schedule(self, callback):
+        self.queue.put(callback)
+
+    def run_until_done(self, future):
+        while not future.done():
+            self.queue.get(timeout=10)()
+            self.steps += 1
+        return future.result()
+
+
+WORDS = [u'cats', 'running', u'ponies', u'cats', 'running', u'dogs'] * 50
+
+
+def test_stem_words():
+    """
+    Make sure that the results match those of ``Stemmer.stemWords``.
+    """
+    expected = purestemmer.Stemmer('english').stemWords(WORDS)
+    loop = EventLoop()
+    stemmer = purestemmer.Stemmer('english')
+    with purestemmer.asynchronous.AsyncStemmer(
+            stemmer, loop.schedule, batchSize=2) as async_stemmer:
+        for x in range(2):
+            stems = loop.run_until_done(async_stemmer.stemWords(WORDS))
+            assert stems == expected
+            assert map(type, stems) == map(type, expected)
+        assert loop.run_until_done(async_stemmer.stemWords([])) == []
+    assert stemmer._cache.get(u'ponies') == u'poni'
+
+
+def test_str_cache():
+    """
+    Make sure that ``str`` words use the stemmer's cache for ``str``.
+    """
+    loop = EventLoop()
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.stemWords(['running'])
+    with purestemmer.asynchronous.AsyncStemmer(
+            stemmer, loop.schedule) as async_stemmer:
+        future = async_stemmer.stemWords(['running', 'cats', u'dogs'])
+        assert loop.run_until_done(future) == ['run', 'cat', u'dog']
+    assert sorted(stemmer._bytes_cache) == ['cats', 'running']
+    assert type(stemmer._bytes_cache['cats']) is str
+    assert sorted(stemmer._cache) == [u'dogs']
+
+
+def test_tick_size():
+    """
+    Make sure that the work is split into steps.
+    """
+    loop = EventLoop()
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.stemWords(WORDS)
+    with purestemmer.asynchronous.AsyncStemmer(
+            stemmer, loop.schedule, tickSize=10) as async_stemmer:
+        loop.run_until_done(async_stemmer.stemWords(WORDS))
+    # Look-up and assembly each take at least len(WORDS) / 10 steps
+    assert loop.steps >= 2 * len(WORDS) / 10
+
+
+def test_process_pool():
+    """
+    Make sure that a process pool can be used.
+    """
+    expected = purestemmer.Stemmer('english').stemWords(WORDS)
+    loop = EventLoop()
+    pool = multiprocessing.Pool(2)
+    try:
+        async_stemmer = purestemmer.asynchronous.AsyncStemmer(
+                purestemmer.Stemmer('english'), loop.schedule, pool,
+                batchSize=2)
+        future = async_stemmer.stemWords(WORDS)
+        assert loop.run_until_done(future) == expected
+        async_stemmer.close()
+    finally:
+        pool.close()
+        pool.join()
+
+
+def test_iter_stems():
+    """
+    Make sure that iterables are stemmed in chunks.
+    """
+    expected = purestemmer.Stemmer('english').stemWords(WORDS)
+    loop = EventLoop()
+    with purestemmer.asynchronous.AsyncStemmer(
+            purestemmer.Stemmer('english'), loop.schedule) as async_stemmer:
+        futures = list(async_stemmer.iterStems(iter(WORDS), 7))
+        assert len(futures) == (len(WORDS) + 6) // 7
+        stems = []
+        for future in futures:
+            stems.extend(loop.run_until_done(future))
+    assert stems == expected
+
+
+def test_errors():
+    """
+    Make sure that errors are reported via the future.
+    """
+    loop = EventLoop()
+    with purestemmer.asynchronous.AsyncStemmer(
+            purestemmer.Stemmer('english'), loop.schedule) as async_stemmer:
+        future = async_stemmer.stemWords([u'cats', '\xff'])
+        try:
+            loop.run_until_done(future)
+        except UnicodeDecodeError:
+            pass
+        else:
+            assert False, 'No UnicodeDecodeError for invalid input.'
@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tests for ``purestemmer.cache``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import random
+import sys
+import threading
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.cache
+
+
+def check_max_size(policy):
+    """
+    Make sure that a cache never exceeds its maximum size.
+    """
+    cache = purestemmer.cache.make_cache(policy, 10)
+    for i in range(100):
+        cache[i] = i
+        assert len(cache) <= 10
+        assert cache[i] == i
+    cache.max_size = 5
+    assert len(cache) == 5
+    for i in range(100, 200):
+        cache[i] = i
+        assert len(cache) <= 5
+    cache.max_size = 0
+    assert len(cache) == 0
+    cache[1] = 1
+    assert len(cache) == 0
+    assert 1 not in cache
+
+
+def test_max_size():
+    """
+    Make sure that caches never exceed their maximum size.
+    """
+    for policy in purestemmer.cache.policies():
+        test = lambda: check_max_size(policy)
+        test.description = policy
+        yield test
+
+
+def check_bulk_access(policy):
+    """
+    Make sure that several entries can be accessed at once.
+    """
+    cache = purestemmer.cache.make_cache(policy, 3)
+    cache.put_many([('a', 1), ('b', 2), ('c', 3), ('d', 4)])
+    assert len(cache) == 3
+    assert cache.get_many(['b', 'c', 'd', 'x']) == {'b': 2, 'c': 3, 'd': 4}
+
+
+def test_bulk_access():
+    """
+    Make sure that caches support bulk access.
+    """
+    for policy in purestemmer.cache.policies():
+        test = lambda: check_bulk_access(policy)
+        test.description = policy
+        yield test
+
+
+def test_lru_eviction_order():
+    """
+    Make sure that the LRU cache discards the least recently used entry.
+    """
+    cache = purestemmer.cache.LRUCache(3)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['c'] = 3
+    cache['a']
+    cache['d'] = 4
+    assert sorted(cache) == ['a', 'c', 'd']
+    cache['c'] = 5
+    cache['e'] = 6
+    assert sorted(cache) == ['c', 'd', 'e']
+    assert cache['c'] == 5
+    del cache['d']
+    assert sorted(cache) == ['c', 'e']
+
+
+def test_compact_cache():
+    """
+    Make sure that the compact cache restores values of any kind.
+    """
+    cache = purestemmer.cache.CompactCache(4)
+    items = [(u'ponies', u'poni'), ('cats', 'cat'), (u'happy', u'happi'),
+             (u'x', u'')]
+    cache.put_many(items)
+    for key, value in items:
+        assert cache[key] == value
+        assert type(cache[key]) is type(value)
+    # Suffixes are shared, but ``str`` and ``unicode`` ones are separate
+    assert sorted(cache._table.values()) == [0, 1, 2]
+    assert sorted(cache._strings) == ['', u'', u'i']
+    cache[u'happy'] = u'xyz'
+    cache[('en', u'cats')] = u'cat'
+    assert cache[u'happy'] == u'xyz'
+    assert cache[('en', u'cats')] == u'cat'
+    assert u'ponies' not in cache
+    assert (u'i', unicode) not in cache._table
+    long_word = u'a' * 100000
+    cache[long_word] = long_word
+    assert cache[long_word] == long_word
+
+
+def test_compact_cache_eviction_order():
+    """
+    Make sure that the compact cache discards the least recently used
+    entry.
+    """
+    cache = purestemmer.cache.CompactCache(3)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['c'] = 3
+    cache['a']
+    cache['d'] = 4
+    assert sorted(cache) == ['a', 'c', 'd']
+    cache['c'] = 5
+    cache['e'] = 6
+    assert sorted(cache) == ['c', 'd', 'e']
+    assert cache['c'] == 5
+    del cache['d']
+    assert sorted(cache) == ['c', 'e']
+    # Freed slots are reused
+    cache['f'] = 7
+    assert len(cache._keys) == 4
+
+
+def test_two_queue_scan_resistance():
+    """
+    Make sure that a scan cannot flush frequently used entries from 2Q.
+    """
+    cache = purestemmer.cache.TwoQueueCache(100)
+    hot = range(50)
+    for key in hot + range(100, 200):
+        cache[key] = key
+    for key in hot:
+        # Evicted from the FIFO queue but remembered, hence promoted to
+        # the main queue when stored again
+        assert key not in cache
+        cache[key] = key
+    for key in range(1000, 2000):
+        cache[key] = key
+    assert all(key in cache for key in hot)
+
+
+def test_adaptive_cache_bypass():
+    """
+    Make sure that an adaptive cache is bypassed if nothing repeats.
+    """
+    cache = purestemmer.cache.AdaptiveCache(purestemmer.cache.LRUCache,
+                                            1000, 10, window=100,
+                                            sample_rate=1)
+    for i in range(100):
+        cache.get('u%d' % i)
+        cache['u%d' % i] = i
+    assert cache.bypassed
+    # Cached entries are still found, but new ones are not stored
+    assert cache['u98'] == 98
+    cache['x'] = 1
+    assert 'x' not in cache
+    for i in range(100):
+        cache.get_many(['h%d' % (i % 5)])
+    assert not cache.bypassed
+    cache['x'] = 1
+    assert cache['x'] == 1
+
+
+def test_adaptive_cache_resize():
+    """
+    Make sure that an adaptive cache adapts its size to the workload.
+    """
+    rng = random.Random(0)
+    cache = purestemmer.cache.AdaptiveCache(purestemmer.cache.LRUCache,
+                                            1024, 16, window=200,
+                                            sample_rate=1)
+    assert cache.size == 1024
+    # Few hot keys and a trickle of unique ones: a small cache suffices
+    for i in range(20000):
+        if rng.random() < 0.9:
+            key = 'h%d' % rng.randrange(10)
+        else:
+            key = 'u%d' % i
+        if cache.get(key) is None:
+            cache[key] = key
+    assert cache.size == 16
+    assert not cache.bypassed
+    assert len(cache) <= 16
+    # Uniformly distributed keys: the cache grows until all fit
+    for i in range(20000):
+        key = 'k%d' % rng.randrange(100)
+        if cache.get(key) is None:
+            cache[key] = key
+    assert cache.size == 128
+    assert cache.max_size == 1024 and cache.min_size == 16
+    cache.max_size = 8
+    assert cache.size == 8 and cache.min_size == 8
+    assert len(cache) <= 8
+
+
+def test_adaptive_cache_size_bounds():
+    """
+    Make sure that invalid size bounds are rejected.
+    """
+    for min_size in [0, 11]:
+        try:
+            purestemmer.cache.AdaptiveCache(purestemmer.cache.LRUCache, 10,
+                                            min_size)
+        except ValueError:
+            pass
+        else:
+            assert False, 'No ValueError for minimum size %d.' % min_size
+
+
+def test_stemmer_adaptive_cache():
+    """
+    Make sure that ``Stemmer`` can use an adaptive cache.
+    """
+    words = [u'cats', u'running', u'cats', u'ponies', u'running'] * 10
+    expected = [u'cat', u'run', u'cat', u'poni', u'run'] * 10
+    for shards in [1, 4]:
+        stemmer = purestemmer.Stemmer('english', 100, cacheShards=shards,
+                                      minCacheSize=10)
+        assert stemmer.stemWords(words) == expected
+        assert [stemmer.stemWord(w) for w in words] == expected
+        assert stemmer.stemWords([w.encode('utf8') for w in words]) == [
+                s.encode('utf8') for s in expected]
+        assert stemmer.maxCacheSize == 100
+
+
+def test_unknown_policy():
+    """
+    Make sure that unknown cache policies are rejected.
+    """
+    try:
+        purestemmer.Stemmer('english', cachePolicy='random')
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for unknown cache policy.'
+
+
+def test_stemmer_cache_policies():
+    """
+    Make sure that the cache policies work with ``Stemmer``.
+    """
+    words = [u'cats', u'running', u'cats', u'ponies', u'running'] * 10
+    expected = [u'cat', u'run', u'cat', u'poni', u'run'] * 10
+    for policy in purestemmer.cache.policies():
+        stemmer = purestemmer.Stemmer('english', 2, policy)
+        assert stemmer.stemWords(words) == expected
+        assert stemmer.maxCacheSize == 2
+        stemmer.maxCacheSize = 0
+        assert stemmer.stemWords(words) == expected
+
+
+def test_sharded_cache():
+    """
+    Make sure that a sharded cache splits its entries among the shards.
+    """
+    for policy in purestemmer.cache.policies():
+        cache = purestemmer.cache.make_cache(policy, 10, 4)
+        assert isinstance(cache, purestemmer.cache.ShardedCache)
+        assert [s.max_size for s in cache._shards] == [3, 3, 2, 2]
+        for i in range(100):
+            cache[i] = i
+            assert cache[i] == i
+        assert len(cache) == 10
+        # Integers are their own hashes, so the shards hold the keys
+        # with the same remainder modulo 4
+        assert sorted(cache) == [88, 89] + range(92, 100)
+        assert cache.get_many([95, 96, 5]) == {95: 95, 96: 96}
+        cache.put_many([(200, 1), (201, 2)])
+        assert cache.get(201) == 2
+        del cache[201]
+        assert 201 not in cache
+        cache.max_size = 0
+        assert len(cache) == 0
+        cache[1] = 1
+        assert 1 not in cache
+
+
+def test_sharded_cache_too_small():
+    """
+    Make sure that every shard of a sharded cache can hold entries.
+    """
+    for max_size in [1, 15]:
+        try:
+            purestemmer.cache.make_cache('lru', max_size, 16)
+        except ValueError:
+            pass
+        else:
+            assert False, 'No ValueError for maximum size %d.' % max_size
+    cache = purestemmer.cache.make_cache('lru', 16, 16)
+    try:
+        cache.max_size = 10
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError when shrinking the cache.'
+    assert cache.max_size == 16
+    cache.max_size = 0
+    stemmer = purestemmer.Stemmer('english', 96, cacheShards=16)
+    words = [u'cats', u'ponies', u'running', u'houses', u'dogs', u'trees']
+    stemmer.stemWords(words)
+    assert sorted(stemmer._cache) == sorted(words)
+
+
+def test_sharded_lru_eviction_order():
+    """
+    Make sure that each shard evicts its least recently used entry.
+    """
+    cache = purestemmer.cache.ShardedCache(purestemmer.cache.LRUCache, 4, 2)
+    for key in [0, 1, 2, 3]:
+        cache[key] = key
+    cache[0]
+    cache[4] = 4
+    assert sorted(cache) == [0, 1, 3, 4]
+
+
+def test_sharded_cache_threads():
+    """
+    Make sure that a sharded cache can be shared by many threads.
+    """
+    words = [u'cats', u'running', u'ponies', u'dogs', u'caresses'] * 200
+    expected = [u'cat', u'run', u'poni', u'dog', u'caress'] * 200
+    stemmer = purestemmer.Stemmer('english', 4, cacheShards=4)
+    errors = []
+
+    def worker():
+        for word, stem in zip(words, expected):
+            if stemmer.stemWord(word) != stem:
+                errors.append(word)
+
+    threads = [threading.Thread(target=worker) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(stemmer._cache) <= 4
+
+
+def test_cache_view():
+    """
+    Make sure that cache views share the size of a cache.
+    """
+    cache = purestemmer.cache.LRUCache(4)
+    a = purestemmer.cache.CacheView(cache, 'a')
+    b = purestemmer.cache.CacheView(cache, 'b')
+    a['x'] = 1
+    b['x'] = 2
+    assert a['x'] == 1 and b['x'] == 2
+    b.put_many([('y', 3), ('z', 4)])
+    assert a.get_many(['x', 'y']) == {'x': 1}
+    assert b.get_many(['x', 'y']) == {'x': 2, 'y': 3}
+    b['w'] = 5
+    # Evicts the least recently used entry of all views
+    assert 'z' not in b
+    assert len(a) == 1 and len(b) == 3
+    b.clear()
+    assert sorted(cache) == [('a', 'x')]
+    assert a.max_size == 4
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tests for ``purestemmer.dictionary``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import shutil
+import sys
+import tempfile
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.dictionary
+
+
+_WORDS = [u'cats', u'running', u'ponies', u'caresses', u'\xfcber', u'']
+
+
+def setup():
+    global _temp_dir
+    _temp_dir = tempfile.mkdtemp()
+
+
+def teardown():
+    shutil.rmtree(_temp_dir)
+
+
+def test_build():
+    """
+    Make sure that a built dictionary contains the right stems.
+    """
+    filename = os.path.join(_temp_dir, 'build.dict')
+    purestemmer.dictionary.build(filename, 'en', _WORDS + _WORDS)
+    stemmer = purestemmer.Stemmer('english')
+    with purestemmer.dictionary.StemDictionary(filename) as d:
+        assert d.algorithm == u'english'
+        assert d.version == purestemmer.__version__
+        assert len(d) == len(_WORDS)
+        assert dict(d) == dict((w, stemmer.stemWord(w)) for w in _WORDS)
+        assert u'dogs' not in d
+        assert d.get(u'dogs') is None
+
+
+def test_save_stemmer():
+    """
+    Make sure that the words cached by a stemmer can be saved.
+    """
+    filename = os.path.join(_temp_dir, 'stemmer.dict')
+    stemmer = purestemmer.Stemmer('german')
+    stemmer.stemWords([u'h\xe4user', 'katzen'])
+    purestemmer.dictionary.save_stemmer(filename, stemmer)
+    d = purestemmer.dictionary.StemDictionary(filename)
+    assert dict(d) == {u'h\xe4user': u'haus', u'katzen': u'katz'}
+
+
+def test_stemmer_uses_dictionary():
+    """
+    Make sure that a stemmer looks up words in its dictionary.
+    """
+    filename = os.path.join(_temp_dir, 'fake.dict')
+    purestemmer.dictionary.save(filename, 'english', {u'cats': u'dog'})
+    stemmer = purestemmer.Stemmer('eng', dictionary=filename)
+    assert stemmer.stemWords([u'cats', 'cats', u'ponies']) == [
+            u'dog', 'dog', u'poni']
+
+
+def test_stale_dictionary():
+    """
+    Make sure that dictionaries for other algorithms are rejected.
+    """
+    filename = os.path.join(_temp_dir, 'stale.dict')
+    purestemmer.dictionary.save(filename, 'english', {u'cats': u'cat'})
+    try:
+        purestemmer.Stemmer('porter', dictionary=filename)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for dictionary of other algorithm.'
+    with open(filename, 'r+b') as f:
+        f.seek(0)
+        f.write('X')
+    try:
+        purestemmer.dictionary.StemDictionary(filename)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for invalid dictionary file.'
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.multilingual``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import sys
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.multilingual
+
+
+_PAIRS = [('en', u'cats'), ('de', u'katzen'), ('english', 'cats'),
+          ('ger', u'h\xe4user'), ('eng', u'running'), ('en', u'cats')]
+
+_STEMS = [u'cat', u'katz', 'cat', u'haus', u'run', u'cat']
+
+
+def test_stem_words():
+    """
+    Make sure that words are stemmed using the algorithm of their language.
+    """
+    for shared in [False, True]:
+        stemmer = purestemmer.multilingual.MultilingualStemmer(
+                sharedCache=shared)
+        for i in range(2):
+            stems = stemmer.stemWords(iter(_PAIRS))
+            assert stems == _STEMS
+            assert map(type, stems) == map(type, _STEMS)
+        assert stemmer.stemWords([]) == []
+        assert stemmer.stemWord('de', u'katzen') == u'katz'
+        assert stemmer.getStemmer('en') is stemmer.getStemmer('english')
+
+
+def test_unknown_language():
+    """
+    Make sure that unknown languages are rejected.
+    """
+    stemmer = purestemmer.multilingual.MultilingualStemmer()
+    try:
+        stemmer.stemWords([('en', u'cats'), ('klingon', u'qapla')])
+    except KeyError:
+        pass
+    else:
+        assert False, 'No KeyError for unknown language.'
+
+
+def test_cache_sizes():
+    """
+    Make sure that cache sizes can be set per language.
+    """
+    stemmer = purestemmer.multilingual.MultilingualStemmer(
+            5, cacheSizes={'de': 1})
+    assert stemmer.getStemmer('english').maxCacheSize == 5
+    assert stemmer.getStemmer('german').maxCacheSize == 1
+    try:
+        purestemmer.multilingual.MultilingualStemmer(
+                sharedCache=True, cacheSizes={'de': 1})
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for cache sizes of shared cache.'
+
+
+def test_shared_cache():
+    """
+    Make sure that all languages can share a single cache.
+    """
+    stemmer = purestemmer.multilingual.MultilingualStemmer(
+            3, sharedCache=True)
+    stemmer.stemWords(_PAIRS)
+    assert len(stemmer._shared_cache) == 3
+    assert stemmer.getStemmer('en').maxCacheSize == 3
+
+
+def test_stem_documents():
+    """
+    Make sure that documents are stemmed using their language.
+    """
+    stemmer = purestemmer.multilingual.MultilingualStemmer()
+    documents = [('en', u'Cats and dogs'), ('de', 'Katzen und Hunde'),
+                 ('en', u'Dogs')] * 2
+    expected = [[u'cat', u'and', u'dog'], ['katz', 'und', 'hund'],
+                [u'dog']] * 2
+    results = stemmer.stemDocuments(iter(documents), chunkSize=4)
+    assert list(results) == expected
+    results = stemmer.stemDocuments(documents, counts=True)
+    assert next(results) == {u'cat': 1, u'and': 1, u'dog': 1}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tests for ``purestemmer.parallel``.
+
+Intended to be run via nosetests.
+"""
+
+
+import multiprocessing
+import os.path
+import sys
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.parallel
+
+
+_WORDS = [u'cats', 'ponies', u'running', u'\xfcber', u'caresses', u'',
+          'flies', u'dying', u'agreed', u'cats', 'cats'] * 3
+
+
+def test_stem_words():
+    """
+    Make sure that parallel stemming returns the same stems.
+    """
+    expected = purestemmer.Stemmer('english').stemWords(_WORDS)
+    with purestemmer.parallel.ParallelStemmer('english', processes=2,
+                                              chunkSize=2) as stemmer:
+        for i in range(2):
+            stems = stemmer.stemWords(_WORDS)
+            assert stems == expected
+            assert map(type, stems) == map(type, expected)
+        assert list(stemmer.iterStems(iter(_WORDS), 5)) == expected
+        assert stemmer.stemWord('ponies') == 'poni'
+
+
+def test_existing_pool():
+    """
+    Make sure that several parallel stemmers can share a pool.
+    """
+    pool = multiprocessing.Pool(2)
+    try:
+        for algorithm in ['english', 'porter', 'de']:
+            expected = purestemmer.Stemmer(algorithm).stemWords(_WORDS)
+            stemmer = purestemmer.parallel.ParallelStemmer(
+                    algorithm, maxCacheSize=0, chunkSize=3, pool=pool)
+            assert stemmer.stemWords(_WORDS) == expected
+            stemmer.close()
+        # Pool must still be usable
+        assert pool.map(abs, [-1]) == [1]
+    finally:
+        pool.close()
+        pool.join()
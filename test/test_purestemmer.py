@@ -33,17 +33,24 @@ Intended to be run via nosetests.
 import codecs
 import glob
 import os.path
+import subprocess
 import sys
 
-import Stemmer
 from nose.plugins.attrib import attr
+from nose.plugins.skip import SkipTest
 
 _module_dir = os.path.abspath(os.path.dirname(__file__))
 _root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
 _snowball_dir = os.path.join(_root_dir, 'snowball')
 sys.path.insert(0, _root_dir)
+import conformance
 import purestemmer
 
+try:
+    import Stemmer
+except ImportError:
+    Stemmer = None
+
 
 def _get_variants(word):
     """
@@ -64,6 +71,8 @@ def compare_stemmers(algorithm, words):
     ``algorithm`` is the name of the algorithm to be tested and
     ``words`` is a list of input words.
     """
+    if Stemmer is None:
+        raise SkipTest('pystemmer is not installed.')
     py = Stemmer.Stemmer(algorithm)
     pure = purestemmer.Stemmer(algorithm)
     for word in words:
@@ -78,6 +87,8 @@ def compare_stemmers(algorithm, words):
                     'Different output types for %r: pystemmer returned %s, ' +
                     'purestemmer returned %s.' % (variant, type(py_stem),
                     type(pure_stem)))
+    for variant in zip(*[_get_variants(word) for word in words]):
+        assert py.stemWords(variant) == pure.stemWords(variant)
 
 
 @attr('slow')
@@ -95,6 +106,71 @@ def test_compare_stemmers():
         yield test
 
 
+def test_expected_stems():
+    """
+    Make sure that there are expected stems for all test data.
+    """
+    for algorithm in conformance.test_algorithms():
+        words = conformance.load_words(algorithm)
+        expected = conformance.load_expected(algorithm)
+        assert len(words) == len(expected), algorithm
+
+
+def check_conformance(algorithm, limit=None):
+    """
+    Check all execution paths against the expected stems.
+
+    Only the first ``limit`` test words are used.
+    """
+    words = conformance.load_words(algorithm)[:limit]
+    expected = conformance.load_expected(algorithm)[:limit]
+    module = purestemmer._load_algorithm(algorithm)
+    checks = ([(path, module) for path in
+               conformance.MODULE_PATHS.values()] +
+              [(path, algorithm) for path in
+               conformance.STEMMER_PATHS.values()])
+    for path, target in checks:
+        result = conformance.check_path(path, target, words, expected)
+        if result is not None:
+            divergence = result[0]
+            assert divergence is None, '%s: %s' % (path.__name__,
+                                                   divergence)
+
+
+def test_conformance():
+    """
+    Make sure that all execution paths return the expected stems.
+    """
+    check_conformance('english', 500)
+
+
+@attr('slow')
+def test_conformance_all():
+    """
+    Make sure that all execution paths return the expected stems.
+    """
+    for algorithm in conformance.test_algorithms():
+        test = lambda: check_conformance(algorithm, 5000)
+        test.description = algorithm
+        yield test
+
+
+def test_find_divergence():
+    """
+    Make sure that wrong stems are reported.
+    """
+    words = [u'cats', u'ponies', u'running']
+    expected = [u'cat', u'poni', u'run']
+    find = conformance.find_divergence
+    assert find(words, expected, [u'cat', u'poni', u'run']) is None
+    assert find(words, expected, [u'cat', u'pony', u'run']) == (
+            1, u'ponies', u'poni', u'pony')
+    assert find(words, expected, [u'cat', 'poni', u'run']) == (
+            1, u'ponies', u'poni', 'poni')
+    assert find(words, expected, [u'cat']) == (1, u'ponies', u'poni', None)
+    assert find(words, expected, expected + [u'x']) == (3, None, None, u'x')
+
+
 def test_aliases():
     """
     Make sure that the aliases work.
@@ -106,3 +182,150 @@ def test_aliases():
         for alias in aliases:
             purestemmer.Stemmer(alias)
 
+
+def test_lazy_loading():
+    """
+    Make sure that algorithm modules are only imported when needed.
+    """
+    code = """
+import sys
+import purestemmer
+def loaded():
+    return sorted(m for m in sys.modules
+                  if m.startswith('purestemmer.algorithms.') and sys.modules[m])
+assert loaded() == [], loaded()
+assert 'english' in purestemmer.algorithms()
+purestemmer.Stemmer('en')
+assert loaded() == ['purestemmer.algorithms.english_en_eng'], loaded()
+purestemmer.preload(['ger', 'porter'])
+assert len(loaded()) == 3, loaded()
+purestemmer.preload()
+assert len(loaded()) == len(purestemmer.algorithms()), loaded()
+"""
+    subprocess.check_call([sys.executable, '-c', code], cwd=_root_dir)
+
+
+def test_preload_unknown_algorithm():
+    """
+    Make sure that preloading an unknown algorithm raises ``KeyError``.
+    """
+    try:
+        purestemmer.preload(['klingon'])
+    except KeyError:
+        pass
+    else:
+        assert False, 'No KeyError for unknown algorithm.'
+
+
+def test_stem_words():
+    """
+    Make sure that ``stemWords`` returns stems in the right order and types.
+    """
+    stemmer = purestemmer.Stemmer('english', maxCacheSize=2)
+    words = [u'cats', 'cats', u'running', u'cats', u'\xfcber', 'runs',
+             '\xc3\xbcber', u'']
+    expected = [u'cat', 'cat', u'run', u'cat', u'\xfcber', 'run',
+                '\xc3\xbcber', u'']
+    for i in range(2):
+        stems = stemmer.stemWords(words)
+        assert stems == expected
+        assert map(type, stems) == map(type, expected)
+    assert stemmer.stemWords(iter(words)) == expected
+    assert stemmer.stemWords([]) == []
+
+
+def test_stem_words_factorized():
+    """
+    Make sure that ``stemWords`` can return factorized stems.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    words = [u'cats', u'running', u'cat', 'cats', u'runs', u'cats']
+    ids, stems = stemmer.stemWords(words, factorize=True)
+    assert list(ids) == [0, 1, 0, 2, 1, 0]
+    assert stems == [u'cat', u'run', 'cat']
+    assert map(type, stems) == [unicode, unicode, str]
+
+
+def test_str_cache():
+    """
+    Make sure that ``str`` and ``unicode`` words are cached separately.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    for i in range(2):
+        assert type(stemmer.stemWord('cats')) is str
+        assert type(stemmer.stemWord(u'cats')) is unicode
+        assert stemmer.stemWord('\xc3\xbcbers') == '\xc3\xbcber'
+        assert stemmer.stemWord(u'\xfcbers') == u'\xfcber'
+    assert sorted(stemmer._bytes_cache) == ['cats', '\xc3\xbcbers']
+    assert sorted(stemmer._cache) == [u'cats', u'\xfcbers']
+    stemmer.maxCacheSize = 1
+    assert len(stemmer._bytes_cache) == 1
+
+
+def test_stem_words_with_newlines():
+    """
+    Make sure that ``str`` words containing newlines are stemmed.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    words = ['cats\n', 'dogs', '\n', 'ponies']
+    assert stemmer.stemWords(words) == [stemmer.stemWord(u'cats\n'),
+                                        'dog', '\n', 'poni']
+
+
+def test_stem_bytes():
+    """
+    Make sure that ``stemBytes`` stems the words in a UTF-8 string.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stems = stemmer.stemBytes('cats\n\xc3\xbcbers  running\r\ncats\n')
+    assert stems == ['cat', '\xc3\xbcber', 'run', 'cat']
+    assert all(type(stem) is str for stem in stems)
+    assert stemmer.stemBytes('') == []
+
+
+def check_prefilter(algorithm, words):
+    """
+    Make sure that an algorithm's prefilter only accepts words that the
+    algorithm returns unchanged.
+
+    Besides ``words``, their prefixes and suffixes are checked.
+    """
+    module = purestemmer._load_algorithm(algorithm)
+    unchanged = getattr(module, 'unchanged', None)
+    if unchanged is None:
+        return
+    for word in words:
+        for i in range(len(word) + 1):
+            for part in (word[:i], word[i:]):
+                if unchanged(part):
+                    assert module.stem(part) == part, (
+                            'Prefilter accepted %r.' % part)
+
+
+@attr('slow')
+def test_prefilters():
+    """
+    Make sure that the prefilters only accept unchanged words.
+    """
+    filenames = sorted(glob.glob(os.path.join(_module_dir, '*.txt')))
+    for filename in filenames:
+        algorithm = os.path.splitext(os.path.basename(filename))[0]
+        with codecs.open(filename, 'r', 'utf8') as f:
+            words = f.read().splitlines()
+        test = lambda: check_prefilter(algorithm, words)
+        test.description = algorithm
+        yield test
+
+
+def test_prefiltered_words_are_not_cached():
+    """
+    Make sure that words accepted by the prefilter bypass the cache.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    assert stemmer._unchanged(u'jump')
+    assert stemmer.stemWord(u'jump') == u'jump'
+    assert stemmer.stemWord('jump') == 'jump'
+    assert stemmer.stemWords([u'jump', u'cats']) == [u'jump', u'cat']
+    assert stemmer.stemWords(['jump', 'cats']) == ['jump', 'cat']
+    assert sorted(stemmer._cache) == [u'cats']
+    assert sorted(stemmer._bytes_cache) == ['cats']
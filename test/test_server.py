@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.server``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.server
+
+
+_WORDS = [u'cats', 'ponies', u'running', u'\xfcber', '\xc3\xbcbers', u'',
+          'flies\n', u'dying', u'agreed', u'cats', 'cats'] * 3
+
+_temp_dir = None
+_server = None
+_thread = None
+
+
+def setup():
+    global _temp_dir, _server, _thread
+    _temp_dir = tempfile.mkdtemp()
+    path = os.path.join(_temp_dir, 'stemmer.sock')
+    _server = purestemmer.server.StemmerServer(path, processes=2,
+                                               chunkSize=2,
+                                               algorithms=['english'])
+    _thread = threading.Thread(target=_server.serve_forever)
+    _thread.start()
+
+
+def teardown():
+    _server.shutdown()
+    _thread.join()
+    _server.close()
+    shutil.rmtree(_temp_dir)
+
+
+def test_stem_words():
+    """
+    Make sure that the client returns the same stems as ``Stemmer``.
+    """
+    for algorithm in ['english', 'de']:
+        expected = purestemmer.Stemmer(algorithm)
+        with purestemmer.server.StemmerClient(algorithm,
+                                              _server.path) as client:
+            for i in range(2):
+                stems = client.stemWords(_WORDS)
+                assert stems == expected.stemWords(_WORDS)
+                assert map(type, stems) == map(type, _WORDS)
+            ids, table = client.stemWords(_WORDS, factorize=True)
+            assert (list(ids), table) == (
+                    list(expected.stemWords(_WORDS, True)[0]),
+                    expected.stemWords(_WORDS, True)[1])
+            assert client.stemWord('ponies') == 'poni'
+            assert client.stemWord(u'ponies') == u'poni'
+            assert client.stemWords([]) == []
+            assert list(client.iterStems(iter(_WORDS), 4)) == stems
+
+
+def test_unknown_algorithm():
+    """
+    Make sure that unknown algorithms raise ``KeyError``.
+    """
+    try:
+        purestemmer.server.StemmerClient('klingon', _server.path)
+    except KeyError:
+        pass
+    else:
+        assert False, 'No KeyError for unknown algorithm.'
+
+
+def test_unknown_algorithm_closes_connection():
+    """
+    Make sure that a failed constructor closes the connection.
+    """
+    sockets = []
+
+    class Client(purestemmer.server.StemmerClient):
+        def _connect(self):
+            purestemmer.server.StemmerClient._connect(self)
+            sockets.append(self._sock)
+
+    try:
+        Client('klingon', _server.path)
+    except KeyError:
+        pass
+    assert len(sockets) == 1
+    try:
+        sockets[0].fileno()
+    except socket.error:
+        pass
+    else:
+        assert False, 'Connection is still open.'
+
+
+def test_reconnect():
+    """
+    Make sure that a closed client reconnects.
+    """
+    client = purestemmer.server.StemmerClient('english', _server.path)
+    client.close()
+    assert client.stemWord(u'cats') == u'cat'
+    client.close()
+
+
+def test_concurrent_clients():
+    """
+    Make sure that several clients can use the server at once.
+    """
+    expected = purestemmer.Stemmer('english').stemWords(_WORDS)
+    errors = []
+
+    def worker():
+        client = purestemmer.server.StemmerClient('english', _server.path)
+        for i in range(20):
+            if client.stemWords(_WORDS) != expected:
+                errors.append(i)
+        client.close()
+
+    threads = [threading.Thread(target=worker) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_non_socket_file_is_kept():
+    """
+    Make sure that a server does not remove a file that is no socket.
+    """
+    path = os.path.join(_temp_dir, 'data.txt')
+    with open(path, 'w') as f:
+        f.write('important')
+    try:
+        purestemmer.server.StemmerServer(path, processes=1)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for a regular file.'
+    with open(path) as f:
+        assert f.read() == 'important'
+
+
+def test_close_keeps_replaced_socket():
+    """
+    Make sure that a server only removes its own socket file.
+    """
+    path = os.path.join(_temp_dir, 'replaced.sock')
+    server = purestemmer.server.StemmerServer(path, processes=1)
+    os.unlink(path)
+    other = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        other.bind(path)
+        server.close()
+        assert os.path.exists(path)
+    finally:
+        other.close()
+        os.unlink(path)
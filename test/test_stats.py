@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.stats``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import shutil
+import sys
+import tempfile
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.cache
+import purestemmer.dictionary
+import purestemmer.stats
+
+
+def test_disabled_by_default():
+    """
+    Make sure that statistics are disabled by default.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.stemWord(u'cats')
+    assert stemmer.getStats() is None
+    assert 'stemWord' not in stemmer.__dict__
+    assert stemmer._cache.stats is None
+
+
+def test_stem_word():
+    """
+    Make sure that ``stemWord`` records statistics.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.enableStats()
+    for word in [u'cats', u'cats', 'ponies', u'cats']:
+        stemmer.stemWord(word)
+    stats = stemmer.getStats()
+    assert stats['lookups'] == 4
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['dictionary_hits'] == 0
+    assert stats['stem_time'] > 0
+    assert stats['word_lengths'] == {4: 3, 6: 1}
+    stemmer.resetStats()
+    assert stemmer.getStats()['lookups'] == 0
+    stemmer.disableStats()
+    assert stemmer.getStats() is None
+    assert stemmer.stemWord(u'cats') == u'cat'
+
+
+def test_stem_words():
+    """
+    Make sure that ``stemWords`` records statistics.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.enableStats()
+    stemmer.stemWords([u'cats', u'dogs', u'cats'])
+    stemmer.stemWords([u'cats', u'birds'])
+    stats = stemmer.getStats()
+    assert stats['lookups'] == 4
+    assert stats['hits'] == 1
+    assert stats['misses'] == 3
+    assert stats['word_lengths'] == {4: 3, 5: 1}
+
+
+def test_dictionary_hits():
+    """
+    Make sure that hits in the stem dictionary are counted.
+    """
+    temp_dir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(temp_dir, 'english.dict')
+        purestemmer.dictionary.build(filename, 'english', [u'cats'])
+        stemmer = purestemmer.Stemmer('english', dictionary=filename)
+        stemmer.enableStats()
+        stemmer.stemWord(u'cats')
+        stemmer.stemWords([u'cats', u'dogs'])
+        stats = stemmer.getStats()
+        assert stats['dictionary_hits'] == 2
+        assert stats['misses'] == 1
+        stemmer._dictionary.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_prefiltered():
+    """
+    Make sure that words accepted by the prefilter are counted.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.enableStats()
+    stemmer.stemWord(u'jump')
+    stemmer.stemWords([u'jump', u'cats', 'box'])
+    stats = stemmer.getStats()
+    assert stats['lookups'] == 4
+    assert stats['prefiltered'] == 3
+    assert stats['misses'] == 1
+    assert stats['hits'] == 0
+
+
+def test_evictions():
+    """
+    Make sure that cache evictions are counted.
+    """
+    for policy in purestemmer.cache.policies():
+        stemmer = purestemmer.Stemmer('english', 2, policy)
+        stemmer.enableStats()
+        stemmer.stemWords([u'cats', u'dogs', u'birds', u'trees'])
+        stemmer.stemWord(u'ponies')
+        assert stemmer.getStats()['evictions'] == 3, policy
+
+
+def test_callback():
+    """
+    Make sure that the callback is called regularly.
+    """
+    snapshots = []
+    stemmer = purestemmer.Stemmer('english')
+    stemmer.enableStats(snapshots.append, interval=3)
+    for word in [u'a', u'b', u'c', u'd', u'e']:
+        stemmer.stemWord(word)
+    stemmer.stemWords([u'f', u'g', u'h', u'i', u'j', u'k', u'l'])
+    assert [s['lookups'] for s in snapshots] == [3, 12]
+
+
+def test_invalid_interval():
+    """
+    Make sure that a non-positive interval is rejected.
+    """
+    try:
+        purestemmer.stats.StemmerStats(interval=0)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for interval 0.'
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tests for ``purestemmer.stream``.
+
+Intended to be run via nosetests.
+"""
+
+
+import io
+import os.path
+import sys
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.stream
+
+
+_TEXTS = [u'', u'\n\n', u'cats\nponies', u'cats\r\n\xfcber\r\n',
+          u'h\xe4user\nkatzen\nh\xe4user\n', u'cats\rponies\r\r',
+          u'cats\r\n\r\nponies\r', u'a\x85b\u2028c\x0bd']
+
+
+def test_iter_blocks():
+    """
+    Make sure that words are split correctly across blocks.
+    """
+    for text in _TEXTS:
+        data = text.encode('utf8')
+        for block_size in [1, 2, 3, 1000]:
+            blocks = purestemmer.stream.iter_blocks(io.BytesIO(data),
+                                                    block_size)
+            words = [word for block in blocks for word in block]
+            assert words == text.splitlines(), (text, block_size, words)
+
+
+def test_iter_blocks_line_breaks():
+    """
+    Make sure that blocks end at all kinds of line breaks.
+    """
+    for sep in [u'\r', u'\r\n', u'\n']:
+        text = sep.join([u'katzen'] * 10000) + sep
+        data = text.encode('utf8')
+        blocks = list(purestemmer.stream.iter_blocks(io.BytesIO(data), 4096))
+        assert len(blocks) > 10, (sep, len(blocks))
+        assert max(len(block) for block in blocks) < 4096, sep
+        words = [word for block in blocks for word in block]
+        assert words == text.splitlines(), sep
+
+
+def test_stem_file():
+    """
+    Make sure that the stems of a file are correct.
+    """
+    stemmer = purestemmer.Stemmer('german')
+    for text in _TEXTS:
+        expected = stemmer.stemWords(text.splitlines())
+        data = text.encode('utf8')
+        stems = purestemmer.stream.iter_file_stems(stemmer, io.BytesIO(data),
+                                                   block_size=3)
+        assert list(stems) == expected
+        outfile = io.BytesIO()
+        count = purestemmer.stream.stem_file(stemmer, io.BytesIO(data),
+                                             outfile, block_size=3)
+        assert count == len(expected)
+        assert outfile.getvalue().decode('utf8').splitlines() == expected
+
+
+def test_iter_stems():
+    """
+    Make sure that ``Stemmer.iterStems`` works.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    words = [u'cats', 'ponies', u'running'] * 5
+    expected = stemmer.stemWords(words)
+    for chunk_size in [1, 4, 100]:
+        stems = stemmer.iterStems(iter(words), chunk_size)
+        assert list(stems) == expected
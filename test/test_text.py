@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.text`` and the text methods of ``Stemmer``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import sys
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.text
+
+
+def test_tokenize():
+    """
+    Make sure that texts are split into lower-case tokens.
+    """
+    tokenize = purestemmer.text.tokenize
+    assert tokenize(u'The DOG-days of 2014_x, \xdcber!') == [
+            u'the', u'dog', u'days', u'of', u'2014', u'x', u'\xfcber']
+    assert tokenize(u"Don't take the dog's ball.") == [
+            u"don't", u'take', u'the', u"dog's", u'ball']
+    assert tokenize(u"l'homme", 'french') == [u'l', u'homme']
+    assert tokenize(u'') == []
+
+
+def test_tokenize_turkish():
+    """
+    Make sure that Turkish case folding is used for Turkish.
+    """
+    text = u'ISTANBUL İzmir'
+    assert purestemmer.text.tokenize(text, 'tr') == [u'ıstanbul',
+                                                     u'izmir']
+    assert purestemmer.text.tokenize(text) == [u'istanbul', u'izmir']
+
+
+def test_stem_text():
+    """
+    Make sure that ``Stemmer.stemText`` tokenizes and stems a text.
+    """
+    stemmer = purestemmer.Stemmer('english')
+    text = u'Cats were running, a cat runs.'
+    expected = [u'cat', u'were', u'run', u'a', u'cat', u'run']
+    assert stemmer.stemText(text) == expected
+    stems = stemmer.stemText(text.encode('utf8'))
+    assert stems == expected
+    assert all(type(stem) is str for stem in stems)
+    assert stemmer.stemText(text, counts=True) == {
+            u'cat': 2, u'were': 1, u'run': 2, u'a': 1}
+
+
+def test_stem_documents():
+    """
+    Make sure that ``Stemmer.stemDocuments`` stems each document.
+    """
+    stemmer = purestemmer.Stemmer('german')
+    documents = [u'H\xe4user und Katzen', 'Katzen', u'', u'Haus'] * 3
+    expected = [{u'haus': 1, u'und': 1, u'katz': 1}, {'katz': 1}, {},
+                {u'haus': 1}] * 3
+    results = stemmer.stemDocuments(iter(documents), counts=True,
+                                    chunkSize=5)
+    assert list(results) == expected
+    results = stemmer.stemDocuments(documents)
+    assert list(results) == [[u'haus', u'und', u'katz'], ['katz'], [],
+                             [u'haus']] * 3
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# vim:fileencoding=utf8
+
+# Copyright (c) 2014 Florian Brucker
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS
+# BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Tests for ``purestemmer.vocabulary``.
+
+Intended to be run via nosetests.
+"""
+
+
+import os.path
+import shutil
+import sys
+import tempfile
+
+_module_dir = os.path.abspath(os.path.dirname(__file__))
+_root_dir = os.path.abspath(os.path.join(_module_dir, '..'))
+sys.path.insert(0, _root_dir)
+import purestemmer
+import purestemmer.vocabulary
+
+
+_WORDS = [u'cats', u'running', 'cat', u'runs', u'cats', u'\xfcber',
+          u'run', u'a\0b', u'']
+
+
+def setup():
+    global _temp_dir
+    _temp_dir = tempfile.mkdtemp()
+
+
+def teardown():
+    shutil.rmtree(_temp_dir)
+
+
+def check_vocabulary(vocabulary):
+    """
+    Make sure that a vocabulary of ``_WORDS`` is correct.
+    """
+    assert vocabulary.words == [u'cats', u'running', u'cat', u'runs',
+                                u'\xfcber', u'run', u'a\0b', u'']
+    assert len(vocabulary) == 8
+    assert u'cat' in vocabulary
+    assert u'dog' not in vocabulary
+    assert vocabulary.get_stem(u'running') == u'run'
+    assert vocabulary.get_stem(u'dog') is None
+    assert vocabulary.get_words(u'run') == [u'running', u'runs', u'run']
+    assert vocabulary.get_words(u'dog') == []
+    stem_id = vocabulary.get_stem_id(u'cat')
+    assert vocabulary.stems[stem_id] == u'cat'
+    assert list(vocabulary.word_stems[:3]) == [stem_id,
+                                               stem_id + 1, stem_id]
+    groups = dict(vocabulary.iter_groups())
+    assert len(groups) == len(vocabulary.stems) == 5
+    assert groups[u'cat'] == [u'cats', u'cat']
+
+
+def test_build():
+    """
+    Make sure that a vocabulary maps words to stems and vice versa.
+    """
+    vocabulary = purestemmer.vocabulary.build('en', iter(_WORDS))
+    assert vocabulary.algorithm == u'english'
+    check_vocabulary(vocabulary)
+
+
+def test_save_and_load():
+    """
+    Make sure that a vocabulary can be saved and loaded.
+    """
+    filename = os.path.join(_temp_dir, 'english.voc')
+    purestemmer.vocabulary.build('english', _WORDS).save(filename)
+    vocabulary = purestemmer.vocabulary.load(filename)
+    assert vocabulary.algorithm == u'english'
+    assert vocabulary.version == purestemmer.__version__
+    check_vocabulary(vocabulary)
+    purestemmer.vocabulary.Vocabulary('english').save(filename)
+    assert len(purestemmer.vocabulary.load(filename)) == 0
+
+
+def test_load_invalid_file():
+    """
+    Make sure that loading a file that is no vocabulary fails.
+    """
+    filename = os.path.join(_temp_dir, 'invalid.voc')
+    with open(filename, 'wb') as f:
+        f.write('foobar')
+    try:
+        purestemmer.vocabulary.load(filename)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for invalid vocabulary.'
+
+
+def test_merge():
+    """
+    Make sure that vocabularies can be merged.
+    """
+    vocabulary = purestemmer.vocabulary.build('english', _WORDS[:4])
+    vocabulary.get_words(u'run')
+    vocabulary.merge(purestemmer.vocabulary.build('english', _WORDS[2:]))
+    check_vocabulary(vocabulary)
+    try:
+        vocabulary.merge(purestemmer.vocabulary.Vocabulary('german'))
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for different algorithms.'
+    old = purestemmer.vocabulary.build('english', [u'ponies'])
+    old.version = '0.0.1'
+    try:
+        vocabulary.merge(old)
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for different versions.'
+    assert u'ponies' not in vocabulary
+
+
+def test_update_with_stemmer():
+    """
+    Make sure that a vocabulary can use a given stemmer.
+    """
+    vocabulary = purestemmer.vocabulary.Vocabulary('english')
+    vocabulary.update(_WORDS, purestemmer.Stemmer('english'))
+    check_vocabulary(vocabulary)
+    try:
+        vocabulary.update(_WORDS, purestemmer.Stemmer('german'))
+    except ValueError:
+        pass
+    else:
+        assert False, 'No ValueError for stemmer of different algorithm.'